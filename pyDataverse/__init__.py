@@ -10,8 +10,6 @@ from __future__ import absolute_import
 import warnings
 from importlib.metadata import PackageNotFoundError, version
 
-import nest_asyncio
-
 from .api.search import QueryOptions
 from .dataverse import Collection, Dataset, Dataverse, File
 
@@ -25,8 +23,6 @@ warnings.filterwarnings(
 )
 
 
-nest_asyncio.apply()
-
 __author__ = "Stefan Kasberger"
 __email__ = "stefan.kasberger@univie.ac.at"
 __copyright__ = "Copyright (c) 2019 Stefan Kasberger"
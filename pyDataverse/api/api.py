@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import abc
 import json
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
 from types import UnionType
 from typing import (
     Any,
+    AsyncGenerator,
+    Callable,
     Coroutine,
     Dict,
     Generator,
@@ -29,6 +31,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     TypeAdapter,
     ValidationError,
     computed_field,
@@ -40,6 +43,7 @@ from typing_extensions import Self, TypeAlias
 from ..auth import ApiTokenAuth
 from .response import APIResponse, Status
 from .utilities.logger import ApiLogger
+from .utilities.loop import BackgroundLoop
 
 DEPRECATION_GUARD = object()
 
@@ -49,6 +53,9 @@ T = TypeVar("T", bound=BaseModel)
 # Type variable for generic Any types, constrained to Any
 A = TypeVar("A", bound=Any)
 
+# Type variable for the results of coroutines run on the background loop
+R = TypeVar("R")
+
 # Union type representing the various response model types that can be used
 # to validate and parse API responses. Includes single models, lists of models,
 # and generic Any types for flexible response handling.
@@ -189,6 +196,10 @@ class Api(DataverseBase, AbstractApi):
         description="Whether to log verbose information.",
     )
 
+    # Event loop the sync facade runs its concurrent requests on. The
+    # process-wide shared loop is used when None.
+    _loop: Optional[BackgroundLoop] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def check_auth(self):
         self.logger.set_verbose(self.verbose)
@@ -266,6 +277,7 @@ class Api(DataverseBase, AbstractApi):
         )
 
         instance.logger.set_verbose(api.verbose)
+        instance._loop = api._loop
         return instance
 
     @overload
@@ -543,6 +555,51 @@ class Api(DataverseBase, AbstractApi):
         ) as response:
             yield response
 
+    @asynccontextmanager
+    async def astream_file_context(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncGenerator[httpx.Response, Any]:
+        """Async counterpart of :meth:`stream_file_context`.
+
+        Streams the response through the instance's ``httpx.AsyncClient``, so
+        many downloads can share one connection pool and run concurrently.
+
+        Args:
+            url (str): The full URL to stream from.
+            params (Optional[Dict[str, Any]]): Optional query parameters.
+            headers (Optional[Dict[str, str]]): Optional HTTP headers. The
+                User-Agent header is added automatically.
+
+        Yields:
+            httpx.Response: A streaming HTTP response object.
+
+        Raises:
+            ValueError: If the async client is not initialized.
+
+        Example:
+            >>> async with api:
+            ...     async with api.astream_file_context(url) as response:
+            ...         async for chunk in response.aiter_bytes():
+            ...             pass
+        """
+        if self.client is None:
+            raise ValueError("Async client is not initialized.")
+
+        headers = self._add_default_headers(headers)
+
+        async with self.client.stream(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            auth=self.auth,
+            follow_redirects=True,
+        ) as response:
+            yield response
+
     @overload
     def post_request(
         self,
@@ -1668,6 +1725,22 @@ class Api(DataverseBase, AbstractApi):
         except ValueError:
             return True
 
+    def _run_async(self, function: Callable[[Self], Coroutine[Any, Any, R]]) -> R:
+        """Run a coroutine function on this API's background event loop.
+
+        The function receives a copy of this API whose request methods return
+        coroutines, bound to the loop's shared async client. The calling
+        thread blocks until the coroutine finishes.
+
+        Args:
+            function: Creates the coroutine from the async copy of this API.
+
+        Returns:
+            The coroutine's result.
+        """
+        loop = self._loop if self._loop is not None else BackgroundLoop.shared()
+        return loop.run(function(loop.bind(self)))
+
     def _setup_async_client(self):
         self.client = httpx.AsyncClient(
             follow_redirects=True,
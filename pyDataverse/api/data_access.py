@@ -1,11 +1,14 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from typing import (
     Any,
+    AsyncGenerator,
+    Dict,
     Generator,
     List,
     Literal,
     Optional,
     Sequence,
+    Tuple,
     Union,
     overload,
 )
@@ -84,6 +87,7 @@ class DataAccessApi(Api):
         data_format: Optional[str] = None,
         no_var_header: Optional[bool] = None,
         image_thumb: Optional[bool] = None,
+        variables: Optional[Sequence[int]] = None,
     ) -> str:
         """
         Get the direct download URL for a datafile, with redirects disabled.
@@ -102,39 +106,124 @@ class DataAccessApi(Api):
                 tabular data format. Pass True to remove the variable header.
             image_thumb (Optional[bool], default=None): Whether to request an image thumbnail
                 instead of the full image. Pass True for thumbnail.
+            variables (Optional[Sequence[int]], default=None): Variable IDs to subset an
+                ingested tabular file to. Only these columns are served.
 
         Returns:
-            str: The direct download URL from the Location response header.
+            str: The direct download URL from the Location response header, or
+            the Data Access URL itself if Dataverse serves the file directly.
 
         Raises:
-            AssertionError: If the Location header is not found in the response.
             httpx.HTTPError: If the request fails for network or HTTP reasons.
 
         Example:
             >>> api = DataAccessApi(base_url="https://demo.dataverse.org/")
             >>> download_url = api.get_datafile_download_url(1234567)
         """
-        response = self._get_datafile_core(
+        redirect = self.resolve_datafile_redirect(
             identifier,
             data_format=data_format,
             no_var_header=no_var_header,
             image_thumb=image_thumb,
-            follow_redirects=False,
+            variables=variables,
         )
+        if redirect is not None:
+            return redirect
 
-        if not response.has_redirect_location:
-            if self._is_pid(identifier):
-                return self._assemble_url(
-                    f"datafile/:persistentId?persistentId={identifier}"
-                )
-            else:
-                return self._assemble_url(f"datafile/{identifier}")
-        elif response.next_request is not None:
-            return str(response.next_request.url)
-        else:
-            raise ValueError(
-                "No redirect found in response for file download URL. This should actually never happen. Please open an issue on GitHub with the following information: {response.__dict__}"
-            )
+        # The request URL already carries the identifier and any
+        # format/subset query parameters.
+        url, params, _ = self._build_stream_request(
+            identifier,
+            data_format=data_format,
+            no_var_header=no_var_header,
+            image_thumb=image_thumb,
+            variables=variables,
+        )
+        return str(httpx.URL(url, params=params))
+
+    def resolve_datafile_redirect(
+        self,
+        identifier: Union[str, int],
+        data_format: Optional[str] = None,
+        no_var_header: Optional[bool] = None,
+        image_thumb: Optional[bool] = None,
+        variables: Optional[Sequence[int]] = None,
+        client: Optional[httpx.Client] = None,
+    ) -> Optional[str]:
+        """
+        Get the storage URL a datafile download redirects to, if any.
+
+        Installations that keep files on S3 or Swift answer Data Access
+        requests with a redirect to a presigned storage URL. This method asks
+        for a single byte and does not follow the redirect, so the probe
+        transfers no file content, whichever store holds the file. An empty
+        file, for which the single byte is out of range (HTTP 416), counts as
+        served by Dataverse itself.
+
+        Args:
+            identifier (Union[str, int]): The identifier for the datafile. Can be the numeric
+                datafile database ID or a persistent identifier (such as a DOI).
+            data_format (Optional[str], default=None): Format conversion for the downloaded data.
+            no_var_header (Optional[bool], default=None): Whether to exclude variable header in
+                tabular data format.
+            image_thumb (Optional[bool], default=None): Whether to request an image thumbnail.
+            variables (Optional[Sequence[int]], default=None): Variable IDs to subset an
+                ingested tabular file to.
+            client (Optional[httpx.Client], default=None): Client to send the probe
+                with, so repeated probes share its connection pool. A client with
+                the instance's timeout is opened for the probe if omitted.
+
+        Returns:
+            Optional[str]: The redirect target, or None if Dataverse serves the
+            file itself (e.g. local file storage).
+
+        Raises:
+            httpx.HTTPStatusError: If Dataverse rejects the request.
+            httpx.HTTPError: If the request fails for network reasons.
+
+        Example:
+            >>> api = DataAccessApi(base_url="https://demo.dataverse.org/")
+            >>> api.resolve_datafile_redirect(1234567)
+            'https://bucket.s3.amazonaws.com/10.5072/FK2/...?X-Amz-Expires=3600&...'
+        """
+        url, params, headers = self._build_stream_request(
+            identifier,
+            data_format=data_format,
+            no_var_header=no_var_header,
+            image_thumb=image_thumb,
+            range_start=0,
+            range_end=0,
+            variables=variables,
+        )
+        headers = self._add_default_headers(headers)
+
+        if client is None:
+            with httpx.Client(timeout=self.timeout) as own_client:
+                return self._probe_redirect(own_client, url, params, headers)
+        return self._probe_redirect(client, url, params, headers)
+
+    def _probe_redirect(
+        self,
+        client: httpx.Client,
+        url: str,
+        params: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> Optional[str]:
+        """Send a redirect probe; the body of a non-redirect answer is left unread."""
+        with client.stream(
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            auth=self.auth,
+            follow_redirects=False,
+        ) as response:
+            if response.has_redirect_location and response.next_request is not None:
+                return str(response.next_request.url)
+            if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+                return None
+            response.raise_for_status()
+            return None
 
     @overload
     def _get_datafile_core(
@@ -144,6 +233,7 @@ class DataAccessApi(Api):
         data_format: Optional[str] = None,
         no_var_header: Optional[bool] = None,
         image_thumb: Optional[bool] = None,
+        variables: Optional[Sequence[int]] = None,
     ) -> httpx.Response:
         """
         Internal helper to issue a datafile download request to the Data Access API.
@@ -158,6 +248,7 @@ class DataAccessApi(Api):
         data_format: Optional[str] = None,
         no_var_header: Optional[bool] = None,
         image_thumb: Optional[bool] = None,
+        variables: Optional[Sequence[int]] = None,
     ) -> bytes:
         """
         Internal helper to issue a datafile download request to the Data Access API.
@@ -171,6 +262,7 @@ class DataAccessApi(Api):
         data_format: Optional[str] = None,
         no_var_header: Optional[bool] = None,
         image_thumb: Optional[bool] = None,
+        variables: Optional[Sequence[int]] = None,
     ) -> Union[bytes, httpx.Response]:
         """
         Internal helper to issue a datafile download request to the Data Access API.
@@ -184,6 +276,7 @@ class DataAccessApi(Api):
             data_format (Optional[str], default=None): Optional format for the downloaded data.
             no_var_header (Optional[bool], default=None): Option to exclude variable header for tabular files.
             image_thumb (Optional[bool], default=None): Option to download an image thumbnail if applicable.
+            variables (Optional[Sequence[int]], default=None): Variable IDs to subset a tabular file to.
             follow_redirects (bool, default=True): Whether to follow HTTP redirects automatically.
 
         Returns:
@@ -206,6 +299,8 @@ class DataAccessApi(Api):
             params["noVarHeader"] = no_var_header
         if image_thumb:
             params["imageThumb"] = image_thumb
+        if variables:
+            params["variables"] = ",".join(str(v) for v in variables)
 
         return self.get_request(
             url,
@@ -224,6 +319,8 @@ class DataAccessApi(Api):
         image_thumb: Optional[bool] = None,
         range_start: Optional[int] = None,
         range_end: Optional[int] = None,
+        variables: Optional[Sequence[int]] = None,
+        ranges: Optional[Sequence[Tuple[int, int]]] = None,
     ) -> Generator[httpx.Response, Any, Any]:
         """Download a datafile via streaming using the Dataverse Data Access API.
 
@@ -239,13 +336,95 @@ class DataAccessApi(Api):
             range_start: Optional start byte position for Range request (inclusive).
             range_end: Optional end byte position for Range request (inclusive).
                 If range_start is provided but range_end is None, reads from range_start to end.
+            variables: Optional variable IDs to subset an ingested tabular file to.
+            ranges: Optional inclusive ``(start, end)`` byte ranges to request at
+                once, answered as ``multipart/byteranges`` by servers that
+                support it. Takes precedence over range_start and range_end.
 
         Returns:
             Context manager that yields the streaming HTTP response.
         """
+        url, params, headers = self._build_stream_request(
+            identifier,
+            data_format=data_format,
+            no_var_header=no_var_header,
+            image_thumb=image_thumb,
+            range_start=range_start,
+            range_end=range_end,
+            variables=variables,
+            ranges=ranges,
+        )
+
+        with self.stream_file_context(url, params=params, headers=headers) as response:
+            yield response
+
+    @asynccontextmanager
+    async def astream_datafile(
+        self,
+        identifier: Union[str, int],
+        data_format: Optional[str] = None,
+        no_var_header: Optional[bool] = None,
+        image_thumb: Optional[bool] = None,
+        range_start: Optional[int] = None,
+        range_end: Optional[int] = None,
+        variables: Optional[Sequence[int]] = None,
+        ranges: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> AsyncGenerator[httpx.Response, Any]:
+        """Async counterpart of :meth:`stream_datafile`.
+
+        Requires the async client, i.e. use within ``async with api:``.
+
+        Args:
+            identifier: Identifier of the datafile. Can be datafile id or persistent
+                identifier of the datafile (e. g. doi).
+            data_format: Optional data format parameter for format conversion.
+            no_var_header: Optional parameter to exclude variable header from tabular data.
+            image_thumb: Optional parameter to request image thumbnail instead of full image.
+            range_start: Optional start byte position for Range request (inclusive).
+            range_end: Optional end byte position for Range request (inclusive).
+            variables: Optional variable IDs to subset an ingested tabular file to.
+            ranges: Optional inclusive ``(start, end)`` byte ranges to request at
+                once (see :meth:`stream_datafile`).
+
+        Returns:
+            Async context manager that yields the streaming HTTP response.
+
+        Example:
+            >>> async with data_access_api:
+            ...     async with data_access_api.astream_datafile(42) as response:
+            ...         content = await response.aread()
+        """
+        url, params, headers = self._build_stream_request(
+            identifier,
+            data_format=data_format,
+            no_var_header=no_var_header,
+            image_thumb=image_thumb,
+            range_start=range_start,
+            range_end=range_end,
+            variables=variables,
+            ranges=ranges,
+        )
+
+        async with self.astream_file_context(
+            url, params=params, headers=headers
+        ) as response:
+            yield response
+
+    def _build_stream_request(
+        self,
+        identifier: Union[str, int],
+        data_format: Optional[str] = None,
+        no_var_header: Optional[bool] = None,
+        image_thumb: Optional[bool] = None,
+        range_start: Optional[int] = None,
+        range_end: Optional[int] = None,
+        variables: Optional[Sequence[int]] = None,
+        ranges: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> Tuple[str, Dict[str, Any], Optional[Dict[str, str]]]:
+        """Build the URL, query parameters and headers of a streamed download."""
         if self._is_pid(identifier):
             url = self._assemble_url("datafile/:persistentId/")
-            params = {"persistentId": identifier}
+            params: Dict[str, Any] = {"persistentId": identifier}
         else:
             url = self._assemble_url(f"datafile/{identifier}")
             params = {}
@@ -257,18 +436,64 @@ class DataAccessApi(Api):
             params["noVarHeader"] = no_var_header
         if image_thumb:
             params["imageThumb"] = image_thumb
+        if variables:
+            params["variables"] = ",".join(str(v) for v in variables)
 
         # Build Range header if range parameters are provided
         headers = None
-        if range_start is not None:
+        if ranges:
+            spec = ",".join(f"{start}-{end}" for start, end in ranges)
+            headers = {"Range": f"bytes={spec}"}
+        elif range_start is not None:
             if range_end is not None:
                 range_header = f"bytes={range_start}-{range_end}"
             else:
                 range_header = f"bytes={range_start}-"
             headers = {"Range": range_header}
 
-        with self.stream_file_context(url, params=params, headers=headers) as response:
-            yield response
+        return url, params, headers
+
+    def get_datafile_ddi(
+        self,
+        identifier: Union[str, int],
+        file_metadata_id: Optional[int] = None,
+    ) -> str:
+        """Retrieve the DDI variable metadata of an ingested tabular datafile.
+
+        The DDI codebook is generated during tabular ingest and describes every
+        variable (column) of the file, including its database ID, name, label,
+        format and value categories. It is served without downloading any data.
+
+        HTTP Request:
+
+        .. code-block:: bash
+
+            GET /api/access/datafile/$id/metadata/ddi
+
+        Args:
+            identifier: Identifier of the datafile. Can be datafile id or persistent
+                identifier of the datafile (e. g. doi).
+            file_metadata_id: Optional file metadata ID parameter for specific versions.
+
+        Returns:
+            str: The DDI codebook as an XML string.
+        """
+        if self._is_pid(identifier):
+            url = self._assemble_url("datafile/:persistentId/metadata/ddi")
+            params = {"persistentId": identifier}
+        else:
+            url = self._assemble_url(f"datafile/{identifier}/metadata/ddi")
+            params = {}
+
+        if file_metadata_id:
+            params["fileMetadataId"] = file_metadata_id
+
+        return self.get_request(
+            url,
+            params=params,
+            use_async=self.client is not None,
+            response_model=str,
+        )
 
     def get_datafiles(
         self,
@@ -1,9 +1,10 @@
-import asyncio
 import json
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     IO,
+    TYPE_CHECKING,
     Annotated,
     Any,
     Dict,
@@ -15,11 +16,12 @@ from typing import (
     Union,
     overload,
 )
+from urllib.parse import urljoin
 
 import deprecation
 import httpx
 import pandas as pd
-from pydantic import computed_field
+from pydantic import Field, PrivateAttr, computed_field
 
 from pyDataverse.models.dataset import locks
 from pyDataverse.models.file import update
@@ -41,9 +43,16 @@ from .utilities import crawl_collection
 from .utilities.ds_fetcher import conc_get_datasets
 from .utilities.fileinput import file_input
 
+if TYPE_CHECKING:
+    from ..filesystem.direct import DirectUploader
+
 # Type alias for version string
 Version = Literal[":draft", ":latest"] | str
 
+# Local files at least this large are uploaded straight to object storage when
+# the dataset's storage driver allows it; smaller files go through Dataverse.
+DEFAULT_DIRECT_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+
 
 class NativeApi(Api):
     """Class to access Dataverse's Native API.
@@ -55,8 +64,18 @@ class NativeApi(Api):
         base_url: Base URL of the Dataverse instance.
         api_token: API token for authentication.
         api_version: API version to use.
+        direct_upload_threshold: Size in bytes from which local files passed
+            by path to ``upload_datafile`` and ``replace_datafile`` are
+            uploaded straight to object storage. None disables this.
     """
 
+    direct_upload_threshold: Optional[int] = Field(
+        default=DEFAULT_DIRECT_UPLOAD_THRESHOLD,
+        description="Size in bytes from which local files are uploaded straight to object storage, where the dataset's store allows it. None disables direct uploads.",
+    )
+
+    _direct_uploader: Optional["DirectUploader"] = PrivateAttr(default=None)
+
     @computed_field
     @property
     def base_url_api_native(self) -> str:
@@ -497,15 +516,7 @@ class NativeApi(Api):
             >>> api = NativeApi(base_url="https://demo.dataverse.org")
             >>> datasets = api.get_datasets([123, 456, "doi:10.11587/8H3N93"])
         """
-        self._setup_async_client()
-
-        try:
-            result = asyncio.run(conc_get_datasets(self, identifiers))
-            self.client = None
-            return result
-        except Exception as e:
-            self.client = None
-            raise e
+        return self._run_async(lambda api: conc_get_datasets(api, identifiers))
 
     def get_dataset_persistent_url(self, identifier: Union[str, int]) -> str:
         """Retrieve the persistent URL for a dataset.
@@ -1455,9 +1466,23 @@ class NativeApi(Api):
             filename: Full path to the file to upload.
             metadata: Optional JSON string containing file metadata (description, tags, directoryLabel, etc.).
 
+        Local files passed by path that are at least
+        ``direct_upload_threshold`` bytes large are uploaded straight to the
+        dataset's object storage instead, if its storage driver allows it
+        (see :class:`~pyDataverse.filesystem.DirectUploader`).
+
         Returns:
             Response object with upload confirmation and file information.
         """
+        payload = self._parse_payload(
+            payload=metadata,
+            model=UploadBody,
+        )
+
+        uploader = self._get_direct_uploader(identifier, file)
+        if uploader is not None:
+            return uploader.upload(identifier, file, payload)  # type: ignore[arg-type]
+
         params = {}
         if self._is_pid(identifier):
             url = self._assemble_url("datasets/:persistentId/add")
@@ -1465,11 +1490,6 @@ class NativeApi(Api):
         else:
             url = self._assemble_url(f"datasets/{identifier}/add")
 
-        payload = self._parse_payload(
-            payload=metadata,
-            model=UploadBody,
-        )
-
         files: dict[str, Any] = file_input(file, metadata=payload)
 
         if payload is not None:
@@ -1602,6 +1622,7 @@ class NativeApi(Api):
         identifier: Union[str, int],
         file: Union[str, Path, IO[str], IO[bytes]],
         metadata: Payload[file.UploadBody],
+        dataset_identifier: Optional[Union[str, int]] = None,
     ):
         """Replace datafile.
 
@@ -1619,11 +1640,31 @@ class NativeApi(Api):
             json_str: Metadata as JSON string.
             is_filepid: ``True`` if ``identifier`` is a persistent identifier for the datafile.
                 ``False``, if not.
+            dataset_identifier: Identifier of the file's dataset. If given,
+                local files passed by path that are at least
+                ``direct_upload_threshold`` bytes large are uploaded straight
+                to the dataset's object storage, if its storage driver allows
+                it.
 
         Returns:
             The json string responded by the CURL request, converted to a
             dict().
         """
+        payload = self._parse_payload(
+            payload=metadata,
+            model=UploadBody,
+        )
+
+        if dataset_identifier is not None:
+            uploader = self._get_direct_uploader(dataset_identifier, file)
+            if uploader is not None:
+                return uploader.upload(
+                    dataset_identifier,
+                    file,  # type: ignore[arg-type]
+                    payload,
+                    replace=identifier,
+                )
+
         params = {}
 
         if self._is_pid(identifier):
@@ -1632,10 +1673,6 @@ class NativeApi(Api):
         else:
             url = self._assemble_url(f"files/{identifier}/replace")
 
-        payload = self._parse_payload(
-            payload=metadata,
-            model=UploadBody,
-        )
         files = file_input(file, metadata=payload)
 
         return self.post_request(
@@ -1648,6 +1685,224 @@ class NativeApi(Api):
             response_model=UploadResponse,
         )
 
+    def _get_direct_uploader(
+        self,
+        identifier: Union[str, int],
+        file: Union[str, Path, IO[str], IO[bytes]],
+    ) -> Optional["DirectUploader"]:
+        """Get the direct uploader if a file should be uploaded with it.
+
+        Only sync uploads of local files passed by path and at least
+        ``direct_upload_threshold`` bytes large qualify, and only if the
+        dataset's storage driver allows direct upload.
+        """
+        if self.client is not None or self.direct_upload_threshold is None:
+            return None
+        if not isinstance(file, (str, Path)):
+            return None
+        if os.path.getsize(file) < self.direct_upload_threshold:
+            return None
+
+        from ..filesystem.direct import DirectUploader
+
+        if self._direct_uploader is None:
+            self._direct_uploader = DirectUploader(self)
+        if not self._direct_uploader.supports(identifier):
+            return None
+        return self._direct_uploader
+
+    def get_dataset_storage_driver(
+        self,
+        identifier: Union[str, int],
+    ) -> dataset.StorageDriver:
+        """Get the storage driver a dataset stores its files with.
+
+        The driver tells whether the dataset accepts direct uploads to object
+        storage (see :meth:`get_datafile_upload_urls`).
+
+        HTTP: GET /api/datasets/{id}/storageDriver
+        HTTP: GET /api/datasets/:persistentId/storageDriver?persistentId={identifier}
+        Docs: https://guides.dataverse.org/en/latest/api/native-api.html#configure-a-dataset-to-store-all-new-files-in-a-specific-file-store
+
+        Args:
+            identifier: Dataset identifier - either a persistent ID or numeric database ID.
+
+        Returns:
+            The dataset's storage driver.
+        """
+        params = {}
+        if self._is_pid(identifier):
+            url = self._assemble_url("datasets/:persistentId/storageDriver")
+            params["persistentId"] = identifier
+        else:
+            url = self._assemble_url(f"datasets/{identifier}/storageDriver")
+
+        return self.get_request(
+            url,
+            params=params,
+            use_async=self.client is not None,
+            response_model=dataset.StorageDriver,
+        )
+
+    def get_datafile_upload_urls(
+        self,
+        identifier: Union[str, int],
+        size: int,
+    ) -> file.UploadUrls:
+        """Request presigned URLs to upload a file directly to object storage.
+
+        Small files get a single ``url`` to PUT the content to. Larger files
+        get one URL per part (``urls``, keyed by part number starting at 1)
+        plus the ``complete`` and ``abort`` paths of the multipart upload.
+        The returned storage identifier registers the file afterwards
+        (see :meth:`register_datafile`).
+
+        HTTP: GET /api/datasets/{id}/uploadurls?size={size}
+        HTTP: GET /api/datasets/:persistentId/uploadurls?persistentId={identifier}&size={size}
+        Docs: https://guides.dataverse.org/en/latest/developers/s3-direct-upload-api.html
+
+        Args:
+            identifier: Dataset identifier - either a persistent ID or numeric database ID.
+            size: Size of the file in bytes.
+
+        Returns:
+            The upload URLs, part size and storage identifier.
+        """
+        params: Dict[str, Any] = {"size": size}
+        if self._is_pid(identifier):
+            url = self._assemble_url("datasets/:persistentId/uploadurls")
+            params["persistentId"] = identifier
+        else:
+            url = self._assemble_url(f"datasets/{identifier}/uploadurls")
+
+        return self.get_request(
+            url,
+            params=params,
+            use_async=self.client is not None,
+            response_model=file.UploadUrls,
+        )
+
+    def complete_multipart_upload(
+        self,
+        path: str,
+        etags: Dict[str, str],
+    ) -> httpx.Response:
+        """Complete a direct multipart upload.
+
+        HTTP: PUT {complete path returned by get_datafile_upload_urls}
+
+        Args:
+            path: The ``complete`` path from :meth:`get_datafile_upload_urls`.
+            etags: ETag of each uploaded part, keyed by part number.
+
+        Returns:
+            Response object of httpx library.
+        """
+        return self.put_request(
+            urljoin(self.base_url, path),
+            data=etags,
+            use_async=self.client is not None,
+        )
+
+    def abort_multipart_upload(self, path: str) -> httpx.Response:
+        """Abort a direct multipart upload and delete its uploaded parts.
+
+        HTTP: DELETE {abort path returned by get_datafile_upload_urls}
+
+        Args:
+            path: The ``abort`` path from :meth:`get_datafile_upload_urls`.
+
+        Returns:
+            Response object of httpx library.
+        """
+        return self.delete_request(
+            urljoin(self.base_url, path),
+            use_async=self.client is not None,
+        )
+
+    def register_datafile(
+        self,
+        identifier: Union[str, int],
+        metadata: Payload[file.DirectUploadBody],
+    ) -> file.UploadResponse:
+        """Add a file that was uploaded directly to object storage to a dataset.
+
+        HTTP: POST /api/datasets/{id}/add
+        HTTP: POST /api/datasets/:persistentId/add?persistentId={identifier}
+        Docs: https://guides.dataverse.org/en/latest/developers/s3-direct-upload-api.html#adding-the-uploaded-file-to-the-dataset
+
+        Args:
+            identifier: Dataset identifier - either a persistent ID or numeric database ID.
+            metadata: Storage identifier, name, checksum and metadata of the file.
+
+        Returns:
+            Response object with upload confirmation and file information.
+        """
+        params = {}
+        if self._is_pid(identifier):
+            url = self._assemble_url("datasets/:persistentId/add")
+            params["persistentId"] = identifier
+        else:
+            url = self._assemble_url(f"datasets/{identifier}/add")
+
+        return self._post_direct_upload_body(url, params, metadata)
+
+    def register_replacement_datafile(
+        self,
+        identifier: Union[str, int],
+        metadata: Payload[file.DirectUploadBody],
+    ) -> file.UploadResponse:
+        """Replace a datafile with a file uploaded directly to object storage.
+
+        HTTP: POST /api/files/{id}/replace
+        HTTP: POST /api/files/:persistentId/replace?persistentId={identifier}
+        Docs: https://guides.dataverse.org/en/latest/developers/s3-direct-upload-api.html#replacing-an-existing-file-in-the-dataset
+
+        Args:
+            identifier: Identifier of the file to be replaced.
+            metadata: Storage identifier, name, checksum and metadata of the file.
+
+        Returns:
+            Response object with upload confirmation and file information.
+        """
+        params = {}
+        if self._is_pid(identifier):
+            url = self._assemble_url("files/:persistentId/replace")
+            params["persistentId"] = identifier
+        else:
+            url = self._assemble_url(f"files/{identifier}/replace")
+
+        return self._post_direct_upload_body(url, params, metadata)
+
+    def _post_direct_upload_body(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        metadata: Payload[file.DirectUploadBody],
+    ) -> file.UploadResponse:
+        """Post the ``jsonData`` form field that registers a direct upload."""
+        payload = self._parse_payload(
+            payload=metadata,
+            model=file.DirectUploadBody,
+        )
+
+        # Sent as a plain multipart field: the endpoint expects form data, but
+        # there is no file part for directly uploaded content.
+        files = {
+            "jsonData": (
+                None,
+                payload.model_dump_json(by_alias=True, exclude_none=True),
+            )
+        }
+
+        return self.post_request(
+            url,
+            files=files,
+            params=params,
+            use_async=self.client is not None,
+            response_model=UploadResponse,
+        )
+
     def get_info_version(self) -> info.VersionResponse:
         """Get the Dataverse version and build number.
 
@@ -2055,15 +2310,14 @@ class NativeApi(Api):
         optionally filter the results to return only specific types of children
         (collections or datasets).
 
-        The method automatically sets up an async client internally to perform
-        concurrent API calls when recursive traversal is enabled, improving
-        performance when dealing with large collection hierarchies. The async
-        client is properly cleaned up after the operation completes or if an
-        error occurs.
+        The method uses the async client of the API's background event loop
+        to perform concurrent API calls when recursive traversal is enabled,
+        improving performance when dealing with large collection hierarchies.
+        The client's connections are reused across calls.
 
         Note:
-            This method runs the asynchronous crawling operation in a new event
-            loop using asyncio.run(). If you're already in an async context,
+            This method runs the asynchronous crawling operation on the API's
+            background event loop. If you're already in an async context,
             consider using the async crawl_collection function directly instead.
 
         Args:
@@ -2090,9 +2344,8 @@ class NativeApi(Api):
 
         Raises:
             Exception: Any exception that occurs during the crawling operation
-                is re-raised after properly cleaning up the async client. This
-                could include network errors, authentication errors, or API
-                response parsing errors.
+                is re-raised. This could include network errors, authentication
+                errors, or API response parsing errors.
 
         Examples:
             Get all children from a collection::
@@ -2134,23 +2387,19 @@ class NativeApi(Api):
             - :meth:`get_dataverse_contents`: For getting immediate contents
               of a single dataverse without recursion.
         """
-        try:
-            collection_url = self._assemble_url(f"dataverses/{alias}")
-            self.logger.info(
-                f"Crawling collection [link={collection_url}]{alias}[/link] filtering by [green]{filter_by}[/green]"
-            )
+        collection_url = self._assemble_url(f"dataverses/{alias}")
+        self.logger.info(
+            f"Crawling collection [link={collection_url}]{alias}[/link] filtering by [green]{filter_by}[/green]"
+        )
 
-            self._setup_async_client()
-            response = asyncio.run(crawl_collection(self, alias, filter_by, recursive))
+        response = self._run_async(
+            lambda api: crawl_collection(api, alias, filter_by, recursive)
+        )
 
-            self.client = None
-            self.logger.info(
-                f"Crawled collection [link={collection_url}]{alias}[/link] filtered by [green]{filter_by}[/green]"
-            )
-            return response
-        except Exception as e:
-            self.client = None
-            raise e
+        self.logger.info(
+            f"Crawled collection [link={collection_url}]{alias}[/link] filtered by [green]{filter_by}[/green]"
+        )
+        return response
 
     @deprecation.deprecated(
         deprecated_in="0.4.0",
@@ -1,12 +1,17 @@
 import asyncio
-import json
-from typing import Any, Dict, Literal, Sequence, Union, overload
+from typing import Any, Dict, Literal, Optional, Sequence, Tuple, Union, overload
 
-from pydantic import computed_field
+from pydantic import Field, PrivateAttr, computed_field
 from rdflib import Graph, URIRef
+from rdflib.plugins.parsers.jsonld import to_rdf
 
 from ..models import collection
 from .api import Api
+from .utilities.contextcache import ContextCache
+
+# schema.org URIs are normalized from HTTP to HTTPS
+_HTTP_SCHEMA_ORG = "http://schema.org/"
+_HTTPS_SCHEMA_ORG = "https://schema.org/"
 
 
 class SemanticApi(Api):
@@ -27,6 +32,8 @@ class SemanticApi(Api):
         api_token: Optional API token for authentication. Required for accessing
             private datasets or performing operations that require authentication.
         api_version: Version of the Dataverse API to use. Defaults to the latest version.
+        context_cache_dir: Optional directory for the on-disk cache of remote
+            JSON-LD contexts. Contexts are cached in memory only if not set.
 
     Attributes:
         base_url_api_native: The base URL for native API endpoints.
@@ -54,6 +61,30 @@ class SemanticApi(Api):
             >>> print(f"Retrieved {len(all_metadata)} datasets")
     """
 
+    context_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the on-disk cache of remote JSON-LD contexts",
+        repr=False,
+    )
+
+    _context_cache: Optional[ContextCache] = PrivateAttr(default=None)
+
+    @property
+    def context_cache(self) -> ContextCache:
+        """Get the cache of remote JSON-LD contexts used when parsing graphs.
+
+        Without ``context_cache_dir``, the process-wide in-memory cache is
+        used, so each context is fetched once per process.
+
+        Returns:
+            ContextCache: The cache.
+        """
+        if self.context_cache_dir is None:
+            return ContextCache.shared()
+        if self._context_cache is None:
+            self._context_cache = ContextCache(self.context_cache_dir)
+        return self._context_cache
+
     @computed_field
     @property
     def base_url_api_native(self) -> str:
@@ -275,7 +306,9 @@ class SemanticApi(Api):
             for identifier in identifiers
         ]
 
-        datasets = asyncio.run(self._get_datasets(identifiers, batch_size))
+        datasets = self._run_async(
+            lambda api: api._get_datasets(identifiers, batch_size)
+        )
         if as_graph:
             return self.responses_to_graph(datasets)
         else:
@@ -293,12 +326,10 @@ class SemanticApi(Api):
         identifiers in batches to optimize performance while managing system resources.
 
         The method works by:
-        1. Setting up an async HTTP client context
-        2. Dividing the identifier list into batches of the specified size
-        3. Creating concurrent tasks for each identifier in a batch
-        4. Using asyncio.gather to execute all tasks in a batch simultaneously
-        5. Collecting and extending results from each batch
-        6. Properly cleaning up the async client when done
+        1. Dividing the identifier list into batches of the specified size
+        2. Creating concurrent tasks for each identifier in a batch
+        3. Using asyncio.gather to execute all tasks in a batch simultaneously
+        4. Collecting and extending results from each batch
 
         Args:
             identifiers: A sequence of dataset identifiers (persistent IDs or numeric IDs).
@@ -316,18 +347,18 @@ class SemanticApi(Api):
 
         Note:
             This method is intended for internal use by the get_datasets method.
-            It requires an async context and proper client lifecycle management.
+            It must be called on an API copy bound to an async client, such as
+            the one ``_run_async`` passes.
             Use get_datasets for synchronous access to this functionality.
         """
 
-        async with self:
-            results = []
-            for i in range(0, len(identifiers), batch_size):
-                batch = identifiers[i : i + batch_size]
-                tasks = [self.get_dataset(identifier) for identifier in batch]
-                batch_results = await asyncio.gather(*tasks)  # type: ignore
-                results.extend(batch_results)
-            return results
+        results = []
+        for i in range(0, len(identifiers), batch_size):
+            batch = identifiers[i : i + batch_size]
+            tasks = [self.get_dataset(identifier) for identifier in batch]
+            batch_results = await asyncio.gather(*tasks)  # type: ignore
+            results.extend(batch_results)
+        return results
 
     def response_to_graph(
         self,
@@ -409,28 +440,9 @@ class SemanticApi(Api):
             and context from the original JSON-LD, making it suitable for advanced
             semantic web applications and linked data workflows.
         """
-        # Extract base URI from response to prevent local file path resolution
-        # Prefer @id, then url, then use base_url as fallback
-        base_uri = None
-        if "@id" in response:
-            base_uri = response["@id"]
-        elif "url" in response:
-            base_uri = response["url"]
-        elif hasattr(self, "base_url") and self.base_url:
-            base_uri = self.base_url
-
-        # Parse with base URI to prevent RDFLib from resolving relative paths
-        # against the current working directory
-        if base_uri:
-            graph = Graph().parse(
-                data=json.dumps(response), format="json-ld", base=base_uri
-            )
-        else:
-            graph = Graph().parse(data=json.dumps(response), format="json-ld")
-
-        if normalize_uris:
-            graph = self._normalize_schema_org_uris(graph)
-        return graph
+        graph = _SchemaOrgGraph() if normalize_uris else Graph()
+        self._parse_into(graph, response)
+        return _plain(graph)
 
     def responses_to_graph(
         self, responses: Sequence[Dict[str, Any]], normalize_uris: bool = True
@@ -451,69 +463,70 @@ class SemanticApi(Api):
         Returns:
             Graph: An RDFLib Graph object containing all triples from the responses.
         """
-        graphs = [
-            self.response_to_graph(response, normalize_uris=normalize_uris)
-            for response in responses
-        ]
-        graph = graphs[0]
-        for g in graphs[1:]:
-            graph += g
-        return graph
+        graph = _SchemaOrgGraph() if normalize_uris else Graph()
+        for response in responses:
+            self._parse_into(graph, response)
+        return _plain(graph)
 
-    def _normalize_schema_org_uris(self, graph: Graph) -> Graph:
-        """Normalize HTTP schema.org URIs to HTTPS to consolidate prefixes.
+    def _parse_into(self, graph: Graph, response: Dict[str, Any]) -> None:
+        """Parse a JSON-LD response into a graph.
 
-        Optimized single-pass implementation using string slicing and minimal allocations.
-        RDFLib doesn't provide built-in URI normalization, so we create a new graph efficiently.
+        The parsed dict is handed to rdflib's JSON-LD processor as is, and
+        remote contexts are taken from :attr:`context_cache`.
 
-        This helper method replaces all occurrences of http://schema.org/ URIs
-        with https://schema.org/ URIs in the graph. This is done to ensure the
-        correct one is used, since there are clashes between HTTP and HTTPS versions
-        of schema.org URIs in the JSON-LD data from Dataverse, which causes RDFLib
-        to create separate prefixes (e.g., `schema:` and `schema1:`) in Turtle serialization.
+        Args:
+            graph: The graph to add the triples to.
+            response: The JSON-LD response.
+        """
+        context = response.get("@context")
+        if context is not None:
+            resolved = self.context_cache.resolve(context)
+            if resolved is not context:
+                response = {**response, "@context": resolved}
 
-        By normalizing to HTTPS (the commonly used and official standard for schema.org),
-        all schema.org URIs are consolidated into a single prefix, resulting in cleaner
-        and more consistent Turtle output.
+        # Extract base URI from response to prevent local file path resolution
+        # Prefer @id, then url, then use base_url as fallback
+        base_uri = None
+        if "@id" in response:
+            base_uri = response["@id"]
+        elif "url" in response:
+            base_uri = response["url"]
+        elif hasattr(self, "base_url") and self.base_url:
+            base_uri = self.base_url
 
-        Args:
-            graph: The RDFLib Graph to normalize.
+        to_rdf(response, graph, base=base_uri, version=1.1)
 
-        Returns:
-            Graph: A new Graph with normalized URIs (HTTP schema.org URIs replaced
-            with HTTPS equivalents), or the original graph if no normalization occurred.
-        """
-        # Constants for performance
-        HTTP_PREFIX = "http://schema.org/"
-        HTTPS_PREFIX = "https://schema.org/"
-        PREFIX_LEN = 18
-
-        # Helper function to normalize a single URIRef (reduces code duplication)
-        uri_cache = {}
-
-        def normalize_uri(uri):
-            if isinstance(uri, URIRef):
-                uri_str = str(uri)
-                if uri_str.startswith(HTTP_PREFIX):
-                    return uri_cache.setdefault(
-                        uri_str, URIRef(HTTPS_PREFIX + uri_str[PREFIX_LEN:])
-                    )
-            return uri
-
-        # Single-pass: normalize and build graph, track if any normalization occurred
-        normalized_graph = Graph()
-        needs_normalization = False
-
-        for s, p, o in graph:
-            s_norm = normalize_uri(s)
-            p_norm = normalize_uri(p)
-            o_norm = normalize_uri(o)
-
-            # Track if normalization occurred (for early return optimization)
-            if s_norm is not s or p_norm is not p or o_norm is not o:
-                needs_normalization = True
-
-            normalized_graph.add((s_norm, p_norm, o_norm))
-
-        # Return original graph if no normalization occurred (zero-copy optimization)
-        return graph if not needs_normalization else normalized_graph
+
+class _SchemaOrgGraph(Graph):
+    """Graph that normalizes HTTP schema.org URIs to HTTPS as triples are added.
+
+    rdflib's JSON-LD processor adds triples one by one, so normalizing here
+    avoids copying the parsed graph. The HTTP and HTTPS schema.org URIs clash
+    in Dataverse's JSON-LD, which otherwise makes rdflib emit duplicate
+    prefixes (``schema:`` and ``schema1:``) in Turtle serialization.
+    """
+
+    def add(self, triple: Tuple[Any, Any, Any]) -> "_SchemaOrgGraph":
+        s, p, o = triple
+        return super().add((_normalize_uri(s), _normalize_uri(p), _normalize_uri(o)))
+
+    def bind(self, prefix, namespace, *args, **kwargs) -> None:
+        super().bind(prefix, _normalize_uri(URIRef(namespace)), *args, **kwargs)
+
+
+def _normalize_uri(term: Any) -> Any:
+    """Return an HTTP schema.org URI as HTTPS and any other term unchanged."""
+    if isinstance(term, URIRef) and term.startswith(_HTTP_SCHEMA_ORG):
+        return URIRef(_HTTPS_SCHEMA_ORG + term[len(_HTTP_SCHEMA_ORG) :])
+    return term
+
+
+def _plain(graph: Graph) -> Graph:
+    """Return a plain Graph over the same store, without copying triples."""
+    if type(graph) is Graph:
+        return graph
+    return Graph(
+        store=graph.store,
+        identifier=graph.identifier,
+        namespace_manager=graph.namespace_manager,
+    )
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+from rdflib.plugins.shared.jsonld.util import source_to_json
+
+_SUFFIX = ".json"
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: Optional[ContextCache] = None
+
+
+class ContextCache:
+    """Cache of the remote JSON-LD context documents used by exports.
+
+    Some exports refer to their JSON-LD context by URL, e.g. the schema.org
+    export uses ``"@context": "http://schema.org"``. rdflib fetches such a
+    context on every parse, so converting the exports of many datasets to
+    graphs meant one context download per dataset. This cache fetches each
+    context once and replaces the URL with the document before parsing.
+
+    Documents are kept in memory, and on disk if a directory is given, so
+    that later processes parse without going to the network at all. Context
+    documents are versioned by their URL and are not expired; call
+    :meth:`clear` to fetch them again.
+
+    Attributes:
+        directory: Directory the documents are stored in, or None to keep
+            them in memory only.
+
+    Example:
+        >>> api = SemanticApi(
+        ...     base_url="https://demo.dataverse.org",
+        ...     context_cache_dir="~/.cache/pyDataverse/contexts",
+        ... )
+        >>> api.context_cache.resolve("http://schema.org")["@vocab"]
+        'http://schema.org/'
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory to store the documents in. Kept in memory
+                only if None.
+        """
+        self.directory = Path(directory).expanduser() if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._documents: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> ContextCache:
+        """Get the process-wide in-memory cache used by APIs without a directory.
+
+        Returns:
+            ContextCache: The shared cache.
+        """
+        global _SHARED
+        with _SHARED_LOCK:
+            if _SHARED is None:
+                _SHARED = cls()
+            return _SHARED
+
+    def get(self, url: str) -> Any:
+        """Get a context document, fetching it on first use.
+
+        Args:
+            url: URL of the context.
+
+        Returns:
+            The context document, usually a dict with an ``@context`` key.
+        """
+        with self._lock:
+            if url in self._documents:
+                return self._documents[url]
+
+        document = self._load(url)
+        if document is None:
+            document = _fetch_context(url)
+            self._store(url, document)
+
+        with self._lock:
+            return self._documents.setdefault(url, document)
+
+    def put(self, url: str, document: Any) -> None:
+        """Store a context document, e.g. to provide it without network access.
+
+        Args:
+            url: URL of the context.
+            document: The context document.
+        """
+        self._store(url, document)
+        with self._lock:
+            self._documents[url] = document
+
+    def resolve(self, context: Any) -> Any:
+        """Replace the remote context URLs of an ``@context`` value by their contexts.
+
+        Inline contexts are returned as they are. Lists are resolved item by
+        item, and remote contexts that refer to further remote contexts are
+        resolved in turn.
+
+        Args:
+            context: The ``@context`` value of a JSON-LD document.
+
+        Returns:
+            The context without remote references. The same object is returned
+            if there was nothing to replace.
+        """
+        return self._resolve(context, frozenset())
+
+    def clear(self) -> None:
+        """Drop all cached documents, in memory and on disk."""
+        with self._lock:
+            self._documents.clear()
+
+        if self.directory is None:
+            return
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _resolve(self, context: Any, seen: FrozenSet[str]) -> Any:
+        if isinstance(context, list):
+            resolved = [self._resolve(item, seen) for item in context]
+            if all(new is old for new, old in zip(resolved, context)):
+                return context
+            return resolved
+
+        # Recursive inclusions and relative references are left to rdflib
+        if not isinstance(context, str) or context in seen:
+            return context
+        if not context.startswith(("http://", "https://")):
+            return context
+
+        document = self.get(context)
+        if not isinstance(document, dict) or "@context" not in document:
+            return context
+        return self._resolve(document["@context"], seen | {context})
+
+    def _path(self, url: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    def _load(self, url: str) -> Optional[Any]:
+        path = self._path(url)
+        if path is None:
+            return None
+        try:
+            with open(path) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        return entry.get("document")
+
+    def _store(self, url: str, document: Any) -> None:
+        path = self._path(url)
+        if path is None:
+            return
+
+        assert self.directory is not None
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as entry_file:
+                json.dump({"url": url, "document": document}, entry_file)
+            os.replace(name, path)
+        except OSError:
+            try:
+                os.unlink(name)
+            except FileNotFoundError:
+                pass
+
+
+def _fetch_context(url: str) -> Any:
+    """Fetch a context document the way rdflib's JSON-LD parser does."""
+    document, _ = source_to_json(url)
+    return document
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+if TYPE_CHECKING:
+    from pyDataverse.api.api import Api
+
+T = TypeVar("T")
+ApiT = TypeVar("ApiT", bound="Api")
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: Optional[BackgroundLoop] = None
+
+# Settings an async client is created with: timeout, connection limits and
+# the credential whose session cookies the client's cookie jar holds.
+_ClientKey = Tuple[int, int, int, Optional[str]]
+
+
+class BackgroundLoop:
+    """A long-lived event loop on a background thread for the sync API.
+
+    Sync methods that run requests concurrently submit their coroutines to
+    this loop and block until they finish, instead of starting a new loop
+    with ``asyncio.run`` on every call. This works the same whether or not
+    the calling thread already runs an event loop (e.g. in Jupyter), and the
+    loop's ``httpx.AsyncClient`` instances keep their connection pools across
+    calls. APIs bound to the loop share a client only if they have the same
+    timeout, connection limits and credential.
+
+    The thread is started on first use and is a daemon thread, so it does
+    not keep the interpreter alive.
+
+    Example:
+        >>> loop = BackgroundLoop()
+        >>> api = NativeApi(base_url="https://demo.dataverse.org")
+        >>> async_api = loop.bind(api)
+        >>> dataset = loop.run(async_api.get_dataset("doi:10.5072/FK2/ABC123"))
+        >>> loop.close()
+    """
+
+    def __init__(self, name: str = "pyDataverse-loop"):
+        """Initialize the loop without starting its thread.
+
+        Args:
+            name: Name of the background thread.
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._clients: Dict[_ClientKey, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> BackgroundLoop:
+        """Get the process-wide loop used by API instances without their own.
+
+        Returns:
+            BackgroundLoop: The shared loop.
+        """
+        global _SHARED
+        with _SHARED_LOCK:
+            if _SHARED is None:
+                _SHARED = cls(name="pyDataverse-shared-loop")
+            return _SHARED
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, started on first access."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from a coroutine running on this loop,
+                which would block the loop forever. Await the coroutine
+                instead.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError(
+                "Cannot block on the background loop from one of its own "
+                "coroutines. Await the async API instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def bind(self, api: ApiT) -> ApiT:
+        """Get a copy of an API instance that sends requests asynchronously.
+
+        The copy's request methods return coroutines, which must run on this
+        loop. Copies of APIs with the same timeout, connection limits and
+        credential share one ``httpx.AsyncClient`` and its connection pool;
+        others get a client of their own, so no API runs with another's
+        settings or sends another user's session cookies.
+
+        Args:
+            api: The API instance to copy.
+
+        Returns:
+            The async copy.
+        """
+        from pyDataverse.filesystem.metacache import auth_credential
+
+        key = (
+            api.timeout,
+            api.max_connections,
+            api.max_keepalive_connections,
+            auth_credential(api.auth),
+        )
+        bound = type(api).from_api(api)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.AsyncClient(
+                    follow_redirects=True,
+                    timeout=api.timeout,
+                    limits=httpx.Limits(
+                        max_connections=api.max_connections,
+                        max_keepalive_connections=api.max_keepalive_connections,
+                    ),
+                )
+            bound.client = client
+        return bound
+
+    def close(self) -> None:
+        """Close the clients and stop the loop and its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            clients = list(self._clients.values())
+            self._loop = self._thread = None
+            self._clients.clear()
+
+        if loop is None or loop.is_closed():
+            return
+        if thread is threading.current_thread():
+            # Called on the loop itself, e.g. by a finalizer; waiting for the
+            # clients to close would block the loop forever.
+            loop.stop()
+            return
+        for client in clients:
+            try:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+            except Exception:  # noqa: BLE001 - best effort on shutdown
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+            loop.close()
@@ -3,6 +3,7 @@ from .contentbase import ContentBase
 from .dataset import Dataset
 from .dataverse import Author, Contact, Dataverse, Subject
 from .file import File
+from .summary import DatasetSummary
 
 ContentBase.model_rebuild()
 Collection.model_rebuild()
@@ -15,5 +16,6 @@ __all__ = [
     "Contact",
     "Subject",
     "Dataset",
+    "DatasetSummary",
     "File",
 ]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import math
+import warnings
+from collections import Counter, defaultdict
 from functools import cached_property
+from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Coroutine,
     Dict,
     List,
     Literal,
     Optional,
+    Set,
+    Tuple,
     TypeAlias,
     Union,
 )
@@ -16,11 +25,17 @@ from typing import (
 import pandas as pd
 from asyncer import asyncify
 from pydantic import Field, PrivateAttr
-from rdflib import BNode, Graph
-from rich.progress import Progress
+from rdflib import BNode, Graph, URIRef
+from rdflib import Dataset as RDFDataset
 from typing_extensions import TypedDict
 
-from pyDataverse.dataverse.dataset import GraphFormat
+from pyDataverse.dataverse.dataset import (
+    GraphFormat,
+    _add_missing_id,
+    _export_async,
+    _exports_to_graph,
+    _graph_formats,
+)
 from pyDataverse.models import info
 
 from ..api.search import QueryOptions
@@ -30,11 +45,19 @@ from .contentbase import ContentBase
 from .dataverse import Author, Contact, Subject
 from .metrics import Metrics
 from .search import SearchResult
+from .summary import DatasetSummary
 
 if TYPE_CHECKING:
     from .dataset import Dataset
 
 
+# Largest page the search API returns
+_SEARCH_PAGE_SIZE = 1000
+
+# Pages searched beyond those the direct children fill, for results from
+# nested collections; children the index has not seen are fetched one by one
+_SEARCH_EXTRA_PAGES = 2
+
 # Type alias for the raw content types
 RawContentTypes: TypeAlias = List[
     Union[collection.content.Collection, collection.content.Dataset]
@@ -49,6 +72,10 @@ ParsedContentTypes: TypeAlias = List[
 ]
 
 
+# Marks blank node objects in signatures, so colors never equal literal values
+_BLANK = object()
+
+
 # Type alias for the content type
 class Content(TypedDict):
     identifier: str
@@ -61,15 +88,22 @@ def _deduplicate_blank_nodes(graph: Graph) -> Graph:
 
     When merging RDF graphs from multiple sources, blank nodes from different
     graphs are treated as distinct entities even if they have identical properties.
-    This function identifies blank nodes with the same property signatures
-    (excluding self-referential properties) and merges them into a single node.
+    This function identifies blank nodes that describe the same structure and
+    merges them into a single node, in place.
+
+    Blank nodes are compared by iterative signatures, as in RDF canonicalization:
+    every blank node starts with the same color, and each round recolors it by
+    its outgoing ``(predicate, object)`` pairs, with blank node objects replaced
+    by their current color. Rounds repeat until no color class splits, so nested
+    structures (e.g. authors with affiliations) merge whenever they are equal
+    at every level. All rounds run over an index built in a single pass over
+    the graph, and only the triples of merged nodes are rewritten.
 
     Args:
         graph: The RDF graph to deduplicate. Must be a valid rdflib Graph instance.
 
     Returns:
-        A new Graph with deduplicated blank nodes. If no duplicates are found,
-        returns the original graph unchanged.
+        The same graph, with duplicate blank nodes merged.
 
     Note:
         Self-referential properties (e.g., a blank node pointing to itself via
@@ -79,43 +113,69 @@ def _deduplicate_blank_nodes(graph: Graph) -> Graph:
     if not graph:
         return graph
 
-    # Collect all blank nodes appearing as subjects or objects
-    blank_nodes = {s for s, _, _ in graph if isinstance(s, BNode)}
-    blank_nodes.update({o for _, _, o in graph if isinstance(o, BNode)})
-
-    if not blank_nodes:
+    # Single pass: outgoing properties of blank nodes, and where blank nodes
+    # are used as objects. Dict order keeps the first node seen canonical.
+    outgoing: Dict[BNode, List[Tuple[Any, Any]]] = {}
+    incoming: Dict[BNode, List[Tuple[Any, Any]]] = defaultdict(list)
+    for s, p, o in graph:
+        if isinstance(s, BNode):
+            outgoing.setdefault(s, [])
+            if o != s:
+                outgoing[s].append((p, o))
+        if isinstance(o, BNode):
+            outgoing.setdefault(o, [])
+            incoming[o].append((s, p))
+
+    if len(outgoing) < 2:
         return graph
 
-    # Group blank nodes by their property signature (excluding self-references)
-    signatures: defaultdict[frozenset[tuple], list[BNode]] = defaultdict(list)  # type: ignore[type-arg]
-    for bnode in blank_nodes:
-        # Get all triples where bnode is subject, excluding self-referential ones
-        props = frozenset(
-            (p, o) for _, p, o in graph.triples((bnode, None, None)) if o != bnode
-        )
-        signatures[props].append(bnode)
-
-    # Create mapping: duplicate blank node -> canonical blank node
-    mapping: dict[BNode, BNode] = {
-        dup: nodes[0]
-        for nodes in signatures.values()
-        if len(nodes) > 1
-        for dup in nodes[1:]
-    }
-
-    if not mapping:
+    # Refine colors until the number of classes stops growing
+    colors = dict.fromkeys(outgoing, 0)
+    n_colors = 1
+    while True:
+        palette: Dict[Tuple[int, frozenset], int] = {}
+        refined = {
+            node: palette.setdefault(
+                (
+                    colors[node],
+                    frozenset(
+                        (p, (_BLANK, colors[o]) if isinstance(o, BNode) else o)
+                        for p, o in properties
+                    ),
+                ),
+                len(palette),
+            )
+            for node, properties in outgoing.items()
+        }
+        colors = refined
+        if len(palette) == n_colors:
+            break
+        n_colors = len(palette)
+
+    if n_colors == len(outgoing):
         return graph
 
-    # Rebuild graph with deduplicated nodes
-    deduplicated = Graph()
-    for s, p, o in graph:
-        # Replace subject if it's a duplicate blank node
-        new_s = mapping.get(s, s) if isinstance(s, BNode) else s
-        # Replace object if it's a duplicate blank node
-        new_o = mapping.get(o, o) if isinstance(o, BNode) else o
-        deduplicated.add((new_s, p, new_o))
-
-    return deduplicated
+    # Map each duplicate to the first node of its color
+    canonical: Dict[int, BNode] = {}
+    mapping: Dict[BNode, BNode] = {}
+    for node, color in colors.items():
+        first = canonical.setdefault(color, node)
+        if first is not node:
+            mapping[node] = first
+
+    # Rewrite only the triples that mention a duplicate. Its properties already
+    # exist on the canonical node, so they are dropped; references from kept
+    # subjects and self-references are moved to the canonical node.
+    for node, first in mapping.items():
+        graph.remove((node, None, None))
+        for s, p in incoming.get(node, ()):
+            if s == node:
+                graph.add((first, p, first))
+            elif s not in mapping:
+                graph.remove((s, p, node))
+                graph.add((s, p, first))
+
+    return graph
 
 
 class Collection(ContentBase):
@@ -213,6 +273,7 @@ class Collection(ContentBase):
 
         # Update the metadata of the collection
         self.native_api.update_collection(self.alias, metadata)
+        self.dataverse.invalidate(self)
         self._metadata = None
 
         if alias is not None:
@@ -234,40 +295,138 @@ class Collection(ContentBase):
         """
         Get a structured list of all content (datasets and collections) in this collection.
 
+        Built from the collection's contents listing plus one search scoped to
+        this collection for the dataset titles and collection aliases, which
+        the listing lacks. A collection of a few thousand items therefore
+        costs a handful of requests rather than one per item. Items the search
+        does not return, e.g. when the search index lags behind, are fetched
+        individually.
+
         Returns:
-            List[Content]: List of dictionaries containing content information.
-                Each dictionary has:
-                - identifier (str): The dataset identifier or collection alias
+            pd.DataFrame: One row per item, with the columns:
                 - content_type (Literal["collection", "dataset"]): Type of content
+                - persistent_identifier (str): The dataset's persistent identifier
+                - identifier (str): The collection's alias
                 - title (Optional[str]): Display title/name of the content
 
         Example:
-            >>> content = collection.overview
-            >>> for item in content:
+            >>> overview = collection.overview
+            >>> for item in overview.to_dict(orient="records"):
             ...     print(f"{item['content_type']}: {item['title']}")
             dataset: My Research Data
             collection: Child Collection
         """
-        collection_content = []
-
-        for dataset in self.datasets:
-            collection_content.append(
-                {
-                    "content_type": "dataset",
-                    "persistent_identifier": dataset.persistent_identifier,
-                    "title": dataset.title,
-                }
-            )
-        for coll in self.collections:
+        datasets: Dict[str, Optional[str]] = {}
+        collections: List[collection.content.Collection] = []
+        for content in self._raw_content:
+            if isinstance(content, collection.content.Dataset):
+                pid = f"{content.protocol}:{content.authority}{content.separator}{content.identifier}"
+                datasets[pid] = None
+            elif isinstance(content, collection.content.Collection):
+                collections.append(content)
+
+        aliases: Dict[str, str] = {}
+        if datasets or collections:
+            aliases = self._search_children(datasets, len(collections))
+
+        missing = [pid for pid, title in datasets.items() if title is None]
+        if missing:
+            responses = self.native_api.get_datasets(missing)
+            for pid, response in zip(missing, responses):
+                if response is not None:
+                    datasets[pid] = DatasetSummary.from_response(
+                        response, self.dataverse
+                    ).title
+
+        collection_content = [
+            {
+                "content_type": "dataset",
+                "persistent_identifier": pid,
+                "title": title,
+            }
+            for pid, title in datasets.items()
+        ]
+        # Sibling names need not be unique, and a shared name cannot tell
+        # the search results apart, so such children are fetched by ID.
+        title_counts = Counter(coll.title for coll in collections)
+        for coll in collections:
+            alias = aliases.get(coll.title) if title_counts[coll.title] == 1 else None
+            if alias is None:
+                alias = self.native_api.get_collection(coll.id).alias
             collection_content.append(
                 {
                     "content_type": "collection",
-                    "identifier": coll.alias,
-                    "title": coll.metadata.name,
+                    "identifier": alias,
+                    "title": coll.title,
                 }
             )
         return pd.DataFrame(collection_content)
 
+    def _search_children(
+        self,
+        titles: Dict[str, Optional[str]],
+        n_collections: int,
+    ) -> Dict[str, str]:
+        """
+        Look up the titles and aliases of this collection's direct children.
+
+        Pages through one search scoped to this collection, stopping once every
+        child has been seen. Results from nested collections are ignored. A
+        child missing from the index would otherwise page through the whole
+        subtree, so the search stops after the pages the children fill plus
+        ``_SEARCH_EXTRA_PAGES``; the caller fetches any child not seen.
+
+        Args:
+            titles: Dataset titles by persistent identifier, filled in place.
+            n_collections: Number of child collections.
+
+        Returns:
+            Dict[str, str]: Child collection aliases by collection name. Names
+                shared by several children are left out.
+        """
+        alias = self.alias
+        aliases: Dict[str, Optional[str]] = {}
+        found = 0
+        options = QueryOptions(
+            subtree=alias,
+            filter_query="dvObjectType:(dataverses OR datasets)",
+        )
+
+        n_children = len(titles) + n_collections
+        max_pages = math.ceil(n_children / _SEARCH_PAGE_SIZE) + _SEARCH_EXTRA_PAGES
+
+        for _ in range(max_pages):
+            if found >= n_children:
+                break
+            response = self.search(
+                "*", per_page=_SEARCH_PAGE_SIZE, options=options
+            )._search_response
+            for item in response.items:
+                if (
+                    item.type == "dataset"
+                    and item.identifier_of_dataverse == alias
+                    and titles.get(item.global_id, "") is None
+                ):
+                    titles[item.global_id] = item.name
+                    found += 1
+                elif (
+                    item.type == "dataverse"
+                    and item.parent_dataverse_identifier == alias
+                    and item.name is not None
+                    and item.identifier is not None
+                ):
+                    # None marks a name shared by several children
+                    aliases[item.name] = (
+                        None if item.name in aliases else item.identifier
+                    )
+                    found += 1
+
+            options.start += len(response.items)
+            if not response.items or options.start >= response.total_count:
+                break
+
+        return {name: child for name, child in aliases.items() if child is not None}
+
     async def _fetch_all_content(self):
         """
         Asynchronously fetch full metadata for all child collections and datasets in this collection.
@@ -468,6 +627,7 @@ class Collection(ContentBase):
         Publish this collection to make it publicly accessible.
         """
         self.native_api.publish_collection(self.alias)
+        self.dataverse.invalidate(self)
         self._metadata = None
 
     def create_collection(
@@ -548,6 +708,7 @@ class Collection(ContentBase):
             parent=parent,
             metadata=metadata,
         )
+        self.dataverse.invalidate(self)
         return Collection(dataverse=self.dataverse, identifier=response.alias)
 
     def graph(
@@ -565,9 +726,13 @@ class Collection(ContentBase):
         hierarchy.
 
         The method works by:
-        1. Iterating through all child collections and retrieving their graphs recursively
-        2. Iterating through all datasets in this collection and retrieving their graphs
-        3. Combining all individual graphs into a single merged RDF graph
+        1. Walking the contents listings of this collection and its subcollections
+        2. Exporting every dataset found in the requested formats
+        3. Merging the dataset graphs into a single graph as they arrive
+
+        Contents listings and exports are requested directly on the instance's
+        event loop, so no dataset objects are built along the way. For graphs too
+        large to hold in memory, use :meth:`write_graph` instead.
 
         Args:
             format (GraphFormat): A single format string or list of format strings
@@ -575,11 +740,10 @@ class Collection(ContentBase):
                 are those available in the Dataverse instance that have semantic media types.
                 This format is passed down to all child datasets when generating their graphs.
             depth (int): The depth of the graph to retrieve. 1 means only the current collection, 2 means the current collection and all child collections, 3 means the current collection and all child collections and all child datasets, etc.
-            max_workers (int): Maximum number of concurrent graph retrieval operations.
-                Controls parallelization when fetching graphs from multiple datasets and
-                subcollections. Defaults to 10. Higher values increase parallelism but
-                may overwhelm the server or consume more resources. Lower values provide
-                more conservative resource usage.
+            max_workers (int): Maximum number of requests in flight at once, shared by
+                all contents listings and exports of the walk. Defaults to 10. Higher
+                values increase parallelism but may overwhelm the server. Lower values
+                provide more conservative resource usage.
         Returns:
             Graph: An rdflib Graph object containing the merged RDF triples from
                 all datasets and subcollections within this collection.
@@ -587,7 +751,6 @@ class Collection(ContentBase):
         Raises:
             ValueError: If the specified format is not available in the Dataverse instance
                 or does not support semantic data representation.
-            IndexError: If the collection contains no child content (empty collection).
 
         Examples:
             Get a comprehensive graph of all content in a collection::
@@ -620,84 +783,234 @@ class Collection(ContentBase):
         Note:
             This method can be resource-intensive for large collections with many
             datasets, as it fetches and processes metadata for all child content.
-            Consider the size of your collection when using this method. The method
-            uses async/await internally with a semaphore to control concurrency,
-            allowing efficient parallel processing while preventing resource exhaustion.
+            Consider the size of your collection when using this method.
         """
-        return asyncio.run(
+        formats = _graph_formats(self.dataverse, format)
+        return self.dataverse._run(
             self._graph_async(
-                format=format,
+                formats=formats,
                 depth=depth,
                 max_workers=max_workers,
             )
         )
 
-    async def _graph_async(
+    def write_graph(
         self,
+        destination: Union[str, Path, IO[str]],
         format: GraphFormat,
-        depth: int,
-        max_workers: int,
-        semaphore: Optional[asyncio.Semaphore] = None,
-    ) -> Graph:
-        """Internal async implementation with semaphore-based concurrency control."""
-        # Base case: if depth is 0 or negative, return empty graph
-        if depth <= 0:
-            return Graph()
-
-        # Initialize semaphore for concurrency control if not provided
-        if semaphore is None:
-            semaphore = asyncio.Semaphore(max_workers)
-
-        # Convert synchronous dataset.graph() method to async for concurrent execution
-        get_dataset_graph = asyncify(lambda ds: ds.graph(format))
-
-        async def fetch_collection(coll):
-            """Fetch graph from a child collection with semaphore protection."""
-            async with semaphore:
-                return await coll._graph_async(
-                    format=format,
-                    depth=depth - 1,  # Reduce depth for recursive call
-                    max_workers=max_workers,
-                    semaphore=semaphore,
-                )
+        depth: int = 2,
+        max_workers: int = 10,
+        rdf_format: Literal["nt", "nquads"] = "nt",
+    ) -> int:
+        """
+        Stream the RDF graph of this collection to a file as line-based RDF.
 
-        async def fetch_dataset(ds):
-            """Fetch graph from a dataset with semaphore protection."""
-            async with semaphore:
-                return await get_dataset_graph(ds)
+        Works like :meth:`graph`, but writes the statements of each dataset as
+        soon as its exports arrive instead of merging everything in memory, so
+        graphs of whole installations can be exported with constant memory.
 
-        # Build list of tasks for concurrent execution
-        tasks = []
+        With ``rdf_format="nquads"`` every dataset's statements are placed in a
+        named graph identified by the dataset's persistent URL. Blank nodes are
+        not deduplicated across datasets, unlike in :meth:`graph`.
+
+        Args:
+            destination: Path of the file to write, or an open text stream.
+            format (GraphFormat): A single format string or list of format strings
+                specifying the semantic export formats to use for datasets.
+            depth (int): The depth of the graph to retrieve, as for :meth:`graph`.
+            max_workers (int): Maximum number of requests in flight at once.
+            rdf_format: ``"nt"`` for N-Triples or ``"nquads"`` for N-Quads.
+
+        Returns:
+            int: The number of statements written.
+
+        Raises:
+            ValueError: If the specified format is not available in the Dataverse instance
+                or does not support semantic data representation, or if
+                ``rdf_format`` is not supported.
 
-        # Add collection tasks only if depth > 1 (to allow recursion)
-        if depth > 1:
-            tasks.extend(fetch_collection(coll) for coll in self.collections)
+        Example:
+            >>> collection = dataverse.fetch_collection("root")
+            >>> collection.write_graph("root.nq", "OAI_ORE", depth=10, rdf_format="nquads")
+            48213
+        """
+        if rdf_format not in ("nt", "nquads"):
+            raise ValueError(
+                f"Unsupported RDF format '{rdf_format}', use 'nt' or 'nquads'."
+            )
 
-        # Always add dataset tasks at current level
-        tasks.extend(fetch_dataset(ds) for ds in self.datasets)
+        formats = _graph_formats(self.dataverse, format)
 
-        # Return empty graph if no content to process
-        if not tasks:
-            return Graph()
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w", encoding="utf-8") as sink:
+                return self.dataverse._run(
+                    self._write_graph_async(
+                        sink, formats, depth, max_workers, rdf_format
+                    )
+                )
 
-        # Execute all tasks concurrently and wait for completion
-        with Progress(disable=True) as progress:
-            task_id = progress.add_task("[cyan]Processing graphs...", total=len(tasks))
-            graphs = []
-            for coro in asyncio.as_completed(tasks):
-                graphs.append(await coro)
-                progress.update(task_id, advance=1)
+        return self.dataverse._run(
+            self._write_graph_async(
+                destination, formats, depth, max_workers, rdf_format
+            )
+        )
 
-        # Merge all retrieved graphs into a single result
+    async def _graph_async(
+        self,
+        formats: List[str],
+        depth: int,
+        max_workers: int,
+    ) -> Graph:
+        """Merge the dataset graphs of the walk as they arrive."""
         result = Graph()
-        for graph in graphs:
-            if graph:  # Only merge non-empty graphs
-                result += graph
+        async for _, graph in self._dataset_graphs(formats, depth, max_workers):
+            result += graph
 
         # Deduplicate blank nodes with identical properties
-        result = _deduplicate_blank_nodes(result)
+        return _deduplicate_blank_nodes(result)
+
+    async def _write_graph_async(
+        self,
+        sink: IO[str],
+        formats: List[str],
+        depth: int,
+        max_workers: int,
+        rdf_format: Literal["nt", "nquads"],
+    ) -> int:
+        """Serialize the dataset graphs of the walk as they arrive."""
+        written = 0
+        async for name, graph in self._dataset_graphs(formats, depth, max_workers):
+            if rdf_format == "nquads":
+                quads = RDFDataset()
+                named = quads.graph(URIRef(name))
+                named += graph
+
+                # Suppress rdflib's own Dataset.contexts deprecation warning
+                with warnings.catch_warnings():
+                    warnings.filterwarnings(
+                        "ignore",
+                        category=DeprecationWarning,
+                        module="rdflib",
+                    )
+                    sink.write(quads.serialize(format="nquads"))
+            else:
+                sink.write(graph.serialize(format="nt"))
+            written += len(graph)
+        return written
+
+    async def _dataset_graphs(
+        self,
+        formats: List[str],
+        depth: int,
+        max_workers: int,
+    ) -> AsyncIterator[Tuple[str, Graph]]:
+        """
+        Walk this collection and yield the graph of each dataset as it arrives.
+
+        Contents listings and exports run as tasks on the current event loop,
+        using async copies of the APIs, while the exports are parsed in worker
+        threads. One semaphore bounds all requests in flight. Another admits
+        at most ``max_workers`` datasets at a time, each from its first export
+        request until its graph is in the queue, which itself holds at most
+        ``max_workers`` graphs. A slow consumer therefore pauses the exports,
+        and no more than twice ``max_workers`` parsed graphs wait for it.
+
+        Args:
+            formats: Validated export formats.
+            depth: Levels of collections to walk; 1 is this collection only.
+            max_workers: Maximum number of requests in flight.
 
-        return result
+        Yields:
+            Tuple[str, Graph]: The dataset's persistent URL and its graph.
+
+        Raises:
+            Exception: The first error raised by a listing or export.
+        """
+        if depth <= 0:
+            return
+
+        loop = self.dataverse._loop
+        native_api = loop.bind(self.native_api)
+        semantic_api = loop.bind(self.dataverse.semantic_api)
+        semaphore = asyncio.Semaphore(max_workers)
+        exporting = asyncio.Semaphore(max_workers)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_workers)
+        finished = object()
+        tasks: Set[asyncio.Task] = set()
+        pending = 0
+
+        async def export(content: collection.content.Dataset) -> None:
+            pid = f"{content.protocol}:{content.authority}{content.separator}{content.identifier}"
+
+            async def fetch(format: str) -> Union[str, Dict[str, Any]]:
+                async with semaphore:
+                    return await _export_async(
+                        native_api, semantic_api, pid, format, ":latest"
+                    )
+
+            # Held until the graph is queued, so graphs the consumer has not
+            # taken yet cannot pile up behind a full queue.
+            async with exporting:
+                exported = await asyncio.gather(*[fetch(f) for f in formats])
+                name = content.persistent_url or pid
+                # Parsing is CPU-bound and may fetch a JSON-LD context, so it
+                # runs in a worker thread to keep the other requests going.
+                graph = await asyncio.to_thread(
+                    _exports_to_graph,
+                    self.dataverse,
+                    [_add_missing_id(e, name) for e in exported if isinstance(e, dict)],
+                )
+                await queue.put((name, graph))
+
+        async def walk(
+            identifier: Union[str, int],
+            level: int,
+            contents: Optional[RawContentTypes] = None,
+        ) -> None:
+            if contents is None:
+                async with semaphore:
+                    contents = await native_api.get_collection_contents(  # type: ignore[misc]
+                        identifier
+                    )
+
+            for content in contents:
+                if isinstance(content, collection.content.Dataset):
+                    spawn(export(content))
+                elif level > 1 and content.id is not None:
+                    spawn(walk(content.id, level - 1))
+
+        async def run(coroutine: Coroutine[Any, Any, None]) -> None:
+            nonlocal pending
+            try:
+                await coroutine
+            except Exception as error:
+                await queue.put(error)
+                return
+
+            pending -= 1
+            if not pending:
+                await queue.put(finished)
+
+        def spawn(coroutine: Coroutine[Any, Any, None]) -> None:
+            nonlocal pending
+            pending += 1
+            task = asyncio.create_task(run(coroutine))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        # Reuse the listing of this collection if it was already fetched
+        spawn(walk(self.identifier, depth, self.__dict__.get("_raw_content")))
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in list(tasks):
+                task.cancel()
 
     def __len__(self):
         """
@@ -1,7 +1,10 @@
-from .builder import create_model_from_block
+from .blocks import MetadataBlocks
+from .builder import create_model_from_block, get_block_model
 from .metadata import MetadataBlockBase
 
 __all__ = [
     "MetadataBlockBase",
+    "MetadataBlocks",
     "create_model_from_block",
+    "get_block_model",
 ]
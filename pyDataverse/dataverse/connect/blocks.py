@@ -0,0 +1,115 @@
+"""Lazily built metadata blocks of a dataset."""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .metadata import MetadataBlockBase
+
+BlockModelGetter = Callable[[], Type[MetadataBlockBase]]
+
+
+class MetadataBlocks(Dict[str, MetadataBlockBase]):
+    """
+    The metadata blocks of a dataset, keyed by block name.
+
+    A dict whose blocks can be registered before they exist: a block added
+    with :meth:`defer` is only built, along with its model class, when it is
+    first accessed by name. A dataset therefore pays only for the blocks it
+    uses, not for every block the installation defines.
+
+    Membership tests and indexing cover deferred blocks, while iteration,
+    ``len`` and ``items`` cover the blocks built so far. Deferred blocks are
+    empty, so serialization is unaffected. :attr:`available` lists all
+    blocks.
+
+    Example:
+        >>> dataset = dataverse.create_dataset(...)
+        >>> "geospatial" in dataset.metadata_blocks
+        True
+        >>> list(dataset.metadata_blocks)  # only citation has been built
+        ['citation']
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize the blocks like a dict.
+
+        Args:
+            *args: Forwarded to dict.
+            **kwargs: Forwarded to dict.
+        """
+        super().__init__(*args, **kwargs)
+        self._deferred: Dict[str, BlockModelGetter] = {}
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler: GetCoreSchemaHandler):
+        """
+        Generate Pydantic core schema for validation.
+
+        Instances are kept as they are, with their deferred blocks; plain
+        dicts are validated and converted.
+
+        Args:
+            source: The source type being validated.
+            handler: Pydantic's core schema handler.
+
+        Returns:
+            A Pydantic core schema for validating metadata blocks.
+        """
+        base = handler.generate_schema(Dict[str, MetadataBlockBase])
+
+        def to_self(value, validate):
+            if isinstance(value, cls):
+                return value
+            return cls(validate(value))
+
+        return core_schema.no_info_wrap_validator_function(to_self, base)
+
+    @property
+    def available(self) -> List[str]:
+        """The names of all blocks, built or deferred."""
+        return list(self) + [
+            name for name in self._deferred if not dict.__contains__(self, name)
+        ]
+
+    def defer(self, models: Mapping[str, BlockModelGetter]) -> None:
+        """
+        Register blocks to be built on first access.
+
+        Args:
+            models: Functions returning the model class of each block, by
+                block name. Blocks already present are left as they are.
+        """
+        for name, model in models.items():
+            if not dict.__contains__(self, name):
+                self._deferred[name] = model
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __missing__(self, key: str) -> MetadataBlockBase:
+        model = self._deferred.pop(key, None)
+        if model is None:
+            raise KeyError(key)
+        block = model()()
+        dict.__setitem__(self, key, block)
+        return block
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._deferred
+
+    def __setitem__(self, key: str, value: MetadataBlockBase) -> None:
+        self._deferred.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self._deferred.pop(key, None) is not None and not dict.__contains__(
+            self, key
+        ):
+            return
+        super().__delitem__(key)
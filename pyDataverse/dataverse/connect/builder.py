@@ -1,5 +1,7 @@
 """Metadata block handling and Pydantic model generation."""
 
+import hashlib
+import threading
 from functools import lru_cache
 from typing import Annotated, Any, Dict, List, Optional, Tuple, Type, TypeVar
 
@@ -14,6 +16,54 @@ from .validated_list import ValidatingList
 
 T = TypeVar("T", bound=BaseModel)
 
+# Block models by (schema hash, enum limit), shared by all Dataverse instances.
+_BLOCK_MODELS: Dict[Tuple[str, Optional[int]], Type[MetadataBlockBase]] = {}
+_BLOCK_MODELS_LOCK = threading.Lock()
+
+
+def schema_hash(spec: metadatablocks.MetadatablockSpecification) -> str:
+    """
+    Hash of a metadata block specification.
+
+    Args:
+        spec: The block specification
+
+    Returns:
+        Hex digest identifying the block's name and fields
+    """
+    return hashlib.sha256(spec.model_dump_json(by_alias=True).encode()).hexdigest()
+
+
+def get_block_model(
+    spec: metadatablocks.MetadatablockSpecification,
+    enum_limit: Optional[int] = None,
+) -> Type[MetadataBlockBase]:
+    """
+    Get the Pydantic model of a metadata block, creating it on first use.
+
+    Models are kept in a process-wide registry keyed by the hash of the block
+    specification, so installations and Dataverse instances serving the same
+    block share one model class.
+
+    Args:
+        spec: The block specification
+        enum_limit: Skip controlled vocabulary fields with more values than this
+
+    Returns:
+        The block's model class
+    """
+    key = (schema_hash(spec), enum_limit)
+    model = _BLOCK_MODELS.get(key)
+    if model is None:
+        with _BLOCK_MODELS_LOCK:
+            model = _BLOCK_MODELS.get(key)
+            if model is None:
+                model = create_model_from_block(
+                    spec.name, spec.fields, enum_limit=enum_limit
+                )
+                _BLOCK_MODELS[key] = model
+    return model
+
 
 def create_model_from_block(
     name: str,
@@ -28,6 +28,9 @@ class DataverseMetaclass(ModelMetaclass):
 
     Attaches block configuration metadata to classes during creation,
     enabling runtime access to field type information and block structure.
+    Classes defining a ``_compile_fields`` classmethod also get their
+    compiled field table, stored as ``__field_infos__``, so that parsing
+    and serialization do not introspect ``model_fields`` per value.
     """
 
     def __new__(
@@ -54,5 +57,11 @@ class DataverseMetaclass(ModelMetaclass):
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
         if block_config is not None:
             cls._block_config = block_config
+
+        # Models with unresolved forward references compile on first use.
+        compile_fields = getattr(cls, "_compile_fields", None)
+        if compile_fields is not None and cls.__pydantic_complete__:
+            cls.__field_infos__ = compile_fields()
+
         return cls
 
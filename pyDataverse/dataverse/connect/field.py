@@ -55,9 +55,11 @@ class FieldInfo:
 
     Contains metadata extracted from Pydantic model field definitions,
     including type information, parent class relationships, and schema metadata.
+    Instances are compiled once per model class and shared by all its values.
     """
 
     json_schema_extra: JSONSchemaExtra
     dtype: Type
     parent_class: Union[Type[BaseModel], Type, None]
     multiple: bool
+    compound: bool = False
@@ -21,6 +21,7 @@ from pydantic import (
     ConfigDict,
     model_serializer,
 )
+from pydantic.fields import FieldInfo as PydanticFieldInfo
 from typing_extensions import Self
 
 from ...models.dataset import create, edit_get
@@ -242,18 +243,67 @@ class MetadataBlockBase(
             )
         return dtype
 
+    @classmethod
+    def _compile_fields(cls) -> Dict[str, FieldInfo]:
+        """
+        Compile the FieldInfo of every field of this class.
+
+        Called once per class by the metaclass. Fields are keyed by name and,
+        where it differs, by alias, i.e. the Dataverse type name.
+
+        Returns:
+            A dictionary mapping field names and aliases to their FieldInfo.
+        """
+        infos: Dict[str, FieldInfo] = {}
+        for name, field in cls.model_fields.items():
+            if not isinstance(field.json_schema_extra, dict):
+                continue
+            info = cls._build_info(field)
+            infos[name] = info
+            if field.alias:
+                infos.setdefault(field.alias, info)
+        return infos
+
+    @classmethod
+    def _field_infos(cls) -> Dict[str, FieldInfo]:
+        """
+        Get the compiled field table of this class, compiling it if needed.
+
+        Returns:
+            A dictionary mapping field names and aliases to their FieldInfo.
+        """
+        infos = cls.__dict__.get("__field_infos__")
+        if infos is None:
+            infos = cls.__field_infos__ = cls._compile_fields()
+        return infos
+
     @classmethod
     def _extract_info(cls, name: str) -> FieldInfo:
         """
-        Extract field information from model field definition.
+        Get the compiled field information of a field.
+
+        Args:
+            name: The name or alias of the field to get information for.
+
+        Returns:
+            FieldInfo containing type information, parent class, and metadata.
+        """
+        info = cls._field_infos().get(name)
+        if info is None:
+            return cls._build_info(cls.model_fields[name])
+        return info
+
+    @classmethod
+    def _build_info(cls, field_info: PydanticFieldInfo) -> FieldInfo:
+        """
+        Extract field information from a model field definition.
 
         Args:
-            name: The name of the field to extract information for.
+            field_info: The Pydantic field definition.
 
         Returns:
             FieldInfo containing type information, parent class, and metadata.
         """
-        field_info = cls.model_fields[name]
         dtype = field_info.annotation
 
         # Check if field is multiple and extract inner type
@@ -271,6 +321,7 @@ class MetadataBlockBase(
             json_schema_extra=JSONSchemaExtra.model_validate(
                 field_info.json_schema_extra
             ),
+            compound=isinstance(dtype, type) and issubclass(dtype, CompoundField),
         )
 
     def _process_field_value(
@@ -290,9 +341,7 @@ class MetadataBlockBase(
         Returns:
             The processed value, with CompoundField instances converted to dictionaries.
         """
-        # Check by class name since CompoundField is defined later in this module
-
-        if issubclass(field_info.dtype, CompoundField):
+        if field_info.compound:
             if field_info.multiple and isinstance(value, list):
                 return [field.to_metadata_fields() for field in value]
             return value.to_metadata_fields()
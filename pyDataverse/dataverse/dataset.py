@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-import warnings
 from contextlib import _GeneratorContextManager
 from functools import cached_property
 from pathlib import Path
@@ -24,7 +23,6 @@ from typing import (
 
 import httpx
 import pandas as pd
-from asyncer import asyncify
 from pydantic import (
     ConfigDict,
     Field,
@@ -44,12 +42,14 @@ from ..models import info
 from ..models.dataset import create, edit_get
 from ..models.dataset.create import DatasetCreateBody, DatasetVersion
 from ..models.file.filemeta import Checksum, UploadBody, UploadResponse
-from .connect import MetadataBlockBase
+from .connect import MetadataBlockBase, MetadataBlocks
 from .contentbase import ContentBase
 from .dataverse import Dataverse
 from .file import File
 
 if TYPE_CHECKING:
+    from ..api.native import NativeApi
+    from ..api.semantic import SemanticApi
     from .collection import Collection
 
 SemanticApiFormat = Literal["semantic_api"]
@@ -68,7 +68,7 @@ class Dataset(ContentBase):
     Attributes:
         identifier (Optional[str]): The unique identifier (such as DOI or database ID) for the dataset.
         license (Union[str, info.License, None]): The assigned license for the dataset, as a string or License object.
-        metadata_blocks (Dict[str, MetadataBlockBase]): All metadata blocks associated with the dataset, keyed by block name.
+        metadata_blocks (MetadataBlocks): All metadata blocks associated with the dataset, keyed by block name. Blocks are built on first access.
         dataverse (Dataverse): The parent Dataverse object this dataset belongs to.
     """
 
@@ -102,9 +102,9 @@ class Dataset(ContentBase):
     )
 
     metadata_blocks: Annotated[
-        Dict[str, MetadataBlockBase], Field(default_factory=dict)
+        MetadataBlocks, Field(default_factory=MetadataBlocks)
     ] = Field(
-        default_factory=dict,
+        default_factory=MetadataBlocks,
         description="Metadata blocks of the dataset",
         repr=False,
     )
@@ -212,10 +212,14 @@ class Dataset(ContentBase):
     ) -> Dataset:
         """
         Refresh the dataset from the Dataverse server.
+
+        Bypasses the identity map for mutable versions, and stores this
+        object there in place of the freshly fetched one.
         """
         if self.persistent_identifier is None:
             raise ValueError("Dataset identifier is required to refresh.")
 
+        self.dataverse.invalidate(self)
         fresh_dataset = self.dataverse.fetch_dataset(
             self.persistent_identifier,
             version=version,
@@ -227,6 +231,7 @@ class Dataset(ContentBase):
         self.identifier = fresh_dataset.identifier
         self.license = fresh_dataset.license
         self.metadata_blocks = fresh_dataset.metadata_blocks
+        self.dataverse._remember_dataset(self, version)
 
         return self
 
@@ -459,65 +464,52 @@ class Dataset(ContentBase):
             >>> for subj, pred, obj in graph:
             ...     print(f"{subj} {pred} {obj}")
         """
-        if isinstance(format, str):
-            format = [format]
-
-        valid_formats = {
-            name: export_format
-            for name, export_format in self.dataverse.export_formats.items()
-            if export_format.media_type in SEMANTIC_FORMATS
-        }
-
-        invalid_formats = [
-            f for f in format if f not in valid_formats and f != "semantic_api"
-        ]
-        if invalid_formats:
-            raise ValueError(
-                f"Invalid formats: {invalid_formats} are not available in the Dataverse instance."
-                f"Available formats: {list(valid_formats.keys())}"
-            )
+        formats = _graph_formats(self.dataverse, format)
 
-        if len(format) == 1:
+        if len(formats) == 1:
             exported = [
-                self._add_missing_id(cast(Dict[str, Any], self.export(format[0])))
+                self._add_missing_id(cast(Dict[str, Any], self.export(formats[0])))
             ]
         else:
             exported = [
                 self._add_missing_id(export)
-                for export in asyncio.run(self._batch_format_export(format))
+                for export in self.dataverse._run(self._batch_format_export(formats))
                 if isinstance(export, dict)
             ]
 
-        # Suppress rdflib ConjunctiveGraph deprecation warning
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message="ConjunctiveGraph is deprecated, use Dataset instead",
-                category=DeprecationWarning,
-                module="rdflib.plugins.parsers.jsonld",
-            )
-            return self.dataverse.semantic_api.responses_to_graph(exported)
+        return _exports_to_graph(self.dataverse, exported)
 
     async def _batch_format_export(
         self,
         formats: List[str],
     ) -> List[Union[str, Dict[str, Any]]]:
         """
-        Fetch the formats from the Dataverse instance.
-        """
-        fetch_format_async = asyncify(self.export)
-        return await asyncio.gather(*[fetch_format_async(f) for f in formats])
+        Fetch the formats concurrently on the instance's event loop.
+        """
+        loop = self.dataverse._loop
+        native_api = loop.bind(self.dataverse.native_api)
+        semantic_api = loop.bind(self.dataverse.semantic_api)
+        return await asyncio.gather(
+            *[
+                _export_async(
+                    native_api,
+                    semantic_api,
+                    self._ensure_identifier(pid=f != "semantic_api"),
+                    f,
+                    self.version,
+                )
+                for f in formats
+            ]
+        )
 
     def _add_missing_id(self, exported: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add the missing ID to the exported data.
         """
-        if "@id" not in exported:
-            if self.persistent_url is not None:
-                exported["@id"] = self.persistent_url
-            else:
-                exported["@id"] = self.identifier
-        return exported
+        return _add_missing_id(
+            exported,
+            self.persistent_url if self.persistent_url is not None else self.identifier,
+        )
 
     @property
     def fs(self) -> DataverseFS:
@@ -537,6 +529,9 @@ class Dataset(ContentBase):
                 api_token=self.dataverse.api_token,
                 native_api=self.dataverse.native_api,
                 data_access_api=self.dataverse.data_access_api,
+                tabular_cache=self.dataverse.tabular_cache,
+                block_cache=self.dataverse.block_cache,
+                range_cache=self.dataverse.range_cache,
             )
         return self._fs
 
@@ -638,6 +633,7 @@ class Dataset(ContentBase):
             payload,
             replace=True,
         )
+        self.dataverse.invalidate(self)
 
         # We will wait for the dataset to unlock to avoid race conditions
         self.wait_for_unlock()
@@ -671,6 +667,7 @@ class Dataset(ContentBase):
             self.persistent_identifier,
             release_type,
         )
+        self.dataverse.invalidate(self)
 
         # Wait for the dataset to unlock to avoid race conditions
         self.wait_for_unlock()
@@ -686,6 +683,7 @@ class Dataset(ContentBase):
             )
 
         self.dataverse.native_api.submit_dataset_to_review(self.persistent_identifier)
+        self.dataverse.invalidate(self)
 
     def return_to_author(self, reason: str):
         """
@@ -699,6 +697,7 @@ class Dataset(ContentBase):
             pid=self.persistent_identifier,
             reason_for_return=reason,
         )
+        self.dataverse.invalidate(self)
 
     def upload_to_collection(self, collection: Union[str, Collection]):
         """
@@ -732,6 +731,12 @@ class Dataset(ContentBase):
             metadata=self.to_dataverse_create_dict(),
         )
 
+        # The collection's contents changed
+        if isinstance(collection, Collection):
+            self.dataverse.invalidate(collection)
+        else:
+            self.dataverse.identity_map.invalidate("collection", [collection])
+
         self.persistent_identifier = response.persistent_id
         self.identifier = response.id
         self.version = ":draft"
@@ -851,7 +856,8 @@ class Dataset(ContentBase):
             "properties": {},
         }
 
-        for name, block in self.metadata_blocks.items():
+        for name in self.metadata_blocks.available:
+            block = self.metadata_blocks[name]
             schema["properties"][name] = block.model_json_schema(mode="validation")
 
         return schema
@@ -1047,15 +1053,29 @@ class Dataset(ContentBase):
         # Check if file exists and determine if we're replacing
         file_id = self._get_existing_file_id(dataset_path)
 
-        # Perform upload or replacement
-        with open(local_path, "rb") as local_file:
-            if file_id:
-                response = self._replace_file(file_id, local_file, upload_metadata)
-            else:
-                response = self._upload_new_file(local_file, upload_metadata)
-
-        # Clear cache to ensure fresh data on next read
-        self.fs._cache.clear()
+        # Perform upload or replacement, straight to object storage for large
+        # files if the dataset's store allows it
+        uploader = self.fs.direct_uploader(local_path.stat().st_size)
+        if uploader is not None:
+            response = uploader.upload(
+                self.identifier,
+                local_path,
+                upload_metadata,
+                replace=file_id,
+            )
+        else:
+            with open(local_path, "rb") as local_file:
+                if file_id:
+                    response = self._replace_file(file_id, local_file, upload_metadata)
+                else:
+                    response = self._upload_new_file(local_file, upload_metadata)
+
+        # Bring the cached file listing and dataset up to date
+        self.dataverse.invalidate(self)
+        self.fs.record_write(
+            removed=[file_id] if file_id else [],
+            added=response.files or None,
+        )
 
         return response
 
@@ -1252,6 +1272,41 @@ class Dataset(ContentBase):
             **kwargs,
         )
 
+    def stream_arrow(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        no_header: bool = False,
+        output: Literal["arrow", "pandas", "polars"] = "arrow",
+        block_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream a tabular file as Arrow record batches (requires ``pyarrow``).
+
+        Args:
+            path (str): File path in the dataset.
+            columns (Optional[Sequence[str]]): Column names to read (default: all).
+            no_header (bool, optional): If True, columns are named f0, f1, ...
+            output (str, optional): "arrow" (default), "pandas" or "polars".
+            block_size (Optional[int]): Number of bytes parsed per batch.
+
+        Yields:
+            pyarrow.RecordBatch, or a DataFrame for "pandas"/"polars" output.
+
+        Examples:
+            >>> for batch in dataset.stream_arrow("data/file.tab"):
+            ...     print(batch.num_rows)
+            >>> for df in dataset.stream_arrow("data/file.tab", output="pandas"):
+            ...     process(df)
+        """
+        return self.fs.stream_arrow(
+            path,
+            columns=columns,
+            no_header=no_header,
+            output=output,
+            block_size=block_size,
+        )
+
     @overload
     def bundle_datafiles(
         self,
@@ -1375,3 +1430,94 @@ class Dataset(ContentBase):
             >>> citation = dataset["citation"]
         """
         return self.metadata_blocks[key]
+
+
+def _graph_formats(dataverse: Dataverse, format: GraphFormat) -> List[str]:
+    """
+    Validate the requested graph formats against the semantic export formats.
+
+    Args:
+        dataverse: The Dataverse instance whose export formats are used.
+        format: A single format or a list of formats.
+
+    Returns:
+        List[str]: The requested formats.
+
+    Raises:
+        ValueError: If a format is not available or not semantic.
+    """
+    formats = [format] if isinstance(format, str) else list(format)
+
+    valid_formats = {
+        name: export_format
+        for name, export_format in dataverse.export_formats.items()
+        if export_format.media_type in SEMANTIC_FORMATS
+    }
+
+    invalid_formats = [
+        f for f in formats if f not in valid_formats and f != "semantic_api"
+    ]
+    if invalid_formats:
+        raise ValueError(
+            f"Invalid formats: {invalid_formats} are not available in the Dataverse instance."
+            f"Available formats: {list(valid_formats.keys())}"
+        )
+
+    return formats
+
+
+async def _export_async(
+    native_api: "NativeApi",
+    semantic_api: "SemanticApi",
+    identifier: Union[str, int],
+    format: str,
+    version: Optional[str],
+) -> Union[str, Dict[str, Any]]:
+    """
+    Export a dataset in one format through async copies of the APIs.
+
+    Args:
+        native_api: Native API bound to an event loop (see ``BackgroundLoop.bind``).
+        semantic_api: Semantic API bound to the same loop.
+        identifier: Dataset identifier. Native exports require the PID.
+        format: Export format, or ``"semantic_api"``.
+        version: Dataset version to export.
+
+    Returns:
+        Union[str, Dict[str, Any]]: The exported metadata.
+    """
+    if format == "semantic_api":
+        return await semantic_api.get_dataset(identifier)  # type: ignore[misc]
+
+    return await native_api.get_dataset_export(  # type: ignore[misc]
+        cast(str, identifier),
+        format,
+        version,
+    )
+
+
+def _add_missing_id(
+    exported: Dict[str, Any],
+    identifier: Union[str, int, None],
+) -> Dict[str, Any]:
+    """Set ``@id`` of an exported JSON-LD document if the export lacks one."""
+    if "@id" not in exported:
+        exported["@id"] = identifier
+    return exported
+
+
+def _exports_to_graph(
+    dataverse: Dataverse,
+    exported: Sequence[Dict[str, Any]],
+) -> Graph:
+    """
+    Parse the JSON-LD exports of one dataset into a single graph.
+
+    Args:
+        dataverse: The Dataverse instance whose semantic API parses the exports.
+        exported: The JSON-LD exports.
+
+    Returns:
+        Graph: The merged graph.
+    """
+    return dataverse.semantic_api.responses_to_graph(exported)
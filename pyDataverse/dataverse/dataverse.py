@@ -5,17 +5,20 @@ from __future__ import annotations
 import asyncio
 import re
 import threading
-from functools import cached_property, lru_cache
+import weakref
+from functools import cached_property, partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Coroutine,
     Dict,
     List,
     Literal,
     Optional,
     Sequence,
     Type,
+    TypeVar,
     Union,
 )
 
@@ -27,19 +30,32 @@ from pyDataverse.api.search import QueryOptions, SearchApi
 from pyDataverse.dataverse.search import SearchResult
 
 from ..api import DataAccessApi, MetricsApi, NativeApi, SemanticApi
+from ..api.utilities.loop import BackgroundLoop
+from ..filesystem.blockcache import DEFAULT_BLOCK_CACHE_SIZE, BlockCache
+from ..filesystem.rangecache import DEFAULT_MAX_SIZE as DEFAULT_RANGE_CACHE_SIZE
+from ..filesystem.rangecache import RangeCache
 from ..models import collection, info
 from ..models.dataset import create, edit_get
-from ..models.metadatablocks import MetadatablockSpecification
-from .connect import create_model_from_block
+from ..models.metadatablocks import MetadatablockMeta, MetadatablockSpecification
+from .connect import MetadataBlockBase, get_block_model
+from .identitymap import DEFAULT_MAX_ENTRIES as DEFAULT_IDENTITY_MAP_SIZE
+from .identitymap import DEFAULT_TTL as DEFAULT_IDENTITY_MAP_TTL
+from .identitymap import IdentityMap, collection_key, dataset_key
 from .metrics import Metrics
+from .schemacache import DEFAULT_MAX_AGE as DEFAULT_SCHEMA_MAX_AGE
+from .schemacache import SchemaCache
 
 if TYPE_CHECKING:
+    from ..filesystem.parquet import TabularCache
     from .collection import Collection
     from .dataset import Dataset
 
 VERSION_PATTERN = re.compile(r"^v?(\d+)(?:\.\d+)*")
 MINIMUM_MAJOR_VERSION = 6
 
+# Result type of coroutines run on the background event loop
+R = TypeVar("R")
+
 _PID_URL_PREFIXES = {"doi": "https://doi.org/", "hdl": "https://hdl.handle.net/"}
 
 
@@ -129,6 +145,25 @@ class Dataverse(BaseModel):
     Attributes:
         base_url: Base URL of the Dataverse installation
         api_token: Optional API token for authentication
+        tabular_cache_dir: Optional directory for caching parsed tabular files
+            as Parquet (requires pyarrow)
+        tabular_cache_size: Maximum size of the tabular cache in bytes
+        block_cache_size: Memory budget in bytes of the block cache that files
+            opened with ``cache_type="prefetch"`` share
+        range_cache_dir: Optional directory for the persistent cache of byte
+            ranges read from remote files
+        range_cache_size: Maximum size of the range cache in bytes
+        schema_cache_dir: Optional directory for the persistent cache of
+            metadata block specifications, which lets later instances start
+            without fetching them
+        schema_cache_max_age: Seconds after which cached specifications are
+            checked against the installation's block listing
+        context_cache_dir: Optional directory for the persistent cache of
+            remote JSON-LD contexts used when building graphs
+        identity_map_size: Maximum number of keys held by the identity map of
+            fetched datasets and collections; zero disables it
+        identity_map_ttl: Seconds a fetched draft, ``:latest`` version or
+            collection is reused before it is fetched again
 
     Example:
         >>> # Create a Dataverse instance
@@ -158,12 +193,81 @@ class Dataverse(BaseModel):
         repr=False,
     )
 
+    tabular_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the opt-in Parquet cache of parsed tabular files",
+        repr=False,
+    )
+
+    tabular_cache_size: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Maximum size of the tabular cache in bytes",
+        repr=False,
+    )
+
+    block_cache_size: int = Field(
+        default=DEFAULT_BLOCK_CACHE_SIZE,
+        description="Memory budget of the shared block cache of prefetching readers",
+        repr=False,
+    )
+
+    range_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the opt-in on-disk cache of remote byte ranges",
+        repr=False,
+    )
+
+    range_cache_size: int = Field(
+        default=DEFAULT_RANGE_CACHE_SIZE,
+        description="Maximum size of the range cache in bytes",
+        repr=False,
+    )
+
+    schema_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the opt-in on-disk cache of metadata block specifications",
+        repr=False,
+    )
+
+    schema_cache_max_age: float = Field(
+        default=DEFAULT_SCHEMA_MAX_AGE,
+        description="Seconds after which cached block specifications are checked",
+        repr=False,
+    )
+
+    context_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the opt-in on-disk cache of remote JSON-LD contexts",
+        repr=False,
+    )
+
+    identity_map_size: int = Field(
+        default=DEFAULT_IDENTITY_MAP_SIZE,
+        description="Maximum number of keys held by the identity map",
+        repr=False,
+    )
+
+    identity_map_ttl: float = Field(
+        default=DEFAULT_IDENTITY_MAP_TTL,
+        description="Seconds a mutable dataset version or collection is reused",
+        repr=False,
+    )
+
     _native_api: Optional[NativeApi] = PrivateAttr(default=None)
     _data_access_api: Optional[DataAccessApi] = PrivateAttr(default=None)
     _semantic_api: Optional[SemanticApi] = PrivateAttr(default=None)
     _metrics_api: Optional[MetricsApi] = PrivateAttr(default=None)
     _search_api: Optional[SearchApi] = PrivateAttr(default=None)
+    _tabular_cache: Optional[TabularCache] = PrivateAttr(default=None)
+    _block_cache: Optional[BlockCache] = PrivateAttr(default=None)
+    _range_cache: Optional[RangeCache] = PrivateAttr(default=None)
+    _schema_cache: Optional[SchemaCache] = PrivateAttr(default=None)
+    _identity_map: Optional[IdentityMap] = PrivateAttr(default=None)
+    _loop: BackgroundLoop = PrivateAttr(default_factory=BackgroundLoop)
     _factory_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _dataset_factories: Dict[Optional[int], Callable[..., Dataset]] = PrivateAttr(
+        default_factory=dict
+    )
     _factory_initialized: bool = PrivateAttr(default=False)
     _api_version_checked: bool = PrivateAttr(default=False)
 
@@ -186,6 +290,8 @@ class Dataverse(BaseModel):
         self._ensure_apis_initialized()
         # Pre-initialize the factory to prevent race conditions in async operations
         self._ensure_factory_initialized()
+        # Stop the background loop once the instance is garbage collected
+        weakref.finalize(self, self._loop.close)
         return self
 
     def _ensure_apis_initialized(self) -> None:
@@ -196,9 +302,12 @@ class Dataverse(BaseModel):
                 api_token=self.api_token,  # pyright: ignore[reportCallIssue]
                 verbose=self.verbose,  # pyright: ignore[reportCallIssue]
             )
+            # All APIs of this instance share its background event loop
+            self._native_api._loop = self._loop
 
             self._data_access_api = DataAccessApi.from_api(self._native_api)
             self._semantic_api = SemanticApi.from_api(self._native_api)
+            self._semantic_api.context_cache_dir = self.context_cache_dir
             self._metrics_api = MetricsApi.from_api(self._native_api)
             self._search_api = SearchApi.from_api(self._native_api)
 
@@ -228,7 +337,7 @@ class Dataverse(BaseModel):
         if self._api_version_checked:
             return
 
-        version = self.native_api.get_info_version()
+        version = self.version
         major_version = _extract_major_version(version.version)
 
         if major_version < MINIMUM_MAJOR_VERSION:
@@ -282,6 +391,146 @@ class Dataverse(BaseModel):
         assert self._metrics_api is not None, "MetricsApi not initialized"
         return self._metrics_api
 
+    @property
+    def tabular_cache(self) -> Optional[TabularCache]:
+        """
+        The on-disk Parquet cache shared by this instance's datasets.
+
+        Only created when ``tabular_cache_dir`` is set, and requires pyarrow.
+        Tabular reads of files in the cache skip the download and CSV parsing.
+
+        Returns:
+            Optional[TabularCache]: The cache, or None if caching is disabled.
+
+        Example:
+            >>> dv = Dataverse(
+            ...     base_url="https://demo.dataverse.org",
+            ...     tabular_cache_dir="~/.cache/pyDataverse/tabular",
+            ... )
+            >>> df = dv.fetch_dataset(pid).files["data.tab"].open_tabular()
+        """
+        if self.tabular_cache_dir is None:
+            return None
+
+        if self._tabular_cache is None:
+            from ..filesystem.parquet import TabularCache
+
+            self._tabular_cache = TabularCache(
+                self.tabular_cache_dir,
+                max_size=self.tabular_cache_size,
+            )
+        return self._tabular_cache
+
+    @property
+    def block_cache(self) -> BlockCache:
+        """
+        The in-memory block cache shared by this instance's datasets.
+
+        Files opened with ``cache_type="prefetch"`` read through it, so blocks
+        of a file fetched by one handle are reused by every other handle on
+        the same file.
+
+        Returns:
+            BlockCache: The cache, bounded by ``block_cache_size``.
+
+        Example:
+            >>> dv = Dataverse(base_url="https://demo.dataverse.org")
+            >>> with dv.fetch_dataset(pid).open("big.h5", "rb", cache_type="prefetch") as f:
+            ...     data = f.read()
+            >>> dv.block_cache.stats()["hits"]
+        """
+        if self._block_cache is None:
+            self._block_cache = BlockCache(max_size=self.block_cache_size)
+        return self._block_cache
+
+    @property
+    def range_cache(self) -> Optional[RangeCache]:
+        """
+        The persistent on-disk range cache shared by this instance's datasets.
+
+        Only created when ``range_cache_dir`` is set. Byte ranges read from
+        remote files are kept on disk, so later reads of the same ranges, in
+        this or another process, skip the download.
+
+        Returns:
+            Optional[RangeCache]: The cache, or None if caching is disabled.
+
+        Example:
+            >>> dv = Dataverse(
+            ...     base_url="https://demo.dataverse.org",
+            ...     range_cache_dir="~/.cache/pyDataverse/ranges",
+            ... )
+            >>> with dv.fetch_dataset(pid).open("model.h5", "rb") as f:
+            ...     header = f.read(4096)
+        """
+        if self.range_cache_dir is None:
+            return None
+
+        if self._range_cache is None:
+            self._range_cache = RangeCache(
+                self.range_cache_dir,
+                max_size=self.range_cache_size,
+            )
+        return self._range_cache
+
+    @property
+    def schema_cache(self) -> Optional[SchemaCache]:
+        """
+        The persistent on-disk cache of metadata block specifications.
+
+        Only created when ``schema_cache_dir`` is set. Instances for an
+        installation whose version is in the cache load the specifications
+        from disk instead of fetching every block.
+
+        Returns:
+            Optional[SchemaCache]: The cache, or None if caching is disabled.
+
+        Example:
+            >>> dv = Dataverse(
+            ...     base_url="https://demo.dataverse.org",
+            ...     schema_cache_dir="~/.cache/pyDataverse/schemas",
+            ... )
+            >>> dv.schema_cache.directory
+        """
+        if self.schema_cache_dir is None:
+            return None
+
+        if self._schema_cache is None:
+            self._schema_cache = SchemaCache(
+                self.schema_cache_dir,
+                max_age=self.schema_cache_max_age,
+            )
+        return self._schema_cache
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """
+        The identity map of the datasets and collections fetched by this instance.
+
+        Repeated ``fetch_dataset``, ``fetch_collection`` and view lookups for
+        the same identifier and version return the same object. Numbered
+        published versions are kept until evicted; drafts, ``:latest``
+        versions and collections for ``identity_map_ttl`` seconds or until
+        they are written to through this instance.
+
+        Returns:
+            IdentityMap: The map, bounded by ``identity_map_size``.
+
+        Example:
+            >>> dv = Dataverse(base_url="https://demo.dataverse.org")
+            >>> dataset = dv.fetch_dataset(pid, version="1.0")
+            >>> dv.fetch_dataset(pid, version="1.0") is dataset
+            True
+            >>> dv.identity_map.stats()["hits"]
+            1
+        """
+        if self._identity_map is None:
+            self._identity_map = IdentityMap(
+                max_entries=self.identity_map_size,
+                ttl=self.identity_map_ttl,
+            )
+        return self._identity_map
+
     @cached_property
     def version(self) -> info.VersionResponse:
         """
@@ -381,9 +630,8 @@ class Dataverse(BaseModel):
         Return the list of available metadata blocks.
         """
 
-        return self.native_api.get_metadatablocks(full=True)
+        return self._load_metadata_blocks()
 
-    @lru_cache
     def _dataset_factory(
         self,
         enum_limit: Optional[int] = None,
@@ -391,29 +639,32 @@ class Dataverse(BaseModel):
         """
         Return the dataset factory.
 
-        This method is cached to avoid repeated API calls. The factory is
-        pre-initialized during Dataverse setup to prevent race conditions
-        when multiple async operations try to fetch datasets simultaneously.
+        Factories are cached per instance to avoid repeated API calls. The
+        factory is pre-initialized during Dataverse setup to prevent race
+        conditions when multiple async operations try to fetch datasets
+        simultaneously.
+
+        Block models are not created here: each dataset defers its blocks,
+        and a block's model is created when a dataset first accesses it.
         """
+        if enum_limit in self._dataset_factories:
+            return self._dataset_factories[enum_limit]
 
         from .dataset import Dataset
 
         # Ensure APIs are initialized before fetching metadata blocks
         self._ensure_apis_initialized()
 
-        self.native_api.logger.info("Fetching metadata blocks...")
+        metadata_blocks = self.metadatablocks
+        models: Dict[str, Type[MetadataBlockBase]] = {}
 
-        metadata_blocks = asyncio.run(self._get_metadata_blocks())
-
-        blocks = {}
-
-        # Add each metadata block to the dataset
-        for block_name in metadata_blocks:
-            blocks[block_name] = create_model_from_block(
-                block_name,
-                metadata_blocks[block_name].fields,
-                enum_limit=enum_limit,
-            )
+        def block_model(block_name: str) -> Type[MetadataBlockBase]:
+            if block_name not in models:
+                models[block_name] = get_block_model(
+                    metadata_blocks[block_name],
+                    enum_limit=enum_limit,
+                )
+            return models[block_name]
 
         def factory(include: Optional[List[str]] = None) -> Dataset:
             dataset = Dataset(
@@ -424,15 +675,19 @@ class Dataverse(BaseModel):
                 version=None,
             )
 
-            for block_name, model in blocks.items():
-                if include is not None and block_name not in include:
-                    continue
-                dataset.metadata_blocks[block_name] = model()
+            dataset.metadata_blocks.defer(
+                {
+                    block_name: partial(block_model, block_name)
+                    for block_name in metadata_blocks
+                    if include is None or block_name in include
+                }
+            )
 
             return dataset
 
         self.native_api.logger.info("Dataset factory initialized")
 
+        self._dataset_factories[enum_limit] = factory
         return factory
 
     def search(
@@ -682,8 +937,34 @@ class Dataverse(BaseModel):
         self._ensure_factory_initialized()
         return self._dataset_factory(enum_limit=enum_limit)()
 
+    def _load_metadata_blocks(self) -> Dict[str, MetadatablockSpecification]:
+        """
+        Get all metadata block specifications, from the schema cache if possible.
+
+        Returns:
+            Dict[str, MetadatablockSpecification]: A dictionary mapping block names
+                to their full specifications
+        """
+        cache = self.schema_cache
+        if cache is not None:
+            blocks = cache.get(
+                self.base_url,
+                self.version,
+                lambda: self.native_api.get_metadatablocks(full=False),
+            )
+            if blocks is not None:
+                self.native_api.logger.info("Loaded metadata blocks from cache")
+                return blocks
+
+        self.native_api.logger.info("Fetching metadata blocks...")
+        blocks = self.native_api._run_async(self._get_metadata_blocks)
+        if cache is not None:
+            cache.put(self.base_url, self.version, blocks)
+        return blocks
+
     async def _get_metadata_blocks(
         self,
+        native_api: NativeApi,
     ) -> Dict[str, MetadatablockSpecification]:
         """
         Asynchronously fetch all metadata block specifications.
@@ -692,26 +973,63 @@ class Dataverse(BaseModel):
         and then fetches the full specification for each block concurrently
         using asyncio.gather for improved performance.
 
+        Args:
+            native_api: Async copy of the NativeApi, bound to the background loop
+
         Returns:
             Dict[str, MetadatablockSpecification]: A dictionary mapping block names
                 to their full specifications
+        """
+        listing: List[MetadatablockMeta] = await native_api.get_metadatablocks(  # type: ignore
+            full=False
+        )
+        tasks = [native_api.get_metadatablock(block.name) for block in listing]
+        results: List[MetadatablockSpecification] = await asyncio.gather(*tasks)  # type: ignore
+        return {block.name: block for block in results}
 
-        Raises:
-            Exception: If there's an error during the async operations, the
-                exception is re-raised after cleaning up the async client
+    def _run(self, coroutine: Coroutine[Any, Any, R]) -> R:
         """
-        native_api = self.native_api  # Use property to ensure initialization
-        blocks = [block.name for block in native_api.get_metadatablocks(full=False)]
-        try:
-            native_api._setup_async_client()
-            tasks = [native_api.get_metadatablock(block) for block in blocks]
-            results: List[MetadatablockSpecification] = await asyncio.gather(*tasks)  # type: ignore
-            return {block.name: block for block in results}
-        except Exception as e:
-            native_api.client = None
-            raise e
-        finally:
-            native_api.client = None
+        Run a coroutine on this instance's background event loop and wait for it.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return self._loop.run(coroutine)
+
+    def close(self) -> None:
+        """
+        Stop the background event loop and close its connections.
+
+        The loop runs the concurrent requests of the sync API. It is started
+        again if the instance is used after closing. Instances that are not
+        closed explicitly, or used as a context manager, close the loop when
+        they are garbage collected.
+        """
+        self._loop.close()
+
+    def __enter__(self) -> Self:
+        """
+        Use the instance as a context manager that closes it on exit.
+
+        Example:
+            >>> with Dataverse(base_url="https://demo.dataverse.org") as dv:
+            ...     dataset = dv.fetch_dataset("doi:10.70122/FK2/ABC123")
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the instance when leaving a context manager.
+
+        Args:
+            exc_type (type): The type of the exception raised, if any.
+            exc_value (Exception): The exception raised, if any.
+            traceback (traceback): The traceback object associated with the exception, if any.
+        """
+        self.close()
 
     def fetch_dataset(
         self,
@@ -720,10 +1038,76 @@ class Dataverse(BaseModel):
             Literal[":latest", ":latest-published", ":draft"], str
         ] = ":latest",
     ) -> Dataset:
-        return self._internal_fetch_dataset(
-            identifier,
-            version,
-            _blocks_to_include=None,
+        """
+        Load a dataset from the Dataverse instance.
+
+        Datasets are kept in the instance's :attr:`identity_map`, so fetching
+        the same identifier and version again returns the same object without
+        a request, until the entry expires or the dataset is written to.
+
+        Args:
+            identifier: Dataset identifier - either a persistent ID (e.g. `doi:10.11587/8H3N93`)
+                or numeric database ID.
+            version: Version to retrieve. Options are `:latest-published` (latest published),
+                `:latest` (draft if exists, otherwise latest published), `:draft` (draft only),
+                `x.y` (specific version like 1.0), or `x` (major version like 1).
+                Defaults to `:latest`.
+
+        Returns:
+            Dataset: A Dataset instance with metadata blocks populated from the server.
+        """
+        dataset = self.identity_map.get(dataset_key(identifier, version))
+        if dataset is None:
+            dataset = self._internal_fetch_dataset(
+                identifier,
+                version,
+                _blocks_to_include=None,
+            )
+            self._remember_dataset(dataset, version, identifier)
+        return dataset
+
+    def _remember_dataset(
+        self,
+        dataset: Dataset,
+        version: str,
+        identifier: Union[str, int, None] = None,
+    ) -> None:
+        """Store a dataset version in the identity map under all its identifiers."""
+        identifiers = {identifier, dataset.persistent_identifier, dataset.identifier}
+        self.identity_map.put(
+            [dataset_key(name, version) for name in identifiers if name is not None],
+            dataset,
+        )
+
+    def invalidate(self, target: Union[Dataset, Collection]) -> None:
+        """
+        Drop a dataset or collection that was written to from the identity map.
+
+        Writes through :class:`Dataset`, :class:`Collection` and
+        :class:`~pyDataverse.dataverse.file.File` call this themselves; call
+        it after changing a dataset or collection through the Native API
+        directly, so that the next fetch returns fresh metadata. Numbered
+        dataset versions are immutable and stay cached.
+
+        Args:
+            target: The dataset or collection that was written to.
+
+        Example:
+            >>> dv.native_api.edit_dataset_metadata(dataset.identifier, body)
+            >>> dv.invalidate(dataset)
+        """
+        from .collection import Collection
+
+        if isinstance(target, Collection):
+            identifiers: List[Union[str, int, None]] = [target.identifier]
+            if target._metadata is not None:
+                identifiers += [target._metadata.alias, target._metadata.id]
+            self.identity_map.invalidate("collection", identifiers)
+            return
+
+        self.identity_map.invalidate(
+            "dataset",
+            [target.persistent_identifier, target.identifier],
         )
 
     def _internal_fetch_dataset(
@@ -776,10 +1160,24 @@ class Dataverse(BaseModel):
     ):
         """
         Load a collection from the Dataverse instance.
+
+        Collections are kept in the instance's :attr:`identity_map`, like
+        datasets, so their cached metadata and contents are reused.
+
+        Args:
+            identifier: Collection alias or numeric database ID.
+
+        Returns:
+            Collection: The collection.
         """
         from .collection import Collection
 
-        return Collection(dataverse=self, identifier=identifier)
+        key = collection_key(identifier)
+        coll = self.identity_map.get(key)
+        if coll is None:
+            coll = Collection(dataverse=self, identifier=identifier)
+            self.identity_map.put([key], coll)
+        return coll
 
     def from_dataverse_dict(
         self,
@@ -827,8 +1225,9 @@ class Dataverse(BaseModel):
         dataset = self._internal_create_blank_dataset(enum_limit=enum_limit)
         blocks = {}
 
-        for block_name, block in dataset.metadata_blocks.items():
-            blocks[block_name] = block.__class__
+        # Blocks of a blank dataset are deferred, so list all available ones
+        for block_name in dataset.metadata_blocks.available:
+            blocks[block_name] = dataset.metadata_blocks[block_name].__class__
 
         return blocks
 
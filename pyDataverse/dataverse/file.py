@@ -3,7 +3,17 @@ from __future__ import annotations
 import webbrowser
 from functools import cached_property
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Dict, Iterator, List, Literal, Optional, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
 import pandas as pd
 import rich
@@ -148,9 +158,10 @@ class File(ContentBase):
         """
         Get the schema (column names and data types) of a tabular file.
 
-        This property reads the first few rows of the tabular file to infer the column
-        names and data types using pandas' type inference. The result is cached so
-        subsequent accesses don't require additional API calls.
+        For ingested files the schema is resolved from the file's DDI variable
+        metadata, without downloading any data. Other tabular files fall back to
+        reading the first few rows and using pandas' type inference. The result
+        is cached so subsequent accesses don't require additional API calls.
 
         Returns:
             Dict[str, str]: A dictionary mapping column names to their pandas data types
@@ -169,6 +180,10 @@ class File(ContentBase):
         if not self.is_tabular:
             raise ValueError(f"File '{self.path}' is not tabular")
 
+        variables = self.dataset.fs.tabular_variables(self.path)
+        if variables:
+            return {variable.name: variable.pandas_dtype for variable in variables}
+
         # Stream first 4 rows and get dtypes and names
         header = self.open_tabular(nrows=4)
 
@@ -235,6 +250,7 @@ class File(ContentBase):
         )
 
         self._metadata = None  # drop stale cache
+        self.dataset.dataverse.invalidate(self.dataset)
 
         return result
 
@@ -310,6 +326,36 @@ class File(ContentBase):
             **kwargs,
         )
 
+    def stream_arrow(
+        self,
+        columns: Optional[List[str]] = None,
+        no_header: bool = False,
+        output: Literal["arrow", "pandas", "polars"] = "arrow",
+        block_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Read a tabular file as a stream of Arrow record batches (requires ``pyarrow``).
+
+        Args:
+            columns (Optional[List[str]]): Column names to read (default: all).
+            no_header (bool): If True, columns are named f0, f1, ...
+            output (str): "arrow" (default), "pandas" or "polars".
+            block_size (Optional[int]): Number of bytes parsed per batch.
+
+        Yields:
+            pyarrow.RecordBatch, or a DataFrame for "pandas"/"polars" output.
+        """
+        if not self.is_tabular:
+            raise ValueError(f"File '{self.path}' is not tabular")
+
+        return self.dataset.stream_arrow(
+            self.path,
+            columns=columns,
+            no_header=no_header,
+            output=output,
+            block_size=block_size,
+        )
+
     def download(
         self,
         path: Union[str, Path],
@@ -355,7 +401,9 @@ class File(ContentBase):
         Returns:
             None
         """
-        self.native_api.replace_datafile(
+        replaced_id = self.id
+
+        response = self.native_api.replace_datafile(
             self.identifier,
             file,
             metadata=UploadBody(
@@ -363,15 +411,24 @@ class File(ContentBase):
                 categories=categories,
                 restrict=restrict,
             ),
+            dataset_identifier=self.dataset.identifier,
         )
 
         rich.print(f"Replaced {self.path} with {file}")
 
+        self.dataset.fs.record_write(
+            removed=[replaced_id],
+            added=response.files or None,
+        )
+        self.dataset.dataverse.invalidate(self.dataset)
         self._metadata = None  # drop stale cache
 
     def delete(self) -> None:
         """
         Delete the file from Dataverse.
         """
+        deleted_id = self.id
         self.native_api.delete_datafile(self.identifier)
+        self.dataset.fs.record_write(removed=[deleted_id])
+        self.dataset.dataverse.invalidate(self.dataset)
         rich.print(f"Deleted {self.path}")
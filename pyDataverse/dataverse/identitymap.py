@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from ..filesystem.metacache import is_immutable_version
+
+# Default number of keys held by a Dataverse instance's identity map.
+DEFAULT_MAX_ENTRIES = 256
+
+# Default number of seconds a mutable dataset version or collection is served
+# from the identity map before it is fetched again.
+DEFAULT_TTL = 300.0
+
+# (kind, identifier, version); collections have no version.
+IdentityKey = Tuple[str, str, Optional[str]]
+
+
+class _Entry(NamedTuple):
+    value: Any
+    stored_at: float
+    immutable: bool
+
+
+def dataset_key(identifier: Union[str, int], version: Union[str, int]) -> IdentityKey:
+    """
+    The identity map key of a dataset version.
+
+    Args:
+        identifier: Dataset identifier (PID or database ID).
+        version: The requested version.
+
+    Returns:
+        IdentityKey: The key.
+    """
+    return ("dataset", str(identifier), str(version))
+
+
+def collection_key(identifier: Union[str, int]) -> IdentityKey:
+    """
+    The identity map key of a collection.
+
+    Args:
+        identifier: Collection alias or database ID.
+
+    Returns:
+        IdentityKey: The key.
+    """
+    return ("collection", str(identifier), None)
+
+
+class IdentityMap:
+    """
+    Bounded identity map of the datasets and collections of one Dataverse.
+
+    Repeated ``fetch_dataset`` and ``fetch_collection`` calls for the same
+    identifier and version return the same object instead of fetching and
+    rebuilding it. An object is stored under each of its identifiers, e.g.
+    both the PID and the database ID of a dataset.
+
+    Numbered published versions (``"1.0"``) never change and do not expire.
+    Drafts, ``:latest``, ``:latest-published`` and collections are served for
+    at most ``ttl`` seconds, and local writes drop them right away (see
+    :meth:`invalidate`). The least recently used keys are evicted once more
+    than ``max_entries`` are held.
+
+    Attributes:
+        max_entries: Maximum number of keys held.
+        ttl: Seconds a mutable dataset version or collection is served.
+        hits: Lookups served from the map.
+        misses: Lookups that had to fetch.
+
+    Example:
+        >>> dv = Dataverse(base_url="https://demo.dataverse.org")
+        >>> dv.fetch_dataset(pid) is dv.fetch_dataset(pid)
+        True
+        >>> dv.identity_map.stats()
+        {'hits': 1, 'misses': 1, 'entries': 2}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Initialize an empty identity map.
+
+        Args:
+            max_entries: Maximum number of keys held. Zero disables the map.
+            ttl: Seconds a mutable dataset version or collection is served.
+        """
+        if max_entries < 0:
+            raise ValueError(f"max_entries must not be negative, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[IdentityKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def get(self, key: IdentityKey) -> Optional[Any]:
+        """
+        Get a stored object.
+
+        Args:
+            key: The object's key (see :func:`dataset_key` and :func:`collection_key`).
+
+        Returns:
+            Optional[Any]: The object, or None if not stored or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.immutable:
+                if time.monotonic() - entry.stored_at >= self.ttl:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, keys: Iterable[IdentityKey], value: Any) -> None:
+        """
+        Store an object under each of its keys.
+
+        Args:
+            keys: The object's keys.
+            value: The object.
+        """
+        if self.max_entries == 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                immutable = key[0] == "dataset" and is_immutable_version(key[2])
+                self._entries[key] = _Entry(value, now, immutable)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        kind: str,
+        identifiers: Iterable[Union[str, int, None]],
+    ) -> None:
+        """
+        Drop the mutable entries of a dataset or collection after a local write.
+
+        Numbered published dataset versions are kept, since writes cannot
+        change them.
+
+        Args:
+            kind: ``"dataset"`` or ``"collection"``.
+            identifiers: All known identifiers of the dataset or collection.
+        """
+        names = {str(identifier) for identifier in identifiers if identifier}
+        if not names:
+            return
+
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == kind and key[1] in names and not entry.immutable
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
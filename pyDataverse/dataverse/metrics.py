@@ -82,32 +82,39 @@ class Metrics(BaseModel):
         Returns:
             Dict[str, Any]: Dictionary containing summary metrics, with metric names as keys.
         """
-        return asyncio.run(self._serialize_metrics_async())
+        return self.metrics_api._run_async(self._serialize_metrics_async)
 
-    async def _serialize_metrics_async(self) -> Dict[str, Any]:
-        """Internal async helper to parallelize metric collection."""
-        api = self.metrics_api
+    async def _serialize_metrics_async(self, api: MetricsApi) -> Dict[str, Any]:
+        """
+        Internal async helper to parallelize metric collection.
+
+        Args:
+            api: Async copy of the MetricsApi, bound to the background loop.
+        """
         data_types = ("dataverses", "datasets", "files", "downloads")
         locations = ("local", "remote", "all")
 
         # Pre-compute collections to dicts
         tasks = [
-            asyncify(api.get_collections_by_subject)(parent_alias=self.parent_alias),
-            asyncify(api.get_collections_by_category)(parent_alias=self.parent_alias),
+            # The tabular metrics are parsed synchronously after the request
+            asyncify(self.metrics_api.get_collections_by_subject)(
+                parent_alias=self.parent_alias
+            ),
+            asyncify(self.metrics_api.get_collections_by_category)(
+                parent_alias=self.parent_alias
+            ),
             *[
-                asyncify(api.get_datasets_by_data_location)(
+                api.get_datasets_by_data_location(
                     data_location=loc, parent_alias=self.parent_alias
                 )
                 for loc in locations
             ],
             *[
-                asyncify(api.total)(
-                    data_type=cast(DataType, dt), parent_alias=self.parent_alias
-                )
+                api.total(data_type=cast(DataType, dt), parent_alias=self.parent_alias)
                 for dt in data_types
             ],
             *[
-                asyncify(api.past_days)(
+                api.past_days(
                     data_type=cast(DataType, dt), days=7, parent_alias=self.parent_alias
                 )
                 for dt in data_types
@@ -152,18 +159,21 @@ class Metrics(BaseModel):
         Example:
             >>> dv.metrics.df
         """
-        return asyncio.run(self._collect_all_metrics())
+        return self.metrics_api._run_async(self._collect_all_metrics)
 
-    async def _collect_all_metrics(self) -> pd.DataFrame:
+    async def _collect_all_metrics(self, api: MetricsApi) -> pd.DataFrame:
         """
-        Internal: Collect all top-level metrics in parallel via asyncer.
+        Internal: Collect all top-level metrics in parallel.
+
+        Args:
+            api: Async copy of the MetricsApi, bound to the background loop.
 
         Returns:
             pd.DataFrame: Table with columns ['Type', 'Interval', 'Location', 'Count'].
         """
-        total_async = asyncify(self.metrics_api.total)
-        past_days_async = asyncify(self.metrics_api.past_days)
-        location_async = asyncify(self.metrics_api.get_datasets_by_data_location)
+        total_async = api.total
+        past_days_async = api.past_days
+        location_async = api.get_datasets_by_data_location
 
         data_types = ["dataverses", "datasets", "files", "downloads"]
         locations = ["local", "remote", "all"]
@@ -309,7 +319,7 @@ class Metrics(BaseModel):
         """
         Dictionary of all metrics.
         """
-        return asyncio.run(self._serialize_metrics_async())
+        return self.metrics_api._run_async(self._serialize_metrics_async)
 
     def json(self, indent: Optional[int] = 4) -> str:
         """
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from ..models.info import VersionResponse
+from ..models.metadatablocks import MetadatablockMeta, MetadatablockSpecification
+
+# Seconds a cached schema is trusted before the block listing is checked.
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+_SUFFIX = ".json"
+
+
+class SchemaCache:
+    """
+    Persistent on-disk cache of the metadata block specifications of
+    Dataverse installations.
+
+    Fetching every block specification is the slow part of creating a
+    :class:`Dataverse`. This cache keeps them on disk, keyed by the
+    installation's base URL and its version and build, so later instances,
+    in this or another process, start without any block requests. The
+    version is requested at startup anyway, so an upgrade of the
+    installation is picked up at once.
+
+    Blocks loaded into an installation without an upgrade are caught by a
+    cheap check: once an entry is older than ``max_age`` seconds, the brief
+    block listing (one request) is compared with the cached blocks. The
+    entry is kept if they match, and fetched again otherwise. Changes to the
+    fields of an existing block show after :meth:`clear`.
+
+    Attributes:
+        directory: Directory the cached schemas are stored in.
+        max_age: Seconds after which an entry is checked against the listing.
+
+    Example:
+        >>> dv = Dataverse(
+        ...     base_url="https://demo.dataverse.org",
+        ...     schema_cache_dir="~/.cache/pyDataverse/schemas",
+        ... )  # fetches the blocks once, later instances load them from disk
+    """
+
+    def __init__(self, directory: Union[str, Path], max_age: float = DEFAULT_MAX_AGE):
+        if max_age < 0:
+            raise ValueError(f"max_age must not be negative, got {max_age}")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+
+    def get(
+        self,
+        base_url: str,
+        version: VersionResponse,
+        list_blocks: Callable[[], List[MetadatablockMeta]],
+    ) -> Optional[Dict[str, MetadatablockSpecification]]:
+        """
+        Get the cached block specifications of an installation.
+
+        Args:
+            base_url: Base URL of the Dataverse installation.
+            version: The installation's current version.
+            list_blocks: Fetches the brief block listing, to check an entry
+                older than ``max_age``.
+
+        Returns:
+            Optional[Dict[str, MetadatablockSpecification]]: The specifications
+            by block name, or None if not cached or out of date.
+        """
+        path = self._path(base_url, version)
+        entry = self._load(path)
+        if entry is None or entry.get("base_url") != _normalize(base_url):
+            return None
+
+        try:
+            blocks = {
+                block["name"]: MetadatablockSpecification.model_validate(block)
+                for block in entry["blocks"]
+            }
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            return None
+        if age >= self.max_age:
+            listed = {(block.id, block.name) for block in list_blocks()}
+            if listed != {(block.id, block.name) for block in blocks.values()}:
+                return None
+            _touch(path)
+
+        return blocks
+
+    def put(
+        self,
+        base_url: str,
+        version: VersionResponse,
+        blocks: Dict[str, MetadatablockSpecification],
+    ) -> None:
+        """
+        Store the block specifications of an installation.
+
+        Args:
+            base_url: Base URL of the Dataverse installation.
+            version: The installation's current version.
+            blocks: The specifications by block name.
+        """
+        entry = {
+            "base_url": _normalize(base_url),
+            "version": version.version,
+            "build": version.build,
+            "blocks": [
+                block.model_dump(mode="json", by_alias=True)
+                for block in blocks.values()
+            ],
+        }
+
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(name, self._path(base_url, version))
+        except OSError:
+            try:
+                os.unlink(name)
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all cached schemas."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _path(self, base_url: str, version: VersionResponse) -> Path:
+        key = "\n".join([_normalize(base_url), version.version, version.build or ""])
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / f"{digest}{_SUFFIX}"
+
+    @staticmethod
+    def _load(path: Path) -> Optional[dict]:
+        try:
+            with open(path) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+
+def _normalize(base_url: str) -> str:
+    return base_url.rstrip("/")
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
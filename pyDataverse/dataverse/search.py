@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Dict, List, Union, cast
 
 from ..models.collection.content import Collection as ContentCollection
 from ..models.collection.content import Dataset as ContentDataset
+from .summary import DatasetSummary
 from .views.collectionview import CollectionView
 from .views.datasetview import DatasetView
 
@@ -100,6 +101,28 @@ class SearchResult:
             dataverse=self.dataverse,
         )
 
+    @cached_property
+    def summaries(self) -> List[DatasetSummary]:
+        """
+        Return a read-only summary of each dataset in the search results.
+
+        Summaries are filled from the search response itself, so no further
+        requests are made until a summary is upgraded with ``to_dataset()``.
+
+        Returns:
+            List[DatasetSummary]: One summary per dataset result.
+
+        Examples:
+            >>> for summary in search_result.summaries:
+            ...     print(summary.title, summary.authors)
+            >>> dataset = search_result.summaries[0].to_dataset()
+        """
+        return [
+            DatasetSummary.from_search(item, self.dataverse)
+            for item in self._search_response.items or []
+            if item.type == "dataset" and item.global_id
+        ]
+
     @cached_property
     def collections(self) -> CollectionView:
         """
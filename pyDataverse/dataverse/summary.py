@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Union
+
+from ..models.dataset import edit_get
+from ..models.search import Item
+
+if TYPE_CHECKING:
+    from .dataset import Dataset
+    from .dataverse import Dataverse
+
+
+class DatasetSummary:
+    """
+    A compact, read-only summary of a dataset for bulk listings.
+
+    Summaries hold only the fields needed to list datasets and are filled
+    straight from a raw dataset response or search result, without building
+    metadata block models, file views or filesystems. Listing thousands of
+    datasets therefore stays cheap in time and memory. Call :meth:`to_dataset`
+    to load the full :class:`Dataset` when one is needed.
+
+    Attributes:
+        identifier: Database ID, if known. Search results do not include it.
+        persistent_identifier: Persistent identifier (e.g. DOI).
+        version: The version summarized, e.g. ``":latest"``, ``":draft"`` or ``"1.2"``.
+        title: Dataset title.
+        authors: Author names.
+        subjects: Subject terms.
+        license: License name, if known. Search results do not include it.
+        file_count: Number of files.
+        size: Total size of all files in bytes, if known. Search results do
+            not include it.
+
+    Example:
+        >>> for summary in collection.datasets.summaries():
+        ...     print(summary.persistent_identifier, summary.title)
+        >>> dataset = summary.to_dataset()
+    """
+
+    __slots__ = (
+        "_dataverse",
+        "identifier",
+        "persistent_identifier",
+        "version",
+        "title",
+        "authors",
+        "subjects",
+        "license",
+        "file_count",
+        "size",
+    )
+
+    _dataverse: "Dataverse"
+    identifier: Optional[int]
+    persistent_identifier: Optional[str]
+    version: str
+    title: Optional[str]
+    authors: Tuple[str, ...]
+    subjects: Tuple[str, ...]
+    license: Optional[str]
+    file_count: Optional[int]
+    size: Optional[int]
+
+    def __init__(
+        self,
+        dataverse: "Dataverse",
+        *,
+        identifier: Optional[int] = None,
+        persistent_identifier: Optional[str] = None,
+        version: str = ":latest",
+        title: Optional[str] = None,
+        authors: Iterable[str] = (),
+        subjects: Iterable[str] = (),
+        license: Optional[str] = None,
+        file_count: Optional[int] = None,
+        size: Optional[int] = None,
+    ):
+        """
+        Initialize the summary.
+
+        Args:
+            dataverse: The Dataverse instance used to load the full dataset.
+            identifier: Database ID of the dataset.
+            persistent_identifier: Persistent identifier of the dataset.
+            version: The version summarized.
+            title: Dataset title.
+            authors: Author names.
+            subjects: Subject terms.
+            license: License name.
+            file_count: Number of files.
+            size: Total size of all files in bytes.
+        """
+        set_field = object.__setattr__
+        set_field(self, "_dataverse", dataverse)
+        set_field(self, "identifier", identifier)
+        set_field(self, "persistent_identifier", persistent_identifier)
+        set_field(self, "version", version)
+        set_field(self, "title", title)
+        set_field(self, "authors", tuple(authors))
+        set_field(self, "subjects", tuple(subjects))
+        set_field(self, "license", license)
+        set_field(self, "file_count", file_count)
+        set_field(self, "size", size)
+
+    @classmethod
+    def from_response(
+        cls,
+        response: edit_get.GetDatasetResponse,
+        dataverse: "Dataverse",
+        version: str = ":latest",
+    ) -> DatasetSummary:
+        """
+        Summarize a raw dataset response from the native API.
+
+        Args:
+            response: The dataset response, as returned by ``NativeApi.get_dataset``.
+            dataverse: The Dataverse instance used to load the full dataset.
+            version: The version the response was requested for.
+
+        Returns:
+            DatasetSummary: The summary.
+        """
+        content: edit_get.Dataset = response
+        if not response.metadata_blocks and response.latest_version is not None:
+            content = response.latest_version
+
+        citation = (content.metadata_blocks or {}).get("citation")
+        values = (
+            {field.type_name: field.value for field in citation.fields}
+            if citation is not None
+            else {}
+        )
+
+        files = content.files or []
+        sizes = [
+            file.data_file.filesize
+            for file in files
+            if file.data_file is not None and file.data_file.filesize is not None
+        ]
+
+        return cls(
+            dataverse,
+            identifier=response.dataset_id or response.id,
+            persistent_identifier=response.dataset_persistent_id,
+            version=version,
+            title=_as_text(values.get("title")),
+            authors=_compound_values(values.get("author"), "authorName"),
+            subjects=_as_texts(values.get("subject")),
+            license=response.license.name if response.license else None,
+            file_count=len(files),
+            size=sum(sizes) if len(sizes) == len(files) else None,
+        )
+
+    @classmethod
+    def from_search(
+        cls,
+        item: Union[Item, Dict[str, Any]],
+        dataverse: "Dataverse",
+    ) -> DatasetSummary:
+        """
+        Summarize a dataset item of a search response.
+
+        Args:
+            item: The search item, as a model or as raw search JSON.
+            dataverse: The Dataverse instance used to load the full dataset.
+
+        Returns:
+            DatasetSummary: The summary.
+        """
+        if not isinstance(item, Item):
+            item = Item.model_validate(item)
+
+        if item.version_state == "DRAFT" or item.major_version is None:
+            version = ":draft" if item.version_state == "DRAFT" else ":latest"
+        else:
+            version = f"{item.major_version}.{item.minor_version or 0}"
+
+        return cls(
+            dataverse,
+            persistent_identifier=item.global_id,
+            version=version,
+            title=item.name,
+            authors=item.authors or (),
+            subjects=item.subjects or (),
+            file_count=item.file_count,
+        )
+
+    def to_dataset(self) -> "Dataset":
+        """
+        Load the full dataset this summary describes.
+
+        Returns:
+            Dataset: The dataset, at the summarized version.
+
+        Raises:
+            ValueError: If the summary has no identifier to load the dataset by.
+        """
+        identifier = self.persistent_identifier or self.identifier
+        if identifier is None:
+            raise ValueError("Dataset summary has no identifier")
+        return self._dataverse.fetch_dataset(identifier, version=self.version)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return (
+            f"DatasetSummary(persistent_identifier={self.persistent_identifier!r}, "
+            f"version={self.version!r}, title={self.title!r})"
+        )
+
+
+def _as_text(value: Any) -> Optional[str]:
+    """Return a primitive field value as text, or None for other values."""
+    return value if isinstance(value, str) else None
+
+
+def _as_texts(value: Any) -> Tuple[str, ...]:
+    """Return the text values of a single or multiple primitive field."""
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, list):
+        return tuple(item for item in value if isinstance(item, str))
+    return ()
+
+
+def _compound_values(value: Any, child: str) -> Tuple[str, ...]:
+    """Return the values of one child field of a compound field."""
+    if isinstance(value, dict):
+        value = [value]
+    if not isinstance(value, list):
+        return ()
+
+    values = []
+    for entry in value:
+        if isinstance(entry, dict) and child in entry:
+            text = _as_text(entry[child].value)
+            if text is not None:
+                values.append(text)
+    return tuple(values)
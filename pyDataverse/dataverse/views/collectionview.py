@@ -45,9 +45,11 @@ class CollectionView(ContentView["Collection"]):
 
         ``fetch_collection`` only builds a lazy handle, so the metadata request
         is issued here to make the view's concurrent fetch window do real work.
+        Collections from the identity map keep the metadata they already have.
         """
         coll = self.dataverse.fetch_collection(identifier)
-        coll._metadata = self.dataverse.native_api.get_collection(identifier)
+        if coll._metadata is None:
+            coll._metadata = self.dataverse.native_api.get_collection(identifier)
         return coll
 
     def _get_cache_keys(
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple, Type, Union
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Type, Union
 
 from ...models.collection import content as collection_content
+from ..summary import DatasetSummary
 from .contentview import ContentView
 
 if TYPE_CHECKING:
@@ -19,6 +20,9 @@ class DatasetView(ContentView["Dataset"]):
 
     Internally, the view optimizes performance by prefetching datasets concurrently on
     first iteration and maintains a cache for fast repeated access.
+
+    For listings of many datasets, :meth:`summaries` yields lightweight
+    :class:`DatasetSummary` objects instead of full datasets.
     """
 
     def _get_content_type(self) -> Type:
@@ -41,6 +45,34 @@ class DatasetView(ContentView["Dataset"]):
         """Fetch a single dataset by identifier."""
         return self.dataverse.fetch_dataset(identifier)
 
+    def summaries(self, batch_size: int = 100) -> Iterator[DatasetSummary]:
+        """
+        Yield a read-only summary of each dataset, in order.
+
+        Raw dataset responses are fetched concurrently in batches and turned
+        into summaries directly, without building full Dataset objects. Only
+        one batch of responses is held in memory at a time. Datasets that
+        fail to load are skipped. Summaries are not cached by the view.
+
+        Args:
+            batch_size: Number of datasets to fetch per batch.
+
+        Yields:
+            DatasetSummary: The summary of each dataset.
+
+        Example:
+            >>> titles = [s.title for s in collection.datasets.summaries()]
+            >>> dataset = next(collection.datasets.summaries()).to_dataset()
+        """
+        ids = self._extract_ids()
+        self._ids = ids
+        native_api = self.dataverse.native_api
+        for start in range(0, len(ids), batch_size):
+            responses = native_api.get_datasets(ids[start : start + batch_size])
+            for response in responses:
+                if response is not None:
+                    yield DatasetSummary.from_response(response, self.dataverse)
+
     def _get_cache_keys(self, dataset: "Dataset") -> List[Union[str, int]]:
         """Extract cache keys from a fetched dataset."""
         keys = []
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Generator,
     List,
@@ -12,6 +14,7 @@ from typing import (
     Union,
 )
 
+import numpy as np
 import pandas as pd
 from bigtree.node.node import Node
 from bigtree.tree.export import print_tree
@@ -390,3 +393,109 @@ class FilesView:
                 )
             )
         return pd.DataFrame(rows)
+
+    def load_tabular(
+        self,
+        paths: Optional[Sequence[str]] = None,
+        max_concurrency: int = 4,
+        concat: bool = False,
+        source_column: str = "source_path",
+        **kwargs: Any,
+    ) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+        """
+        Download and parse several tabular files concurrently.
+
+        At most ``max_concurrency`` files are downloaded and parsed at the same
+        time, which bounds the peak memory used by in-flight parses.
+
+        Args:
+            paths (Optional[Sequence[str]]): Paths of the files to load. Defaults
+                to every tabular file in the view.
+            max_concurrency (int): Maximum number of files parsed at once.
+            concat (bool): If True, return one DataFrame with all rows and a
+                ``source_column`` holding each row's file path. All files must
+                share the same columns and dtypes.
+            source_column (str): Name of the path column when ``concat`` is True.
+            **kwargs: Additional arguments forwarded to ``File.open_tabular``.
+
+        Returns:
+            Union[Dict[str, pd.DataFrame], pd.DataFrame]: DataFrames keyed by path
+                in view order, or the concatenated DataFrame when ``concat`` is True.
+
+        Raises:
+            KeyError: If a path does not refer to a file in this view.
+            ValueError: If a file is not tabular, or ``concat`` is True and the
+                files' schemas differ.
+
+        Example:
+            >>> frames = dataset.tabular_files.load_tabular()
+            >>> df = dataset.tabular_files.load_tabular(
+            ...     ["data/2023.tab", "data/2024.tab"], concat=True
+            ... )
+        """
+        self._load_files()
+        if paths is None:
+            paths = [path for path in self._files_list if self[path].is_tabular]
+        files = [self[path] for path in paths]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            results = list(
+                executor.map(lambda file: file.open_tabular(**kwargs), files)
+            )
+
+        frames = {file.path: df for file, df in zip(files, results)}
+        if not concat:
+            return frames
+
+        return _concat_frames(frames, source_column)
+
+
+def _concat_frames(
+    frames: Dict[str, pd.DataFrame],
+    source_column: str,
+) -> pd.DataFrame:
+    """
+    Concatenate DataFrames of identical schema, tagging rows with their path.
+
+    The path column is categorical, so it costs one small integer per row.
+    """
+    if not frames:
+        return pd.DataFrame({source_column: pd.Categorical([])})
+
+    items = list(frames.items())
+    first_path, first = items[0]
+    schema = _schema(first)
+    for path, df in items[1:]:
+        if _schema(df) != schema:
+            raise ValueError(
+                f"Schema of '{path}' does not match '{first_path}'; "
+                "use concat=False to load files with different schemas"
+            )
+
+    if source_column in first.columns:
+        raise ValueError(f"Column '{source_column}' already exists in the data")
+
+    combined = pd.concat([df for _, df in items], ignore_index=True)
+
+    # Categoricals with differing categories concatenate to object.
+    for column, dtype in schema:
+        if dtype == "category" and combined[column].dtype != "category":
+            combined[column] = combined[column].astype("category")
+
+    combined.insert(
+        0,
+        source_column,
+        pd.Categorical(
+            np.repeat([path for path, _ in items], [len(df) for _, df in items]),
+            categories=[path for path, _ in items],
+        ),
+    )
+    return combined
+
+
+def _schema(df: pd.DataFrame) -> List[tuple]:
+    """Column names and dtypes, treating all categoricals as one dtype."""
+    return [
+        (column, "category" if isinstance(dtype, pd.CategoricalDtype) else str(dtype))
+        for column, dtype in df.dtypes.items()
+    ]
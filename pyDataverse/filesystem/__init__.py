@@ -2,16 +2,30 @@
 
 from fsspec import register_implementation
 
+from .asyncfs import AsyncDataverseFS
+from .blockcache import BlockCache
+from .direct import DirectUploader
 from .dvfs import DataverseFS
+from .metacache import SHARED_METADATA_CACHE, MetadataCache
+from .rangecache import RangeCache
 from .reader import DataverseFileReader
-from .writer import DataverseFileWriter
+from .redirects import RedirectCache
+from .writer import DataverseFileWriter, DataverseTransaction
 
 # Register the "dataverse://" protocol for source/editable installs; a packaging
 # entry point also registers it on install (clobber keeps both idempotent).
 register_implementation("dataverse", DataverseFS, clobber=True)
 
 __all__ = [
+    "AsyncDataverseFS",
+    "BlockCache",
     "DataverseFS",
     "DataverseFileReader",
     "DataverseFileWriter",
+    "DataverseTransaction",
+    "DirectUploader",
+    "MetadataCache",
+    "RangeCache",
+    "RedirectCache",
+    "SHARED_METADATA_CACHE",
 ]
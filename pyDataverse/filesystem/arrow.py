@@ -0,0 +1,192 @@
+import io
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Arrow-based tabular streaming requires pyarrow. "
+        "Install it with: pip install 'pyDataverse[arrow]'"
+    ) from e
+
+from .variables import TabularVariable
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ..api import DataAccessApi
+
+ArrowOutput = Literal["arrow", "pandas", "polars"]
+
+# Bytes parsed per record batch. Large enough to amortize per-batch overhead,
+# small enough to keep memory bounded on multi-gigabyte files.
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class _ResponseReader(io.RawIOBase):
+    """Raw, read-only file adapter over a streaming httpx response.
+
+    Arrow's CSV reader pulls bytes through ``readinto``; each call is served
+    from the response's byte iterator without materializing the body.
+    """
+
+    def __init__(self, response: "httpx.Response", chunk_size: int):
+        self._chunks = response.iter_bytes(chunk_size)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def arrow_type(variable: TabularVariable) -> "pa.DataType":
+    """
+    The Arrow type for a DDI variable.
+
+    Arrow columns are nullable, so integer variables always map to ``int64``
+    regardless of missing values. Labelled character variables are dictionary
+    encoded, mirroring the ``category`` dtype used for pandas reads.
+
+    Args:
+        variable: The variable to map.
+
+    Returns:
+        pa.DataType: The Arrow type to convert the column to.
+    """
+    dtype = variable.pandas_dtype
+    if dtype in ("int64", "Int64"):
+        return pa.int64()
+    if dtype == "float64":
+        return pa.float64()
+    if dtype == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def iter_record_batches(
+    data_access_api: "DataAccessApi",
+    file_identifier: Union[str, int],
+    delimiter: str,
+    columns: Optional[Sequence[str]] = None,
+    variables: Optional[List[TabularVariable]] = None,
+    variable_ids: Optional[Sequence[int]] = None,
+    no_header: bool = False,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    use_threads: bool = True,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream a delimited datafile as Arrow record batches.
+
+    The file is read through :meth:`DataAccessApi.stream_datafile`, so the
+    API's authentication applies, and fed into Arrow's streaming CSV reader.
+    Only one ``block_size`` worth of input is parsed at a time, keeping memory
+    bounded regardless of the file size.
+
+    Args:
+        data_access_api: The Data Access API client to download with.
+        file_identifier: Database ID or persistent ID of the datafile.
+        delimiter: Field delimiter of the file.
+        columns: Optional column names to keep.
+        variables: Optional DDI variables used to set explicit column types.
+        variable_ids: Optional variable IDs to subset the file server-side.
+        no_header: If True, the file has no header row and columns are named
+            ``f0``, ``f1``, ...
+        block_size: Number of bytes parsed per record batch.
+        use_threads: Whether Arrow may use its thread pool.
+
+    Yields:
+        pa.RecordBatch: Consecutive batches of rows.
+    """
+    read_options = pa_csv.ReadOptions(
+        use_threads=use_threads,
+        block_size=block_size,
+        autogenerate_column_names=no_header,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+
+    convert_kwargs: Dict[str, Any] = {}
+    if columns:
+        convert_kwargs["include_columns"] = list(columns)
+    if variables:
+        convert_kwargs["column_types"] = {
+            variable.name: arrow_type(variable) for variable in variables
+        }
+    convert_options = pa_csv.ConvertOptions(**convert_kwargs)
+
+    with data_access_api.stream_datafile(
+        file_identifier,
+        variables=variable_ids,
+    ) as response:
+        response.raise_for_status()
+        source = io.BufferedReader(
+            _ResponseReader(response, chunk_size=block_size),
+            buffer_size=block_size,
+        )
+        reader = pa_csv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        yield from reader
+
+
+def convert_batches(
+    batches: Iterator["pa.RecordBatch"],
+    output: ArrowOutput = "arrow",
+) -> Iterator[Any]:
+    """
+    Convert a stream of record batches to the requested frame type.
+
+    Args:
+        batches: Record batches to convert.
+        output: ``"arrow"`` to yield the batches unchanged, ``"pandas"`` for
+            pandas DataFrames or ``"polars"`` for polars DataFrames.
+
+    Yields:
+        One converted object per record batch.
+
+    Raises:
+        ValueError: If the output type is unknown.
+        ImportError: If polars output is requested but polars is missing.
+    """
+    if output == "arrow":
+        yield from batches
+    elif output == "pandas":
+        for batch in batches:
+            yield batch.to_pandas()
+    elif output == "polars":
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError(
+                "Polars output requires polars. Install it with: pip install polars"
+            ) from e
+        for batch in batches:
+            yield pl.from_arrow(batch)
+    else:
+        raise ValueError(
+            f"Invalid output '{output}'. Supported outputs: 'arrow', 'pandas', 'polars'"
+        )
@@ -0,0 +1,478 @@
+import asyncio
+import os
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+from fsspec.asyn import AsyncFileSystem, sync
+from fsspec.callbacks import DEFAULT_CALLBACK
+
+from ..api import DataAccessApi, NativeApi
+from ..models.dataset.edit_get import File
+from ..models.file.filemeta import UploadBody
+from .dvfs import DataverseFS
+from .index import DatasetIndex
+from .ranges import (
+    DEFAULT_MAX_GAP,
+    Range,
+    absolute_range,
+    merge_ranges,
+    read_byteranges,
+    split_ranges,
+)
+from .writer import _INGEST_POLL_INTERVAL_SECONDS, _INGEST_TIMEOUT_SECONDS
+
+# Chunk size used when streaming downloads to local files.
+_GET_CHUNK_SIZE = 5 * 1024 * 1024
+
+
+class AsyncDataverseFS(DataverseFS, AsyncFileSystem):
+    """
+    An fsspec ``AsyncFileSystem`` variant of :class:`DataverseFS`.
+
+    Implements the async primitives (``_cat_file``, ``_get_file``,
+    ``_put_file``, ``_info``, ``_ls``) on ``httpx.AsyncClient``, so fsspec's
+    bulk operations run transfers concurrently: ``fs.cat(paths)``,
+    ``fs.get(paths, local_dir)`` and ``fs.cat_ranges(...)`` issue up to
+    ``batch_size`` requests at once instead of one file at a time. Opening
+    files and the Dataverse-specific helpers behave exactly as in
+    :class:`DataverseFS`.
+
+    Byte ranges are read through the same ``redirect_cache`` and
+    ``range_cache`` as in :class:`DataverseFS`. Concurrent operations on a
+    cold metadata cache fetch the dataset listing once.
+
+    Uploads through ``fs.put`` run one at a time: Dataverse locks a dataset
+    while it registers (and ingests) a new file, and rejects concurrent edits.
+
+    Example:
+        >>> fs = AsyncDataverseFS(
+        ...     base_url="https://demo.dataverse.org",
+        ...     identifier="doi:10.5072/FK2/ABCDEF",
+        ...     batch_size=16,
+        ... )
+        >>> contents = fs.cat(fs.find("data"))
+        >>> fs.get("data/", "local_data/", recursive=True)
+        >>>
+        >>> # Inside a running event loop
+        >>> fs = AsyncDataverseFS(base_url, identifier, asynchronous=True)
+        >>> data = await fs._cat_file("data/file.csv")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        identifier: Union[str, int],
+        *args,
+        batch_size: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Initialize an AsyncDataverseFS instance.
+
+        Accepts the same arguments as :class:`DataverseFS`, plus:
+
+        Args:
+            batch_size: Maximum number of concurrent transfers in bulk
+                operations (fsspec's default if omitted).
+            asynchronous: Set to True when used from within a running event
+                loop; the async methods must then be awaited directly.
+            loop: Optional event loop to run sync calls on.
+        """
+        super().__init__(base_url, identifier, *args, batch_size=batch_size, **kwargs)
+        self._async_native_api: Optional[NativeApi] = None
+        self._async_data_access_api: Optional[DataAccessApi] = None
+        self._put_lock: Optional[asyncio.Lock] = None
+        self._index_lock: Optional[asyncio.Lock] = None
+
+    async def set_session(self) -> DataAccessApi:
+        """
+        Get the async API clients, creating them on first use.
+
+        The clients share one ``httpx.AsyncClient`` with the connection limits
+        of this filesystem's :class:`NativeApi`. It is closed when the
+        filesystem is garbage collected.
+
+        Returns:
+            DataAccessApi: The async Data Access API client.
+        """
+        if self._async_data_access_api is None:
+            native_api = NativeApi.from_api(self.native_api)
+            native_api._setup_async_client()
+            data_access_api = DataAccessApi.from_api(self.native_api)
+            data_access_api.client = native_api.client
+
+            self._async_native_api = native_api
+            self._async_data_access_api = data_access_api
+            if not self.asynchronous:
+                weakref.finalize(self, self.close_session, self.loop, native_api)
+
+        return self._async_data_access_api
+
+    @staticmethod
+    def close_session(loop: Any, api: NativeApi) -> None:
+        """Close the shared async client, if its event loop is still running."""
+        client = api.client
+        if client is None:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            try:
+                sync(loop, client.aclose, timeout=0.1)
+            except Exception:  # noqa: BLE001 - best effort on interpreter exit
+                pass
+
+    # ------------------------------------------------------------------
+    # fsspec async interface
+    # ------------------------------------------------------------------
+
+    async def _info(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Async :meth:`DataverseFS.info`."""
+        path = self._strip_protocol(path)
+        if path == "":
+            return {"name": "", "size": 0, "type": "directory"}
+        return (await self._get_index_async()).info(path)
+
+    async def _ls(
+        self, path: str, detail: bool = True, **kwargs
+    ) -> Union[List[Dict[str, Any]], List[str]]:
+        """Async :meth:`DataverseFS.ls`."""
+        path = self._strip_protocol(path)
+
+        info = await self._info(path)
+        if info["type"] == "file":
+            return [info] if detail else [info["name"]]
+
+        entries = (await self._get_index_async()).ls(path)
+        return entries if detail else [entry["name"] for entry in entries]
+
+    async def _cat_file(
+        self,
+        path: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Fetch a file's content, or the byte range ``[start, end)`` of it.
+
+        Negative offsets count from the end of the file, as in fsspec.
+        """
+        file = await self._find_file_async(path)
+        assert file.data_file is not None and file.data_file.id is not None
+
+        if (start is not None and start < 0) or (end is not None and end < 0):
+            size = file.data_file.filesize or 0
+            if start is not None and start < 0:
+                start = max(size + start, 0)
+            if end is not None and end < 0:
+                end = size + end
+
+        if end is not None and end <= (start or 0):
+            return b""
+
+        if end is None:
+            return await self._fetch_to_end_async(file.data_file.id, start or 0)
+        return await self._fetch_range_async(file, (start or 0, end))
+
+    async def _cat_ranges(
+        self,
+        paths: List[str],
+        starts: Union[Optional[int], List[Optional[int]]],
+        ends: Union[Optional[int], List[Optional[int]]],
+        max_gap: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        on_error: str = "return",
+        **kwargs,
+    ) -> List[Union[bytes, Exception]]:
+        """
+        Async :meth:`DataverseFS.cat_ranges`.
+
+        Ranges are merged and fetched in the same way, with up to
+        ``batch_size`` requests in flight across all files.
+        """
+        if not isinstance(paths, list):
+            raise TypeError("paths must be a list")
+        if not isinstance(starts, list):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, list):
+            ends = [ends] * len(paths)
+        if len(starts) != len(paths) or len(ends) != len(paths):
+            raise ValueError("paths, starts and ends must have the same length")
+        if max_gap is None:
+            max_gap = DEFAULT_MAX_GAP
+
+        out: List[Union[bytes, Exception]] = [b""] * len(paths)
+        plans: List[Tuple[File, List[Tuple[int, int, int]], List[Range]]] = []
+        open_ended: List[Tuple[int, str, int]] = []
+        for path, positions in self._group_ranges(paths).items():
+            try:
+                file = await self._find_file_async(path)
+            except Exception as exc:  # noqa: BLE001 - reported per range
+                for position in positions:
+                    out[position] = exc
+                continue
+            assert file.data_file is not None and file.data_file.id is not None
+            size = file.data_file.filesize or 0
+
+            ranges = []
+            for position in positions:
+                start, end = absolute_range(starts[position], ends[position], size)
+                if end is None:
+                    open_ended.append((position, path, start))
+                elif end > start:
+                    ranges.append((position, start, end))
+            if ranges:
+                spans = merge_ranges(
+                    [(start, end) for _, start, end in ranges], max_gap
+                )
+                plans.append((file, ranges, spans))
+
+        semaphore = asyncio.Semaphore(batch_size or self.batch_size)
+
+        async def fetch_span(file: File, span: Range) -> bytes:
+            async with semaphore:
+                return await self._fetch_range_async(file, span)
+
+        async def fetch_file(file: File, spans: List[Range]) -> List[bytes]:
+            if len(spans) > 1:
+                async with semaphore:
+                    try:
+                        buffers = await self._fetch_multipart_async(file, spans)
+                    except Exception:  # noqa: BLE001 - retried per span below
+                        buffers = None
+                if buffers is not None:
+                    return buffers
+            return list(
+                await asyncio.gather(*(fetch_span(file, span) for span in spans))
+            )
+
+        results = await asyncio.gather(
+            *(fetch_file(file, spans) for file, _, spans in plans),
+            return_exceptions=True,
+        )
+        for (_, ranges, spans), result in zip(plans, results):
+            if isinstance(result, BaseException):
+                for position, _, _ in ranges:
+                    out[position] = result  # type: ignore[assignment]
+                continue
+            pieces = split_ranges(
+                [(start, end) for _, start, end in ranges], spans, result
+            )
+            for (position, _, _), piece in zip(ranges, pieces):
+                out[position] = piece
+
+        for position, path, start in open_ended:
+            try:
+                out[position] = await self._cat_file(path, start, None)
+            except Exception as exc:  # noqa: BLE001 - reported per range
+                out[position] = exc
+
+        if on_error != "return":
+            for result in out:
+                if isinstance(result, Exception):
+                    raise result
+        return out
+
+    async def _get_file(
+        self,
+        rpath: str,
+        lpath: str,
+        chunk_size: int = _GET_CHUNK_SIZE,
+        callback=DEFAULT_CALLBACK,
+        **kwargs,
+    ) -> None:
+        """Stream a file to a local path without holding it in memory."""
+        if os.path.isdir(lpath):
+            return
+
+        file = await self._find_file_async(rpath)
+        assert file.data_file is not None and file.data_file.id is not None
+        callback.set_size(file.data_file.filesize)
+
+        data_access_api = await self.set_session()
+        async with data_access_api.astream_datafile(file.data_file.id) as response:
+            response.raise_for_status()
+            with open(lpath, "wb") as local_file:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    local_file.write(chunk)
+                    callback.relative_update(len(chunk))
+
+    async def _put_file(
+        self,
+        lpath: str,
+        rpath: str,
+        callback=DEFAULT_CALLBACK,
+        **kwargs,
+    ) -> None:
+        """Upload a local file, replacing any file at the same path."""
+        if os.path.isdir(lpath):
+            # Directories are implicit in file paths.
+            return
+
+        rpath = self._strip_protocol(rpath)
+        directory_label, _, filename = rpath.rpartition("/")
+        metadata = UploadBody(
+            directory_label=directory_label or None,
+            filename=filename,
+        )
+
+        if self._put_lock is None:
+            self._put_lock = asyncio.Lock()
+
+        async with self._put_lock:
+            await self.set_session()
+            assert self._async_native_api is not None
+            native_api = self._async_native_api
+
+            existing = (await self._get_index_async()).find_file(rpath)
+            replaced_id = (
+                existing.data_file.id
+                if existing is not None and existing.data_file is not None
+                else None
+            )
+
+            callback.set_size(os.path.getsize(lpath))
+            with open(lpath, "rb") as local_file:
+                if replaced_id is not None:
+                    response = await native_api.replace_datafile(
+                        identifier=replaced_id,
+                        file=local_file,
+                        metadata=metadata,
+                    )
+                else:
+                    response = await native_api.upload_datafile(
+                        identifier=self.identifier,
+                        file=local_file,
+                        metadata=metadata,
+                    )
+            callback.relative_update(os.path.getsize(lpath))
+
+            await self._wait_for_ingest_async()
+            self.record_write(
+                removed=[replaced_id] if replaced_id is not None else [],
+                added=response.files or None,
+            )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _get_index_async(self) -> DatasetIndex:
+        """
+        Async :meth:`DataverseFS._get_index`.
+
+        Concurrent calls on a cold cache wait for one fetch of the dataset
+        instead of each fetching it.
+        """
+        key = self._metadata_key()
+        index = self.metadata_cache.get(key, max_age=self.cache_ttl)
+        if index is not None:
+            return index
+
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+
+        async with self._index_lock:
+            index = self.metadata_cache.get(key, max_age=self.cache_ttl)
+            if index is not None:
+                return index
+
+            await self.set_session()
+            assert self._async_native_api is not None
+            dataset = await self._async_native_api.get_dataset(
+                self.identifier, self.version
+            )
+            return self._store_snapshot(key, dataset)
+
+    async def _find_file_async(self, path: str) -> File:
+        """Async :meth:`DataverseFS._find_file`."""
+        path = self._strip_protocol(path)
+        file = (await self._get_index_async()).find_file(path)
+
+        if file is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        if file.data_file is None or file.data_file.id is None:
+            raise FileNotFoundError(
+                f"File '{path}' exists but has no data_file metadata"
+            )
+        return file
+
+    async def _fetch_to_end_async(self, file_id: int, start: int) -> bytes:
+        """Fetch a file's content from ``start`` to the end of its HTTP body."""
+        data_access_api = await self.set_session()
+        async with data_access_api.astream_datafile(
+            file_id,
+            range_start=start or None,
+        ) as response:
+            response.raise_for_status()
+            return await response.aread()
+
+    async def _fetch_range_async(self, file: File, span: Range) -> bytes:
+        """Async :meth:`DataverseFS._fetch_span`."""
+        assert file.data_file is not None and file.data_file.id is not None
+        start, end = span
+
+        size = file.data_file.filesize or 0
+        if self._range_cache_key(file) is not None and end <= size:
+            # The range cache reads and writes local files; keep it off the loop.
+            return await asyncio.to_thread(self._fetch_span, file, span)
+
+        data_access_api = await self.set_session()
+        return await self.redirect_cache.afetch_range(
+            file.data_file.id, start, end, data_access_api
+        )
+
+    async def _fetch_multipart_async(
+        self, file: File, spans: List[Range]
+    ) -> Optional[List[bytes]]:
+        """Async :meth:`DataverseFS._fetch_multipart`."""
+        assert file.data_file is not None and file.data_file.id is not None
+        if self._range_cache_key(file) is not None:
+            return None
+
+        file_id = file.data_file.id
+        url = await self.redirect_cache.aresolve(file_id)
+        host = urlparse(url).netloc if url is not None else None
+        if self._multipart_hosts.get(host) is False:
+            return None
+
+        data_access_api = await self.set_session()
+        inclusive = [(start, end - 1) for start, end in spans]
+        if url is None:
+            request = data_access_api.astream_datafile(file_id, ranges=inclusive)
+        else:
+            assert data_access_api.client is not None
+            spec = ",".join(f"{start}-{end}" for start, end in inclusive)
+            request = data_access_api.client.stream(
+                "GET", url, headers={"Range": f"bytes={spec}"}
+            )
+
+        async with request as response:
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                # A 200 would send the whole file, so it is left unread.
+                if response.status_code in (200, 416):
+                    self._multipart_hosts[host] = False
+                return None
+            body = await response.aread()
+
+        buffers = read_byteranges(response, body, spans)
+        self._multipart_hosts[host] = buffers is not None
+        return buffers
+
+    async def _wait_for_ingest_async(self) -> None:
+        """Async :meth:`DataverseFileWriter._wait_for_ingest`."""
+        assert self._async_native_api is not None
+
+        deadline = time.monotonic() + _INGEST_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                locks = await self._async_native_api.get_dataset_lock(
+                    self.identifier, type="Ingest"
+                )
+            except Exception:  # noqa: BLE001 - best-effort; upload already done
+                return
+            if not locks.root:
+                return
+            await asyncio.sleep(_INGEST_POLL_INTERVAL_SECONDS)
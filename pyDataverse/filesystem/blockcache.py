@@ -0,0 +1,257 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+from fsspec.caching import BaseCache
+
+# Default memory budget of a BlockCache.
+DEFAULT_BLOCK_CACHE_SIZE = 256 * 1024 * 1024
+
+# Default number of blocks a prefetching reader fetches ahead of the position.
+DEFAULT_READ_AHEAD = 4
+
+# ``cache_type`` that opens a DataverseFileReader in prefetching mode.
+PREFETCH_CACHE_TYPE = "prefetch"
+
+# Blocks are keyed by (file id, block size, block index).
+BlockKey = Tuple[Hashable, int, int]
+
+
+class BlockCache:
+    """
+    Memory-bounded LRU cache of file blocks, shared across open files.
+
+    Blocks are keyed by file ID, so every handle on the same datafile, from
+    any ``fs.open`` call, reuses blocks another handle has already fetched.
+    Datafile IDs change whenever a file is replaced, so cached blocks never
+    go stale. The least recently used blocks are evicted once the cached
+    bytes exceed ``max_size``.
+
+    A block is fetched at most once at a time: a read that needs a block
+    another thread is already fetching (for example a background prefetch)
+    waits for that fetch instead of issuing its own.
+
+    Attributes:
+        max_size: Memory budget in bytes.
+        hits: Block reads served from memory, including reads that waited
+            for an in-flight fetch.
+        misses: Block reads that had to fetch the block.
+        prefetches: Blocks fetched in the background ahead of reads.
+        evictions: Blocks dropped to stay within the budget.
+
+    Example:
+        >>> cache = BlockCache(max_size=512 * 1024 * 1024)
+        >>> fs = DataverseFS(base_url, pid, block_cache=cache)
+        >>> with fs.open("data/big.h5", "rb", cache_type="prefetch") as f:
+        ...     data = f.read(100_000_000)
+        >>> cache.stats()
+        {'hits': 16, 'misses': 4, 'prefetches': 16, 'evictions': 0, ...}
+    """
+
+    def __init__(self, max_size: int = DEFAULT_BLOCK_CACHE_SIZE, max_workers: int = 8):
+        """
+        Initialize an empty block cache.
+
+        Args:
+            max_size: Memory budget in bytes.
+            max_workers: Maximum number of concurrent background fetches.
+        """
+        self.max_size = max_size
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self.prefetches = 0
+        self.evictions = 0
+
+        self._blocks: "OrderedDict[BlockKey, bytes]" = OrderedDict()
+        self._pending: Dict[BlockKey, Future] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached blocks in bytes."""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit/miss counters and the current memory use."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "prefetches": self.prefetches,
+                "evictions": self.evictions,
+                "blocks": len(self._blocks),
+                "size": self._size,
+            }
+
+    def get(self, key: BlockKey, fetch: Callable[[], bytes]) -> bytes:
+        """
+        Get a block, fetching it if it is neither cached nor in flight.
+
+        Args:
+            key: The block's (file id, block size, block index).
+            fetch: Fetches the block's bytes.
+
+        Returns:
+            bytes: The block's content.
+        """
+        with self._lock:
+            data = self._blocks.get(key)
+            if data is not None:
+                self._blocks.move_to_end(key)
+                self.hits += 1
+                return data
+
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._pending[key] = Future()
+            else:
+                self.hits += 1
+
+        if owner:
+            self._run(key, fetch, future)
+        return future.result()
+
+    def prefetch(self, key: BlockKey, fetch: Callable[[], bytes]) -> None:
+        """
+        Fetch a block in the background unless it is cached or in flight.
+
+        Args:
+            key: The block's (file id, block size, block index).
+            fetch: Fetches the block's bytes.
+        """
+        with self._lock:
+            if key in self._blocks or key in self._pending:
+                return
+            future = self._pending[key] = Future()
+            self.prefetches += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="pydataverse-prefetch",
+                )
+            executor = self._executor
+
+        executor.submit(self._run, key, fetch, future)
+
+    def invalidate(self, file_id: Hashable) -> None:
+        """Drop all cached blocks of a file."""
+        with self._lock:
+            for key in [key for key in self._blocks if key[0] == file_id]:
+                self._size -= len(self._blocks.pop(key))
+
+    def clear(self) -> None:
+        """Drop all cached blocks."""
+        with self._lock:
+            self._blocks.clear()
+            self._size = 0
+
+    def _run(self, key: BlockKey, fetch: Callable[[], bytes], future: Future) -> None:
+        """Fetch a block, store it and resolve its pending future."""
+        try:
+            data = fetch()
+        except BaseException as exc:  # noqa: BLE001 - re-raised by waiters
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(exc)
+            return
+
+        with self._lock:
+            self._pending.pop(key, None)
+            self._store(key, data)
+        future.set_result(data)
+
+    def _store(self, key: BlockKey, data: bytes) -> None:
+        """Insert a block and evict LRU blocks over budget (lock held)."""
+        if len(data) > self.max_size or key in self._blocks:
+            return
+
+        self._blocks[key] = data
+        self._size += len(data)
+        while self._size > self.max_size:
+            _, evicted = self._blocks.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+
+class PrefetchCache(BaseCache):
+    """
+    fsspec read cache that serves blocks from a shared :class:`BlockCache`.
+
+    Reads are split into ``blocksize`` blocks. When reads move forward
+    through the file, the next ``read_ahead`` blocks are fetched
+    concurrently in the background, so a sequential scan rarely waits for the
+    network. Random access fetches only the blocks it touches.
+    """
+
+    name = PREFETCH_CACHE_TYPE
+
+    def __init__(
+        self,
+        blocksize: int,
+        fetcher: Callable[[int, int], bytes],
+        size: int,
+        block_cache: BlockCache,
+        file_key: Hashable,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ):
+        """
+        Initialize a prefetching cache for one open file.
+
+        Args:
+            blocksize: Block size in bytes.
+            fetcher: Fetches the byte range ``[start, end)`` of the file.
+            size: File size in bytes.
+            block_cache: Cache shared by all handles.
+            file_key: Key of the file in ``block_cache`` (its datafile ID).
+            read_ahead: Number of blocks to prefetch ahead of sequential reads.
+        """
+        super().__init__(blocksize, fetcher, size)
+        self.block_cache = block_cache
+        self.file_key = file_key
+        self.read_ahead = read_ahead
+        self._next_block = 0
+
+    def _fetch(self, start: Union[int, None], stop: Union[int, None]) -> bytes:
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = self.size
+        if start >= self.size or start >= stop:
+            return b""
+        stop = min(stop, self.size)
+
+        first = start // self.blocksize
+        last = (stop - 1) // self.blocksize
+
+        # Only a forward scan triggers read-ahead; random access does not.
+        if first in (self._next_block - 1, self._next_block):
+            for index in range(last + 1, last + 1 + self.read_ahead):
+                if index * self.blocksize >= self.size:
+                    break
+                self.block_cache.prefetch(self._key(index), self._block_fetcher(index))
+        self._next_block = last + 1
+
+        blocks = [
+            self.block_cache.get(self._key(index), self._block_fetcher(index))
+            for index in range(first, last + 1)
+        ]
+        self.total_requested_bytes += stop - start
+
+        offset = start - first * self.blocksize
+        if len(blocks) == 1:
+            return blocks[0][offset : offset + stop - start]
+        return b"".join(blocks)[offset : offset + stop - start]
+
+    def _key(self, index: int) -> BlockKey:
+        return (self.file_key, self.blocksize, index)
+
+    def _block_fetcher(self, index: int) -> Callable[[], bytes]:
+        start = index * self.blocksize
+        end = min(start + self.blocksize, self.size)
+        return lambda: self.fetcher(start, end)
@@ -0,0 +1,311 @@
+import hashlib
+import mimetypes
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Union
+
+import httpx
+
+from ..api import NativeApi
+from ..models.file.directupload import (
+    DirectUploadBody,
+    DirectUploadChecksum,
+    UploadUrls,
+)
+from ..models.file.filemeta import UploadBody, UploadResponse
+
+# How often a failed part upload is retried, and the initial delay between
+# attempts (doubled after each failure).
+_MAX_PART_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 1.0
+
+# Storage responses worth retrying; anything else fails the part at once.
+_RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Size of the reads that feed part uploads and the checksum.
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Checksum algorithms Dataverse accepts for registered files, mapped to their
+# hashlib names. Installations choose one via :FileFixityChecksumAlgorithm.
+_CHECKSUM_ALGORITHMS = {
+    "MD5": "md5",
+    "SHA-1": "sha1",
+    "SHA-256": "sha256",
+    "SHA-512": "sha512",
+}
+
+
+class DirectUploader:
+    """
+    Uploads local files straight to a dataset's object storage.
+
+    Regular uploads stream the whole file through the Dataverse application
+    server in one request. With an S3 store that allows direct upload, the
+    file is instead PUT to presigned storage URLs and only registered with
+    Dataverse afterwards:
+
+    1. Request presigned URLs for the file size. Large files are split into
+       parts, one URL each.
+    2. Upload the parts concurrently, retrying failed parts with backoff.
+       The checksum Dataverse needs is computed locally meanwhile.
+    3. Complete the multipart upload (or abort it on failure).
+    4. Register the uploaded object as a new or replacement datafile.
+
+    Each part is read from disk while it is sent, so memory use does not
+    grow with the file or part size.
+
+    Attributes:
+        native_api: Native API client of the dataset's installation.
+        max_concurrency: Maximum number of parts uploaded at once.
+        max_retries: How often a failed part is retried.
+        checksum_algorithm: Checksum registered with the file. Must match the
+            installation's :FileFixityChecksumAlgorithm setting.
+
+    Example:
+        >>> uploader = DirectUploader(native_api, max_concurrency=8)
+        >>> if uploader.supports(pid):
+        ...     uploader.upload(pid, "large.h5", UploadBody(filename="large.h5"))
+    """
+
+    def __init__(
+        self,
+        native_api: NativeApi,
+        max_concurrency: int = 4,
+        max_retries: int = _MAX_PART_RETRIES,
+        checksum_algorithm: str = "MD5",
+    ):
+        """
+        Initialize a direct uploader.
+
+        Args:
+            native_api: Native API client of the dataset's installation.
+            max_concurrency: Maximum number of parts uploaded at once.
+            max_retries: How often a failed part is retried.
+            checksum_algorithm: One of "MD5", "SHA-1", "SHA-256" or "SHA-512".
+
+        Raises:
+            ValueError: If the checksum algorithm is not supported.
+        """
+        if checksum_algorithm not in _CHECKSUM_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported checksum algorithm '{checksum_algorithm}'. "
+                f"Supported: {', '.join(_CHECKSUM_ALGORITHMS)}"
+            )
+
+        self.native_api = native_api
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.checksum_algorithm = checksum_algorithm
+        self._supported: Dict[str, bool] = {}
+
+    def supports(self, identifier: Union[str, int]) -> bool:
+        """
+        Whether a dataset's storage driver accepts direct uploads.
+
+        The answer is cached per dataset. Installations that do not report
+        their storage driver are treated as not supporting direct upload.
+
+        Args:
+            identifier: Dataset identifier (DOI string or numeric database ID).
+        """
+        key = str(identifier)
+        if key not in self._supported:
+            try:
+                driver = self.native_api.get_dataset_storage_driver(identifier)
+                self._supported[key] = bool(driver.direct_upload)
+            except Exception:  # noqa: BLE001 - fall back to regular uploads
+                self._supported[key] = False
+        return self._supported[key]
+
+    def upload(
+        self,
+        identifier: Union[str, int],
+        local_path: Union[str, os.PathLike],
+        metadata: UploadBody,
+        replace: Optional[Union[str, int]] = None,
+    ) -> UploadResponse:
+        """
+        Upload a local file directly to storage and register it.
+
+        Args:
+            identifier: Dataset identifier (DOI string or numeric database ID).
+            local_path: Path of the local file.
+            metadata: Upload metadata (filename, directory label, ...). The
+                filename defaults to the local file's name.
+            replace: ID of the datafile to replace, if any.
+
+        Returns:
+            UploadResponse: Response with the registered file's information.
+
+        Raises:
+            IOError: If uploading the content to storage fails.
+        """
+        size = os.path.getsize(local_path)
+        upload_urls = self.native_api.get_datafile_upload_urls(identifier, size)
+        checksum = self.transfer(local_path, upload_urls)
+
+        filename = metadata.filename or os.path.basename(local_path)
+        body = DirectUploadBody(
+            storage_identifier=upload_urls.storage_identifier,
+            file_name=filename,
+            mime_type=metadata.content_type
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream",
+            checksum=DirectUploadChecksum(
+                type=self.checksum_algorithm,
+                value=checksum,
+            ),
+            description=metadata.description,
+            categories=metadata.categories,
+            directory_label=metadata.directory_label,
+            restrict=metadata.restrict,
+            tab_ingest=metadata.tab_ingest,
+            force_replace=metadata.force_replace,
+        )
+
+        if replace is not None:
+            return self.native_api.register_replacement_datafile(replace, body)
+        return self.native_api.register_datafile(identifier, body)
+
+    def transfer(
+        self,
+        local_path: Union[str, os.PathLike],
+        upload_urls: UploadUrls,
+    ) -> str:
+        """
+        Upload a local file's content to presigned storage URLs.
+
+        Args:
+            local_path: Path of the local file.
+            upload_urls: URLs from :meth:`NativeApi.get_datafile_upload_urls`.
+
+        Returns:
+            str: Hex digest of the file in ``checksum_algorithm``.
+
+        Raises:
+            IOError: If a part still fails after all retries, or if the
+                multipart upload cannot be completed. A multipart upload is
+                aborted first, so storage keeps no orphaned parts.
+        """
+        size = os.path.getsize(local_path)
+
+        with (
+            httpx.Client(timeout=self.native_api.timeout) as client,
+            ThreadPoolExecutor(max_workers=self.max_concurrency) as pool,
+        ):
+            parts: Dict[str, Future] = {}
+            if upload_urls.url is not None:
+                # Dataverse signs single-part URLs with a tag that marks the
+                # object as temporary until it is registered.
+                parts["1"] = pool.submit(
+                    self._put_part,
+                    client,
+                    upload_urls.url,
+                    local_path,
+                    0,
+                    size,
+                    {"x-amz-tagging": "dv-state=temp"},
+                )
+            else:
+                part_size = upload_urls.part_size or size
+                for number, url in sorted(
+                    (upload_urls.urls or {}).items(), key=lambda item: int(item[0])
+                ):
+                    offset = (int(number) - 1) * part_size
+                    parts[number] = pool.submit(
+                        self._put_part,
+                        client,
+                        url,
+                        local_path,
+                        offset,
+                        min(part_size, size - offset),
+                    )
+
+            try:
+                # Hash while the parts upload; the reads overlap the network.
+                checksum = _file_checksum(local_path, self.checksum_algorithm)
+                etags = {number: part.result() for number, part in parts.items()}
+            except Exception as exc:
+                for part in parts.values():
+                    part.cancel()
+                self._abort(upload_urls)
+                raise IOError(f"Direct upload failed: {exc}") from exc
+
+        if upload_urls.complete is not None:
+            try:
+                self.native_api.complete_multipart_upload(upload_urls.complete, etags)
+            except Exception as exc:
+                self._abort(upload_urls)
+                raise IOError(f"Completing the direct upload failed: {exc}") from exc
+
+        return checksum
+
+    def _put_part(
+        self,
+        client: httpx.Client,
+        url: str,
+        local_path: Union[str, os.PathLike],
+        offset: int,
+        length: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """PUT one byte range of the file, retrying; returns the part's ETag."""
+        request_headers = {"Content-Length": str(length), **(headers or {})}
+        error: Exception = IOError("no attempt made")
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                response = client.put(
+                    url,
+                    content=_read_range(local_path, offset, length),
+                    headers=request_headers,
+                )
+            except httpx.TransportError as exc:
+                error = exc
+                continue
+
+            if response.status_code in _RETRY_STATUS_CODES:
+                error = IOError(f"HTTP {response.status_code}")
+                continue
+            response.raise_for_status()
+            return response.headers.get("ETag", "")
+
+        raise IOError(
+            f"Part at offset {offset} failed after {self.max_retries + 1} attempts: {error}"
+        )
+
+    def _abort(self, upload_urls: UploadUrls) -> None:
+        """Abort a multipart upload, best effort."""
+        if upload_urls.abort is None:
+            return
+        try:
+            self.native_api.abort_multipart_upload(upload_urls.abort)
+        except Exception:  # noqa: BLE001 - the upload error is raised instead
+            pass
+
+
+def _read_range(
+    local_path: Union[str, os.PathLike], offset: int, length: int
+) -> Iterator[bytes]:
+    """Yield ``length`` bytes of a file from ``offset``, in chunks."""
+    with open(local_path, "rb") as local_file:
+        local_file.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = local_file.read(min(_READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _file_checksum(local_path: Union[str, os.PathLike], algorithm: str) -> str:
+    """Hex digest of a file in one of the ``_CHECKSUM_ALGORITHMS``."""
+    digest = hashlib.new(_CHECKSUM_ALGORITHMS[algorithm])
+    with open(local_path, "rb") as local_file:
+        while chunk := local_file.read(_READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,19 +1,59 @@
-from typing import Any, Dict, List, Literal, Optional, Union, overload
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 from urllib.parse import parse_qs, urlparse
+from xml.etree.ElementTree import ParseError
 
+import httpx
 import pandas as pd
-from cachetools import TTLCache
 from fsspec.spec import AbstractFileSystem
 from typing_extensions import Self
 
 from pyDataverse.models.file import update
 
 from ..api import DataAccessApi, NativeApi
+from ..api.native import DEFAULT_DIRECT_UPLOAD_THRESHOLD
 from ..models.dataset.edit_get import DataFile, File, GetDatasetResponse
-from ..models.file.filemeta import UploadBody
+from ..models.file.filemeta import FileInfo, UploadBody
+from .blockcache import BlockCache
+from .direct import DirectUploader
+from .index import DatasetIndex
+from .metacache import (
+    SHARED_METADATA_CACHE,
+    MetadataCache,
+    MetadataKey,
+    auth_credential,
+    metadata_key,
+)
+from .rangecache import RangeCache, datafile_cache_key
+from .ranges import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_GAP,
+    Range,
+    absolute_range,
+    merge_ranges,
+    read_byteranges,
+    split_ranges,
+)
 from .reader import DataverseFileReader
-from .tab import TABULAR_MIME_TYPES, TabSpecs
-from .writer import DataverseFileWriter, DataverseTextIO
+from .redirects import RedirectCache
+from .tab import INGESTABLE_MIME_TYPES, TABULAR_MIME_TYPES, TabSpecs
+from .variables import TabularVariable, parse_ddi_variables
+from .writer import DataverseFileWriter, DataverseTextIO, DataverseTransaction
+
+if TYPE_CHECKING:
+    from .parquet import TabularCache
 
 
 class Info(DataFile):
@@ -64,11 +104,19 @@ class DataverseFS(AbstractFileSystem):
         >>> with fs.open("data/newfile.csv", "wb") as f:
         ...     f.write(b"column1,column2\\n")
         ...     f.write(b"value1,value2\\n")
+        >>>
+        >>> # Upload several files as one batch
+        >>> with fs.transaction:
+        ...     for name in ("a.csv", "b.csv"):
+        ...         with fs.open(f"data/{name}", "wb") as f:
+        ...             f.write(b"column1,column2\\n")
     """
 
     protocol = "dataverse"
     # Each dataset gets its own instance; do not share via fsspec's cache.
     cachable = False
+    # ``with fs.transaction:`` uploads the files written inside as one batch.
+    transaction_type = DataverseTransaction
 
     def __init__(
         self,
@@ -81,6 +129,12 @@ class DataverseFS(AbstractFileSystem):
         cache_ttl: int = 60,
         native_api: Optional[NativeApi] = None,
         data_access_api: Optional[DataAccessApi] = None,
+        tabular_cache: Optional["TabularCache"] = None,
+        direct_upload_threshold: Optional[int] = DEFAULT_DIRECT_UPLOAD_THRESHOLD,
+        block_cache: Optional[BlockCache] = None,
+        range_cache: Optional[RangeCache] = None,
+        redirect_cache: Optional[RedirectCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
         **kwargs,
     ):
         """
@@ -94,9 +148,25 @@ class DataverseFS(AbstractFileSystem):
                 ":latest-published" - latest published version only
                 ":draft" - draft version
             api_token: Optional API token for authentication
-            cache_ttl: Cache TTL in seconds (default: 60, set to 0 to disable)
+            cache_ttl: Seconds a cached listing of a mutable version (``:latest``,
+                ``:draft``, ...) is reused (default: 60, set to 0 to disable).
+                Numbered versions such as ``"1.0"`` never change and are
+                cached for good.
             native_api: Optional existing NativeApi instance to reuse
             data_access_api: Optional existing DataAccessApi instance to reuse
+            tabular_cache: Optional on-disk Parquet cache that ``open_tabular``
+                and ``stream_tabular`` read parsed files from (requires pyarrow)
+            direct_upload_threshold: Size in bytes from which local files are
+                uploaded straight to object storage, if the dataset's store
+                allows it (default: 64 MiB, None to always upload via Dataverse)
+            block_cache: Optional in-memory block cache that files opened with
+                ``cache_type="prefetch"`` share (a new 256 MiB cache if omitted)
+            range_cache: Optional persistent on-disk cache that byte ranges read
+                from non-tabular files are served from
+            redirect_cache: Optional cache of the presigned storage URLs that
+                byte-range reads go to directly (a new cache if omitted)
+            metadata_cache: Optional cache of dataset listings (the
+                process-wide ``SHARED_METADATA_CACHE`` if omitted)
             **kwargs: Forwarded to fsspec's AbstractFileSystem.
         """
         super().__init__(**kwargs)
@@ -111,7 +181,27 @@ class DataverseFS(AbstractFileSystem):
         self.data_access_api = data_access_api or DataAccessApi.from_api(
             self.native_api
         )
-        self._cache = TTLCache(maxsize=1, ttl=cache_ttl) if cache_ttl > 0 else {}
+        # Dataset snapshots and their path indexes, shared across instances.
+        self.cache_ttl = cache_ttl
+        self.metadata_cache = (
+            metadata_cache if metadata_cache is not None else SHARED_METADATA_CACHE
+        )
+        # Datafile IDs change whenever a file is replaced, so variable metadata
+        # keyed by ID never goes stale and is kept for the instance lifetime.
+        self._variables: Dict[int, List[TabularVariable]] = {}
+        self.tabular_cache = tabular_cache
+        self.direct_upload_threshold = direct_upload_threshold
+        self._direct_uploader: Optional[DirectUploader] = None
+        self.block_cache = block_cache if block_cache is not None else BlockCache()
+        self.range_cache = range_cache
+        self.redirect_cache = (
+            redirect_cache
+            if redirect_cache is not None
+            else RedirectCache(self.data_access_api)
+        )
+        # Whether a host (None for Dataverse itself) answers multi-range
+        # requests with the requested ranges; learned on first use.
+        self._multipart_hosts: Dict[Optional[str], bool] = {}
 
     @classmethod
     def _strip_protocol(cls, path: str) -> str:
@@ -250,21 +340,7 @@ class DataverseFS(AbstractFileSystem):
         if path == "":
             return {"name": "", "size": 0, "type": "directory"}
 
-        dataset = self._get_dataset()
-        prefix = f"{path}/"
-        is_dir = False
-
-        for file in dataset.files or []:
-            full = self._build_file_path(file)
-            if full == path:
-                return self._file_info(path, file)
-            if full.startswith(prefix):
-                is_dir = True
-
-        if is_dir:
-            return {"name": path, "size": 0, "type": "directory"}
-
-        raise FileNotFoundError(f"File not found: {path}")
+        return self._get_index().info(path)
 
     def ls(
         self, path: str, detail: bool = True, **kwargs
@@ -290,31 +366,174 @@ class DataverseFS(AbstractFileSystem):
         if info["type"] == "file":
             return [info] if detail else [info["name"]]
 
-        dataset = self._get_dataset()
-        prefix = f"{path}/" if path else ""
+        entries = self._get_index().ls(path)
+        return entries if detail else [entry["name"] for entry in entries]
 
-        entries: Dict[str, Dict[str, Any]] = {}
-        for file in dataset.files or []:
-            full = self._build_file_path(file)
-            if prefix and not full.startswith(prefix):
-                continue
+    def du(
+        self,
+        path: str,
+        total: bool = True,
+        maxdepth: Optional[int] = None,
+        withdirs: bool = False,
+        **kwargs,
+    ) -> Union[int, Dict[str, int]]:
+        """
+        Space used by files under a path.
 
-            remainder = full[len(prefix) :] if prefix else full
-            if not remainder:
-                continue
+        Total sizes without a depth limit are served from the aggregated
+        directory sizes of the path index; other calls use fsspec's default.
+
+        Args:
+            path: File or directory path.
+            total: If True, return the summed size; otherwise a dict per file.
+            maxdepth: Maximum directory depth to descend.
+            withdirs: Whether to include directory entries in the result.
+
+        Returns:
+            The total size in bytes, or a dict of sizes keyed by path.
+        """
+        if not total or maxdepth is not None:
+            return super().du(
+                path, total=total, maxdepth=maxdepth, withdirs=withdirs, **kwargs
+            )
+
+        path = self._strip_protocol(path)
+        index = self._get_index()
+        file = index.find_file(path)
+        if file is not None:
+            return index.info(path)["size"]
+        return index.directory_size(path)
+
+    def cat_ranges(
+        self,
+        paths: List[str],
+        starts: Union[Optional[int], List[Optional[int]]],
+        ends: Union[Optional[int], List[Optional[int]]],
+        max_gap: Optional[int] = None,
+        on_error: str = "return",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ) -> List[Union[bytes, Exception]]:
+        """
+        Fetch byte ranges of one or more files in as few requests as possible.
+
+        Ranges of the same file that overlap or lie at most ``max_gap`` bytes
+        apart are merged into one span. Where the server answers multi-range
+        requests with ``multipart/byteranges``, all spans of a file are
+        fetched with one request; otherwise the spans are fetched
+        concurrently. The requested ranges are then cut back out of the
+        spans. Readers such as pyarrow's Parquet reader issue many small reads
+        per file, which this turns into a handful of requests.
+
+        Args:
+            paths: Path of the file of each range.
+            starts: First byte of each range, or one value for all ranges.
+                Negative values count from the end of the file.
+            ends: Byte after the last one of each range, or one value for all
+                ranges. None reads to the end of the file.
+            max_gap: Largest gap in bytes bridged by a merged span
+                (default: 64 KiB).
+            on_error: "return" to place a failed range's exception in the
+                result, anything else to raise it.
+            max_concurrency: Maximum number of spans fetched at once.
 
-            head, _, rest = remainder.partition("/")
-            child = prefix + head
+        Returns:
+            List[Union[bytes, Exception]]: The content of each range, in order.
 
-            if rest:
-                entries.setdefault(
-                    child, {"name": child, "size": 0, "type": "directory"}
+        Example:
+            >>> footer, row_group = fs.cat_ranges(
+            ...     ["data/table.parquet"] * 2, [-8, 4], [None, 65_540]
+            ... )
+        """
+        if not isinstance(paths, list):
+            raise TypeError("paths must be a list")
+        if not isinstance(starts, list):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, list):
+            ends = [ends] * len(paths)
+        if len(starts) != len(paths) or len(ends) != len(paths):
+            raise ValueError("paths, starts and ends must have the same length")
+        if max_gap is None:
+            max_gap = DEFAULT_MAX_GAP
+
+        out: List[Union[bytes, Exception]] = [b""] * len(paths)
+        plans: List[Tuple[File, List[Tuple[int, int, int]], List[Range]]] = []
+        open_ended: List[Tuple[int, str, int]] = []
+        for path, positions in self._group_ranges(paths).items():
+            try:
+                file = self._find_file(path)
+                size = file.data_file.filesize or 0  # type: ignore[union-attr]
+                ranges = []
+                for position in positions:
+                    start, end = absolute_range(starts[position], ends[position], size)
+                    if end is None:
+                        open_ended.append((position, path, start))
+                    elif end > start:
+                        ranges.append((position, start, end))
+            except Exception as exc:  # noqa: BLE001 - reported per range
+                for position in positions:
+                    out[position] = exc
+                continue
+            if ranges:
+                spans = merge_ranges(
+                    [(start, end) for _, start, end in ranges], max_gap
+                )
+                plans.append((file, ranges, spans))
+
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="pydataverse-ranges",
+        ) as executor:
+            # Files with several spans first try a single multi-range request.
+            multipart = {
+                index: executor.submit(self._fetch_multipart, file, spans)
+                for index, (file, _, spans) in enumerate(plans)
+                if len(spans) > 1
+            }
+            fetches: Dict[int, List[Future]] = {
+                index: [executor.submit(self._fetch_span, file, span) for span in spans]
+                for index, (file, _, spans) in enumerate(plans)
+                if index not in multipart
+            }
+            buffers: Dict[int, List[bytes]] = {}
+            for index, future in multipart.items():
+                try:
+                    result = future.result()
+                except Exception:  # noqa: BLE001 - retried per span below
+                    result = None
+                if result is not None:
+                    buffers[index] = result
+                else:
+                    file, _, spans = plans[index]
+                    fetches[index] = [
+                        executor.submit(self._fetch_span, file, span) for span in spans
+                    ]
+
+            for index, (_, ranges, spans) in enumerate(plans):
+                try:
+                    if index not in buffers:
+                        buffers[index] = [future.result() for future in fetches[index]]
+                except Exception as exc:  # noqa: BLE001 - reported per range
+                    for position, _, _ in ranges:
+                        out[position] = exc
+                    continue
+                pieces = split_ranges(
+                    [(start, end) for _, start, end in ranges], spans, buffers[index]
                 )
-            else:
-                entries[child] = self._file_info(child, file)
+                for (position, _, _), piece in zip(ranges, pieces):
+                    out[position] = piece
 
-        result = [entries[key] for key in sorted(entries)]
-        return result if detail else [entry["name"] for entry in result]
+        for position, path, start in open_ended:
+            try:
+                out[position] = self.cat_file(path, start, None, **kwargs)
+            except Exception as exc:  # noqa: BLE001 - reported per range
+                out[position] = exc
+
+        if on_error != "return":
+            for result in out:
+                if isinstance(result, Exception):
+                    raise result
+        return out
 
     def _open(
         self,
@@ -324,6 +543,7 @@ class DataverseFS(AbstractFileSystem):
         autocommit: bool = True,
         cache_options: Optional[dict] = None,
         metadata: Optional[UploadBody] = None,
+        cache_type: str = "readahead",
         **kwargs,
     ) -> Union[DataverseFileReader, DataverseFileWriter]:
         """fsspec hook returning a binary file object (see ``open``)."""
@@ -340,16 +560,18 @@ class DataverseFS(AbstractFileSystem):
                 file_identifier=file.data_file.id,
                 size=file.data_file.filesize,
                 block_size=block,
+                cache_type=cache_type,
                 cache_options=cache_options,
+                range_cache_key=self._range_cache_key(file),
             )
 
         if mode in ("wb", "w"):
-            self._cache.clear()
             return DataverseFileWriter(
                 self,
                 path,
                 metadata=metadata,
                 block_size=block,
+                autocommit=autocommit,
             )
 
         raise ValueError(
@@ -361,8 +583,15 @@ class DataverseFS(AbstractFileSystem):
         self.remove(path)
 
     def invalidate_cache(self, path: Optional[str] = None) -> None:
-        """Clear cached dataset metadata in addition to fsspec's dir cache."""
-        self._cache.clear()
+        """Clear fsspec's dir cache; without a path, cached dataset metadata too.
+
+        fsspec calls this with the written path and its parent whenever a
+        file is closed. Those calls keep the metadata, which the write itself
+        has already brought up to date through :meth:`record_write`. Call it
+        without a path to see changes made out-of-band.
+        """
+        if path is None:
+            self._invalidate_metadata()
         super().invalidate_cache(path)
 
     def mkdir(self, path: str, create_parents: bool = True, **kwargs) -> None:
@@ -542,6 +771,11 @@ class DataverseFS(AbstractFileSystem):
         """
         Stream a tabular file as a chunked pandas DataFrame iterator.
 
+        With a ``tabular_cache`` configured, files already in the cache are
+        streamed from the local Parquet copy. A full read (no options besides
+        ``usecols``) of an uncached file stores it once all chunks have been
+        consumed.
+
         Args:
             path: Path to the file.
             chunk_size: Number of rows per chunk.
@@ -550,8 +784,12 @@ class DataverseFS(AbstractFileSystem):
             sep: Delimiter to use. Default is ",".
             **kwargs: Additional keyword arguments passed to pandas.read_csv().
                 Common options include:
-                - usecols: List of column names or indices to read
-                - dtype: Dictionary of column names to data types
+                - usecols: List of column names or indices to read. Column
+                  names of ingested files are subset server-side, so only
+                  the selected columns are downloaded.
+                - dtype: Dictionary of column names to data types. For
+                  ingested files these override the dtypes derived from
+                  the file's DDI variable metadata.
                 - na_values: Values to recognize as NA/NaN
                 - skiprows: Number of rows to skip at the start
                 - nrows: Number of rows to read
@@ -567,8 +805,44 @@ class DataverseFS(AbstractFileSystem):
             >>> for chunk in fs.stream_tabular("data/file.csv", api_token=None):
             ...     print(chunk.columns)
         """
-        download_link = self._get_tabular_download_link(path)
+        cache_key = self._get_tabular_cache_key(path, no_header, kwargs)
+        if cache_key is not None:
+            assert self.tabular_cache is not None
+            columns = self._get_cached_columns(cache_key, kwargs.get("usecols"))
+            if columns is not None:
+                chunks = self.tabular_cache.iter_chunks(cache_key, chunk_size, columns)
+                if chunks is not None:
+                    return chunks
+
+            # Only full reads are materialized; the entry is committed once
+            # the caller has consumed every chunk.
+            if "usecols" not in kwargs:
+                return self.tabular_cache.write_chunks(
+                    cache_key,
+                    iter(
+                        self._read_tabular_chunks(
+                            path, api_token, chunk_size, no_header
+                        )
+                    ),
+                )
 
+        return self._read_tabular_chunks(
+            path,
+            api_token,
+            chunk_size,
+            no_header,
+            **kwargs,
+        )
+
+    def _read_tabular_chunks(
+        self,
+        path: str,
+        api_token: Optional[str],
+        chunk_size: int,
+        no_header: bool,
+        **kwargs,
+    ):
+        """Stream a tabular file from Dataverse, bypassing the tabular cache."""
         # Get tab specs
         tab_specs = self._get_tab_specs(path)
         if tab_specs is None:
@@ -594,12 +868,89 @@ class DataverseFS(AbstractFileSystem):
         if tab_specs.tab_type == "spreadsheet":
             raise ValueError("Spreadsheet files are not supported for streaming")
 
+        self._apply_variable_dtypes(path, read_kwargs)
+        download_link = self._get_tabular_download_link(
+            path,
+            variables=self._resolve_variable_ids(path, read_kwargs),
+        )
+
         return pd.read_csv(
             download_link,
             storage_options=request_headers,
             **read_kwargs,
         )
 
+    def stream_arrow(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        no_header: bool = False,
+        output: Literal["arrow", "pandas", "polars"] = "arrow",
+        block_size: Optional[int] = None,
+        use_threads: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Stream a tabular file as Arrow record batches.
+
+        Unlike :meth:`stream_tabular`, the bytes are read through this
+        filesystem's Data Access API client (its authentication and
+        connection settings apply) and parsed by Arrow's native CSV reader
+        instead of pandas. Memory is bounded by ``block_size`` rather than
+        by the file size. Requires the optional ``pyarrow`` dependency.
+
+        For ingested files, column types come from the DDI variable metadata
+        and ``columns`` is subset server-side, like ``usecols`` for
+        :meth:`open_tabular`.
+
+        Args:
+            path: Path to the file.
+            columns: Optional column names to read.
+            no_header: If True, the file has no header row. Columns are then
+                named ``f0``, ``f1``, ... Default is False.
+            output: ``"arrow"`` (default) yields ``pyarrow.RecordBatch``
+                objects, ``"pandas"`` and ``"polars"`` yield DataFrames.
+            block_size: Number of bytes parsed per batch (default 16 MiB).
+            use_threads: Whether Arrow may use its thread pool.
+
+        Yields:
+            One record batch (or DataFrame) per parsed block.
+
+        Raises:
+            ImportError: If pyarrow (or polars, for polars output) is missing.
+            ValueError: If the file is not tabular or is a spreadsheet.
+
+        Example:
+            >>> for batch in fs.stream_arrow("data/file.tab", columns=["age"]):
+            ...     print(batch.num_rows)
+        """
+        from .arrow import DEFAULT_BLOCK_SIZE, convert_batches, iter_record_batches
+
+        tab_specs = self._get_tab_specs(path)
+        if tab_specs is None or tab_specs.delimiter is None:
+            raise ValueError("Spreadsheet files are not supported for streaming")
+
+        file = self._find_file(path)
+        if file.data_file is None or file.data_file.id is None:
+            raise ValueError(f"File '{path}' has no file ID")
+
+        read_kwargs: Dict[str, Any] = {"header": None if no_header else 0}
+        if columns:
+            read_kwargs["usecols"] = list(columns)
+
+        batches = iter_record_batches(
+            self.data_access_api,
+            file.data_file.id,
+            delimiter=tab_specs.delimiter,
+            columns=columns,
+            variables=self._get_read_variables(path, read_kwargs),
+            variable_ids=self._resolve_variable_ids(path, read_kwargs),
+            no_header=no_header,
+            block_size=block_size or DEFAULT_BLOCK_SIZE,
+            use_threads=use_threads,
+        )
+
+        return convert_batches(batches, output=output)
+
     def open_tabular(
         self,
         path: str,
@@ -610,6 +961,10 @@ class DataverseFS(AbstractFileSystem):
         """
         Open the entire tabular file as a pandas DataFrame.
 
+        With a ``tabular_cache`` configured, the first read without options
+        besides ``usecols`` stores the parsed file as Parquet; later reads load
+        only the requested columns from the memory-mapped local copy.
+
         Args:
             path: Path to the file.
             api_token: Optional Dataverse API token for authenticated access.
@@ -617,8 +972,12 @@ class DataverseFS(AbstractFileSystem):
                 be integers (0, 1, 2, ...). Default is False.
             **kwargs: Additional keyword arguments passed to pandas.read_csv().
                 Common options include:
-                - usecols: List of column names or indices to read
-                - dtype: Dictionary of column names to data types
+                - usecols: List of column names or indices to read. Column
+                  names of ingested files are subset server-side, so only
+                  the selected columns are downloaded.
+                - dtype: Dictionary of column names to data types. For
+                  ingested files these override the dtypes derived from
+                  the file's DDI variable metadata.
                 - na_values: Values to recognize as NA/NaN
                 - skiprows: Number of rows to skip at the start
                 - nrows: Number of rows to read
@@ -633,8 +992,64 @@ class DataverseFS(AbstractFileSystem):
         Example:
             >>> df = fs.open_tabular("data/file.csv", api_token=None)
         """
-        download_link = self._get_tabular_download_link(path)
+        cache_key = self._get_tabular_cache_key(path, no_header, kwargs)
+        if cache_key is None:
+            return self._read_tabular(path, api_token, no_header, **kwargs)
+
+        assert self.tabular_cache is not None
+        usecols = kwargs.get("usecols")
+        columns = self._get_cached_columns(cache_key, usecols)
+        if columns is not None:
+            df = self.tabular_cache.read(cache_key, columns)
+            if df is not None:
+                return df
+
+        # Materialize the whole file once so any later projection is served
+        # from the cache.
+        df = self._read_tabular(path, api_token, no_header)
+        self.tabular_cache.write(cache_key, df)
+
+        if usecols is None:
+            return df
+
+        missing = [column for column in usecols if column not in df.columns]
+        if missing:
+            raise ValueError(
+                f"Usecols do not match columns, columns expected but not found: {missing}"
+            )
+        return df[[column for column in df.columns if column in set(usecols)]]
+
+    def tabular_variables(self, path: str) -> Optional[List[TabularVariable]]:
+        """
+        Get the DDI variable metadata of an ingested tabular file.
+
+        Reads no file data: the metadata comes from the DDI record Dataverse
+        generated during ingest, and is cached for the lifetime of this
+        instance.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            Optional[List[TabularVariable]]: The file's variables in column
+                order, or None if the file was not ingested or its DDI record
+                is unavailable.
+
+        Example:
+            >>> variables = fs.tabular_variables("data/survey.tab")
+            >>> {variable.name: variable.pandas_dtype for variable in variables}
+            {'id': 'int64', 'score': 'float64'}
+        """
+        return self._get_read_variables(path, {"header": 0})
 
+    def _read_tabular(
+        self,
+        path: str,
+        api_token: Optional[str],
+        no_header: bool = False,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read a tabular file from Dataverse, bypassing the tabular cache."""
         # Build read_csv arguments
         read_kwargs: Dict[str, Any] = {}
 
@@ -649,24 +1064,34 @@ class DataverseFS(AbstractFileSystem):
         if tab_specs is None:
             raise ValueError(f"File '{path}' has no tab specs")
 
+        self._apply_variable_dtypes(path, read_kwargs)
+        download_link = self._get_tabular_download_link(
+            path,
+            variables=self._resolve_variable_ids(path, read_kwargs),
+        )
+
         return tab_specs.parse(
             download_link,
             api_token=api_token,
             **read_kwargs,
         )
 
-    def _get_tabular_download_link(self, path: str) -> str:
+    def _get_tabular_download_link(
+        self,
+        path: str,
+        variables: Optional[Sequence[int]] = None,
+    ) -> str:
         """
         Helper to validate file is tabular and return the download link.
 
         Args:
             path (str): Path to the file.
+            variables (Optional[Sequence[int]]): Variable IDs to subset the
+                file to server-side. Only valid for ingested tabular files.
 
         Returns:
             str: Direct download URL for the file.
         """
-        if "dataset" not in self._cache:
-            self._cache["dataset"] = self._get_dataset()
         file = self._find_file(path)
 
         # Check if file is tabular
@@ -677,8 +1102,306 @@ class DataverseFS(AbstractFileSystem):
 
         return self.data_access_api.get_datafile_download_url(
             file.data_file.id,
+            variables=variables,
         )
 
+    def _get_tabular_cache_key(
+        self,
+        path: str,
+        no_header: bool,
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Get the tabular cache key for a read, if the cache can serve it.
+
+        The cache holds each file parsed with default options, so only reads
+        with a header row and at most a ``usecols`` list of column names are
+        eligible. Everything else goes straight to Dataverse.
+
+        Args:
+            path (str): Path to the file.
+            no_header (bool): Whether the read treats the file as headerless.
+            kwargs (Dict[str, Any]): User keyword arguments of the read.
+
+        Returns:
+            Optional[str]: The cache key, or None to bypass the cache.
+        """
+        if self.tabular_cache is None or no_header:
+            return None
+        if any(key != "usecols" for key in kwargs):
+            return None
+
+        usecols = kwargs.get("usecols")
+        if usecols is not None and (
+            isinstance(usecols, str)
+            or callable(usecols)
+            or not all(isinstance(column, str) for column in usecols)
+        ):
+            return None
+
+        return self.tabular_cache.key(self._find_file(path).data_file)
+
+    def _get_cached_columns(
+        self,
+        cache_key: str,
+        usecols: Optional[Sequence[str]],
+    ) -> Optional[List[str]]:
+        """
+        Resolve ``usecols`` against a cached entry, in file column order.
+
+        Returns None if the entry is missing or lacks a requested column, so
+        the read falls through to Dataverse (and pandas' own error).
+        """
+        assert self.tabular_cache is not None
+        names = self.tabular_cache.columns(cache_key)
+        if names is None or usecols is None:
+            return names
+
+        wanted = set(usecols)
+        if not wanted.issubset(names):
+            return None
+        return [name for name in names if name in wanted]
+
+    def direct_uploader(self, size: int) -> Optional[DirectUploader]:
+        """
+        Get the direct uploader if a file of this size should use it.
+
+        Args:
+            size (int): Size of the file to upload, in bytes.
+
+        Returns:
+            Optional[DirectUploader]: The uploader, or None for files below
+                ``direct_upload_threshold`` and for datasets whose storage
+                driver does not allow direct upload.
+
+        Example:
+            >>> uploader = fs.direct_uploader(os.path.getsize("large.h5"))
+            >>> if uploader is not None:
+            ...     uploader.upload(fs.identifier, "large.h5", UploadBody())
+        """
+        if self.direct_upload_threshold is None or size < self.direct_upload_threshold:
+            return None
+        if self._direct_uploader is None:
+            self._direct_uploader = DirectUploader(self.native_api)
+        if not self._direct_uploader.supports(self.identifier):
+            return None
+        return self._direct_uploader
+
+    def _range_cache_key(self, file: File) -> Optional[str]:
+        """Key of a file in the on-disk range cache, or None if not cached."""
+        # Ingested tabular files are served in a derived format whose size
+        # differs from the metadata, so only original files are cached.
+        if self.range_cache is None or file.data_file is None:
+            return None
+        if file.data_file.tabular_data:
+            return None
+        return datafile_cache_key(file.data_file)
+
+    def _group_ranges(self, paths: List[str]) -> Dict[str, List[int]]:
+        """Positions of the ranges of each file, keyed by normalized path."""
+        groups: Dict[str, List[int]] = {}
+        for position, path in enumerate(paths):
+            groups.setdefault(self._strip_protocol(path), []).append(position)
+        return groups
+
+    def _fetch_span(self, file: File, span: Range) -> bytes:
+        """Fetch one span of a file, through the range cache if enabled."""
+        assert file.data_file is not None and file.data_file.id is not None
+        file_id = file.data_file.id
+        start, end = span
+
+        key = self._range_cache_key(file)
+        size = file.data_file.filesize or 0
+        if self.range_cache is not None and key is not None and end <= size:
+            return self.range_cache.read(
+                key,
+                size,
+                start,
+                end,
+                lambda first, last: self.redirect_cache.fetch_range(
+                    file_id, first, last
+                ),
+            )
+        return self.redirect_cache.fetch_range(file_id, start, end)
+
+    def _fetch_multipart(self, file: File, spans: List[Range]) -> Optional[List[bytes]]:
+        """
+        Fetch several spans of a file with one multi-range request.
+
+        Returns None, leaving the spans to :meth:`_fetch_span`, if the file is
+        read through the range cache (which fetches only missing parts) or if
+        the server does not answer with the requested ranges. Servers that
+        ignore or refuse multi-range requests are remembered per host.
+        """
+        assert file.data_file is not None and file.data_file.id is not None
+        if self._range_cache_key(file) is not None:
+            return None
+
+        file_id = file.data_file.id
+        url = self.redirect_cache.resolve(file_id)
+        host = urlparse(url).netloc if url is not None else None
+        if self._multipart_hosts.get(host) is False:
+            return None
+
+        inclusive = [(start, end - 1) for start, end in spans]
+        if url is None:
+            request = self.data_access_api.stream_datafile(file_id, ranges=inclusive)
+        else:
+            spec = ",".join(f"{start}-{end}" for start, end in inclusive)
+            request = self.redirect_cache.client.stream(
+                "GET", url, headers={"Range": f"bytes={spec}"}
+            )
+
+        with request as response:
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                # A 200 would send the whole file, so it is left unread.
+                if response.status_code in (200, 416):
+                    self._multipart_hosts[host] = False
+                return None
+            body = response.read()
+
+        buffers = read_byteranges(response, body, spans)
+        self._multipart_hosts[host] = buffers is not None
+        return buffers
+
+    def _drop_file_caches(self, file_id: Optional[int]) -> None:
+        """Remove a datafile's entries from the on-disk caches, if enabled."""
+        if file_id is None:
+            return
+        if self.tabular_cache is not None:
+            self.tabular_cache.invalidate(file_id)
+        if self.range_cache is not None:
+            self.range_cache.invalidate(file_id)
+
+    def _get_variables(self, path: str) -> List[TabularVariable]:
+        """
+        Get the DDI variable metadata of an ingested tabular file.
+
+        Fetched once per datafile and cached for the lifetime of this instance.
+
+        Args:
+            path (str): Path to the file.
+
+        Returns:
+            List[TabularVariable]: The file's variables in column order.
+
+        Raises:
+            ValueError: If the file is not an ingested tabular file.
+        """
+        file = self._find_file(path)
+        data_file = file.data_file
+
+        if data_file is None or data_file.id is None or not data_file.tabular_data:
+            raise ValueError(f"File '{path}' is not an ingested tabular file")
+
+        if data_file.id not in self._variables:
+            ddi = self.data_access_api.get_datafile_ddi(data_file.id)
+            self._variables[data_file.id] = parse_ddi_variables(ddi)
+
+        return self._variables[data_file.id]
+
+    def _get_read_variables(
+        self,
+        path: str,
+        read_kwargs: Dict[str, Any],
+    ) -> Optional[List[TabularVariable]]:
+        """
+        Get the DDI variables for a pandas read, if they can be applied to it.
+
+        Variable metadata is keyed by header name, so it only applies to
+        ingested files read with their header row and without custom
+        ``names``. Any failure to fetch or parse the DDI record is treated as
+        "no metadata" so reads fall back to plain pandas behavior.
+
+        Args:
+            path (str): Path to the file.
+            read_kwargs (Dict[str, Any]): Keyword arguments of the pandas read.
+
+        Returns:
+            Optional[List[TabularVariable]]: The variables, or None when they
+                do not apply to this read.
+        """
+        if read_kwargs.get("header") != 0 or "names" in read_kwargs:
+            return None
+
+        data_file = self._find_file(path).data_file
+        if data_file is None or not data_file.tabular_data:
+            return None
+
+        try:
+            return self._get_variables(path)
+        except (httpx.HTTPError, ParseError, ValueError):
+            return None
+
+    def _resolve_variable_ids(
+        self,
+        path: str,
+        read_kwargs: Dict[str, Any],
+    ) -> Optional[List[int]]:
+        """
+        Map the ``usecols`` column names of a read to DDI variable IDs.
+
+        The Data Access API can subset ingested tabular files by variable ID,
+        so only the requested columns leave the server. Projection is only
+        pushed down when every requested column is a header name known to the
+        DDI record; otherwise ``None`` is returned and the full file is read
+        (non-ingested files, positional or callable ``usecols``, custom
+        ``names`` or headerless reads).
+
+        Args:
+            path (str): Path to the file.
+            read_kwargs (Dict[str, Any]): Keyword arguments of the pandas read.
+
+        Returns:
+            Optional[List[int]]: Variable IDs to request, or None to fall back
+                to a full download.
+        """
+        usecols = read_kwargs.get("usecols")
+        if usecols is None or callable(usecols) or isinstance(usecols, str):
+            return None
+
+        columns = list(dict.fromkeys(usecols))
+        if not columns or not all(isinstance(column, str) for column in columns):
+            return None
+
+        variables = self._get_read_variables(path, read_kwargs)
+        if variables is None:
+            return None
+
+        ids_by_name = {variable.name: variable.id for variable in variables}
+        if any(column not in ids_by_name for column in columns):
+            return None
+
+        return [ids_by_name[column] for column in columns]
+
+    def _apply_variable_dtypes(self, path: str, read_kwargs: Dict[str, Any]) -> None:
+        """
+        Pass DDI-derived column dtypes to a pandas read.
+
+        Explicit dtypes skip pandas' type inference pass, keep integer columns
+        with missing values intact (nullable ``Int64``) and store labelled
+        string columns as ``category``. User-provided ``dtype`` entries take
+        precedence; a non-dict ``dtype`` is left untouched.
+
+        Args:
+            path (str): Path to the file.
+            read_kwargs (Dict[str, Any]): Keyword arguments of the pandas read,
+                updated in place.
+        """
+        user_dtype = read_kwargs.get("dtype")
+        if user_dtype is not None and not isinstance(user_dtype, dict):
+            return
+
+        variables = self._get_read_variables(path, read_kwargs)
+        if not variables:
+            return
+
+        dtype: Dict[str, Any] = {
+            variable.name: variable.pandas_dtype for variable in variables
+        }
+        dtype.update(user_dtype or {})
+        read_kwargs["dtype"] = dtype
+
     def _get_tab_specs(self, path: str) -> Optional[TabSpecs]:
         """
         Get the tab specs for a file.
@@ -714,7 +1437,7 @@ class DataverseFS(AbstractFileSystem):
             raise ValueError(f"File '{path}' has no file ID")
 
         self.native_api.delete_datafile(file.data_file.id)
-        self._cache.clear()
+        self.record_write(removed=[file.data_file.id])
 
     def removedir(self, path: str):
         """
@@ -754,61 +1477,109 @@ class DataverseFS(AbstractFileSystem):
             raise ValueError(f"File '{path}' has no file ID")
 
         self.native_api.update_datafile_metadata(file.data_file.id, metadata=info)
-        self._cache.clear()
+        self._invalidate_metadata()
+
+    def record_write(
+        self,
+        removed: Sequence[int] = (),
+        added: Optional[Sequence[FileInfo]] = (),
+    ) -> None:
+        """
+        Bring the caches up to date after files were replaced, removed or added.
+
+        Writes through this filesystem call this themselves; call it after
+        changing the dataset's files through the Native API directly. Removed
+        and replaced datafiles are dropped from the on-disk caches, and the
+        cached draft snapshots are updated from the upload response.
+
+        Uploads of files Dataverse may ingest are not applied, since ingest
+        renames them and changes their type and size after the upload
+        response; the mutable snapshots are dropped instead, as they are when
+        the upload response lists no files.
+
+        Args:
+            removed: Datafile IDs of the removed or replaced files.
+            added: Entries of the uploaded files from the upload response, or
+                None to drop the cached snapshots.
+
+        Example:
+            >>> response = native_api.replace_datafile(42, "data.csv")
+            >>> fs.record_write(removed=[42], added=response.files or None)
+        """
+        for file_id in removed:
+            self._drop_file_caches(file_id)
+
+        if added is None:
+            self._invalidate_metadata()
+            return
+
+        files = [
+            File.model_validate(info.model_dump(by_alias=True, exclude_none=True))
+            for info in added
+        ]
+        for file in files:
+            if file.data_file is None or file.data_file.id is None:
+                self._invalidate_metadata()
+                return
+            if file.data_file.content_type in INGESTABLE_MIME_TYPES:
+                self._invalidate_metadata()
+                return
+
+        self.metadata_cache.update(self._metadata_key(), removed=removed, added=files)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _get_dataset(self) -> GetDatasetResponse:
-        """Fetch dataset metadata from Dataverse."""
-        if "dataset" in self._cache:
-            return self._cache["dataset"]
+        """Get the dataset snapshot, fetching it if it is not cached."""
+        return self._get_index().dataset
+
+    def _get_index(self) -> DatasetIndex:
+        """Get the path index of the dataset snapshot, from the metadata cache."""
+        key = self._metadata_key()
+        index = self.metadata_cache.get(key, max_age=self.cache_ttl)
+        if index is not None:
+            return index
 
         dataset = self.native_api.get_dataset(self.identifier, self.version)
+        return self._store_snapshot(key, dataset)
 
+    def _store_snapshot(
+        self, key: MetadataKey, dataset: GetDatasetResponse
+    ) -> DatasetIndex:
+        """Index a freshly fetched snapshot and add it to the metadata cache."""
         if dataset.files is None:
             raise FileNotFoundError(
                 f"Dataset {self.identifier} (version {self.version}) contains no files"
             )
 
-        self._cache["dataset"] = dataset
-        return dataset
+        index = DatasetIndex(dataset)
+        self.metadata_cache.put(key, index)
+        return index
+
+    def _metadata_key(self) -> MetadataKey:
+        """Key of this filesystem's dataset version in the metadata cache."""
+        return metadata_key(
+            self.base_url,
+            self.identifier,
+            self.version,
+            auth_credential(self.native_api.auth),
+        )
 
-    @staticmethod
-    def _build_file_path(file: File) -> str:
-        """Build full path for a file from its metadata."""
-        return "/".join(filter(None, [file.directory_label, file.label]))
-
-    @staticmethod
-    def _file_info(name: str, file: File) -> Dict[str, Any]:
-        """Build an fsspec info dict for a file entry."""
-        data_file = file.data_file
-        return {
-            "name": name,
-            "size": data_file.filesize
-            if data_file is not None and data_file.filesize is not None
-            else 0,
-            "type": "file",
-            "id": data_file.id if data_file is not None else None,
-            "content_type": data_file.content_type
-            if data_file is not None
-            else None,
-        }
+    def _invalidate_metadata(self) -> None:
+        """Drop the cached snapshots of the dataset's mutable versions."""
+        self.metadata_cache.invalidate(self._metadata_key())
 
     def _find_file(self, path: str) -> File:
         """Find a file by its path in the dataset."""
-        dataset = self._get_dataset()
         path = self._strip_protocol(path)
+        file = self._get_index().find_file(path)
 
-        assert dataset.files is not None
-
-        for file in dataset.files:
-            if self._build_file_path(file) == path:
-                if file.data_file is None:
-                    raise FileNotFoundError(
-                        f"File '{path}' exists but has no data_file metadata"
-                    )
-                return file
-
-        raise FileNotFoundError(f"File not found: {path}")
+        if file is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        if file.data_file is None:
+            raise FileNotFoundError(
+                f"File '{path}' exists but has no data_file metadata"
+            )
+        return file
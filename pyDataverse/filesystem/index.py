@@ -0,0 +1,215 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..models.dataset.edit_get import File, GetDatasetResponse
+
+
+class _Directory:
+    """A node of the directory trie."""
+
+    __slots__ = ("path", "directories", "files", "size", "_listing")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.directories: Dict[str, "_Directory"] = {}
+        self.files: Dict[str, File] = {}
+        self.size = 0
+        self._listing: Optional[List[Dict[str, Any]]] = None
+
+
+class DatasetIndex:
+    """
+    Path index over one snapshot of a dataset's file listing.
+
+    Dataverse returns a dataset's files as a flat list, so resolving a path
+    or listing a directory would otherwise scan every file. The index is
+    built once per snapshot and maps each file path to its entry, and each
+    directory to its immediate children and the total size of the files
+    below it. Lookups are O(1) and listings O(children).
+
+    Attributes:
+        dataset: The snapshot the index was built from.
+        files: File entries keyed by their full path.
+
+    Example:
+        >>> index = DatasetIndex(native_api.get_dataset(pid))
+        >>> index.info("data")
+        {'name': 'data', 'size': 0, 'type': 'directory'}
+        >>> [entry["name"] for entry in index.ls("data")]
+        ['data/file.csv', 'data/raw']
+    """
+
+    def __init__(self, dataset: GetDatasetResponse):
+        self.dataset = dataset
+        self.files: Dict[str, File] = {}
+        self._directories: Dict[str, _Directory] = {"": _Directory("")}
+
+        for file in dataset.files or []:
+            path = build_file_path(file)
+            if not path:
+                continue
+
+            self.files[path] = file
+            parent, _, name = path.rpartition("/")
+            directory = self._get_or_create_directory(parent)
+            directory.files[name] = file
+
+            size = _file_size(file)
+            while True:
+                directory.size += size
+                if not directory.path:
+                    break
+                directory = self._directories[directory.path.rpartition("/")[0]]
+
+    def find_file(self, path: str) -> Optional[File]:
+        """
+        Get the file entry at a path.
+
+        Args:
+            path: Full path of the file, without protocol or leading slash.
+
+        Returns:
+            Optional[File]: The entry, or None if no file has this path.
+        """
+        return self.files.get(path)
+
+    def is_directory(self, path: str) -> bool:
+        """Whether the path is an (implicit) directory, including the root."""
+        return path in self._directories
+
+    def directory_size(self, path: str) -> int:
+        """
+        Total size in bytes of all files below a directory.
+
+        Args:
+            path: Directory path ("" for the root).
+
+        Raises:
+            FileNotFoundError: If the path is not a directory.
+        """
+        directory = self._directories.get(path)
+        if directory is None:
+            raise FileNotFoundError(f"Directory not found: {path}")
+        return directory.size
+
+    def info(self, path: str) -> Dict[str, Any]:
+        """
+        Get the fsspec info dict of a file or directory.
+
+        A path that is both a file and a directory prefix resolves to the file.
+
+        Args:
+            path: Path within the dataset ("" for the root).
+
+        Returns:
+            Dict[str, Any]: A new info dict.
+
+        Raises:
+            FileNotFoundError: If no file or directory matches the path.
+        """
+        file = self.files.get(path)
+        if file is not None:
+            return file_info(path, file)
+        if path in self._directories:
+            return directory_info(path)
+        raise FileNotFoundError(f"File not found: {path}")
+
+    def ls(self, path: str) -> List[Dict[str, Any]]:
+        """
+        List the immediate children of a directory, sorted by name.
+
+        The listing is built on first access and reused afterwards; callers
+        receive fresh copies of the info dicts.
+
+        Args:
+            path: Directory path ("" for the root).
+
+        Returns:
+            List[Dict[str, Any]]: Info dicts of the children.
+
+        Raises:
+            FileNotFoundError: If the path is not a directory.
+        """
+        directory = self._directories.get(path)
+        if directory is None:
+            raise FileNotFoundError(f"Directory not found: {path}")
+
+        if directory._listing is None:
+            prefix = f"{path}/" if path else ""
+            entries = {
+                prefix + name: directory_info(prefix + name)
+                for name in directory.directories
+            }
+            # Files shadow directories of the same name, as in ``info``.
+            for name, file in directory.files.items():
+                entries[prefix + name] = file_info(prefix + name, file)
+            directory._listing = [entries[key] for key in sorted(entries)]
+
+        return [dict(entry) for entry in directory._listing]
+
+    def apply(
+        self, removed: Iterable[int] = (), added: Iterable[File] = ()
+    ) -> "DatasetIndex":
+        """
+        Build the index of the snapshot after a write, without refetching it.
+
+        Args:
+            removed: Datafile IDs of the removed or replaced files.
+            added: Entries of the added files; they replace any file at the
+                same path.
+
+        Returns:
+            DatasetIndex: A new index; this one is left unchanged.
+        """
+        removed_ids = set(removed)
+        added = list(added)
+        added_paths = {build_file_path(file) for file in added}
+
+        files = [
+            file
+            for file in self.dataset.files or []
+            if (file.data_file is None or file.data_file.id not in removed_ids)
+            and build_file_path(file) not in added_paths
+        ]
+        files.extend(added)
+        return DatasetIndex(self.dataset.model_copy(update={"files": files}))
+
+    def _get_or_create_directory(self, path: str) -> _Directory:
+        """Return the trie node for a directory, creating missing ancestors."""
+        directory = self._directories.get(path)
+        if directory is not None:
+            return directory
+
+        directory = _Directory(path)
+        self._directories[path] = directory
+        parent_path, _, name = path.rpartition("/")
+        self._get_or_create_directory(parent_path).directories[name] = directory
+        return directory
+
+
+def build_file_path(file: File) -> str:
+    """Build the full path of a file from its metadata."""
+    return "/".join(filter(None, [file.directory_label, file.label]))
+
+
+def file_info(name: str, file: File) -> Dict[str, Any]:
+    """Build an fsspec info dict for a file entry."""
+    data_file = file.data_file
+    return {
+        "name": name,
+        "size": _file_size(file),
+        "type": "file",
+        "id": data_file.id if data_file is not None else None,
+        "content_type": data_file.content_type if data_file is not None else None,
+    }
+
+
+def directory_info(name: str) -> Dict[str, Any]:
+    """Build an fsspec info dict for an implicit directory."""
+    return {"name": name, "size": 0, "type": "directory"}
+
+
+def _file_size(file: File) -> int:
+    data_file = file.data_file
+    if data_file is None or data_file.filesize is None:
+        return 0
+    return data_file.filesize
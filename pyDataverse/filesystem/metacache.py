@@ -0,0 +1,276 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+import httpx
+
+from ..models.dataset.edit_get import File
+from .index import DatasetIndex
+
+# Default upper bound for the number of file entries held across all cached
+# snapshots. A file entry takes a few kilobytes once parsed.
+DEFAULT_MAX_FILES = 200_000
+
+# Dataset versions whose content can still change. Any other version string
+# names one published version (for example "1.0") and is cached for good.
+_MUTABLE_VERSIONS = frozenset({":draft", ":latest", ":latest-published"})
+
+# Versions that a write to the dataset changes: it edits the draft, which
+# ":latest" then points to.
+_DRAFT_VERSIONS = frozenset({":draft", ":latest"})
+
+_NUMBERED_VERSION = re.compile(r"^\d+\.\d+$")
+
+# (base URL, dataset identifier, version, credential fingerprint)
+MetadataKey = Tuple[str, str, str, Optional[str]]
+
+
+class _Entry(NamedTuple):
+    index: DatasetIndex
+    stored_at: float
+    immutable: bool
+    weight: int
+
+
+def is_immutable_version(version: Union[str, int, None]) -> bool:
+    """
+    Whether a dataset version names one published version that never changes.
+
+    Only full ``major.minor`` numbers qualify. A bare major version such as
+    ``"1"`` resolves to its latest minor version, which a later minor
+    release changes.
+
+    Args:
+        version: The requested version.
+    """
+    return (
+        version is not None
+        and str(version) not in _MUTABLE_VERSIONS
+        and _NUMBERED_VERSION.match(str(version)) is not None
+    )
+
+
+def auth_credential(auth: Optional[httpx.Auth]) -> Optional[str]:
+    """
+    The secret that tells the users of an API client apart.
+
+    Args:
+        auth: The client's auth handler, if any.
+
+    Returns:
+        Optional[str]: The API or bearer token, an identifier of a custom
+        auth handler, or None for anonymous access.
+    """
+    if auth is None:
+        return None
+    for attribute in ("api_token", "bearer_token"):
+        token = getattr(auth, attribute, None)
+        if token:
+            return token
+    # Custom handlers do not expose their secret; key them per instance.
+    return f"{type(auth).__qualname__}-{id(auth)}"
+
+
+def metadata_key(
+    base_url: str,
+    identifier: Union[str, int],
+    version: Union[str, int],
+    credential: Optional[str] = None,
+) -> MetadataKey:
+    """
+    The cache key of a dataset version.
+
+    Mutable versions are keyed per credential, since drafts and restricted
+    content differ between users. Published versions look the same to
+    everyone and are shared.
+
+    Args:
+        base_url: Base URL of the Dataverse installation.
+        identifier: Dataset identifier (PID or database ID).
+        version: The requested version.
+        credential: Credential the version is read with, if any (see
+            :func:`auth_credential`).
+
+    Returns:
+        MetadataKey: The key.
+    """
+    principal = None
+    if credential and not is_immutable_version(version):
+        principal = hashlib.sha256(credential.encode()).hexdigest()[:16]
+    return (base_url.rstrip("/"), str(identifier), str(version), principal)
+
+
+class MetadataCache:
+    """
+    Process-wide, memory-bounded cache of dataset snapshots and their indexes.
+
+    Every :class:`DataverseFS` for the same dataset version, whether created
+    by ``Dataset.fs`` or by fsspec for a ``dataverse://`` URL, reads its file
+    listing from this cache instead of fetching the full dataset again.
+    Snapshots of numbered published versions (``"1.0"``) never change and do
+    not expire. Snapshots of ``:draft``, ``:latest`` and ``:latest-published``
+    are served for at most ``max_age`` seconds, as chosen by each reader.
+
+    Writes through a filesystem update the draft snapshots in place where
+    the change is known (see :meth:`update`) and otherwise drop only the
+    dataset's mutable snapshots (see :meth:`invalidate`).
+
+    The least recently used snapshots are evicted once the cached snapshots
+    hold more than ``max_files`` file entries in total.
+
+    Attributes:
+        max_files: Maximum number of file entries held across all snapshots.
+        hits: Lookups served from the cache.
+        misses: Lookups that had to fetch the dataset.
+
+    Example:
+        >>> fs = DataverseFS(base_url, pid, version="1.0")
+        >>> fs.ls("")  # fetches the dataset once
+        >>> DataverseFS(base_url, pid, version="1.0").ls("")  # served from cache
+        >>> SHARED_METADATA_CACHE.stats()
+        {'hits': 1, 'misses': 1, 'entries': 1, 'files': 120}
+    """
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES):
+        """
+        Initialize an empty metadata cache.
+
+        Args:
+            max_files: Maximum number of file entries held across all snapshots.
+        """
+        if max_files <= 0:
+            raise ValueError(f"max_files must be positive, got {max_files}")
+
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[MetadataKey, _Entry]" = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "files": self._weight,
+            }
+
+    def get(self, key: MetadataKey, max_age: float) -> Optional[DatasetIndex]:
+        """
+        Get the index of a cached snapshot.
+
+        Args:
+            key: The snapshot's key (see :func:`metadata_key`).
+            max_age: Maximum age in seconds of a mutable version's snapshot.
+
+        Returns:
+            Optional[DatasetIndex]: The index, or None if not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.immutable:
+                if time.monotonic() - entry.stored_at >= max_age:
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.index
+
+    def put(self, key: MetadataKey, index: DatasetIndex) -> None:
+        """
+        Store the index of a freshly fetched snapshot.
+
+        Args:
+            key: The snapshot's key (see :func:`metadata_key`).
+            index: The snapshot's index.
+        """
+        weight = 1 + len(index.dataset.files or [])
+        with self._lock:
+            self._remove(key)
+            if weight > self.max_files:
+                return
+            self._entries[key] = _Entry(
+                index, time.monotonic(), is_immutable_version(key[2]), weight
+            )
+            self._weight += weight
+            while self._weight > self.max_files:
+                self._remove(next(iter(self._entries)))
+
+    def update(
+        self,
+        key: MetadataKey,
+        removed: Iterable[int] = (),
+        added: Iterable[File] = (),
+    ) -> None:
+        """
+        Apply a write to the cached draft snapshots of a dataset.
+
+        The writer's own ``:draft`` and ``:latest`` snapshots are updated in
+        place; their age is not reset, so the next refresh still happens on
+        schedule. Draft snapshots read with other credentials are dropped,
+        and published and anonymous snapshots, which a write does not
+        change, are kept.
+
+        Args:
+            key: Key of any snapshot the writer reads (see :func:`metadata_key`).
+            removed: Datafile IDs of the removed or replaced files.
+            added: File entries of the added files.
+        """
+        base_url, identifier, _, principal = key
+        removed = list(removed)
+        added = list(added)
+        with self._lock:
+            for other, entry in list(self._entries.items()):
+                if (
+                    other[:2] != (base_url, identifier)
+                    or other[2] not in _DRAFT_VERSIONS
+                ):
+                    continue
+                if other[3] is None:
+                    continue
+                if other[3] != principal:
+                    self._remove(other)
+                    continue
+                index = entry.index.apply(removed=removed, added=added)
+                weight = 1 + len(index.dataset.files or [])
+                self._weight += weight - entry.weight
+                self._entries[other] = entry._replace(index=index, weight=weight)
+
+    def invalidate(self, key: MetadataKey) -> None:
+        """
+        Drop all mutable snapshots of a dataset, for every credential.
+
+        Args:
+            key: Key of any snapshot of the dataset (see :func:`metadata_key`).
+        """
+        with self._lock:
+            for other, entry in list(self._entries.items()):
+                if other[:2] == key[:2] and not entry.immutable:
+                    self._remove(other)
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def _remove(self, key: MetadataKey) -> None:
+        """Remove an entry, if present (lock held)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= entry.weight
+
+
+# The cache shared by all filesystems that are not given their own.
+SHARED_METADATA_CACHE = MetadataCache()
@@ -0,0 +1,318 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "The Parquet tabular cache requires pyarrow. "
+        "Install it with: pip install 'pyDataverse[arrow]'"
+    ) from e
+
+from ..models.dataset.edit_get import DataFile
+from .rangecache import datafile_cache_key
+
+# Default upper bound for the total size of the cache directory.
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+_SUFFIX = ".parquet"
+
+
+class TabularCache:
+    """
+    On-disk Parquet cache of parsed tabular files.
+
+    Each entry holds the DataFrame parsed from one datafile and is keyed by
+    the datafile's database ID and checksum. Dataverse assigns a new ID when
+    a file is replaced, so a cached entry can never be served for different
+    content. Entries are read back memory-mapped, reading only the requested
+    columns.
+
+    The total size of the directory is bounded by ``max_size``; when a new
+    entry pushes it over the limit, the least recently used entries are
+    removed. Recency is tracked through file modification times, so several
+    processes can share one cache directory.
+
+    Attributes:
+        directory: Directory the Parquet files are stored in.
+        max_size: Maximum total size of all entries in bytes.
+
+    Example:
+        >>> cache = TabularCache("~/.cache/pyDataverse/tabular", max_size=2**30)
+        >>> fs = DataverseFS(base_url, identifier, tabular_cache=cache)
+        >>> df = fs.open_tabular("data/file.tab", api_token=None)  # downloads
+        >>> df = fs.open_tabular("data/file.tab", api_token=None)  # from cache
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def key(data_file: Optional[DataFile]) -> Optional[str]:
+        """
+        The cache key of a datafile, or None if it cannot be cached.
+
+        Files without an ID or without a checksum are not cached, since their
+        content cannot be told apart from a later version.
+
+        Args:
+            data_file: The datafile metadata from the dataset listing.
+
+        Returns:
+            Optional[str]: The key, e.g. ``"42-5d41402abc4b2a76"``.
+        """
+        return datafile_cache_key(data_file)
+
+    @property
+    def size(self) -> int:
+        """The total size of all entries in bytes."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def columns(self, key: str) -> Optional[List[str]]:
+        """
+        The column names of a cached entry, or None if it is not cached.
+
+        Args:
+            key: The entry's key.
+
+        Returns:
+            Optional[List[str]]: Column names in file order.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            return pq.read_schema(path, memory_map=True).names
+        except (OSError, pa.ArrowException):
+            self._discard(path)
+            return None
+
+    def read(
+        self,
+        key: str,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read a cached entry as a DataFrame.
+
+        Args:
+            key: The entry's key.
+            columns: Optional column names to read; others are never loaded.
+
+        Returns:
+            Optional[pd.DataFrame]: The DataFrame, or None on a cache miss.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            table = pq.read_table(
+                path,
+                columns=list(columns) if columns is not None else None,
+                memory_map=True,
+            )
+        except (OSError, pa.ArrowException):
+            self._discard(path)
+            return None
+
+        self._touch(path)
+        return table.to_pandas()
+
+    def iter_chunks(
+        self,
+        key: str,
+        chunk_size: int,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[Iterator[pd.DataFrame]]:
+        """
+        Read a cached entry as a stream of DataFrame chunks.
+
+        Chunk indexes continue across chunks, matching ``pandas.read_csv``
+        with ``chunksize``.
+
+        Args:
+            key: The entry's key.
+            chunk_size: Number of rows per chunk.
+            columns: Optional column names to read.
+
+        Returns:
+            Optional[Iterator[pd.DataFrame]]: The chunks, or None on a cache miss.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            parquet_file = pq.ParquetFile(path, memory_map=True)
+        except (OSError, pa.ArrowException):
+            self._discard(path)
+            return None
+
+        self._touch(path)
+
+        def _chunks() -> Iterator[pd.DataFrame]:
+            start = 0
+            with parquet_file:
+                for batch in parquet_file.iter_batches(
+                    batch_size=chunk_size,
+                    columns=list(columns) if columns is not None else None,
+                ):
+                    chunk = batch.to_pandas()
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    yield chunk
+
+        return _chunks()
+
+    def write(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Store a DataFrame under a key.
+
+        Frames that Arrow cannot represent (e.g. object columns mixing types)
+        are skipped rather than raising.
+
+        Args:
+            key: The entry's key.
+            df: The parsed file.
+
+        Returns:
+            bool: True if the entry was written.
+        """
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            return False
+
+        temp_path = self._temp_path()
+        try:
+            pq.write_table(table, temp_path)
+            os.replace(temp_path, self._path(key))
+        except (OSError, pa.ArrowException):
+            self._discard(temp_path)
+            return False
+
+        self._evict()
+        return True
+
+    def write_chunks(
+        self,
+        key: str,
+        chunks: Iterator[pd.DataFrame],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Pass chunks through while storing them under a key.
+
+        The entry is only committed once the chunks are fully consumed; a
+        partially read stream, or chunks whose types drift from the first
+        chunk, leave the cache untouched.
+
+        Args:
+            key: The entry's key.
+            chunks: DataFrame chunks of the parsed file.
+
+        Yields:
+            pd.DataFrame: The chunks, unchanged.
+        """
+        temp_path = self._temp_path()
+        writer: Optional[pq.ParquetWriter] = None
+        failed = False
+
+        try:
+            for chunk in chunks:
+                if not failed:
+                    try:
+                        if writer is None:
+                            table = pa.Table.from_pandas(chunk, preserve_index=False)
+                            writer = pq.ParquetWriter(temp_path, table.schema)
+                        else:
+                            table = pa.Table.from_pandas(
+                                chunk,
+                                schema=writer.schema,
+                                preserve_index=False,
+                            )
+                        writer.write_table(table)
+                    except (OSError, pa.ArrowException, TypeError, ValueError):
+                        failed = True
+                yield chunk
+
+            if writer is not None and not failed:
+                writer.close()
+                writer = None
+                os.replace(temp_path, self._path(key))
+                self._evict()
+        finally:
+            if writer is not None:
+                writer.close()
+            self._discard(temp_path)
+
+    def invalidate(self, file_id: int) -> None:
+        """
+        Remove all entries of a datafile.
+
+        Args:
+            file_id: Database ID of the datafile.
+        """
+        for entry in self.directory.glob(f"{file_id}-*{_SUFFIX}"):
+            self._discard(entry)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self._entries():
+            self._discard(entry)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _temp_path(self) -> Path:
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(handle)
+        return Path(name)
+
+    def _entries(self) -> List[Path]:
+        return list(self.directory.glob(f"*{_SUFFIX}"))
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the size limit holds."""
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat(), entry))
+            except FileNotFoundError:
+                continue
+
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.max_size:
+                break
+            self._discard(entry)
+            total -= stat.st_size
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,374 @@
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from ..models.dataset.edit_get import DataFile
+
+# Default upper bound for the bytes cached on disk.
+DEFAULT_MAX_SIZE = 4 * 1024 * 1024 * 1024
+
+# Missing ranges are widened to multiples of this size before fetching, so
+# small scattered reads do not fragment the range index.
+DEFAULT_ALIGNMENT = 1024 * 1024
+
+_DATA_SUFFIX = ".data"
+_INDEX_SUFFIX = ".ranges"
+
+Range = Tuple[int, int]
+
+# Size in bytes of an entry's cached ranges, and the modification time of its
+# index in nanoseconds when this process last wrote or read it.
+_Entry = Tuple[int, int]
+
+
+def datafile_cache_key(data_file: Optional[DataFile]) -> Optional[str]:
+    """
+    The cache key of a datafile, or None if it cannot be cached.
+
+    The key combines the datafile's database ID and checksum. Dataverse
+    assigns a new ID when a file is replaced, so a cached entry can never be
+    served for different content. Files without an ID or without a checksum
+    are not cached, since their content cannot be told apart from a later
+    version.
+
+    Args:
+        data_file: The datafile metadata from the dataset listing.
+
+    Returns:
+        Optional[str]: The key, e.g. ``"42-5d41402abc4b2a76"``.
+    """
+    if data_file is None or data_file.id is None:
+        return None
+
+    checksum = data_file.md5
+    if data_file.checksum is not None and data_file.checksum.value:
+        checksum = data_file.checksum.value
+    if not checksum:
+        return None
+
+    return f"{data_file.id}-{checksum}"
+
+
+class RangeCache:
+    """
+    Persistent on-disk cache of byte ranges of remote files.
+
+    Each datafile gets a sparse local file of its full size, into which
+    fetched ranges are written at their own offsets, and a small index of
+    the ranges present. A read serves the cached parts memory-mapped from
+    disk and fetches only the gaps, so repeated random access to the same
+    files (HDF5, NetCDF, ...) costs no network traffic, across processes
+    and sessions. Entries are keyed by :func:`datafile_cache_key`.
+
+    The total size of the cached ranges is bounded by ``max_size``; when a
+    write pushes it over the limit, the least recently used files are
+    removed. Ranges that do not fit even into an otherwise empty cache are
+    read remotely and not cached. Sizes and recency are kept in memory, so
+    a write costs the same however many files are cached.
+
+    Several processes can share one cache directory. Each process accounts
+    for the files present when it first writes and the files it writes
+    itself. Recency is also tracked through the modification times of the
+    index files, so a file another process has read since is not evicted
+    as unused. A range written by one process may occasionally be missing
+    from the index written by another; it is then fetched again.
+
+    Attributes:
+        directory: Directory the cached files are stored in.
+        max_size: Maximum total size of the cached ranges in bytes.
+        alignment: Granularity in bytes of fetched gaps.
+
+    Example:
+        >>> cache = RangeCache("~/.cache/pyDataverse/ranges", max_size=2**33)
+        >>> fs = DataverseFS(base_url, identifier, range_cache=cache)
+        >>> with fs.open("data/model.h5", "rb") as f:
+        ...     f.seek(1_000_000)
+        ...     chunk = f.read(4096)  # fetched once, then read from disk
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+        alignment: int = DEFAULT_ALIGNMENT,
+    ):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if alignment <= 0:
+            raise ValueError(f"alignment must be positive, got {alignment}")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.alignment = alignment
+        self._lock = threading.Lock()
+        # Known entries by index path, least recently used first; scanned
+        # from the directory on first use.
+        self._entries: Optional["OrderedDict[Path, _Entry]"] = None
+        self._total = 0
+
+    @property
+    def size(self) -> int:
+        """The total size of all cached ranges in bytes."""
+        return sum(_total(self._load_ranges(path)) for path in self._indexes())
+
+    def ranges(self, key: str) -> List[Range]:
+        """
+        The cached ``[start, end)`` ranges of an entry, sorted and merged.
+
+        Args:
+            key: The entry's key.
+        """
+        return self._load_ranges(self._index_path(key))
+
+    def read(
+        self,
+        key: str,
+        size: int,
+        start: int,
+        end: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> bytes:
+        """
+        Read the byte range ``[start, end)`` of a file, fetching only gaps.
+
+        Args:
+            key: The entry's key.
+            size: Size of the whole file in bytes.
+            start: First byte to read.
+            end: Byte after the last one to read; clipped to ``size``.
+            fetch: Fetches the byte range ``[start, end)`` from the remote.
+
+        Returns:
+            bytes: The requested bytes.
+        """
+        end = min(end, size)
+        if end <= start:
+            return b""
+
+        data_path = self._data_path(key)
+        index_path = self._index_path(key)
+
+        with self._lock:
+            ranges = self._load_ranges(index_path) if data_path.exists() else []
+        gaps = _gaps(ranges, start, end)
+
+        if gaps:
+            gaps = [self._align(gap, size) for gap in gaps]
+            if _total(ranges) + _total(gaps) > self.max_size:
+                # The entry could never fit under the size cap.
+                return fetch(start, end)
+
+            # Fetch outside the lock so reads of other ranges run concurrently.
+            fetched = self._fill(data_path, gaps, size, fetch)
+            with self._lock:
+                ranges = self._load_ranges(index_path)
+                for new in fetched:
+                    ranges = _merge(ranges, new)
+                self._save_ranges(index_path, ranges)
+                self._record(index_path, _total(ranges))
+                self._evict(keep=index_path)
+            if _gaps(ranges, start, end):
+                # The remote returned fewer bytes than asked for.
+                return fetch(start, end)
+        else:
+            with self._lock:
+                self._record(index_path, _total(ranges), touch=True)
+
+        try:
+            with open(data_path, "rb") as data_file:
+                with mmap.mmap(
+                    data_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    return mapped[start:end]
+        except (OSError, ValueError):
+            # Evicted by a concurrent write; serve this read remotely.
+            return fetch(start, end)
+
+    def invalidate(self, file_id: int) -> None:
+        """
+        Remove all entries of a datafile.
+
+        Args:
+            file_id: Database ID of the datafile.
+        """
+        with self._lock:
+            for index_path in self.directory.glob(f"{file_id}-*{_INDEX_SUFFIX}"):
+                self._discard(index_path)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for index_path in self._indexes():
+                self._discard(index_path)
+            self._entries = OrderedDict()
+            self._total = 0
+
+    def _align(self, gap: Range, size: int) -> Range:
+        """Widen a gap to multiples of the alignment, within the file."""
+        gap_start, gap_end = gap
+        gap_start -= gap_start % self.alignment
+        gap_end = min(-(-gap_end // self.alignment) * self.alignment, size)
+        return gap_start, gap_end
+
+    def _fill(
+        self,
+        data_path: Path,
+        gaps: List[Range],
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> List[Range]:
+        """Fetch aligned gaps into the sparse data file; return the ranges written."""
+        fetched = []
+        handle = os.open(data_path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(handle, "r+b") as data_file:
+            if os.fstat(handle).st_size < size:
+                data_file.truncate(size)
+            for gap_start, gap_end in gaps:
+                data = fetch(gap_start, gap_end)
+                data_file.seek(gap_start)
+                data_file.write(data)
+                fetched.append((gap_start, gap_start + len(data)))
+        return fetched
+
+    def _data_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_DATA_SUFFIX}"
+
+    def _index_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_INDEX_SUFFIX}"
+
+    def _indexes(self) -> List[Path]:
+        return list(self.directory.glob(f"*{_INDEX_SUFFIX}"))
+
+    @staticmethod
+    def _load_ranges(index_path: Path) -> List[Range]:
+        try:
+            with open(index_path) as index_file:
+                return [(int(start), int(end)) for start, end in json.load(index_file)]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def _save_ranges(self, index_path: Path, ranges: List[Range]) -> None:
+        """Write the range index atomically."""
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as index_file:
+                json.dump(ranges, index_file)
+            os.replace(name, index_path)
+        except OSError:
+            try:
+                os.unlink(name)
+            except FileNotFoundError:
+                pass
+
+    def _known_entries(self) -> "OrderedDict[Path, _Entry]":
+        """The known entries, scanning the directory on first use."""
+        if self._entries is None:
+            entries = []
+            for index_path in self._indexes():
+                try:
+                    mtime = index_path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                size = _total(self._load_ranges(index_path))
+                entries.append((mtime, index_path, size))
+
+            self._entries = OrderedDict(
+                (index_path, (size, mtime))
+                for mtime, index_path, size in sorted(entries)
+            )
+            self._total = sum(size for size, _ in self._entries.values())
+        return self._entries
+
+    def _record(self, index_path: Path, size: int, touch: bool = False) -> None:
+        """Mark an entry as most recently used and update its size."""
+        entries = self._known_entries()
+        mtime = time.time_ns()
+        try:
+            if touch:
+                os.utime(index_path, ns=(mtime, mtime))
+            else:
+                mtime = index_path.stat().st_mtime_ns
+        except OSError:
+            pass
+
+        previous = entries.pop(index_path, None)
+        self._total += size - (previous[0] if previous is not None else 0)
+        entries[index_path] = (size, mtime)
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used files until the size limit holds."""
+        entries = self._known_entries()
+        while self._total > self.max_size:
+            index_path = next((path for path in entries if path != keep), None)
+            if index_path is None:
+                return
+
+            size, recorded = entries[index_path]
+            try:
+                mtime = index_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = recorded
+            if mtime > recorded:
+                # Another process has used the entry since; it is evicted the
+                # next time it comes up, unless used again.
+                entries[index_path] = (size, mtime)
+                entries.move_to_end(index_path)
+                continue
+            self._discard(index_path)
+
+    def _discard(self, index_path: Path) -> None:
+        """Remove an entry's index and data file."""
+        if self._entries is not None:
+            entry = self._entries.pop(index_path, None)
+            if entry is not None:
+                self._total -= entry[0]
+
+        data_path = index_path.with_suffix(_DATA_SUFFIX)
+        for path in (index_path, data_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _gaps(ranges: List[Range], start: int, end: int) -> List[Range]:
+    """The parts of ``[start, end)`` not covered by sorted, merged ranges."""
+    gaps = []
+    position = start
+    for range_start, range_end in ranges:
+        if range_end <= position:
+            continue
+        if range_start >= end:
+            break
+        if range_start > position:
+            gaps.append((position, range_start))
+        position = max(position, range_end)
+        if position >= end:
+            break
+    if position < end:
+        gaps.append((position, end))
+    return gaps
+
+
+def _merge(ranges: List[Range], new: Range) -> List[Range]:
+    """Insert a range into sorted ranges, merging overlapping or adjacent ones."""
+    merged: List[Range] = []
+    start, end = new
+    for range_start, range_end in ranges:
+        if range_end < start or range_start > end:
+            merged.append((range_start, range_end))
+        else:
+            start, end = min(start, range_start), max(end, range_end)
+    merged.append((start, end))
+    return sorted(merged)
+
+
+def _total(ranges: List[Range]) -> int:
+    return sum(end - start for start, end in ranges)
@@ -0,0 +1,133 @@
+import re
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+import httpx
+
+# Ranges of one file closer together than this are fetched as one span; the
+# bytes in between cost less than another request.
+DEFAULT_MAX_GAP = 64 * 1024
+
+# Default number of spans fetched at once by ``cat_ranges``.
+DEFAULT_MAX_CONCURRENCY = 8
+
+_CONTENT_RANGE = re.compile(rb"bytes (\d+)-(\d+)/(?:\d+|\*)", re.IGNORECASE)
+
+# A ``[start, end)`` byte range.
+Range = Tuple[int, int]
+
+
+def absolute_range(
+    start: Optional[int], end: Optional[int], size: int
+) -> Tuple[int, Optional[int]]:
+    """
+    Resolve negative offsets of a range against the file size, as fsspec does.
+
+    Args:
+        start: First byte, None for 0; negative values count from the end.
+        end: Byte after the last one, None for the end of the file; negative
+            values count from the end.
+        size: File size in bytes.
+
+    Returns:
+        Tuple[int, Optional[int]]: The non-negative start and end.
+    """
+    start = start or 0
+    if start < 0:
+        start = max(size + start, 0)
+    if end is not None and end < 0:
+        end = max(size + end, 0)
+    return start, end
+
+
+def merge_ranges(ranges: Sequence[Range], max_gap: int) -> List[Range]:
+    """
+    Merge byte ranges that overlap or lie at most ``max_gap`` bytes apart.
+
+    Args:
+        ranges: ``[start, end)`` ranges in any order.
+        max_gap: Largest gap in bytes bridged by a merged span.
+
+    Returns:
+        List[Range]: Sorted, disjoint spans covering all ranges.
+    """
+    spans: List[Range] = []
+    for start, end in sorted(ranges):
+        if spans and start - spans[-1][1] <= max_gap:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
+
+
+def split_ranges(
+    ranges: Sequence[Range], spans: Sequence[Range], buffers: Sequence[bytes]
+) -> List[bytes]:
+    """
+    Cut the requested ranges back out of the fetched spans.
+
+    Args:
+        ranges: The requested ``[start, end)`` ranges.
+        spans: The spans returned by :func:`merge_ranges` for ``ranges``.
+        buffers: The fetched content of each span.
+
+    Returns:
+        List[bytes]: The content of each range, in the order of ``ranges``.
+    """
+    span_starts = [start for start, _ in spans]
+    out = []
+    for start, end in ranges:
+        index = bisect_right(span_starts, start) - 1
+        offset = start - span_starts[index]
+        out.append(buffers[index][offset : offset + end - start])
+    return out
+
+
+def read_byteranges(
+    response: httpx.Response, body: bytes, spans: Sequence[Range]
+) -> Optional[List[bytes]]:
+    """
+    Get the content of each span from the response to a multi-range request.
+
+    Servers may answer with one part per range, coalesce ranges into fewer
+    parts, or send a single part without ``multipart/byteranges`` framing.
+
+    Args:
+        response: The response, whose body has been read.
+        body: The response body.
+        spans: The requested ``[start, end)`` spans.
+
+    Returns:
+        Optional[List[bytes]]: The content of each span, or None if the
+        response does not cover every span.
+    """
+    parts: List[Tuple[int, bytes]] = []
+    content_type = response.headers.get("content-type", "")
+    boundary = re.search(r'boundary="?([^";]+)"?', content_type)
+
+    if content_type.lower().startswith("multipart/byteranges") and boundary:
+        delimiter = b"--" + boundary.group(1).encode()
+        for chunk in body.split(delimiter)[1:]:
+            head, separator, data = chunk.partition(b"\r\n\r\n")
+            match = _CONTENT_RANGE.search(head)
+            if not separator or match is None:
+                continue
+            first, last = int(match.group(1)), int(match.group(2))
+            parts.append((first, data[: last - first + 1]))
+    else:
+        match = _CONTENT_RANGE.search(
+            response.headers.get("content-range", "").encode()
+        )
+        if match is None:
+            return None
+        parts.append((int(match.group(1)), body))
+
+    out = []
+    for start, end in spans:
+        for first, data in parts:
+            if first <= start and end <= first + len(data):
+                out.append(data[start - first : end - first])
+                break
+        else:
+            return None
+    return out
@@ -2,6 +2,8 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from fsspec.spec import AbstractBufferedFile
 
+from .blockcache import PREFETCH_CACHE_TYPE, PrefetchCache
+
 if TYPE_CHECKING:
     from .dvfs import DataverseFS
 
@@ -23,6 +25,12 @@ class DataverseFileReader(AbstractBufferedFile):
         >>> # Slice notation reads an explicit byte range
         >>> with fs.open("data/file.csv", "rb") as f:
         ...     chunk = f[100:1000]
+        >>> # Prefetch the next blocks of a sequential scan in the background
+        >>> with fs.open(
+        ...     "data/big.h5", "rb", cache_type="prefetch",
+        ...     cache_options={"read_ahead": 8},
+        ... ) as f:
+        ...     data = f.read(100_000_000)
     """
 
     def __init__(
@@ -34,6 +42,7 @@ class DataverseFileReader(AbstractBufferedFile):
         block_size: Union[int, str] = "default",
         cache_type: str = "readahead",
         cache_options: Optional[dict] = None,
+        range_cache_key: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -45,24 +54,42 @@ class DataverseFileReader(AbstractBufferedFile):
             file_identifier: Database ID or persistent ID of the file.
             size: Optional known file size, to avoid an extra metadata lookup.
             block_size: Read-ahead block size ("default" for the fsspec default).
-            cache_type: fsspec read cache policy.
+            cache_type: fsspec read cache policy, or "prefetch" to fetch the
+                next ``read_ahead`` blocks (cache option, default 4) in the
+                background into the filesystem's shared ``block_cache``.
             cache_options: Additional options for the read cache.
+            range_cache_key: Key of the file in the filesystem's on-disk
+                ``range_cache``; ranges are fetched remotely when omitted.
         """
         self.data_access_api = fs.data_access_api
         self.file_identifier = file_identifier
+        self.redirect_cache = fs.redirect_cache
+        self.range_cache = fs.range_cache if range_cache_key is not None else None
+        self.range_cache_key = range_cache_key
         self._known_end: Optional[int] = None
 
+        prefetch = cache_type == PREFETCH_CACHE_TYPE
         super().__init__(
             fs,
             path,
             mode="rb",
             block_size=block_size,
-            cache_type=cache_type,
-            cache_options=cache_options,
+            cache_type="none" if prefetch else cache_type,
+            cache_options=None if prefetch else cache_options,
             size=size,
             **kwargs,
         )
 
+        if prefetch:
+            self.cache = PrefetchCache(
+                self.blocksize,
+                self._fetch_range,
+                self.size,
+                block_cache=fs.block_cache,
+                file_key=file_identifier,
+                **(cache_options or {}),
+            )
+
     def read(self, length: int = -1) -> bytes:
         """Read ``length`` bytes, or the rest of the file when ``length < 0``.
 
@@ -93,20 +120,33 @@ class DataverseFileReader(AbstractBufferedFile):
         return data
 
     def _fetch_range(self, start: int, end: int) -> bytes:
-        """Fetch a byte range ``[start, end)`` via a Range request.
+        """Fetch a byte range ``[start, end)``.
 
-        fsspec uses an exclusive ``end``, whereas the Data Access API Range
-        header is inclusive, hence ``range_end=end - 1``.
+        With an on-disk ``range_cache``, cached parts are read from disk and
+        only the gaps are requested.
         """
         if end <= start:
             return b""
 
-        with self.data_access_api.stream_datafile(
-            self.file_identifier,
-            range_start=start,
-            range_end=end - 1,
-        ) as response:
-            return b"".join(response.iter_bytes())
+        if self.range_cache is not None and end <= self.size:
+            assert self.range_cache_key is not None
+            return self.range_cache.read(
+                self.range_cache_key,
+                self.size,
+                start,
+                end,
+                self._fetch_remote_range,
+            )
+        return self._fetch_remote_range(start, end)
+
+    def _fetch_remote_range(self, start: int, end: int) -> bytes:
+        """Fetch a byte range ``[start, end)`` via a Range request.
+
+        On S3 or Swift stores the request goes straight to the presigned
+        storage URL held in the filesystem's ``redirect_cache``, rather than
+        through a Dataverse redirect for every block.
+        """
+        return self.redirect_cache.fetch_range(self.file_identifier, start, end)
 
     def __getitem__(self, key: Union[int, slice]) -> bytes:
         """
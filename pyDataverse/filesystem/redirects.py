@@ -0,0 +1,389 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+if TYPE_CHECKING:
+    from ..api import DataAccessApi
+
+# Lifetime assumed for redirect targets whose expiry cannot be read from the
+# URL, and for files Dataverse serves itself. Dataverse presigns S3 URLs for
+# 60 minutes unless configured otherwise.
+DEFAULT_REDIRECT_TTL = 300
+
+# Redirect targets are re-resolved this many seconds before they expire, so
+# a request never starts with a URL about to become invalid.
+EXPIRY_MARGIN = 30
+
+# Storage answers with one of these once a presigned URL has expired.
+_EXPIRED_STATUS_CODES = frozenset({401, 403})
+
+# A resolved redirect: the storage URL (None if Dataverse serves the file
+# itself) and the monotonic time after which it must be resolved again.
+_Entry = Tuple[Optional[str], float]
+
+
+class RedirectCache:
+    """
+    Cache of the storage URLs Data Access downloads redirect to.
+
+    On S3 or Swift stores, every Data Access request is answered with a
+    redirect to a presigned storage URL, so each Range read of an open file
+    would cost a round trip to Dataverse before the one to storage. This
+    cache resolves the redirect once per datafile and sends Range requests
+    straight to storage until the presigned URL expires. The expiry is read
+    from the URL's signature parameters (S3, Google Cloud Storage, Swift
+    temporary URLs, Azure SAS) where present.
+
+    An expired or revoked URL (HTTP 401/403 from storage) is dropped and
+    resolved again transparently. Files Dataverse serves itself are
+    remembered as such for ``default_ttl`` seconds and read through the Data
+    Access API as before. Storage requests never carry Dataverse credentials.
+
+    Probes and storage reads share one pooled ``httpx.Client`` with the
+    timeout of the Data Access API; :meth:`close` releases its connections.
+    A store that ignores the Range header is read only up to the end of the
+    requested range before the connection is dropped.
+
+    Attributes:
+        default_ttl: Lifetime in seconds of entries without a readable expiry.
+        hits: Reads that used a cached entry.
+        misses: Reads that had to resolve the redirect.
+
+    Example:
+        >>> redirects = RedirectCache(data_access_api)
+        >>> redirects.fetch_range(42, 0, 1024)  # resolves, then reads from S3
+        >>> redirects.fetch_range(42, 1024, 2048)  # reads from S3 directly
+    """
+
+    def __init__(
+        self,
+        data_access_api: "DataAccessApi",
+        default_ttl: float = DEFAULT_REDIRECT_TTL,
+    ):
+        """
+        Initialize an empty redirect cache.
+
+        Args:
+            data_access_api: API used to resolve redirects and to read files
+                Dataverse serves itself.
+            default_ttl: Lifetime in seconds of entries without a readable expiry.
+        """
+        self.data_access_api = data_access_api
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Dict[Union[str, int], _Entry] = {}
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled client for redirect probes and storage reads, created on first use."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(timeout=self.data_access_api.timeout)
+            return self._client
+
+    def close(self) -> None:
+        """Close the pooled client; a later read opens a new one."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def resolve(self, identifier: Union[str, int]) -> Optional[str]:
+        """
+        Get the storage URL of a datafile, resolving it if needed.
+
+        Args:
+            identifier: Database ID or persistent ID of the datafile.
+
+        Returns:
+            Optional[str]: The presigned storage URL, or None if Dataverse
+            serves the file itself.
+        """
+        entry = self._lookup(identifier)
+        if entry is not None:
+            return entry[0]
+        return self._resolve_uncached(identifier)
+
+    async def aresolve(self, identifier: Union[str, int]) -> Optional[str]:
+        """
+        Async :meth:`resolve`.
+
+        Cached entries are returned right away; a redirect that has to be
+        resolved is probed in a worker thread.
+
+        Args:
+            identifier: Database ID or persistent ID of the datafile.
+
+        Returns:
+            Optional[str]: The presigned storage URL, or None if Dataverse
+            serves the file itself.
+        """
+        entry = self._lookup(identifier)
+        if entry is not None:
+            return entry[0]
+        return await asyncio.to_thread(self._resolve_uncached, identifier)
+
+    def fetch_range(self, identifier: Union[str, int], start: int, end: int) -> bytes:
+        """
+        Read the byte range ``[start, end)`` of a datafile.
+
+        Args:
+            identifier: Database ID or persistent ID of the datafile.
+            start: First byte to read.
+            end: Byte after the last one to read.
+
+        Returns:
+            bytes: The requested bytes.
+        """
+        if end <= start:
+            return b""
+
+        url = self.resolve(identifier)
+        if url is None:
+            return self._fetch_via_dataverse(identifier, start, end)
+
+        data = _fetch_from_storage(self.client, url, start, end)
+        if data is None:
+            # The presigned URL expired early or was revoked; resolve it anew.
+            self.invalidate(identifier)
+            url = self.resolve(identifier)
+            if url is None:
+                return self._fetch_via_dataverse(identifier, start, end)
+            data = _fetch_from_storage(self.client, url, start, end)
+            if data is None:
+                raise PermissionError(
+                    f"Storage rejected the download URL of datafile '{identifier}'"
+                )
+        return data
+
+    async def afetch_range(
+        self,
+        identifier: Union[str, int],
+        start: int,
+        end: int,
+        data_access_api: "DataAccessApi",
+    ) -> bytes:
+        """
+        Async :meth:`fetch_range`.
+
+        Args:
+            identifier: Database ID or persistent ID of the datafile.
+            start: First byte to read.
+            end: Byte after the last one to read.
+            data_access_api: Data Access API with an async client, used to read
+                from storage and files Dataverse serves itself.
+
+        Returns:
+            bytes: The requested bytes.
+        """
+        if end <= start:
+            return b""
+
+        url = await self.aresolve(identifier)
+        if url is None:
+            return await _afetch_via_dataverse(data_access_api, identifier, start, end)
+
+        data = await _afetch_from_storage(data_access_api.client, url, start, end)
+        if data is None:
+            # The presigned URL expired early or was revoked; resolve it anew.
+            self.invalidate(identifier)
+            url = await self.aresolve(identifier)
+            if url is None:
+                return await _afetch_via_dataverse(
+                    data_access_api, identifier, start, end
+                )
+            data = await _afetch_from_storage(data_access_api.client, url, start, end)
+            if data is None:
+                raise PermissionError(
+                    f"Storage rejected the download URL of datafile '{identifier}'"
+                )
+        return data
+
+    def invalidate(self, identifier: Optional[Union[str, int]] = None) -> None:
+        """
+        Drop the cached redirect of a datafile, or of all datafiles.
+
+        Args:
+            identifier: Database ID or persistent ID of the datafile, or None
+                to drop every entry.
+        """
+        with self._lock:
+            if identifier is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(identifier, None)
+
+    def _lookup(self, identifier: Union[str, int]) -> Optional[_Entry]:
+        """Get an unexpired entry, counting the lookup as a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(identifier)
+            if entry is not None and entry[1] > time.monotonic():
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def _resolve_uncached(self, identifier: Union[str, int]) -> Optional[str]:
+        """Resolve the redirect of a datafile and store it."""
+        now = time.monotonic()
+        url = self.data_access_api.resolve_datafile_redirect(
+            identifier, client=self.client
+        )
+        expires = now + self.default_ttl
+        if url is not None:
+            expires = now + _remaining_lifetime(url, self.default_ttl) - EXPIRY_MARGIN
+
+        with self._lock:
+            self._entries[identifier] = (url, expires)
+        return url
+
+    def _fetch_via_dataverse(
+        self, identifier: Union[str, int], start: int, end: int
+    ) -> bytes:
+        """Read a range through the Data Access API (inclusive Range header)."""
+        with self.data_access_api.stream_datafile(
+            identifier,
+            range_start=start,
+            range_end=end - 1,
+        ) as response:
+            if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+                return b""
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                return _slice_whole_body(response.iter_bytes(), start, end)
+            return response.read()
+
+
+def _fetch_from_storage(
+    client: httpx.Client, url: str, start: int, end: int
+) -> Optional[bytes]:
+    """Read a range from a presigned URL; None if the URL is no longer valid."""
+    with client.stream(
+        "GET",
+        url,
+        headers={"Range": f"bytes={start}-{end - 1}"},
+        follow_redirects=True,
+    ) as response:
+        if response.status_code in _EXPIRED_STATUS_CODES:
+            return None
+        if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+            # The range starts past the end of the object, e.g. an empty file.
+            return b""
+        response.raise_for_status()
+        if response.status_code != httpx.codes.PARTIAL_CONTENT:
+            return _slice_whole_body(response.iter_bytes(), start, end)
+        return response.read()
+
+
+def _slice_whole_body(chunks: Iterator[bytes], start: int, end: int) -> bytes:
+    """
+    Cut ``[start, end)`` out of a response that ignored the Range header.
+
+    Only the body up to ``end`` is read; closing the response afterwards
+    drops the connection instead of downloading the rest of the file.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= end:
+            break
+    return bytes(buffer[start:end])
+
+
+async def _aslice_whole_body(
+    chunks: AsyncIterator[bytes], start: int, end: int
+) -> bytes:
+    """Async :func:`_slice_whole_body`."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= end:
+            break
+    return bytes(buffer[start:end])
+
+
+async def _afetch_via_dataverse(
+    data_access_api: "DataAccessApi", identifier: Union[str, int], start: int, end: int
+) -> bytes:
+    """Async :meth:`RedirectCache._fetch_via_dataverse`."""
+    async with data_access_api.astream_datafile(
+        identifier,
+        range_start=start,
+        range_end=end - 1,
+    ) as response:
+        if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+            return b""
+        response.raise_for_status()
+        if response.status_code != httpx.codes.PARTIAL_CONTENT:
+            return await _aslice_whole_body(response.aiter_bytes(), start, end)
+        return await response.aread()
+
+
+async def _afetch_from_storage(
+    client: httpx.AsyncClient, url: str, start: int, end: int
+) -> Optional[bytes]:
+    """Async :func:`_fetch_from_storage`, on a client without Dataverse credentials."""
+    async with client.stream(
+        "GET",
+        url,
+        headers={"Range": f"bytes={start}-{end - 1}"},
+        follow_redirects=True,
+    ) as response:
+        if response.status_code in _EXPIRED_STATUS_CODES:
+            return None
+        if response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+            return b""
+        response.raise_for_status()
+        if response.status_code != httpx.codes.PARTIAL_CONTENT:
+            return await _aslice_whole_body(response.aiter_bytes(), start, end)
+        return await response.aread()
+
+
+def _remaining_lifetime(url: str, default: float) -> float:
+    """Seconds until a presigned URL expires, from its signature parameters."""
+    query = {key: values[0] for key, values in parse_qs(urlparse(url).query).items()}
+    now = datetime.now(timezone.utc)
+
+    try:
+        if "X-Amz-Expires" in query and "X-Amz-Date" in query:
+            signed = datetime.strptime(query["X-Amz-Date"], "%Y%m%dT%H%M%SZ")
+            expires = signed.replace(tzinfo=timezone.utc).timestamp() + int(
+                query["X-Amz-Expires"]
+            )
+        elif "X-Goog-Expires" in query and "X-Goog-Date" in query:
+            signed = datetime.strptime(query["X-Goog-Date"], "%Y%m%dT%H%M%SZ")
+            expires = signed.replace(tzinfo=timezone.utc).timestamp() + int(
+                query["X-Goog-Expires"]
+            )
+        elif "Expires" in query:
+            # S3 signature version 2 uses epoch seconds, as does Swift.
+            expires = float(query["Expires"])
+        elif "temp_url_expires" in query:
+            expires = float(query["temp_url_expires"])
+        elif "se" in query:
+            # Azure shared access signatures use an ISO 8601 expiry time.
+            expires = datetime.fromisoformat(
+                query["se"].replace("Z", "+00:00")
+            ).timestamp()
+        else:
+            return default
+    except (ValueError, OverflowError):
+        return default
+
+    return max(expires - now.timestamp(), 0.0)
@@ -106,3 +106,21 @@ TABULAR_MIME_TYPES = {
         tab_type="spreadsheet",
     ),
 }
+
+# MIME types Dataverse ingests into ``.tab`` files after upload, which changes
+# the file's name, type and size.
+INGESTABLE_MIME_TYPES = frozenset(
+    {
+        "text/csv",
+        "text/x-comma-separated-values",
+        "text/tab-separated-values",
+        "text/x-tab-separated-values",
+        "text/tsv",
+        "application/vnd.ms-excel",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/x-spss-sav",
+        "application/x-spss-por",
+        "application/x-stata",
+        "application/x-rlang-transport",
+    }
+)
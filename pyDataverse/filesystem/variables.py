@@ -0,0 +1,155 @@
+from typing import Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+
+from pydantic import BaseModel, Field
+
+
+class TabularVariable(BaseModel):
+    """
+    A single variable (column) of an ingested tabular file.
+
+    Parsed from the ``<var>`` elements in the ``dataDscr`` section of the DDI
+    record Dataverse generates during tabular ingest.
+
+    Attributes:
+        id: Database ID of the variable, as expected by the Data Access API's
+            ``variables`` subsetting parameter.
+        name: Column name as it appears in the header of the ``.tab`` file.
+        label: Optional human-readable variable label.
+        interval: Measurement interval, ``"discrete"`` for integer-valued and
+            ``"contin"`` for continuous numeric variables.
+        format_type: Storage type, either ``"numeric"`` or ``"character"``.
+        format_category: Optional format category (e.g. ``"date"``, ``"time"``).
+        invalid_count: Number of missing values, when reported by the DDI.
+        categories: Category values mapped to their labels, for categorical
+            variables.
+    """
+
+    id: int
+    name: str
+    label: Optional[str] = None
+    interval: Optional[str] = None
+    format_type: Optional[str] = None
+    format_category: Optional[str] = None
+    invalid_count: Optional[int] = None
+    categories: Dict[str, Optional[str]] = Field(default_factory=dict)
+
+    @property
+    def pandas_dtype(self) -> str:
+        """
+        The pandas dtype that represents this variable without data loss.
+
+        Integer variables use numpy ``int64`` unless the DDI reports missing
+        values (or does not report them at all), in which case the nullable
+        ``Int64`` is used. Continuous numeric variables map to ``float64``.
+        Character variables map to ``category`` when the DDI lists categories
+        for them, and to ``object`` otherwise.
+
+        Returns:
+            str: A dtype string accepted by ``pandas.read_csv``.
+        """
+        if self.format_type == "numeric":
+            if self.interval == "discrete" and not self.format_category:
+                return "int64" if self.invalid_count == 0 else "Int64"
+            if self.interval == "contin":
+                return "float64"
+            return "object"
+
+        if self.categories:
+            return "category"
+
+        return "object"
+
+
+def parse_ddi_variables(ddi: str) -> List[TabularVariable]:
+    """
+    Extract the variables of a tabular file from its DDI XML record.
+
+    Variables are returned in the order they appear in the DDI record, which
+    matches the column order of the ingested ``.tab`` file.
+
+    Args:
+        ddi: DDI codebook XML as returned by
+            :meth:`DataAccessApi.get_datafile_ddi`.
+
+    Returns:
+        List[TabularVariable]: One entry per column of the tabular file.
+
+    Example:
+        >>> variables = parse_ddi_variables(data_access_api.get_datafile_ddi(42))
+        >>> [v.name for v in variables]
+        ['name', 'age']
+    """
+    root = ElementTree.fromstring(ddi)
+    variables = []
+
+    for element in root.iter():
+        if _local_name(element.tag) != "var":
+            continue
+
+        var_id = element.get("ID", "")
+        name = element.get("name")
+        if not name or not var_id.lstrip("v").isdigit():
+            continue
+
+        label = None
+        format_type = None
+        format_category = None
+        invalid_count = None
+        categories: Dict[str, Optional[str]] = {}
+
+        for child in element:
+            tag = _local_name(child.tag)
+            if tag == "labl" and label is None:
+                label = _text(child)
+            elif tag == "varFormat":
+                format_type = child.get("type")
+                format_category = child.get("category")
+            elif tag == "sumStat" and child.get("type") == "invd":
+                value = _text(child)
+                if value is not None and value.isdigit():
+                    invalid_count = int(value)
+            elif tag == "catgry":
+                value, category_label = _parse_category(child)
+                if value is not None:
+                    categories[value] = category_label
+
+        variables.append(
+            TabularVariable(
+                id=int(var_id.lstrip("v")),
+                name=name,
+                label=label,
+                interval=element.get("intrvl"),
+                format_type=format_type,
+                format_category=format_category,
+                invalid_count=invalid_count,
+                categories=categories,
+            )
+        )
+
+    return variables
+
+
+def _parse_category(
+    element: ElementTree.Element,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return the ``(value, label)`` pair of a DDI ``<catgry>`` element."""
+    value = None
+    label = None
+    for child in element:
+        tag = _local_name(child.tag)
+        if tag == "catValu":
+            value = _text(child)
+        elif tag == "labl":
+            label = _text(child)
+    return value, label
+
+
+def _text(element: ElementTree.Element) -> Optional[str]:
+    """Return the stripped text of an element, or None when empty."""
+    return (element.text or "").strip() or None
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an ElementTree tag."""
+    return tag.rsplit("}", 1)[-1]
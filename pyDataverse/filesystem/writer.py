@@ -1,14 +1,20 @@
 import io
+import os
+import shutil
+import tempfile
 import time
-from queue import Queue
+import zipfile
+from queue import Empty, Full, Queue
 from threading import Thread
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from fsspec.spec import AbstractBufferedFile
+from fsspec.transaction import Transaction
 
 from pyDataverse.models.file import UploadBody
 
 if TYPE_CHECKING:
+    from ..api import NativeApi
     from .dvfs import DataverseFS
 
 # How long to wait for the background upload thread to finish on close.
@@ -19,6 +25,15 @@ _UPLOAD_TIMEOUT_SECONDS = 300
 _INGEST_TIMEOUT_SECONDS = 120
 _INGEST_POLL_INTERVAL_SECONDS = 0.5
 
+# How many written blocks may wait for the network before writes block, and
+# how often a blocked writer re-checks whether the upload has failed.
+_MAX_QUEUED_CHUNKS = 4
+_PUT_POLL_INTERVAL_SECONDS = 0.1
+
+# Name of the archive that bundles the new files of a transaction. Dataverse
+# unpacks uploaded zip files, keeping their folder structure as file paths.
+_BATCH_ARCHIVE_NAME = "pydataverse-batch.zip"
+
 
 class DataverseTextIO(io.TextIOWrapper):
     """Text wrapper that exposes the underlying Dataverse file's attributes.
@@ -46,49 +61,105 @@ class _UploadStream(io.RawIOBase):
 
     Acts as the consumer end of a producer/consumer queue: chunks written by
     the :class:`DataverseFileWriter` are pushed onto the queue, and httpx pulls
-    them out via ``read`` as the multipart request body is sent. ``read``
-    blocks until either enough bytes are available or the stream is finished,
-    so the whole file is never held in memory at once.
+    them out via ``read``/``readinto`` as the multipart request body is sent.
+
+    The queue holds at most ``max_chunks`` chunks, so a writer that is faster
+    than the network blocks in ``put`` until the upload catches up, and memory
+    stays bounded by ``max_chunks`` blocks. Chunks are queued as they are
+    passed in, without a copy, and ``read`` hands out ``memoryview`` slices of
+    them, so the bytes are first copied when httpx writes them to the socket.
+    Callers must not modify a chunk after passing it to ``put``.
     """
 
-    def __init__(self, name: Optional[str] = None):
-        self._queue: "Queue[Optional[bytes]]" = Queue()
-        self._buffer = b""
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        max_chunks: int = _MAX_QUEUED_CHUNKS,
+    ):
+        self._queue: "Queue[Optional[memoryview]]" = Queue(maxsize=max(1, max_chunks))
+        self._current = memoryview(b"")
         self._eof = False
+        self._aborted = False
         if name:
             # httpx uses this attribute as the multipart filename.
             self.name = name
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: Union[bytes, memoryview]) -> None:
+        """Queue a chunk, blocking while the queue is full."""
         if data:
-            self._queue.put(data)
+            self._put(memoryview(data).cast("B"))
 
     def finish(self) -> None:
-        self._queue.put(None)
+        """Signal end-of-stream to the reader."""
+        self._put(None)
 
-    def readable(self) -> bool:
-        return True
+    def abort(self) -> None:
+        """Stop accepting chunks and release queued ones.
 
-    def read(self, size: int = -1) -> bytes:
-        if size is None or size < 0:
-            while not self._eof:
-                item = self._queue.get()
-                if item is None:
-                    self._eof = True
-                else:
-                    self._buffer += item
-            result, self._buffer = self._buffer, b""
-            return result
+        Called from the upload thread when the request fails, so a producer
+        blocked on a full queue fails fast instead of waiting forever.
+        """
+        self._aborted = True
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+
+    def _put(self, item: Optional[memoryview]) -> None:
+        while not self._aborted:
+            try:
+                self._queue.put(item, timeout=_PUT_POLL_INTERVAL_SECONDS)
+            except Full:
+                continue
+            if not self._aborted:
+                return
+        raise IOError("Upload stream was aborted")
 
-        while len(self._buffer) < size and not self._eof:
+    def _next_chunk(self) -> bool:
+        """Advance to the next queued chunk; False at end-of-stream."""
+        while not self._current:
+            if self._eof:
+                return False
             item = self._queue.get()
             if item is None:
                 self._eof = True
-            else:
-                self._buffer += item
+                return False
+            self._current = item
+        return True
+
+    def readable(self) -> bool:
+        return True
 
-        result, self._buffer = self._buffer[:size], self._buffer[size:]
-        return result
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(view) and self._next_chunk():
+            size = min(len(view) - filled, len(self._current))
+            view[filled : filled + size] = self._current[:size]
+            self._current = self._current[size:]
+            filled += size
+        return filled
+
+    def read(self, size: int = -1) -> Union[bytes, memoryview]:
+        """Read up to ``size`` bytes as a view of the current chunk.
+
+        Like any raw stream, a read may return fewer bytes than requested; it
+        stops at the end of the current chunk. Without ``size``, the rest of
+        the stream is read and returned as bytes.
+        """
+        if size is None or size < 0:
+            parts = []
+            while self._next_chunk():
+                parts.append(self._current)
+                self._current = memoryview(b"")
+            return b"".join(parts)
+
+        if not self._next_chunk():
+            return b""
+        part = self._current[:size]
+        self._current = self._current[len(part) :]
+        return part
 
 
 class DataverseFileWriter(AbstractBufferedFile):
@@ -98,10 +169,16 @@ class DataverseFileWriter(AbstractBufferedFile):
     Built on :class:`fsspec.spec.AbstractBufferedFile`. fsspec buffers at most
     one ``blocksize`` chunk before calling :meth:`_upload_chunk`, and each chunk
     is handed straight to a background upload thread through an
-    :class:`_UploadStream`. This keeps memory bounded by the block size rather
+    :class:`_UploadStream`, whose bounded queue makes writes wait while the
+    network lags behind. This keeps memory bounded by a few blocks rather
     than the file size, even for very large uploads. If a file already exists at
     the given path it is replaced; otherwise a new file is created.
 
+    Inside ``with fs.transaction:`` the writer does not upload on close.
+    Its content is staged in a local temporary file, and the transaction
+    uploads all staged files together when the block exits (see
+    :class:`DataverseTransaction`).
+
     Example:
         >>> with fs.open("data/newfile.csv", "wb") as f:
         ...     f.write(b"column1,column2\\n")
@@ -154,6 +231,8 @@ class DataverseFileWriter(AbstractBufferedFile):
             pass
 
         self.file_pid: Optional[str] = None
+        self._staging_dir: Optional[str] = None
+        self._staged: Optional[io.BufferedWriter] = None
         self._stream: Optional[_UploadStream] = None
         self._thread: Optional[Thread] = None
         self._error: Optional[Exception] = None
@@ -175,8 +254,35 @@ class DataverseFileWriter(AbstractBufferedFile):
         )
         return str(self.file_pid)
 
+    @property
+    def staged_path(self) -> Optional[str]:
+        """Local file holding the content staged for a transaction, if any."""
+        if self._staging_dir is None:
+            return None
+        return os.path.join(self._staging_dir, self._filename)
+
+    def commit(self) -> None:
+        """Upload the content staged inside a transaction (fsspec hook)."""
+        commit_staged_files(self.fs, [self])
+
+    def discard(self) -> None:
+        """Drop the content staged inside a transaction (fsspec hook)."""
+        if self._staged is not None:
+            self._staged.close()
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+
     def _initiate_upload(self) -> None:
-        """Start the background upload thread on the first flush."""
+        """Start the background upload thread on the first flush.
+
+        Inside a transaction, open the local staging file instead.
+        """
+        if not self.autocommit:
+            self._staging_dir = tempfile.mkdtemp(prefix="pydataverse-")
+            self._staged = open(self.staged_path, "wb")  # type: ignore[arg-type]
+            return
+
         self._stream = _UploadStream(name=self._filename)
 
         def _run() -> None:
@@ -195,20 +301,32 @@ class DataverseFileWriter(AbstractBufferedFile):
                     )
             except Exception as exc:  # noqa: BLE001 - surfaced on the writer thread
                 self._error = exc
+                assert self._stream is not None
+                self._stream.abort()
 
         self._thread = Thread(target=_run, daemon=False)
         self._thread.start()
 
     def _upload_chunk(self, final: bool = False) -> bool:
         """Push the current buffer to the upload stream (fsspec hook)."""
+        if self._staged is not None:
+            self._staged.write(self.buffer.getbuffer())
+            if final:
+                self._staged.close()
+            return True
+
         assert self._stream is not None  # set by _initiate_upload
 
         if self._error is not None:
             raise IOError(f"Upload failed: {self._error}")
 
-        data = self.buffer.getvalue()
-        if data:
+        # fsspec starts a new buffer after each chunk, so the upload stream can
+        # take a view of this one instead of a copy.
+        data = self.buffer.getbuffer()
+        try:
             self._stream.put(data)
+        except IOError as exc:
+            raise IOError(f"Upload failed: {self._error}") from exc
 
         if final:
             self._finalize()
@@ -219,7 +337,10 @@ class DataverseFileWriter(AbstractBufferedFile):
         """Signal end-of-stream and wait for the upload to complete."""
         assert self._stream is not None and self._thread is not None
 
-        self._stream.finish()
+        try:
+            self._stream.finish()
+        except IOError:
+            pass  # the upload thread failed; its error is raised below
         self._thread.join(timeout=_UPLOAD_TIMEOUT_SECONDS)
 
         if self._thread.is_alive():
@@ -227,40 +348,236 @@ class DataverseFileWriter(AbstractBufferedFile):
         if self._error is not None:
             raise IOError(f"Upload failed: {self._error}")
 
-        self._capture_result()
+        replaced = self.file_identifier
+        self.set_upload_response(self._response)
         self._wait_for_ingest()
-        self.fs._cache.clear()
+        self.fs.record_write(
+            removed=[replaced] if isinstance(replaced, int) else [],
+            added=getattr(self._response, "files", None) or None,
+        )
 
     def _wait_for_ingest(self) -> None:
-        """Block until any tabular-ingest lock on the dataset clears.
+        """Block until any tabular-ingest lock on the dataset clears."""
+        wait_for_ingest(self.native_api, self.ds_identifier)
 
-        Uploading an ingestable file (CSV, TSV, spreadsheet, ...) triggers
-        asynchronous ingest, during which Dataverse locks the dataset and the
-        ingested ``.tab`` artifacts (and bundle/DDI/citation files) do not yet
-        exist. Waiting here lets a caller read those artifacts immediately after
-        the ``with`` block, instead of racing the server.
+    def set_upload_response(self, response) -> None:
+        """Store the upload response and take the new file's ID/PID from it.
 
-        Non-ingestable uploads acquire no ingest lock, so this returns after a
-        single lock check. The wait is best-effort: it gives up after
-        ``_INGEST_TIMEOUT_SECONDS`` rather than blocking indefinitely.
+        Used by :func:`commit_staged_files` for files uploaded on behalf of
+        the writer.
         """
-        deadline = time.monotonic() + _INGEST_TIMEOUT_SECONDS
-        while time.monotonic() < deadline:
-            try:
-                locks = self.native_api.get_dataset_lock(
-                    self.ds_identifier, type="Ingest"
-                )
-            except Exception:  # noqa: BLE001 - best-effort; upload already done
-                return
-            if not locks.root:
-                return
-            time.sleep(_INGEST_POLL_INTERVAL_SECONDS)
-
-    def _capture_result(self) -> None:
-        """Extract the new file's ID/PID from the upload response."""
-        response = self._response
+        self._response = response
         if response is not None and getattr(response, "files", None):
             data_file = response.files[0].data_file
             if data_file is not None:
                 self.file_identifier = data_file.id
                 self.file_pid = data_file.persistent_id
+
+
+class DataverseTransaction(Transaction):
+    """
+    An fsspec transaction that uploads its files to Dataverse as one batch.
+
+    Files written inside ``with fs.transaction:`` are staged locally and
+    uploaded when the block exits without an exception; on an exception they
+    are discarded and nothing is uploaded. Committing the whole batch at once
+    lets new files travel in a single zip upload and waits for tabular ingest
+    and invalidates the dataset metadata only once, instead of once per file.
+    See :func:`commit_staged_files` for how the batch is uploaded.
+
+    Example:
+        >>> with fs.transaction:
+        ...     for name, frame in frames.items():
+        ...         with fs.open(f"results/{name}.csv", "w") as f:
+        ...             frame.to_csv(f, index=False)
+    """
+
+    def complete(self, commit: bool = True) -> None:
+        """Upload (or discard) all files staged in the transaction."""
+        fs = self.fs
+        writers = list(self.files)
+        self.files.clear()
+        try:
+            if commit:
+                commit_staged_files(fs, writers)
+            else:
+                for writer in writers:
+                    writer.discard()
+        finally:
+            fs._intrans = False
+            fs._transaction = None
+            self.fs = None
+
+
+def commit_staged_files(fs: "DataverseFS", writers: List[DataverseFileWriter]) -> None:
+    """
+    Upload files staged inside a transaction as one batch.
+
+    When a path was written more than once, only its last write is uploaded.
+    Files that replace an existing file, carry custom upload metadata,
+    are large enough for direct upload to object storage, or would not
+    survive a round trip through a zip archive (dotfiles and zip files,
+    which Dataverse would drop or unpack) are uploaded one request each.
+    All other new files are packed into a single zip archive, which
+    Dataverse unpacks into individual files, keeping their folder structure.
+    The batch ends with one ingest wait and one cache invalidation.
+
+    Args:
+        fs: The owning DataverseFS instance.
+        writers: Writers whose content was staged in the transaction.
+
+    Raises:
+        IOError: If an upload fails. Files uploaded before the failure stay
+            in the dataset; the remaining staged files are discarded.
+    """
+    latest: Dict[str, DataverseFileWriter] = {}
+    for writer in writers:
+        if not writer.closed:
+            writer.close()
+        latest[_target_path(writer)] = writer
+
+    native_api = fs.native_api
+    replaced: List[int] = []
+    try:
+        staged = [writer for writer in latest.values() if writer.staged_path]
+        bundled = [writer for writer in staged if _can_bundle(fs, writer)]
+        if len(bundled) < 2:
+            bundled = []
+
+        for writer in staged:
+            if writer in bundled:
+                continue
+            if isinstance(writer.file_identifier, int):
+                replaced.append(writer.file_identifier)
+            try:
+                response = _upload_staged_file(fs, writer)
+            except Exception as exc:
+                raise IOError(
+                    f"Upload of '{_target_path(writer)}' failed: {exc}"
+                ) from exc
+            writer.set_upload_response(response)
+
+        if bundled:
+            _upload_archive(native_api, fs.identifier, bundled)
+
+        if staged:
+            wait_for_ingest(native_api, fs.identifier)
+    finally:
+        for writer in writers:
+            writer.discard()
+        fs.record_write(removed=replaced, added=None)
+
+
+def wait_for_ingest(native_api: "NativeApi", identifier: Union[str, int]) -> None:
+    """
+    Block until any tabular-ingest lock on a dataset clears.
+
+    Uploading an ingestable file (CSV, TSV, spreadsheet, ...) triggers
+    asynchronous ingest, during which Dataverse locks the dataset and the
+    ingested ``.tab`` artifacts (and bundle/DDI/citation files) do not yet
+    exist. Waiting here lets a caller read those artifacts immediately after
+    an upload, instead of racing the server.
+
+    Non-ingestable uploads acquire no ingest lock, so this returns after a
+    single lock check. The wait is best-effort: it gives up after
+    ``_INGEST_TIMEOUT_SECONDS`` rather than blocking indefinitely.
+
+    Args:
+        native_api: Native API client of the dataset's installation.
+        identifier: Dataset identifier (DOI string or numeric database ID).
+    """
+    deadline = time.monotonic() + _INGEST_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            locks = native_api.get_dataset_lock(identifier, type="Ingest")
+        except Exception:  # noqa: BLE001 - best-effort; upload already done
+            return
+        if not locks.root:
+            return
+        time.sleep(_INGEST_POLL_INTERVAL_SECONDS)
+
+
+def _upload_staged_file(fs: "DataverseFS", writer: DataverseFileWriter) -> Any:
+    """Upload one staged file, straight to object storage if it is large."""
+    staged_path: str = writer.staged_path  # type: ignore[assignment]
+    uploader = fs.direct_uploader(os.path.getsize(staged_path))
+    if uploader is not None:
+        return uploader.upload(
+            fs.identifier,
+            staged_path,
+            writer.metadata,
+            replace=writer.file_identifier,
+        )
+
+    with open(staged_path, "rb") as staged_file:
+        if writer.file_identifier is not None:
+            return fs.native_api.replace_datafile(
+                identifier=writer.file_identifier,
+                file=staged_file,
+                metadata=writer.metadata,
+            )
+        return fs.native_api.upload_datafile(
+            identifier=fs.identifier,
+            file=staged_file,
+            metadata=writer.metadata,
+        )
+
+
+def _upload_archive(
+    native_api: "NativeApi",
+    identifier: Union[str, int],
+    writers: List[DataverseFileWriter],
+) -> None:
+    """Upload staged files as one zip archive and record their new IDs."""
+    staging_dir = tempfile.mkdtemp(prefix="pydataverse-")
+    try:
+        archive_path = os.path.join(staging_dir, _BATCH_ARCHIVE_NAME)
+        with zipfile.ZipFile(
+            archive_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for writer in writers:
+                archive.write(writer.staged_path, arcname=_target_path(writer))  # type: ignore[arg-type]
+
+        with open(archive_path, "rb") as archive_file:
+            try:
+                response = native_api.upload_datafile(
+                    identifier=identifier,
+                    file=archive_file,
+                    metadata=UploadBody(filename=_BATCH_ARCHIVE_NAME),
+                )
+            except Exception as exc:
+                raise IOError(f"Batch upload failed: {exc}") from exc
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    uploaded = {
+        "/".join(filter(None, [info.directory_label, info.label])): info.data_file
+        for info in response.files or []
+    }
+    for writer in writers:
+        data_file = uploaded.get(_target_path(writer))
+        if data_file is not None:
+            writer.file_identifier = data_file.id
+            writer.file_pid = data_file.persistent_id
+
+
+def _target_path(writer: DataverseFileWriter) -> str:
+    """Full path the writer's file will have in the dataset."""
+    return "/".join(filter(None, [writer.metadata.directory_label, writer._filename]))
+
+
+def _can_bundle(fs: "DataverseFS", writer: DataverseFileWriter) -> bool:
+    """Whether a staged file can be uploaded as part of a zip archive."""
+    if writer.file_identifier is not None:
+        return False
+    if fs.direct_uploader(os.path.getsize(writer.staged_path)) is not None:  # type: ignore[arg-type]
+        return False
+
+    name = writer._filename
+    if name.startswith(".") or name.lower().endswith(".zip"):
+        return False
+
+    custom = writer.metadata.model_dump(
+        exclude_none=True, exclude={"directory_label", "filename"}
+    )
+    return not custom
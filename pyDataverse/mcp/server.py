@@ -1,7 +1,5 @@
-import asyncio
 from typing import Dict, List, Literal, Optional, TypeAlias, Union
 
-from asyncer import asyncify
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
@@ -297,26 +295,14 @@ class DataverseMCP:
     def _all_metadatablocks(self) -> List[str]:
         """
         Get all metadata blocks from the dataverse.
+
+        Each Dataverse loads its block specifications when it is created, so
+        this makes no requests.
         """
         if isinstance(self.dataverse, Dataverse):
             return list(self.dataverse.metadatablocks.keys())
-        else:
-            return asyncio.run(self._async_metadatablocks())
-
-    async def _async_metadatablocks(self) -> List[str]:
-        """
-        Get all metadata blocks from the dataverse asynchronously.
-        """
-        assert isinstance(self.dataverse, dict), (
-            "Dataverse must be a dictionary for multi-dataverse setup."
-        )
 
-        tasks = [
-            asyncify(dv.native_api.get_metadatablocks)(full=True)
-            for dv in self.dataverse.values()
-        ]
-        results = await asyncio.gather(*tasks)
         blocks = set()
-        for result in results:
-            blocks.update(result.keys())
+        for dv in self.dataverse.values():
+            blocks.update(dv.metadatablocks.keys())
         return list(blocks)
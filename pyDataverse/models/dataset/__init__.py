@@ -27,6 +27,7 @@ from .private_url import Assignee, PrivateUrl, Role
 from .publish import DatasetPublishResponse
 from .review import DatasetReview, ReturnToAuthorBody, ReviewResponse
 from .size import DatasetSizeResponse
+from .storage import StorageDriver
 
 __all__ = [
     "Assignee",
@@ -57,5 +58,6 @@ __all__ = [
     "ReviewResponse",
     "Role",
     "SetLockResponse",
+    "StorageDriver",
     "UnpublishedDatasetDeleteResponse",
 ]
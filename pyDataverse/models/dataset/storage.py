@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Annotated, Optional
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+
+
+class StorageDriver(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+    name: Optional[str] = None
+    type: Optional[str] = None
+    label: Optional[str] = None
+    direct_upload: Annotated[
+        Optional[bool],
+        Field(validation_alias=AliasChoices("directUpload", "directDataUpload")),
+    ] = None
+    direct_download: Annotated[Optional[bool], Field(alias="directDownload")] = None
@@ -3,6 +3,7 @@ Auto-generated models from JSON schemas.
 """
 
 from .access import AccessRequest, AccessRequests
+from .directupload import DirectUploadBody, DirectUploadChecksum, UploadUrls
 from .filemeta import Checksum, DataFile, FileInfo, UploadBody, UploadResponse
 from .redetect import RedetectedFileType
 from .restrict import RestrictFileBody
@@ -13,6 +14,8 @@ __all__ = [
     "AccessRequests",
     "Checksum",
     "DataFile",
+    "DirectUploadBody",
+    "DirectUploadChecksum",
     "FileInfo",
     "Model",
     "RedetectedFileType",
@@ -20,4 +23,5 @@ __all__ = [
     "UpdateBody",
     "UploadBody",
     "UploadResponse",
+    "UploadUrls",
 ]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Annotated, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class UploadUrls(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+    url: Optional[str] = None
+    urls: Optional[Dict[str, str]] = None
+    abort: Optional[str] = None
+    complete: Optional[str] = None
+    part_size: Annotated[Optional[int], Field(alias="partSize")] = None
+    storage_identifier: Annotated[str, Field(alias="storageIdentifier")]
+
+
+class DirectUploadChecksum(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+    type: Annotated[str, Field(alias="@type")]
+    value: Annotated[str, Field(alias="@value")]
+
+
+class DirectUploadBody(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+    storage_identifier: Annotated[str, Field(alias="storageIdentifier")]
+    file_name: Annotated[str, Field(alias="fileName")]
+    mime_type: Annotated[Optional[str], Field(alias="mimeType")] = None
+    checksum: DirectUploadChecksum
+    description: Optional[str] = None
+    categories: Optional[List[str]] = None
+    directory_label: Annotated[Optional[str], Field(alias="directoryLabel")] = None
+    restrict: Optional[bool] = None
+    tab_ingest: Annotated[Optional[bool], Field(alias="tabIngest")] = None
+    force_replace: Annotated[Optional[bool], Field(alias="forceReplace")] = None
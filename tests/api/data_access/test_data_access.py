@@ -13,6 +13,7 @@ import pytest
 
 from pyDataverse.api.data_access import DataAccessApi
 from pyDataverse.api.native import NativeApi
+from pyDataverse.filesystem.variables import parse_ddi_variables
 from tests.conftest import Credentials, DatasetFactory
 
 
@@ -103,6 +104,46 @@ class TestDataAccess:
 
         assert content == b"Hello", "File should contain the correct content"
 
+    def test_get_datafile_ddi(
+        self,
+        data_access_api: DataAccessApi,
+        dataset: DatasetFactory,
+    ):
+        """Test retrieving the DDI variable metadata of an ingested file."""
+        test_dataset = dataset()
+
+        with test_dataset.open("test_datafile.csv", "w") as f:
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+            f.write(df.to_csv(index=False))
+
+        variables = parse_ddi_variables(data_access_api.get_datafile_ddi(f.id))
+
+        assert [v.name for v in variables] == ["name", "age"], (
+            "DDI should describe every column in file order"
+        )
+
+    def test_stream_datafile_with_variables(
+        self,
+        data_access_api: DataAccessApi,
+        dataset: DatasetFactory,
+    ):
+        """Test subsetting an ingested tabular file to selected variables."""
+        test_dataset = dataset()
+
+        with test_dataset.open("test_datafile.csv", "w") as f:
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+            f.write(df.to_csv(index=False))
+
+        variables = parse_ddi_variables(data_access_api.get_datafile_ddi(f.id))
+        age = next(v for v in variables if v.name == "age")
+
+        with data_access_api.stream_datafile(f.id, variables=[age.id]) as response:
+            content = b"".join(response.iter_bytes())
+
+        subset = pd.read_csv(io.BytesIO(content), sep="\t")
+        assert list(subset.columns) == ["age"], "Only the selected column is served"
+        assert subset["age"].tolist() == [25, 30], "Subset should keep all rows"
+
     def test_get_datafiles_multiple(
         self,
         data_access_api: DataAccessApi,
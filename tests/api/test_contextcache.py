@@ -0,0 +1,93 @@
+"""Tests for the JSON-LD context cache and graph parsing of the semantic API."""
+
+from typing import Any, List
+
+import pytest
+from rdflib import Literal, URIRef
+
+from pyDataverse.api import SemanticApi
+from pyDataverse.api.utilities import contextcache
+from pyDataverse.api.utilities.contextcache import ContextCache
+
+SCHEMA_ORG = "http://schema.org"
+SCHEMA_ORG_CONTEXT = {
+    "@context": {
+        "@vocab": "http://schema.org/",
+        "schema": "http://schema.org/",
+        "sameAs": {"@id": "schema:sameAs", "@type": "@id"},
+    }
+}
+
+
+def _export(index: int) -> dict:
+    return {
+        "@context": SCHEMA_ORG,
+        "@id": f"https://doi.org/10.5072/FK2/{index}",
+        "@type": "Dataset",
+        "name": f"Dataset {index}",
+        "sameAs": f"https://example.org/{index}",
+    }
+
+
+class TestContextCache:
+    """Test suite for the JSON-LD context cache."""
+
+    def test_contexts_are_fetched_once_and_kept_on_disk(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """It fetches a remote context once and serves later caches from disk."""
+        fetched: List[str] = []
+
+        def fetch(url: str) -> Any:
+            fetched.append(url)
+            return SCHEMA_ORG_CONTEXT
+
+        monkeypatch.setattr(contextcache, "_fetch_context", fetch)
+
+        cache = ContextCache(tmp_path)
+        inline = {"dcterms": "http://purl.org/dc/terms/"}
+        assert cache.resolve(inline) is inline
+        assert cache.resolve([SCHEMA_ORG, inline]) == [
+            SCHEMA_ORG_CONTEXT["@context"],
+            inline,
+        ]
+        assert cache.resolve(SCHEMA_ORG) == SCHEMA_ORG_CONTEXT["@context"]
+        assert ContextCache(tmp_path).get(SCHEMA_ORG) == SCHEMA_ORG_CONTEXT
+        assert fetched == [SCHEMA_ORG]
+
+        cache.clear()
+        assert (
+            ContextCache(tmp_path).resolve(SCHEMA_ORG) == SCHEMA_ORG_CONTEXT["@context"]
+        )
+        assert fetched == [SCHEMA_ORG, SCHEMA_ORG]
+
+    def test_graphs_parse_offline_with_normalized_uris(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """It parses remote-context exports without the network and uses HTTPS schema.org."""
+
+        def fetch(url: str) -> Any:
+            pytest.fail(f"fetched {url}")
+
+        monkeypatch.setattr(contextcache, "_fetch_context", fetch)
+
+        api = SemanticApi.model_construct(
+            base_url="http://localhost", context_cache_dir=str(tmp_path)
+        )
+        api.context_cache.put(SCHEMA_ORG, SCHEMA_ORG_CONTEXT)
+
+        graph = api.responses_to_graph([_export(1), _export(2)])
+
+        dataset = URIRef("https://doi.org/10.5072/FK2/1")
+        assert graph.value(dataset, URIRef("https://schema.org/name")) == Literal(
+            "Dataset 1"
+        )
+        assert (dataset, URIRef("https://schema.org/sameAs"), None) in graph
+        assert not any(
+            str(term).startswith("http://schema.org/")
+            for triple in graph
+            for term in triple
+        )
+        assert len(graph) == 2 * 3
+        assert type(graph).__name__ == "Graph"
+        assert "schema1" not in graph.serialize(format="turtle")
@@ -0,0 +1,116 @@
+"""Tests for the background event loop of the sync API."""
+
+import asyncio
+import gc
+from typing import Iterator, List
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.api.utilities.loop import BackgroundLoop
+from pyDataverse.dataverse import Dataverse
+from tests.conftest import StandInHandler, StandInServer
+
+
+def _make_handler(ports: List[int]):
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            ports.append(self.client_address[1])
+            if self.route == "/api/metadatablocks":
+                self.reply_json([])
+            else:
+                self.reply_json({"version": "6.5", "build": "1"})
+
+    return Handler
+
+
+@pytest.fixture
+def api(stand_in_server: StandInServer) -> Iterator[tuple]:
+    ports: List[int] = []
+    native_api = NativeApi(base_url=stand_in_server(_make_handler(ports)), verbose=0)
+    native_api._loop = BackgroundLoop()
+    yield native_api, ports
+    native_api._loop.close()
+
+
+class TestBackgroundLoop:
+    """Test suite for the background event loop."""
+
+    def test_connections_are_reused_across_calls(self, api) -> None:
+        """It runs every call on one loop whose client keeps its connections."""
+        native_api, ports = api
+
+        for _ in range(3):
+            version = native_api._run_async(lambda api: api.get_info_version())
+            assert version.version == "6.5"
+
+        assert len(ports) == 3
+        assert len(set(ports)) == 1, "one pooled connection serves all calls"
+        assert native_api.client is None, "the sync API itself stays sync"
+
+    def test_runs_while_the_caller_runs_a_loop(self, api) -> None:
+        """It works from code that already runs an event loop, as in Jupyter."""
+        native_api, _ = api
+
+        async def caller() -> str:
+            return native_api._run_async(lambda api: api.get_info_version()).version
+
+        assert asyncio.run(caller()) == "6.5"
+
+    def test_refuses_to_block_its_own_loop(self) -> None:
+        """It raises instead of deadlocking when called from its own coroutines."""
+        loop = BackgroundLoop()
+
+        async def inner() -> int:
+            return 1
+
+        async def outer() -> int:
+            return loop.run(inner())
+
+        try:
+            with pytest.raises(RuntimeError, match="Await the async API"):
+                loop.run(outer())
+        finally:
+            loop.close()
+
+    def test_clients_are_keyed_on_settings(self, api) -> None:
+        """It shares a client only between APIs with the same settings and user."""
+        native_api, _ = api
+        loop = BackgroundLoop()
+        same = NativeApi.from_api(native_api)
+        slower = NativeApi.from_api(native_api)
+        slower.timeout = native_api.timeout * 2
+        other_user = NativeApi(
+            base_url=native_api.base_url, api_token="other", verbose=0
+        )
+
+        client = loop.bind(native_api).client
+        assert loop.bind(same).client is client
+        assert loop.bind(slower).client is not client
+        assert loop.bind(slower).client.timeout.read == slower.timeout
+        assert loop.bind(other_user).client is not client
+        loop.close()
+
+    def test_dataverse_closes_its_loop(self, stand_in_server: StandInServer) -> None:
+        """It stops the loop on leaving a with block and once garbage collected."""
+        base_url = stand_in_server(_make_handler([]))
+
+        with Dataverse(base_url=base_url, verbose=0) as dataverse:
+            assert (
+                dataverse.native_api._run_async(
+                    lambda api: api.get_info_version()
+                ).version
+                == "6.5"
+            )
+            thread = dataverse._loop._thread
+            assert thread is not None and thread.is_alive()
+        assert not thread.is_alive()
+
+        dataverse = Dataverse(base_url=base_url, verbose=0)
+        dataverse.native_api._run_async(lambda api: api.get_info_version())
+        thread = dataverse._loop._thread
+        assert thread is not None
+        del dataverse
+        gc.collect()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
@@ -2,7 +2,11 @@
 
 import json
 import os
-from typing import Callable
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+from urllib.parse import urlparse
 
 import pytest
 from pydantic import BaseModel
@@ -19,11 +23,14 @@ from pyDataverse.models.dataset.create import DatasetCreateBody
 
 DatasetFactory = Callable[[], Dataset]
 CollectionFactory = Callable[[str], Collection]
+StandInServer = Callable[[Type[BaseHTTPRequestHandler]], str]
 REQUIRED_TEST_ENV_VARS = ("BASE_URL", "API_TOKEN", "API_TOKEN_SUPERUSER")
 
 
 def _missing_required_test_env_vars() -> list[str]:
-    return [env_var for env_var in REQUIRED_TEST_ENV_VARS if not os.environ.get(env_var)]
+    return [
+        env_var for env_var in REQUIRED_TEST_ENV_VARS if not os.environ.get(env_var)
+    ]
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -38,6 +45,24 @@ def pytest_sessionstart(session):
         )
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked as benchmarks.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 class Credentials(BaseModel):
     base_url: str
     api_token: str
@@ -355,3 +380,69 @@ def collection(dataverse: Dataverse) -> CollectionFactory:
         return collection
 
     return create_collection
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Base handler for local stand-ins of Dataverse and its storage.
+
+    Subclasses implement ``do_GET`` and friends and answer through
+    :meth:`reply` or :meth:`reply_json`. Requests are served over HTTP/1.1
+    so that clients can keep their connections alive.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    @property
+    def route(self) -> str:
+        """The request path without query string and with slashes collapsed."""
+        return re.sub("/+", "/", urlparse(self.path).path)
+
+    def reply(
+        self,
+        status: int = 200,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Send a response with the given status, body and headers."""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def reply_json(self, data: Any, status: int = 200) -> None:
+        """Send ``data`` wrapped in the Dataverse JSON envelope."""
+        body = json.dumps({"status": "OK", "data": data}).encode()
+        self.reply(status, body, {"Content-Type": "application/json"})
+
+    def do_HEAD(self) -> None:
+        self.reply()
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[StandInServer]:
+    """Fixture to serve stand-in handlers on local ports.
+
+    Returns a function that starts a server for a handler class and returns
+    its base URL. All servers are shut down when the test finishes.
+
+    Returns:
+        StandInServer: Function that serves a handler and returns its URL.
+    """
+    servers: List[ThreadingHTTPServer] = []
+
+    def serve(handler: Type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield serve
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,96 @@
+"""Unit tests for lazily built metadata blocks."""
+
+from typing import List
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from pyDataverse.dataverse.connect import MetadataBlocks, get_block_model
+from pyDataverse.models.metadatablocks import MetadatablockSpecification
+
+_SPEC = {
+    "id": 1,
+    "name": "citation",
+    "displayName": "Citation Metadata",
+    "fields": {
+        "title": {
+            "name": "title",
+            "displayName": "Title",
+            "title": "Title",
+            "type": "TEXT",
+            "typeClass": "primitive",
+            "multiple": False,
+            "isControlledVocabulary": False,
+            "displayFormat": "",
+            "displayOrder": 0,
+            "isRequired": True,
+        }
+    },
+}
+
+
+class _Holder(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    blocks: MetadataBlocks
+
+
+class TestMetadataBlocks:
+    """Test suite for lazily built metadata blocks."""
+
+    def test_models_are_shared_by_schema_hash(self) -> None:
+        """It creates one model per block schema, however often it is requested."""
+        first = get_block_model(MetadatablockSpecification.model_validate(_SPEC))
+        again = get_block_model(MetadatablockSpecification.model_validate(_SPEC))
+        limited = get_block_model(
+            MetadatablockSpecification.model_validate(_SPEC), enum_limit=10
+        )
+
+        assert first is again
+        assert first is not limited
+
+    def test_blocks_are_built_on_first_access(self) -> None:
+        """It builds a deferred block once, when it is first accessed by name."""
+        requested: List[str] = []
+
+        def model():
+            requested.append("citation")
+            return get_block_model(MetadatablockSpecification.model_validate(_SPEC))
+
+        blocks = MetadataBlocks()
+        blocks.defer({"citation": model})
+
+        assert "citation" in blocks and "geospatial" not in blocks
+        assert list(blocks) == [] and blocks.available == ["citation"]
+        assert requested == []
+
+        blocks["citation"]["title"] = "A title"
+        assert blocks.get("citation")["title"] == "A title"
+        assert list(blocks) == ["citation"] and requested == ["citation"]
+        assert blocks.get("geospatial") is None
+        with pytest.raises(KeyError):
+            blocks["geospatial"]
+
+    def test_validation_keeps_deferred_blocks(self) -> None:
+        """It keeps instances as they are and converts plain dicts."""
+        blocks = MetadataBlocks()
+        blocks.defer(
+            {"citation": lambda: get_block_model(MetadatablockSpecification(**_SPEC))}
+        )
+
+        holder = _Holder(blocks=blocks)
+        assert holder.blocks is blocks
+
+        holder.blocks = {}
+        assert isinstance(holder.blocks, MetadataBlocks)
+        assert "citation" not in holder.blocks
+
+    def test_field_table_is_compiled_with_the_model(self) -> None:
+        """It compiles the field information once, when the model class is created."""
+        model = get_block_model(MetadatablockSpecification.model_validate(_SPEC))
+
+        assert set(model.__dict__["__field_infos__"]) == {"title"}
+        info = model._extract_info("title")
+        assert info is model._extract_info("title")
+        assert info.json_schema_extra.type_name == "title"
+        assert not info.multiple and not info.compound
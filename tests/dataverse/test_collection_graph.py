@@ -0,0 +1,157 @@
+"""Tests for collection graphs against a local stand-in for Dataverse."""
+
+import asyncio
+import io
+import json
+from collections import Counter
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from rdflib import Graph, URIRef
+from rdflib import Dataset as RDFDataset
+
+from pyDataverse.dataverse import Dataverse
+from pyDataverse.dataverse import collection as collection_module
+from tests.conftest import StandInHandler, StandInServer
+
+SCHEMA_NAME = URIRef("https://schema.org/name")
+
+
+def _dataset(index: int) -> Dict[str, Any]:
+    return {
+        "id": index,
+        "identifier": f"FK2/{index:05d}",
+        "persistentUrl": f"https://doi.org/10.5072/FK2/{index:05d}",
+        "protocol": "doi",
+        "authority": "10.5072",
+        "separator": "/",
+        "publisher": "Root",
+        "storageIdentifier": f"file://10.5072/FK2/{index:05d}",
+        "type": "dataset",
+    }
+
+
+# root -> (1, 2, child 10 -> (3, grandchild 20 -> (4)))
+CONTENTS: Dict[str, List[Dict[str, Any]]] = {
+    "root": [
+        _dataset(1),
+        _dataset(2),
+        {"id": 10, "title": "Child", "type": "dataverse"},
+    ],
+    "10": [_dataset(3), {"id": 20, "title": "Grandchild", "type": "dataverse"}],
+    "20": [_dataset(4)],
+    "wide": [_dataset(index) for index in range(100, 140)],
+}
+
+
+def _export(pid: str) -> Dict[str, Any]:
+    index = int(pid.rsplit("/", 1)[1])
+    return {
+        "@context": {"@vocab": "https://schema.org/"},
+        "@type": "Dataset",
+        "name": f"Dataset {index}",
+        "author": {"name": "Doe, Jane"},
+    }
+
+
+def _make_handler(requests: Counter):
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            path = self.route
+            query = parse_qs(urlparse(self.path).query)
+            requests[path] += 1
+
+            if path == "/api/info/version":
+                self.reply_json({"version": "6.5", "build": "1"})
+            elif path == "/api/metadatablocks":
+                self.reply_json([])
+            elif path == "/api/info/exportFormats":
+                exporter = {
+                    "displayName": "Schema.org JSON-LD",
+                    "mediaType": "application/ld+json",
+                    "isHarvestable": False,
+                    "isVisibleInUserInterface": True,
+                }
+                self.reply_json({"schema.org": exporter})
+            elif path.endswith("/contents"):
+                self.reply_json(CONTENTS[path.split("/")[3]])
+            elif path == "/api/datasets/export":
+                body = json.dumps(_export(query["persistentId"][0])).encode()
+                self.reply(200, body, {"Content-Type": "application/json"})
+            else:
+                self.reply(404)
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(stand_in_server: StandInServer) -> Iterator[tuple]:
+    requests: Counter = Counter()
+    dataverse = Dataverse(base_url=stand_in_server(_make_handler(requests)), verbose=0)
+    yield dataverse, requests
+    dataverse.close()
+
+
+class TestCollectionGraph:
+    """Test suite for collection graphs."""
+
+    def test_graph_walks_listings_and_exports(self, stand_in) -> None:
+        """It builds the graph from contents listings and exports only."""
+        dataverse, requests = stand_in
+        collection = dataverse.fetch_collection("root")
+
+        graph = collection.graph("schema.org", depth=2, max_workers=1)
+
+        names = sorted(str(name) for _, name in graph.subject_objects(SCHEMA_NAME))
+        assert names == ["Dataset 1", "Dataset 2", "Dataset 3", "Doe, Jane"]
+        dataset = URIRef("https://doi.org/10.5072/FK2/00003")
+        assert str(graph.value(dataset, SCHEMA_NAME)) == "Dataset 3"
+        assert requests["/api/datasets/export"] == 3
+        assert requests["/api/dataverses/20/contents"] == 0
+        assert not any("/api/datasets/:persistentId" in path for path in requests)
+
+    def test_write_graph_streams_named_graphs(self, stand_in, tmp_path) -> None:
+        """It writes each dataset as a named graph of an N-Quads file."""
+        dataverse, _ = stand_in
+        collection = dataverse.fetch_collection("root")
+        target = tmp_path / "root.nq"
+
+        written = collection.write_graph(
+            target, "schema.org", depth=3, rdf_format="nquads"
+        )
+
+        quads = RDFDataset()
+        quads.parse(target, format="nquads")
+        names = {str(context.identifier) for context in quads.graphs()}
+        assert {f"https://doi.org/10.5072/FK2/0000{i}" for i in range(1, 5)} <= names
+        assert written == len(quads) == 4 * 4
+
+        sink = io.StringIO()
+        assert collection.write_graph(sink, "schema.org", depth=1) == 2 * 4
+        assert len(Graph().parse(data=sink.getvalue(), format="nt")) == 2 * 4
+
+    def test_slow_consumers_bound_pending_graphs(self, stand_in, monkeypatch) -> None:
+        """It parses no more than twice max_workers graphs ahead of the consumer."""
+        dataverse, _ = stand_in
+        collection = dataverse.fetch_collection("wide")
+        parsed: List[int] = []
+
+        def parse(*args: Any) -> Graph:
+            # Parsing faster than the consumer takes graphs builds the backlog
+            parsed.append(1)
+            return Graph()
+
+        monkeypatch.setattr(collection_module, "_exports_to_graph", parse)
+
+        async def consume() -> List[int]:
+            ahead = []
+            async for _ in collection._dataset_graphs(["schema.org"], 1, 2):
+                await asyncio.sleep(0.05)
+                ahead.append(len(parsed) - len(ahead) - 1)
+            return ahead
+
+        ahead = dataverse._run(consume())
+
+        assert len(ahead) == 40
+        assert max(ahead) <= 2 * 2, ahead
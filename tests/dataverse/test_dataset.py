@@ -342,6 +342,38 @@ class TestDataset:
             "Dataset file content is not correct"
         )
 
+    def test_dataset_tabular_files_load_tabular(
+        self,
+        dataset: DatasetFactory,
+    ):
+        """Test loading all tabular files of a dataset at once.
+
+        Verifies that the bulk loader returns one DataFrame per file, and a
+        single frame tagged with each row's source path when concatenating.
+        """
+        test_dataset = dataset()
+        first = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+        second = pd.DataFrame({"name": ["Carol"], "age": [35]})
+
+        with test_dataset.open("data/first.tab", "w") as f:
+            f.write(first.to_csv(index=False, sep="\t"))
+        with test_dataset.open("data/second.tab", "w") as f:
+            f.write(second.to_csv(index=False, sep="\t"))
+
+        frames = test_dataset.tabular_files.load_tabular(max_concurrency=2)
+        assert isinstance(frames, dict), "Expected a dict of DataFrames"
+        assert list(frames) == ["data/first.tab", "data/second.tab"]
+        assert frames["data/first.tab"].equals(first), "DataFrame does not match"
+
+        combined = test_dataset.tabular_files.load_tabular(concat=True)
+        assert isinstance(combined, pd.DataFrame), "Expected a DataFrame"
+        assert combined["source_path"].tolist() == [
+            "data/first.tab",
+            "data/first.tab",
+            "data/second.tab",
+        ], "Source paths do not match"
+        assert combined["age"].tolist() == [25, 30, 35], "Rows do not match"
+
     def test_dataset_update_metadata(self, dataset: DatasetFactory):
         """Test updating dataset metadata on the server.
 
@@ -673,6 +705,37 @@ class TestDataset:
         with test_dataset.open("data/file.txt", "r") as f:
             assert f.read() == "This is a test file.", "File content is not the same"
 
+    def test_dataset_open_file_transaction(self, dataset: DatasetFactory):
+        """Test writing several files inside a filesystem transaction.
+
+        Verifies that files written inside ``fs.transaction`` are uploaded as
+        one batch when the block exits, keeping their folders, and that files
+        written in a failed transaction are discarded.
+        """
+        test_dataset = dataset()
+        contents = {
+            "data/a.txt": "File A",
+            "data/nested/b.txt": "File B",
+            "c.txt": "File C",
+        }
+
+        with test_dataset.fs.transaction:
+            for path, content in contents.items():
+                with test_dataset.open(path, "w") as f:
+                    f.write(content)
+
+        for path, content in contents.items():
+            with test_dataset.open(path, "r") as f:
+                assert f.read() == content, f"File content of {path} is not the same"
+
+        with pytest.raises(RuntimeError):
+            with test_dataset.fs.transaction:
+                with test_dataset.open("discarded.txt", "w") as f:
+                    f.write("Never uploaded")
+                raise RuntimeError("abort transaction")
+
+        assert not test_dataset.fs.exists("discarded.txt"), "File was uploaded"
+
     def test_upload_file(self, dataset: DatasetFactory):
         """Test uploading a local file to the dataset.
 
@@ -0,0 +1,182 @@
+"""Tests and a benchmark for loading datasets into metadata block models."""
+
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.dataverse import Dataverse
+from pyDataverse.dataverse.connect.metadata import MetadataBlockBase
+from pyDataverse.models.dataset.edit_get import GetDatasetResponse
+from tests.conftest import StandInHandler, StandInServer
+
+
+def _field(name: str, type_class: str = "primitive", **extra: Any) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "displayName": name,
+        "title": name,
+        "type": "NONE" if type_class == "compound" else "TEXT",
+        "typeClass": type_class,
+        "multiple": False,
+        "isControlledVocabulary": type_class == "controlledVocabulary",
+        "displayFormat": "",
+        "displayOrder": 0,
+        "isRequired": False,
+        **extra,
+    }
+
+
+_BLOCK = {
+    "id": 1,
+    "name": "citation",
+    "displayName": "Citation Metadata",
+    "fields": {
+        "title": _field("title"),
+        "subtitle": _field("subtitle"),
+        "subject": _field(
+            "subject",
+            "controlledVocabulary",
+            multiple=True,
+            controlledVocabularyValues=["Chemistry", "Physics", "Other"],
+        ),
+        "author": _field(
+            "author",
+            "compound",
+            multiple=True,
+            childFields={
+                "authorName": _field("authorName"),
+                "authorAffiliation": _field("authorAffiliation"),
+            },
+        ),
+    },
+}
+
+
+def _dataset(identifier: int) -> Dict[str, Any]:
+    def field(name: str, value: Any, type_class: str = "primitive") -> dict:
+        return {
+            "typeName": name,
+            "multiple": isinstance(value, list),
+            "typeClass": type_class,
+            "value": value,
+        }
+
+    authors = [
+        {
+            "authorName": field("authorName", f"Author {index}"),
+            "authorAffiliation": field("authorAffiliation", "University"),
+        }
+        for index in range(3)
+    ]
+    return {
+        "id": identifier,
+        "datasetId": identifier,
+        "datasetPersistentId": f"doi:10.5072/FK2/{identifier:06d}",
+        "license": {"name": "CC0 1.0"},
+        "metadataBlocks": {
+            "citation": {
+                "displayName": "Citation Metadata",
+                "name": "citation",
+                "fields": [
+                    field("title", f"Dataset {identifier}"),
+                    field("subtitle", "A subtitle"),
+                    field("subject", ["Chemistry", "Physics"], "controlledVocabulary"),
+                    field("author", authors, "compound"),
+                ],
+            }
+        },
+    }
+
+
+class _Handler(StandInHandler):
+    def do_GET(self) -> None:
+        if self.route == "/api/info/version":
+            data: Any = {"version": "6.5", "build": "1"}
+        elif self.route == "/api/metadatablocks":
+            data = [{key: _BLOCK[key] for key in ("id", "name", "displayName")}]
+        else:
+            data = _BLOCK
+        self.reply_json(data)
+
+
+@pytest.fixture
+def dataverse(stand_in_server: StandInServer) -> Iterator[Dataverse]:
+    dataverse = Dataverse(base_url=stand_in_server(_Handler), verbose=0)
+    yield dataverse
+    dataverse.close()
+
+
+class TestDatasetLoading:
+    """Test suite for loading datasets into metadata block models."""
+
+    def test_field_infos_are_compiled_once(self, dataverse, monkeypatch) -> None:
+        """It builds no field information after the block classes are created."""
+        responses = {
+            identifier: GetDatasetResponse.model_validate(_dataset(identifier))
+            for identifier in range(1, 4)
+        }
+        monkeypatch.setattr(
+            NativeApi,
+            "get_dataset",
+            lambda self, identifier, version: responses[identifier],
+        )
+        dataverse.fetch_dataset(1).metadata_blocks["citation"]
+
+        built: List[str] = []
+        build_info = MetadataBlockBase._build_info.__func__  # type: ignore[attr-defined]
+
+        def spy(cls, field_info):
+            built.append(cls.__name__)
+            return build_info(cls, field_info)
+
+        monkeypatch.setattr(MetadataBlockBase, "_build_info", classmethod(spy))
+
+        for identifier in (2, 3):
+            block = dataverse.fetch_dataset(identifier).metadata_blocks["citation"]
+            assert block.author[0].authorName == "Author 0"
+            block.to_metadata_block()
+            block.to_update_metadata_block()
+
+        assert built == []
+        type(block)._compile_fields()
+        assert built, "compiling a class goes through the spy"
+
+    @pytest.mark.benchmark
+    def test_fetch_5000_datasets(self, dataverse, monkeypatch) -> None:
+        """It parses and serializes 5,000 datasets in well under a minute.
+
+        Dataset responses are served in-process so that the benchmark measures
+        building the metadata block models rather than HTTP round trips.
+        """
+        responses = {
+            identifier: GetDatasetResponse.model_validate(_dataset(identifier))
+            for identifier in range(1, 5001)
+        }
+        monkeypatch.setattr(
+            NativeApi,
+            "get_dataset",
+            lambda self, identifier, version: responses[identifier],
+        )
+
+        started = time.perf_counter()
+        for identifier in range(1, 5001):
+            dataset = dataverse.fetch_dataset(identifier)
+            block = dataset.metadata_blocks["citation"]
+            assert block.title == f"Dataset {identifier}"
+            assert [author.authorName for author in block.author][2] == "Author 2"
+            assert len(block.to_metadata_block().fields) == 4
+        elapsed = time.perf_counter() - started
+
+        update = {field.type_name: field for field in block.to_update_metadata_block()}
+        assert update["subject"].value == ["Chemistry", "Physics"]
+        assert update["author"].value[0]["authorName"].value == "Author 0"
+        assert elapsed < 60, f"loading 5,000 datasets took {elapsed:.1f}s"
+
+    def test_to_pydantic_lists_deferred_blocks(self, dataverse) -> None:
+        """It returns a model for every block, although blank datasets defer them."""
+        models = dataverse.to_pydantic()
+
+        assert list(models) == ["citation"]
+        assert "title" in models["citation"].model_fields
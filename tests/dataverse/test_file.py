@@ -9,7 +9,9 @@ from io import BytesIO
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
+from pyDataverse.api.data_access import DataAccessApi
 from pyDataverse.api.native import NativeApi
 from pyDataverse.models.file.filemeta import UploadBody
 from tests.conftest import Credentials, DatasetFactory
@@ -182,6 +184,22 @@ class TestFile:
             "Tabular schema does not match"
         )
 
+    def test_tabular_schema_sparse_column(self, dataset: DatasetFactory):
+        """Test that integer columns with missing values get a nullable dtype."""
+        test_dataset = dataset()
+
+        with test_dataset.open("data/file.tab", "w") as file:
+            file.write("name\tage\nAlice\t25\nBob\t\nCarol\t40\n")
+
+        test_file = test_dataset.files["data/file.tab"]
+        assert test_file.tabular_schema == {"name": "object", "age": "Int64"}, (
+            "Tabular schema does not match"
+        )
+
+        df = test_file.open_tabular()
+        assert str(df["age"].dtype) == "Int64", "DDI dtype should be applied"
+        assert df["age"].isna().sum() == 1, "Missing value should be preserved"
+
     def test_file_is_restricted(self, native_api: NativeApi, dataset: DatasetFactory):
         """Test checking if file is restricted."""
         test_dataset = dataset()
@@ -258,6 +276,35 @@ class TestFile:
         df = test_file.open_tabular()
         assert df.equals(df), "DataFrame does not match"
 
+    def test_open_tabular_usecols(
+        self,
+        dataset: DatasetFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that selecting columns only downloads the selected variables."""
+        test_dataset = dataset()
+        with test_dataset.open("data/file.tab", "w") as file:
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+            file.write(df.to_csv(index=False, sep="\t"))
+
+        test_file = test_dataset.files["data/file.tab"]
+        get_download_url = DataAccessApi.get_datafile_download_url
+        requested = []
+
+        def spy(self, identifier, **kwargs):
+            requested.append(kwargs.get("variables"))
+            return get_download_url(self, identifier, **kwargs)
+
+        monkeypatch.setattr(DataAccessApi, "get_datafile_download_url", spy)
+
+        projected = test_file.open_tabular(usecols=["age"])
+        assert projected.equals(df[["age"]]), "DataFrame does not match"
+
+        variables = test_dataset.fs.tabular_variables(test_file.path)
+        assert variables is not None, "File should have DDI variables"
+        age = [variable.id for variable in variables if variable.name == "age"]
+        assert requested[-1] == age, "Only the selected variable should be requested"
+
     def test_stream_tabular_file(self, dataset: DatasetFactory):
         """Test streaming tabular file as chunks."""
         test_dataset = dataset()
@@ -271,6 +318,51 @@ class TestFile:
         df_streamed = pd.concat(list(test_file.stream_tabular()))
         assert df_streamed.equals(df), "DataFrame does not match"
 
+    def test_stream_arrow(self, dataset: DatasetFactory):
+        """Test streaming tabular file as Arrow record batches."""
+        pytest.importorskip("pyarrow")
+
+        test_dataset = dataset()
+        with test_dataset.open("data/file.tab", "w") as file:
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+            file.write(df.to_csv(index=False, sep="\t"))
+
+        test_file = test_dataset.files["data/file.tab"]
+        batches = list(test_file.stream_arrow())
+        assert sum(batch.num_rows for batch in batches) == 2, "Row count mismatch"
+        assert batches[0].schema.names == ["name", "age"], "Columns do not match"
+
+        df_streamed = pd.concat(
+            test_file.stream_arrow(columns=["age"], output="pandas")
+        )
+        assert df_streamed["age"].tolist() == [25, 30], "DataFrame does not match"
+
+    def test_open_tabular_parquet_cache(self, dataset: DatasetFactory):
+        """Test that tabular reads are served from the Parquet cache."""
+        pytest.importorskip("pyarrow")
+        from pyDataverse.filesystem.parquet import TabularCache
+
+        test_dataset = dataset()
+        with test_dataset.open("data/file.tab", "w") as file:
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [25, 30]})
+            file.write(df.to_csv(index=False, sep="\t"))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TabularCache(cache_dir)
+            test_dataset.fs.tabular_cache = cache
+            test_file = test_dataset.files["data/file.tab"]
+
+            assert test_file.open_tabular().equals(df), "DataFrame does not match"
+            assert cache.size > 0, "Parsed file should be cached"
+
+            projected = test_file.open_tabular(usecols=["age"])
+            assert projected["age"].tolist() == [25, 30], "Cached read mismatch"
+            streamed = pd.concat(test_file.stream_tabular(chunk_size=1))
+            assert streamed["name"].tolist() == ["Alice", "Bob"], "Stream mismatch"
+
+            test_file.delete()
+            assert cache.size == 0, "Deleted file should be evicted"
+
     def test_file_download(
         self,
         dataset: DatasetFactory,
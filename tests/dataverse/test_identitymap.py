@@ -0,0 +1,143 @@
+"""Tests for the identity map of fetched datasets and collections."""
+
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.dataverse import Dataverse
+from pyDataverse.dataverse.identitymap import (
+    IdentityMap,
+    collection_key,
+    dataset_key,
+)
+from pyDataverse.models.dataset.edit_get import GetDatasetResponse
+from tests.conftest import StandInHandler, StandInServer
+
+PID = "doi:10.5072/FK2/000007"
+
+_BLOCK = {
+    "id": 1,
+    "name": "citation",
+    "displayName": "Citation Metadata",
+    "fields": {
+        "title": {
+            "name": "title",
+            "displayName": "Title",
+            "title": "Title",
+            "type": "TEXT",
+            "typeClass": "primitive",
+            "multiple": False,
+            "isControlledVocabulary": False,
+            "displayFormat": "",
+            "displayOrder": 0,
+            "isRequired": True,
+        }
+    },
+}
+
+
+def _response() -> GetDatasetResponse:
+    return GetDatasetResponse.model_validate(
+        {
+            "id": 7,
+            "datasetId": 7,
+            "datasetPersistentId": PID,
+            "metadataBlocks": {
+                "citation": {
+                    "displayName": "Citation Metadata",
+                    "name": "citation",
+                    "fields": [
+                        {
+                            "typeName": "title",
+                            "multiple": False,
+                            "typeClass": "primitive",
+                            "value": "Dataset 7",
+                        }
+                    ],
+                }
+            },
+        }
+    )
+
+
+class _Handler(StandInHandler):
+    def do_GET(self) -> None:
+        if self.route == "/api/info/version":
+            data: Any = {"version": "6.5", "build": "1"}
+        elif self.route == "/api/metadatablocks":
+            data = [{key: _BLOCK[key] for key in ("id", "name", "displayName")}]
+        elif "/locks" in self.route:
+            data = []
+        else:
+            data = _BLOCK
+        self.reply_json(data)
+
+
+@pytest.fixture
+def dataverse(stand_in_server: StandInServer) -> Iterator[Dataverse]:
+    dataverse = Dataverse(base_url=stand_in_server(_Handler), verbose=0)
+    yield dataverse
+    dataverse.close()
+
+
+class TestIdentityMap:
+    """Test suite for the identity map of fetched datasets and collections."""
+
+    def test_mutable_entries_expire_and_numbered_versions_do_not(self) -> None:
+        """It expires drafts and collections after the TTL but keeps ``1.0``."""
+        identity_map = IdentityMap(ttl=0)
+        identity_map.put([dataset_key(PID, ":draft")], "draft")
+        identity_map.put([dataset_key(PID, "1.0")], "published")
+        identity_map.put([collection_key("root")], "collection")
+
+        assert identity_map.get(dataset_key(PID, ":draft")) is None
+        assert identity_map.get(collection_key("root")) is None
+        assert identity_map.get(dataset_key(PID, "1.0")) == "published"
+        assert identity_map.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+    def test_invalidate_keeps_numbered_versions_and_size_is_bounded(self) -> None:
+        """It drops only mutable versions on writes and evicts the least recent key."""
+        identity_map = IdentityMap(max_entries=2)
+        identity_map.put([dataset_key(PID, ":latest"), dataset_key(7, ":latest")], "a")
+        identity_map.invalidate("dataset", [PID, 7])
+        assert identity_map.stats()["entries"] == 0
+
+        identity_map.put([dataset_key(PID, "1.0")], "a")
+        identity_map.put([dataset_key(PID, "2.0")], "b")
+        identity_map.get(dataset_key(PID, "1.0"))
+        identity_map.put([dataset_key(PID, "3.0")], "c")
+        identity_map.invalidate("dataset", [PID])
+
+        assert identity_map.get(dataset_key(PID, "1.0")) == "a"
+        assert identity_map.get(dataset_key(PID, "2.0")) is None
+        assert identity_map.get(dataset_key(PID, "3.0")) == "c"
+
+    def test_fetch_dataset_returns_the_same_object(
+        self, dataverse, monkeypatch
+    ) -> None:
+        """It fetches a dataset once per version and again after a local write."""
+        requested: List[tuple] = []
+
+        def get_dataset(self, identifier, version):
+            requested.append((identifier, version))
+            return _response()
+
+        monkeypatch.setattr(NativeApi, "get_dataset", get_dataset)
+        monkeypatch.setattr(
+            NativeApi, "edit_dataset_metadata", lambda *args, **kw: None
+        )
+
+        dataset = dataverse.fetch_dataset(PID)
+        assert dataverse.fetch_dataset(PID) is dataset
+        assert dataverse.fetch_dataset(7) is dataset, "keyed by the database ID too"
+        assert dataverse.fetch_dataset(PID, version="1.0") is not dataset
+
+        # The write drops the cached draft; the refresh refetches it and keeps
+        # the caller's object as the identity.
+        dataset.update_metadata()
+        assert dataverse.fetch_dataset(PID) is dataset
+
+        assert requested == [(PID, ":latest"), (PID, "1.0"), (PID, ":latest")]
+        stats: Dict[str, int] = dataverse.identity_map.stats()
+        assert (stats["hits"], stats["misses"]) == (3, 3)
@@ -0,0 +1,214 @@
+"""Tests for the collection overview against a local stand-in for Dataverse."""
+
+from collections import Counter
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pyDataverse.dataverse import Dataverse
+from tests.conftest import StandInHandler, StandInServer
+
+N_DATASETS = 2000
+
+
+def _pid(index: int) -> str:
+    return f"doi:10.5072/FK2/{index:05d}"
+
+
+def _contents(twins: bool) -> List[Dict[str, Any]]:
+    datasets = [
+        {
+            "id": index,
+            "identifier": f"FK2/{index:05d}",
+            "persistentUrl": f"https://doi.org/10.5072/FK2/{index:05d}",
+            "protocol": "doi",
+            "authority": "10.5072",
+            "separator": "/",
+            "publisher": "Root",
+            "storageIdentifier": f"file://10.5072/FK2/{index:05d}",
+            "type": "dataset",
+        }
+        for index in range(1, N_DATASETS + 1)
+    ]
+    collections = [
+        {"id": 10, "title": "Child A", "type": "dataverse"},
+        {"id": 11, "title": "Child B", "type": "dataverse"},
+    ]
+    if twins:
+        collections += [
+            {"id": 12, "title": "Twin", "type": "dataverse"},
+            {"id": 13, "title": "Twin", "type": "dataverse"},
+        ]
+    return collections + datasets
+
+
+def _search_items(twins: bool, nested: int) -> List[Dict[str, Any]]:
+    # The index lags behind: the last dataset and "Child B" are missing, and
+    # datasets of the nested collection must not be mistaken for children.
+    items = [
+        {
+            "type": "dataset",
+            "name": f"Dataset {index}",
+            "global_id": _pid(index),
+            "identifier_of_dataverse": "root",
+        }
+        for index in range(1, N_DATASETS)
+    ]
+    items.append(
+        {
+            "type": "dataset",
+            "name": "Nested",
+            "global_id": _pid(N_DATASETS),
+            "identifier_of_dataverse": "child-a",
+        }
+    )
+    items.append(
+        {
+            "type": "dataverse",
+            "name": "Child A",
+            "identifier": "child-a",
+            "parentDataverseIdentifier": "root",
+        }
+    )
+    if twins:
+        items += [
+            {
+                "type": "dataverse",
+                "name": "Twin",
+                "identifier": alias,
+                "parentDataverseIdentifier": "root",
+            }
+            for alias in ("twin-13", "twin-12")
+        ]
+    items += [
+        {
+            "type": "dataset",
+            "name": f"Nested {index}",
+            "global_id": f"doi:10.5072/FK2/N{index:05d}",
+            "identifier_of_dataverse": "child-a",
+        }
+        for index in range(nested)
+    ]
+    return items
+
+
+def _make_handler(requests: Counter, twins: bool, nested: int):
+    items = _search_items(twins, nested)
+
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            path = self.route
+            query = parse_qs(urlparse(self.path).query)
+            requests[path] += 1
+
+            if path == "/api/info/version":
+                data: Any = {"version": "6.5", "build": "1"}
+            elif path == "/api/metadatablocks":
+                data = []
+            elif path == "/api/dataverses/root":
+                data = {"id": 1, "alias": "root", "name": "Root"}
+            elif path == "/api/dataverses/11":
+                data = {"id": 11, "alias": "child-b", "name": "Child B"}
+            elif path in ("/api/dataverses/12", "/api/dataverses/13"):
+                number = int(path.rsplit("/", 1)[1])
+                data = {"id": number, "alias": f"twin-{number}", "name": "Twin"}
+            elif path == "/api/dataverses/root/contents":
+                data = _contents(twins)
+            elif path == "/api/search":
+                start = int(query.get("start", ["0"])[0])
+                per_page = int(query["per_page"][0])
+                data = {
+                    "total_count": len(items),
+                    "items": items[start : start + per_page],
+                }
+            else:
+                data = {
+                    "id": N_DATASETS,
+                    "datasetPersistentId": query["persistentId"][0],
+                    "metadataBlocks": {
+                        "citation": {
+                            "displayName": "Citation Metadata",
+                            "name": "citation",
+                            "fields": [
+                                {
+                                    "typeName": "title",
+                                    "typeClass": "primitive",
+                                    "value": "Not indexed yet",
+                                }
+                            ],
+                        }
+                    },
+                }
+            self.reply_json(data)
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(request, stand_in_server: StandInServer) -> Iterator[tuple]:
+    options = getattr(request, "param", {})
+    requests: Counter = Counter()
+    handler = _make_handler(
+        requests, options.get("twins", False), options.get("nested", 0)
+    )
+    dataverse = Dataverse(base_url=stand_in_server(handler), verbose=0)
+    yield dataverse, requests
+    dataverse.close()
+
+
+class TestOverview:
+    """Test suite for the collection overview."""
+
+    def test_overview_costs_a_few_requests(self, stand_in) -> None:
+        """It lists 2,002 items from the contents listing and one paged search."""
+        dataverse, requests = stand_in
+        collection = dataverse.fetch_collection("root")
+        requests.clear()
+
+        overview = collection.overview
+
+        datasets = overview[overview["content_type"] == "dataset"]
+        collections = overview[overview["content_type"] == "collection"]
+        assert len(datasets) == N_DATASETS
+        assert datasets["title"].iloc[0] == "Dataset 1"
+        assert datasets["title"].iloc[-1] == "Not indexed yet"
+        assert list(collections["identifier"]) == ["child-a", "child-b"]
+        assert list(collections["title"]) == ["Child A", "Child B"]
+
+        assert requests["/api/dataverses/root/contents"] == 1
+        assert requests["/api/search"] == 3, "2,001 indexed items in pages of 1,000"
+        assert requests["/api/dataverses/11"] == 1
+        assert requests["/api/dataverses/root"] == 1, "the alias scopes the search"
+        assert sum(requests.values()) == 7, requests
+
+    @pytest.mark.parametrize("stand_in", [{"twins": True}], indirect=True)
+    def test_overview_resolves_shared_names_by_id(self, stand_in) -> None:
+        """It fetches children that share a name instead of guessing their alias."""
+        dataverse, requests = stand_in
+        collection = dataverse.fetch_collection("root")
+        requests.clear()
+
+        overview = collection.overview
+
+        collections = overview[overview["content_type"] == "collection"]
+        assert list(collections["identifier"]) == [
+            "child-a",
+            "child-b",
+            "twin-12",
+            "twin-13",
+        ]
+        assert requests["/api/dataverses/12"] == requests["/api/dataverses/13"] == 1
+
+    @pytest.mark.parametrize("stand_in", [{"nested": 20000}], indirect=True)
+    def test_search_stops_in_large_subtrees(self, stand_in) -> None:
+        """It does not page through a large subtree for a child the index lacks."""
+        dataverse, requests = stand_in
+        collection = dataverse.fetch_collection("root")
+        requests.clear()
+
+        overview = collection.overview
+
+        assert len(overview) == N_DATASETS + 2
+        assert requests["/api/search"] == 5, "3 pages for 2,002 children, 2 extra"
+        assert requests["/api/dataverses/11"] == 1
@@ -0,0 +1,123 @@
+"""Tests for the metadata block schema cache against a local stand-in for Dataverse."""
+
+import os
+import time
+from typing import List
+
+import pytest
+
+from pyDataverse.dataverse import Dataverse
+from pyDataverse.dataverse.schemacache import SchemaCache
+from pyDataverse.models.info import VersionResponse
+from pyDataverse.models.metadatablocks import MetadatablockSpecification
+from tests.conftest import StandInHandler, StandInServer
+
+_BLOCK = {
+    "id": 1,
+    "name": "citation",
+    "displayName": "Citation Metadata",
+    "fields": {
+        "title": {
+            "name": "title",
+            "displayName": "Title",
+            "title": "Title",
+            "type": "TEXT",
+            "typeClass": "primitive",
+            "multiple": False,
+            "isControlledVocabulary": False,
+            "displayFormat": "",
+            "displayOrder": 0,
+            "isRequired": True,
+        }
+    },
+}
+
+
+class _StandIn:
+    """State of a stand-in Dataverse installation."""
+
+    def __init__(self):
+        self.version = "6.5"
+        self.blocks = [_BLOCK]
+        self.requests: List[str] = []
+
+
+def _make_handler(state: _StandIn):
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            state.requests.append(self.route)
+            if self.route == "/api/info/version":
+                data = {"version": state.version, "build": "1"}
+            elif self.route == "/api/metadatablocks":
+                data = [
+                    {key: block[key] for key in ("id", "name", "displayName")}
+                    for block in state.blocks
+                ]
+            else:
+                name = self.route.rpartition("/")[2]
+                data = next(block for block in state.blocks if block["name"] == name)
+            self.reply_json(data)
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(stand_in_server: StandInServer) -> tuple:
+    state = _StandIn()
+    return stand_in_server(_make_handler(state)), state
+
+
+def _block_requests(state: _StandIn) -> List[str]:
+    return [path for path in state.requests if path.startswith("/api/metadatablocks")]
+
+
+class TestSchemaCache:
+    """Test suite for the metadata block schema cache."""
+
+    def test_warm_start_fetches_no_blocks(self, stand_in, tmp_path) -> None:
+        """It loads the blocks from disk until the installation is upgraded."""
+        base_url, state = stand_in
+
+        def connect() -> Dataverse:
+            return Dataverse(
+                base_url=base_url, verbose=0, schema_cache_dir=str(tmp_path)
+            )
+
+        assert "citation" in connect().metadatablocks
+        assert len(_block_requests(state)) == 2
+
+        state.requests.clear()
+        dataverse = connect()
+        assert "citation" in dataverse.metadatablocks
+        assert _block_requests(state) == []
+
+        state.version = "6.6"
+        connect()
+        assert len(_block_requests(state)) == 2
+
+    def test_stale_entries_are_checked_against_the_listing(self, tmp_path) -> None:
+        """It keeps an old entry whose blocks are still listed, and drops it otherwise."""
+        cache = SchemaCache(tmp_path, max_age=60)
+        version = VersionResponse(version="6.5", build="1")
+        blocks = {"citation": MetadatablockSpecification.model_validate(_BLOCK)}
+        cache.put("https://demo.dataverse.org/", version, blocks)
+
+        def never_called() -> list:
+            raise AssertionError("fresh entries need no listing")
+
+        assert cache.get("https://demo.dataverse.org", version, never_called) == blocks
+
+        (path,) = tmp_path.glob("*.json")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        listing = [MetadatablockSpecification.model_validate(_BLOCK)]
+        assert (
+            cache.get("https://demo.dataverse.org", version, lambda: listing) == blocks
+        )
+        assert path.stat().st_mtime > old, "a confirmed entry is fresh again"
+
+        os.utime(path, (old, old))
+        assert cache.get("https://demo.dataverse.org", version, lambda: []) is None
+
+        path.write_text("{not json")
+        assert cache.get("https://demo.dataverse.org", version, never_called) is None
@@ -0,0 +1,129 @@
+"""Unit tests for read-only dataset summaries."""
+
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from pyDataverse.dataverse import DatasetSummary
+from pyDataverse.dataverse.views.datasetview import DatasetView
+from pyDataverse.models.collection.content import Dataset as ContentDataset
+from pyDataverse.models.dataset.edit_get import GetDatasetResponse
+
+
+def _response(identifier: int) -> GetDatasetResponse:
+    def field(name: str, value: Any, type_class: str = "primitive") -> dict:
+        return {"typeName": name, "typeClass": type_class, "value": value}
+
+    return GetDatasetResponse.model_validate(
+        {
+            "id": identifier,
+            "license": {"name": "CC0 1.0"},
+            "datasetPersistentId": f"doi:10.5072/FK2/{identifier}",
+            "latestVersion": {
+                "datasetId": identifier,
+                "datasetPersistentId": f"doi:10.5072/FK2/{identifier}",
+                "metadataBlocks": {
+                    "citation": {
+                        "displayName": "Citation Metadata",
+                        "name": "citation",
+                        "fields": [
+                            field("title", f"Dataset {identifier}"),
+                            field("subject", ["Chemistry"], "controlledVocabulary"),
+                            field(
+                                "author",
+                                [
+                                    {"authorName": field("authorName", "Doe, Jane")},
+                                    {"authorName": field("authorName", "Roe, Rick")},
+                                ],
+                                "compound",
+                            ),
+                        ],
+                    }
+                },
+                "files": [
+                    {"dataFile": {"filesize": 10}},
+                    {"dataFile": {"filesize": 32}},
+                ],
+            },
+        }
+    )
+
+
+class _FakeDataverse:
+    def __init__(self):
+        self.fetched: List[tuple] = []
+        self.requested: List[list] = []
+        self.native_api = SimpleNamespace(get_datasets=self._get_datasets)
+
+    def _get_datasets(self, identifiers):
+        self.requested.append(list(identifiers))
+        return [None if i == 2 else _response(i) for i in identifiers]
+
+    def fetch_dataset(self, identifier, version=":latest"):
+        self.fetched.append((identifier, version))
+        return "dataset"
+
+
+class TestSummary:
+    """Test suite for read-only dataset summaries."""
+
+    def test_summary_from_response(self) -> None:
+        """It fills a summary from the raw response and upgrades it on demand."""
+        dataverse = _FakeDataverse()
+        summary = DatasetSummary.from_response(_response(7), dataverse)
+
+        assert summary.persistent_identifier == "doi:10.5072/FK2/7"
+        assert summary.title == "Dataset 7"
+        assert summary.authors == ("Doe, Jane", "Roe, Rick")
+        assert summary.subjects == ("Chemistry",)
+        assert summary.license == "CC0 1.0"
+        assert (summary.file_count, summary.size) == (2, 42)
+        assert not hasattr(summary, "__dict__")
+
+        with pytest.raises(AttributeError):
+            summary.title = "Changed"
+
+        assert summary.to_dataset() == "dataset"
+        assert dataverse.fetched == [("doi:10.5072/FK2/7", ":latest")]
+
+    def test_summary_from_search(self) -> None:
+        """It fills a summary from raw search JSON."""
+        summary = DatasetSummary.from_search(
+            {
+                "name": "Searched",
+                "type": "dataset",
+                "global_id": "doi:10.5072/FK2/S",
+                "authors": ["Doe, Jane"],
+                "subjects": ["Physics"],
+                "fileCount": 3,
+                "versionState": "RELEASED",
+                "majorVersion": 2,
+                "minorVersion": 1,
+            },
+            _FakeDataverse(),
+        )
+
+        assert (summary.title, summary.version, summary.file_count) == (
+            "Searched",
+            "2.1",
+            3,
+        )
+        assert summary.authors == ("Doe, Jane",) and summary.subjects == ("Physics",)
+        assert summary.identifier is None and summary.size is None
+
+    def test_view_yields_summaries_in_batches(self) -> None:
+        """It fetches raw responses in batches and skips datasets that fail."""
+        dataverse = _FakeDataverse()
+        contents = [
+            ContentDataset.model_construct(id=i, type="dataset") for i in range(1, 6)
+        ]
+        view = DatasetView(
+            collection=SimpleNamespace(_raw_content=contents),  # type: ignore[arg-type]
+            dataverse=dataverse,  # type: ignore[arg-type]
+        )
+
+        titles = [summary.title for summary in view.summaries(batch_size=2)]
+
+        assert titles == ["Dataset 1", "Dataset 3", "Dataset 4", "Dataset 5"]
+        assert dataverse.requested == [[1, 2], [3, 4], [5]]
@@ -0,0 +1,160 @@
+"""Tests for the async Dataverse filesystem."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.filesystem import MetadataCache, RangeCache
+from pyDataverse.filesystem.asyncfs import AsyncDataverseFS
+from tests.conftest import (
+    Credentials,
+    DatasetFactory,
+    StandInHandler,
+    StandInServer,
+)
+
+_CONTENT = bytes(range(256)) * 64
+_LISTING = "/api/datasets/:persistentId/versions/:latest"
+
+
+class _StandIn:
+    """State of a stand-in Dataverse installation with an S3 store."""
+
+    def __init__(self):
+        self.requests: List[str] = []
+        self.lock = threading.Lock()
+
+
+def _make_handler(state: _StandIn):
+    files = [
+        {
+            "label": "a.bin",
+            "dataFile": {"id": 1, "filesize": len(_CONTENT), "md5": "a"},
+        },
+        {"label": "b.bin", "dataFile": {"id": 2, "filesize": len(_CONTENT)}},
+        {"label": "c.bin", "dataFile": {"id": 3, "filesize": len(_CONTENT)}},
+    ]
+
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            with state.lock:
+                state.requests.append(url.path)
+
+            if url.path == _LISTING:
+                # Slow enough for concurrent reads to overlap on a cold cache
+                time.sleep(0.2)
+                self.reply_json({"files": files})
+            elif url.path.startswith("/api/access/datafile/"):
+                file_id = url.path.rsplit("/", 1)[1]
+                location = (
+                    f"http://{self.headers['Host']}/s3/{file_id}?X-Amz-Expires=60"
+                )
+                self.reply(303, headers={"Location": location})
+            elif url.path.startswith("/s3/"):
+                assert "X-Amz-Expires" in parse_qs(url.query)
+                if "Range" not in self.headers:
+                    self.reply(200, _CONTENT)
+                    return
+                # Range reads go to storage without Dataverse credentials
+                assert "X-Dataverse-key" not in self.headers
+                first, last = self.headers["Range"][len("bytes=") :].split("-")
+                self.reply(206, _CONTENT[int(first) : int(last) + 1])
+            else:
+                self.reply(404)
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(tmp_path: Path, stand_in_server: StandInServer) -> tuple:
+    state = _StandIn()
+    base_url = stand_in_server(_make_handler(state))
+    fs = AsyncDataverseFS(
+        base_url,
+        "doi:10.5072/FK2/ABC",
+        native_api=NativeApi(base_url=base_url, api_token="secret", verbose=0),
+        metadata_cache=MetadataCache(),
+        range_cache=RangeCache(tmp_path, alignment=1024),
+        skip_instance_cache=True,
+        batch_size=8,
+    )
+    return fs, state
+
+
+class TestAsyncDataverseFS:
+    """Test suite for concurrent bulk operations."""
+
+    def test_cold_cache_fetches_the_listing_once(self, stand_in) -> None:
+        """It fetches the dataset once for many concurrent reads."""
+        fs, state = stand_in
+
+        contents = fs.cat(["a.bin", "b.bin", "c.bin"])
+
+        assert contents == {"a.bin": _CONTENT, "b.bin": _CONTENT, "c.bin": _CONTENT}
+        assert state.requests.count(_LISTING) == 1
+
+    def test_ranges_use_the_redirect_and_range_caches(self, stand_in) -> None:
+        """It reads ranges like DataverseFS: from disk, or straight from storage."""
+        fs, state = stand_in
+
+        assert fs.cat_file("a.bin", 0, 100) == _CONTENT[:100]
+        assert fs.cat_file("a.bin", 10, 50) == _CONTENT[10:50]
+        assert fs.cat_ranges(["b.bin", "b.bin"], [0, 100], [10, 110]) == [
+            _CONTENT[:10],
+            _CONTENT[100:110],
+        ]
+        assert fs.cat_file("b.bin", 200, 300) == _CONTENT[200:300]
+
+        assert state.requests.count("/api/access/datafile/1") == 1
+        assert state.requests.count("/s3/1") == 1, "the second read is served from disk"
+        assert state.requests.count("/api/access/datafile/2") == 1
+        assert state.requests.count("/s3/2") == 2, "the nearby ranges are merged"
+        assert fs.redirect_cache.misses == 2
+
+    def test_cat_get_put_many(
+        self,
+        credentials: Credentials,
+        dataset: DatasetFactory,
+    ):
+        """Test uploading, reading and downloading several files at once."""
+        test_dataset = dataset()
+        fs = AsyncDataverseFS(
+            base_url=credentials.base_url,
+            identifier=test_dataset._ensure_identifier(),
+            api_token=credentials.api_token,
+            batch_size=4,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            local_paths = []
+            for index in range(3):
+                local_path = Path(tmp) / f"file{index}.txt"
+                local_path.write_bytes(f"content {index}".encode())
+                local_paths.append(str(local_path))
+
+            fs.put(local_paths, "data/")
+            remote_paths = [f"data/file{index}.txt" for index in range(3)]
+
+            contents = fs.cat(remote_paths)
+            assert contents == {
+                path: f"content {index}".encode()
+                for index, path in enumerate(remote_paths)
+            }, "File contents do not match"
+            assert fs.cat_file(remote_paths[0], start=0, end=7) == b"content"
+
+            target = Path(tmp) / "download"
+            target.mkdir()
+            fs.get(remote_paths, str(target) + "/")
+            assert sorted(p.name for p in target.iterdir()) == [
+                "file0.txt",
+                "file1.txt",
+                "file2.txt",
+            ], "Downloaded files do not match"
+            assert (target / "file2.txt").read_bytes() == b"content 2"
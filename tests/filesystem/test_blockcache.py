@@ -0,0 +1,96 @@
+"""Unit tests for the shared block cache and the prefetching read cache."""
+
+import threading
+import time
+from typing import List, Tuple
+
+from pyDataverse.filesystem.blockcache import BlockCache, PrefetchCache
+
+_CONTENT = bytes(range(256)) * 64  # 16 KiB
+_BLOCK_SIZE = 1024
+
+
+class _RangeFetcher:
+    """Serves byte ranges of ``_CONTENT`` and records every request."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, start: int, end: int) -> bytes:
+        with self._lock:
+            self.requests.append((start, end))
+        time.sleep(self.delay)
+        return _CONTENT[start:end]
+
+
+class TestBlockCache:
+    """Test suite for the shared block cache and the prefetching read cache."""
+
+    def test_lru_eviction_within_budget(self) -> None:
+        """It evicts the least recently used blocks once over the memory budget."""
+        cache = BlockCache(max_size=3 * _BLOCK_SIZE)
+        for index in range(3):
+            cache.get(("f", _BLOCK_SIZE, index), lambda: b"x" * _BLOCK_SIZE)
+        cache.get(("f", _BLOCK_SIZE, 0), lambda: b"unused")  # refresh block 0
+        cache.get(("f", _BLOCK_SIZE, 3), lambda: b"x" * _BLOCK_SIZE)
+
+        stats = cache.stats()
+        assert stats["size"] <= 3 * _BLOCK_SIZE
+        assert stats["hits"] == 1 and stats["misses"] == 4 and stats["evictions"] == 1
+        assert cache.get(("f", _BLOCK_SIZE, 0), lambda: b"refetched") != b"refetched"
+        assert cache.get(("f", _BLOCK_SIZE, 1), lambda: b"refetched") == b"refetched"
+
+    def test_concurrent_reads_fetch_block_once(self) -> None:
+        """It shares one in-flight fetch between threads reading the same block."""
+        cache = BlockCache()
+        fetcher = _RangeFetcher(delay=0.2)
+        results: List[bytes] = []
+
+        def read() -> None:
+            results.append(cache.get(("f", 4, 0), lambda: fetcher(0, 4)))
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetcher.requests == [(0, 4)]
+        assert results == [_CONTENT[:4]] * 4
+
+    def test_sequential_reads_prefetch_and_share_blocks(self) -> None:
+        """It prefetches ahead of forward reads, and a second handle hits the cache."""
+        block_cache = BlockCache()
+        fetcher = _RangeFetcher()
+        reader = PrefetchCache(
+            _BLOCK_SIZE, fetcher, len(_CONTENT), block_cache, file_key=1, read_ahead=3
+        )
+
+        data = b"".join(
+            reader._fetch(start, start + 700) for start in range(0, len(_CONTENT), 700)
+        )
+        assert data == _CONTENT
+        assert block_cache.stats()["prefetches"] > 0
+        assert len(set(fetcher.requests)) == len(_CONTENT) // _BLOCK_SIZE
+
+        second = PrefetchCache(
+            _BLOCK_SIZE, fetcher, len(_CONTENT), block_cache, file_key=1, read_ahead=3
+        )
+        requests = len(fetcher.requests)
+        assert second._fetch(5000, 9000) == _CONTENT[5000:9000]
+        assert len(fetcher.requests) == requests
+
+    def test_random_access_does_not_prefetch(self) -> None:
+        """It fetches only the touched blocks for non-sequential reads."""
+        block_cache = BlockCache()
+        fetcher = _RangeFetcher()
+        reader = PrefetchCache(
+            _BLOCK_SIZE, fetcher, len(_CONTENT), block_cache, file_key=1, read_ahead=3
+        )
+
+        assert reader._fetch(10_000, 10_010) == _CONTENT[10_000:10_010]
+        assert reader._fetch(2_000, 2_010) == _CONTENT[2_000:2_010]
+        assert block_cache.stats()["prefetches"] == 0
+        assert len(fetcher.requests) == 2
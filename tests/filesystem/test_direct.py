@@ -0,0 +1,216 @@
+"""Tests for direct uploads against a local stand-in for Dataverse and S3."""
+
+import hashlib
+import json
+import re
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.filesystem import DirectUploader
+from pyDataverse.models.file import UploadBody
+from tests.conftest import StandInHandler, StandInServer
+
+_PART_SIZE = 64 * 1024
+
+
+class _StandIn:
+    """State of a stand-in Dataverse installation with an S3 store."""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self.completed: Dict[str, str] = {}
+        self.completed_type = ""
+        self.registered: List[dict] = []
+        self.posts: List[str] = []
+        self.failures: Dict[str, int] = {}
+        self.aborted = False
+
+
+def _make_handler(state: _StandIn):
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path.endswith("/storageDriver"):
+                self.reply_json({"directUpload": True})
+            elif url.path.endswith("/uploadurls"):
+                size = int(query["size"][0])
+                host = f"http://{self.headers['Host']}"
+                data: dict = {"partSize": _PART_SIZE, "storageIdentifier": "s3://b:k"}
+                if size <= _PART_SIZE:
+                    data["url"] = f"{host}/s3/object"
+                else:
+                    count = -(-size // _PART_SIZE)
+                    data["urls"] = {
+                        str(n): f"{host}/s3/object?partNumber={n}"
+                        for n in range(1, count + 1)
+                    }
+                    data["complete"] = "/api/datasets/mpupload?uploadid=1"
+                    data["abort"] = "/api/datasets/mpupload?uploadid=1"
+                self.reply_json(data)
+            else:
+                self.reply(404)
+
+        def do_PUT(self) -> None:
+            url = urlparse(self.path)
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if url.path == "/s3/object":
+                part = parse_qs(url.query).get("partNumber", ["1"])[0]
+                if state.failures.get(part, 0) > 0:
+                    state.failures[part] -= 1
+                    self.reply(503)
+                    return
+                state.objects[part] = body
+                etag = hashlib.md5(body).hexdigest()
+                self.reply(headers={"ETag": f'"{etag}"'})
+            elif url.path == "/api/datasets/mpupload":
+                state.completed = json.loads(body)
+                state.completed_type = self.headers["Content-Type"]
+                self.reply_json({})
+
+        def do_DELETE(self) -> None:
+            state.aborted = True
+            self.reply(204)
+
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            state.posts.append(self.route)
+            # Registrations carry their metadata as jsonData; regular uploads
+            # without custom metadata may not.
+            match = re.search(rb"\r\n\r\n(\{.*\})\r\n--", body, re.S)
+            registered = json.loads(match.group(1)) if match else {}
+            state.registered.append(registered)
+            files = [
+                {
+                    "label": registered.get("fileName", "upload"),
+                    "directoryLabel": registered.get("directoryLabel"),
+                    "dataFile": {"id": 42, "persistentId": "doi:10.5072/FK2/F1"},
+                }
+            ]
+            self.reply_json({"files": files})
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(stand_in_server: StandInServer) -> tuple:
+    state = _StandIn()
+    native_api = NativeApi(base_url=stand_in_server(_make_handler(state)), verbose=0)
+    return native_api, state
+
+
+class TestDirectUploader:
+    """Test suite for direct uploads to S3 storage."""
+
+    def test_upload_multipart_with_retry(self, stand_in, tmp_path, monkeypatch) -> None:
+        """It uploads the parts concurrently, retries failures and registers the file."""
+        native_api, state = stand_in
+        content = bytes(range(256)) * 1000  # 4 parts, the last one short
+        local_file = tmp_path / "data.bin"
+        local_file.write_bytes(content)
+        state.failures["2"] = 2
+        monkeypatch.setattr("pyDataverse.filesystem.direct._RETRY_BACKOFF_SECONDS", 0)
+
+        uploader = DirectUploader(native_api, max_concurrency=3)
+
+        assert uploader.supports("doi:10.5072/FK2/ABC")
+        response = uploader.upload(
+            "doi:10.5072/FK2/ABC",
+            local_file,
+            UploadBody(filename="data.bin", directory_label="raw"),
+        )
+
+        assert b"".join(state.objects[str(n)] for n in range(1, 5)) == content
+        assert sorted(state.completed) == ["1", "2", "3", "4"]
+        assert not state.aborted
+
+        registered = state.registered[0]
+        assert registered["storageIdentifier"] == "s3://b:k"
+        assert registered["fileName"] == "data.bin"
+        assert registered["directoryLabel"] == "raw"
+        assert registered["checksum"] == {
+            "@type": "MD5",
+            "@value": hashlib.md5(content).hexdigest(),
+        }
+        assert response.files is not None and response.files[0].data_file is not None
+        assert response.files[0].data_file.id == 42
+
+    def test_upload_aborts_after_exhausted_retries(
+        self, stand_in, tmp_path, monkeypatch
+    ) -> None:
+        """It aborts the multipart upload and registers nothing if a part keeps failing."""
+        native_api, state = stand_in
+        local_file = tmp_path / "data.bin"
+        local_file.write_bytes(b"x" * (_PART_SIZE * 2))
+        state.failures["1"] = 10
+        monkeypatch.setattr("pyDataverse.filesystem.direct._RETRY_BACKOFF_SECONDS", 0)
+
+        uploader = DirectUploader(native_api, max_retries=2)
+        with pytest.raises(IOError, match="Direct upload failed"):
+            uploader.upload("1", local_file, UploadBody(filename="data.bin"))
+
+        assert state.aborted
+        assert state.registered == []
+
+    def test_upload_single_part_sha256(self, stand_in, tmp_path) -> None:
+        """It PUTs small files in one request with the configured checksum."""
+        native_api, state = stand_in
+        local_file = tmp_path / "notes.txt"
+        local_file.write_bytes(b"hello")
+
+        uploader = DirectUploader(native_api, checksum_algorithm="SHA-256")
+        uploader.upload("1", local_file, UploadBody())
+
+        assert state.objects["1"] == b"hello"
+        assert state.registered[0]["fileName"] == "notes.txt"
+        assert state.registered[0]["mimeType"] == "text/plain"
+        assert state.registered[0]["checksum"]["@value"] == (
+            hashlib.sha256(b"hello").hexdigest()
+        )
+
+    def test_complete_multipart_upload_sends_json(self, stand_in) -> None:
+        """It sends the part ETags as a JSON object, as Dataverse expects."""
+        native_api, state = stand_in
+
+        native_api.complete_multipart_upload(
+            "/api/datasets/mpupload?uploadid=1",
+            {"1": "etag-1", "2": "etag-2"},
+        )
+
+        assert state.completed == {"1": "etag-1", "2": "etag-2"}
+        assert state.completed_type == "application/json"
+
+    def test_native_uploads_of_large_files_go_direct(self, stand_in, tmp_path) -> None:
+        """It sends large local files to storage from the Native API itself."""
+        native_api, state = stand_in
+        large = tmp_path / "large.bin"
+        large.write_bytes(b"x" * 1000)
+        small = tmp_path / "small.txt"
+        small.write_bytes(b"hello")
+        native_api.direct_upload_threshold = 1000
+
+        native_api.upload_datafile("doi:10.5072/FK2/ABC", large, UploadBody())
+        native_api.replace_datafile(
+            42, str(large), UploadBody(), dataset_identifier="doi:10.5072/FK2/ABC"
+        )
+        native_api.upload_datafile("doi:10.5072/FK2/ABC", small, UploadBody())
+        native_api.replace_datafile(42, large, UploadBody())
+
+        assert state.objects["1"] == b"x" * 1000
+        assert [
+            registered.get("storageIdentifier") for registered in state.registered
+        ] == [
+            "s3://b:k",
+            "s3://b:k",
+            None,
+            None,
+        ], "small files and replacements without a dataset go through Dataverse"
+        assert state.posts == [
+            "/api/datasets/:persistentId/add",
+            "/api/files/42/replace",
+            "/api/datasets/:persistentId/add",
+            "/api/files/42/replace",
+        ]
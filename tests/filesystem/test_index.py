@@ -0,0 +1,88 @@
+"""Unit tests for the dataset path index."""
+
+import time
+from typing import List
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.filesystem import DataverseFS, MetadataCache
+from pyDataverse.filesystem.index import DatasetIndex
+from pyDataverse.models.dataset.edit_get import DataFile, File, GetDatasetResponse
+
+
+def _dataset(paths: List[str], size: int = 10) -> GetDatasetResponse:
+    files = []
+    for file_id, path in enumerate(paths):
+        directory_label, _, label = path.rpartition("/")
+        files.append(
+            File.model_construct(
+                label=label,
+                directory_label=directory_label or None,
+                data_file=DataFile.model_construct(id=file_id, filesize=size),
+            )
+        )
+    return GetDatasetResponse.model_construct(files=files)
+
+
+class TestPathIndex:
+    """Test suite for the dataset path index."""
+
+    def test_info_resolves_files_and_directories(self) -> None:
+        """It returns file entries and implicit directories, and rejects unknown paths."""
+        index = DatasetIndex(_dataset(["README.md", "data/raw/a.csv", "data/b.csv"]))
+
+        assert index.info("data/b.csv")["type"] == "file"
+        assert index.info("data/b.csv")["id"] == 2
+        assert index.info("data/raw") == {
+            "name": "data/raw",
+            "size": 0,
+            "type": "directory",
+        }
+        with pytest.raises(FileNotFoundError):
+            index.info("data/missing.csv")
+
+    def test_ls_lists_immediate_children_sorted(self) -> None:
+        """It lists direct children only, directories and files mixed by name."""
+        index = DatasetIndex(_dataset(["README.md", "data/raw/a.csv", "data/b.csv"]))
+
+        assert [entry["name"] for entry in index.ls("")] == ["README.md", "data"]
+        assert [entry["name"] for entry in index.ls("data")] == [
+            "data/b.csv",
+            "data/raw",
+        ]
+
+        # Listings are cached, but callers must not be able to corrupt them.
+        index.ls("data")[0]["name"] = "changed"
+        assert index.ls("data")[0]["name"] == "data/b.csv"
+
+    def test_directory_size_aggregates_nested_files(self) -> None:
+        """It sums the sizes of all files below a directory."""
+        index = DatasetIndex(_dataset(["README.md", "data/raw/a.csv", "data/b.csv"]))
+
+        assert index.directory_size("") == 30
+        assert index.directory_size("data") == 20
+        assert index.directory_size("data/raw") == 10
+
+    def test_walk_synthetic_100k_files(self) -> None:
+        """Benchmark: fs.walk and fs.find over 100k files run in linear time."""
+        paths = [f"dir{i % 100}/sub{i % 7}/file{i}.csv" for i in range(100_000)]
+        fs = DataverseFS(
+            "http://127.0.0.1:1",
+            "doi:10.5072/FK2/ABC",
+            native_api=NativeApi.model_construct(base_url="http://127.0.0.1:1"),
+            metadata_cache=MetadataCache(),
+            skip_instance_cache=True,
+        )
+        fs.metadata_cache.put(fs._metadata_key(), DatasetIndex(_dataset(paths)))
+
+        start = time.perf_counter()
+        walked = sum(len(files) for _, _, files in fs.walk(""))
+        found = fs.find("")
+        elapsed = time.perf_counter() - start
+
+        assert walked == len(found) == 100_000
+        assert len(fs.find("dir3")) == 1_000
+        # A linear scan per listing takes minutes here; the index takes well
+        # under a second.
+        assert elapsed < 10, f"Walking 100k files took {elapsed:.1f}s"
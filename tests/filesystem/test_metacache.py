@@ -0,0 +1,187 @@
+"""Unit tests for the shared dataset metadata cache."""
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from pyDataverse.auth import ApiTokenAuth
+from pyDataverse.filesystem import DataverseFS, MetadataCache
+from pyDataverse.filesystem.index import DatasetIndex
+from pyDataverse.filesystem.metacache import is_immutable_version, metadata_key
+from pyDataverse.models.dataset.edit_get import DataFile, File, GetDatasetResponse
+from pyDataverse.models.file.filemeta import FileInfo
+
+_BASE_URL = "https://demo.dataverse.org"
+_PID = "doi:10.5072/FK2/ABC"
+
+
+def _file(file_id: int, path: str, content_type: str = "text/plain") -> File:
+    directory_label, _, label = path.rpartition("/")
+    return File.model_construct(
+        label=label,
+        directory_label=directory_label or None,
+        data_file=DataFile.model_construct(
+            id=file_id, filesize=10, content_type=content_type
+        ),
+    )
+
+
+def _index(paths: List[str]) -> DatasetIndex:
+    files = [_file(file_id, path) for file_id, path in enumerate(paths)]
+    return DatasetIndex(GetDatasetResponse.model_construct(files=files))
+
+
+class _NativeApi:
+    """Serves a fixed dataset listing and counts the requests."""
+
+    auth = ApiTokenAuth("token")
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        self.requests = 0
+        self.uploads = 0
+
+    def get_dataset(self, identifier, version) -> GetDatasetResponse:
+        self.requests += 1
+        return _index(self.paths).dataset
+
+    def delete_datafile(self, identifier) -> None:
+        pass
+
+    def upload_datafile(self, identifier, file, metadata) -> SimpleNamespace:
+        while file.read(1 << 16):
+            pass
+        self.uploads += 1
+        info = {
+            "label": metadata.filename,
+            "directoryLabel": metadata.directory_label,
+            "dataFile": {"id": 100 + self.uploads, "contentType": "image/png"},
+        }
+        return SimpleNamespace(files=[FileInfo.model_validate(info)])
+
+
+def _fs(native_api: _NativeApi, cache: MetadataCache, **kwargs) -> DataverseFS:
+    return DataverseFS(
+        _BASE_URL,
+        _PID,
+        native_api=native_api,  # type: ignore[arg-type]
+        data_access_api=object(),  # type: ignore[arg-type]
+        metadata_cache=cache,
+        skip_instance_cache=True,
+        **kwargs,
+    )
+
+
+class TestMetadataCache:
+    """Test suite for the shared dataset metadata cache."""
+
+    def test_published_versions_never_expire(self) -> None:
+        """It serves numbered versions regardless of age, mutable ones within max_age."""
+        cache = MetadataCache()
+        published = metadata_key(_BASE_URL, _PID, "1.0", "token")
+        latest = metadata_key(_BASE_URL, _PID, ":latest", "token")
+        cache.put(published, _index(["a.csv"]))
+        cache.put(latest, _index(["a.csv"]))
+
+        assert cache.get(published, max_age=0) is not None
+        assert cache.get(latest, max_age=60) is not None
+        assert cache.get(latest, max_age=0) is None
+        assert published[3] is None, "published versions are shared across users"
+        assert is_immutable_version("2.1") and not is_immutable_version("2")
+
+    def test_evicts_least_recently_used_within_file_budget(self) -> None:
+        """It bounds the total number of cached file entries."""
+        cache = MetadataCache(max_files=8)
+        keys = [metadata_key(_BASE_URL, f"doi:{n}", "1.0") for n in range(3)]
+        for key in keys:
+            cache.put(key, _index(["a", "b", "c"]))
+
+        assert cache.stats()["files"] <= 8
+        assert cache.get(keys[0], max_age=60) is None
+        assert cache.get(keys[2], max_age=60) is not None
+
+    def test_update_touches_only_the_writers_drafts(self) -> None:
+        """It updates the writer's draft, drops other users' and keeps published ones."""
+        cache = MetadataCache()
+        own = metadata_key(_BASE_URL, _PID, ":latest", "token")
+        other = metadata_key(_BASE_URL, _PID, ":draft", "other-token")
+        anonymous = metadata_key(_BASE_URL, _PID, ":latest")
+        published = metadata_key(_BASE_URL, _PID, "1.0")
+        for key in (own, other, anonymous, published):
+            cache.put(key, _index(["a.csv", "data/b.csv"]))
+
+        cache.update(own, removed=[0], added=[_file(7, "data/c.csv")])
+
+        own_index = cache.get(own, max_age=60)
+        assert own_index is not None
+        assert sorted(own_index.files) == ["data/b.csv", "data/c.csv"]
+        assert cache.get(other, max_age=60) is None
+        for key in (anonymous, published):
+            index = cache.get(key, max_age=60)
+            assert index is not None and sorted(index.files) == ["a.csv", "data/b.csv"]
+
+    def test_filesystems_share_snapshots_and_apply_writes(self) -> None:
+        """It fetches a dataset once across instances and applies removals in place."""
+        cache = MetadataCache()
+        native_api = _NativeApi(["a.csv", "data/b.csv"])
+
+        assert _fs(native_api, cache).ls("", detail=False) == ["a.csv", "data"]
+        fs = _fs(native_api, cache)
+        assert fs.exists("data/b.csv")
+        assert native_api.requests == 1
+
+        fs.remove("data/b.csv")
+        assert not fs.exists("data/b.csv")
+        assert native_api.requests == 1
+
+        fs.record_write(
+            added=[
+                FileInfo.model_validate(
+                    {"label": "c.csv", "dataFile": {"id": 9, "contentType": "text/csv"}}
+                )
+            ]
+        )
+        assert fs.exists("a.csv")
+        assert native_api.requests == 2, "ingestable uploads are refetched"
+
+    def test_writes_keep_the_updated_snapshot(self, tmp_path) -> None:
+        """It applies writes through open() and put_file() without refetching."""
+        native_api = _NativeApi(["a.csv"])
+        fs = _fs(native_api, MetadataCache())
+        assert fs.exists("a.csv")
+
+        with fs.open("data/b.png", "wb") as file:
+            file.write(b"png")
+        local = tmp_path / "c.png"
+        local.write_bytes(b"png")
+        fs.put_file(str(local), "c.png")
+
+        assert native_api.uploads == 2
+        assert fs.exists("data/b.png") and fs.exists("c.png")
+        assert native_api.requests == 1, "the written snapshot stays cached"
+
+        fs.invalidate_cache()
+        assert not fs.exists("c.png")
+        assert native_api.requests == 2
+
+    def test_drafts_are_keyed_by_the_auth_token(self) -> None:
+        """It keys mutable versions by the client's token, which NativeApi moves to auth."""
+        native_api = _NativeApi(["a.csv"])
+        fs = _fs(native_api, MetadataCache())
+        other = _fs(_NativeApi(["a.csv"]), MetadataCache())
+        other.native_api.auth = ApiTokenAuth("other-token")
+
+        assert fs._metadata_key()[3] is not None
+        assert fs._metadata_key() != other._metadata_key()
+
+    def test_cache_ttl_zero_disables_caching_of_mutable_versions(self) -> None:
+        native_api = _NativeApi(["a.csv"])
+        fs = _fs(native_api, MetadataCache(), cache_ttl=0)
+        fs.info("a.csv")
+        fs.info("a.csv")
+        assert native_api.requests == 2
+
+    def test_rejects_invalid_budget(self) -> None:
+        with pytest.raises(ValueError):
+            MetadataCache(max_files=0)
@@ -0,0 +1,125 @@
+"""Unit tests for the persistent on-disk range cache."""
+
+import os
+from typing import List, Tuple
+
+import pytest
+
+from pyDataverse.filesystem.rangecache import RangeCache, datafile_cache_key
+from pyDataverse.models.dataset.edit_get import DataFile
+
+_CONTENT = os.urandom(64 * 1024)
+_ALIGNMENT = 4096
+
+
+class _RangeFetcher:
+    """Serves byte ranges of ``_CONTENT`` and records every request."""
+
+    def __init__(self):
+        self.requests: List[Tuple[int, int]] = []
+
+    def __call__(self, start: int, end: int) -> bytes:
+        self.requests.append((start, end))
+        return _CONTENT[start:end]
+
+
+class TestRangeCache:
+    """Test suite for the persistent on-disk range cache."""
+
+    def test_fetches_only_gaps(self, tmp_path) -> None:
+        """It serves cached ranges from disk and fetches only what is missing."""
+        cache = RangeCache(tmp_path, alignment=_ALIGNMENT)
+        fetcher = _RangeFetcher()
+        size = len(_CONTENT)
+
+        assert cache.read("1-abc", size, 100, 200, fetcher) == _CONTENT[100:200]
+        assert (
+            cache.read("1-abc", size, 20_000, 20_010, fetcher)
+            == _CONTENT[20_000:20_010]
+        )
+        assert fetcher.requests == [(0, 4096), (16_384, 20_480)]
+
+        assert cache.read("1-abc", size, 0, 30_000, fetcher) == _CONTENT[:30_000]
+        assert fetcher.requests[2:] == [(4096, 16_384), (20_480, 32_768)]
+        assert cache.ranges("1-abc") == [(0, 32_768)]
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        """It serves ranges cached by an earlier instance without fetching."""
+        RangeCache(tmp_path).read("1-abc", len(_CONTENT), 0, 1000, _RangeFetcher())
+
+        fetcher = _RangeFetcher()
+        data = RangeCache(tmp_path).read("1-abc", len(_CONTENT), 10, 900, fetcher)
+
+        assert data == _CONTENT[10:900]
+        assert fetcher.requests == []
+
+    def test_evicts_least_recently_used(self, tmp_path) -> None:
+        """It removes the least recently used files once over the size cap."""
+        cache = RangeCache(tmp_path, max_size=2 * _ALIGNMENT, alignment=_ALIGNMENT)
+        size = len(_CONTENT)
+
+        cache.read("1-a", size, 0, 10, _RangeFetcher())
+        cache.read("2-b", size, 0, 10, _RangeFetcher())
+        os.utime(tmp_path / "1-a.ranges", (1, 1))
+        os.utime(tmp_path / "2-b.ranges", (2, 2))
+        cache.read("3-c", size, 0, 10, _RangeFetcher())
+
+        assert cache.ranges("1-a") == []
+        assert not (tmp_path / "1-a.data").exists()
+        assert cache.ranges("2-b") and cache.ranges("3-c")
+        assert cache.size <= 2 * _ALIGNMENT
+
+    def test_invalidate_and_key(self, tmp_path) -> None:
+        """It keys entries by ID and checksum and drops all entries of an ID."""
+        data_file = DataFile.model_validate(
+            {"id": 7, "checksum": {"type": "MD5", "value": "abc"}}
+        )
+        key = datafile_cache_key(data_file)
+        assert key == "7-abc"
+        assert datafile_cache_key(DataFile(id=7)) is None
+
+        cache = RangeCache(tmp_path)
+        cache.read(key, len(_CONTENT), 0, 10, _RangeFetcher())
+        cache.invalidate(7)
+
+        assert cache.ranges(key) == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_invalid_limits(self, tmp_path) -> None:
+        with pytest.raises(ValueError):
+            RangeCache(tmp_path, max_size=0)
+
+    def test_does_not_cache_ranges_over_the_cap(self, tmp_path) -> None:
+        """It reads ranges remotely that could never fit under the size cap."""
+        cache = RangeCache(tmp_path, max_size=2 * _ALIGNMENT, alignment=_ALIGNMENT)
+        fetcher = _RangeFetcher()
+
+        data = cache.read("1-a", len(_CONTENT), 0, 3 * _ALIGNMENT, fetcher)
+
+        assert data == _CONTENT[: 3 * _ALIGNMENT]
+        assert fetcher.requests == [(0, 3 * _ALIGNMENT)]
+        assert list(tmp_path.iterdir()) == [] and cache.size == 0
+
+    def test_evicts_without_rescanning(self, tmp_path, monkeypatch) -> None:
+        """It keeps sizes in memory and spares files another process has read."""
+        cache = RangeCache(tmp_path, max_size=3 * _ALIGNMENT, alignment=_ALIGNMENT)
+        size = len(_CONTENT)
+        for file_id in range(20):
+            cache.read(f"{file_id}-a", size, 0, 10, _RangeFetcher())
+        RangeCache(tmp_path).read("17-a", size, 0, 10, _RangeFetcher())
+
+        loaded = []
+        load_ranges = RangeCache._load_ranges
+        monkeypatch.setattr(
+            RangeCache,
+            "_load_ranges",
+            staticmethod(lambda path: loaded.append(path.name) or load_ranges(path)),
+        )
+        cache.read("99-a", size, 0, 10, _RangeFetcher())
+
+        assert set(loaded) == {"99-a.ranges"}
+        assert sorted(path.name for path in tmp_path.glob("*.ranges")) == [
+            "17-a.ranges",
+            "19-a.ranges",
+            "99-a.ranges",
+        ]
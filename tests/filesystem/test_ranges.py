@@ -0,0 +1,147 @@
+"""Tests for vectorized range reads against a local stand-in for Dataverse."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.filesystem import DataverseFS, MetadataCache
+from pyDataverse.filesystem.index import DatasetIndex
+from pyDataverse.filesystem.ranges import merge_ranges, read_byteranges, split_ranges
+from pyDataverse.models.dataset.edit_get import DataFile, File, GetDatasetResponse
+from tests.conftest import StandInHandler, StandInServer
+
+_CONTENT = bytes(range(256)) * 1024  # 256 KiB
+_BOUNDARY = "THIS_STRING_SEPARATES"
+
+
+class _StandIn:
+    """State of a stand-in Dataverse installation serving files itself."""
+
+    def __init__(self):
+        self.multipart = True
+        self.ranges: List[str] = []
+
+
+def _make_handler(state: _StandIn):
+    class Handler(StandInHandler):
+        def do_GET(self) -> None:
+            spec = self.headers["Range"][len("bytes=") :]
+            state.ranges.append(spec)
+            total = len(_CONTENT)
+            ranges = [
+                (int(first), int(last or total - 1))
+                for first, _, last in (part.partition("-") for part in spec.split(","))
+            ]
+
+            if len(ranges) > 1 and not state.multipart:
+                self.reply(200, _CONTENT, {})
+            elif len(ranges) == 1:
+                first, last = ranges[0]
+                self.reply(
+                    206,
+                    _CONTENT[first : last + 1],
+                    {"Content-Range": f"bytes {first}-{last}/{total}"},
+                )
+            else:
+                body = b""
+                for first, last in ranges:
+                    body += (
+                        f"\r\n--{_BOUNDARY}\r\n"
+                        "Content-Type: application/octet-stream\r\n"
+                        f"Content-Range: bytes {first}-{last}/{total}\r\n\r\n"
+                    ).encode() + _CONTENT[first : last + 1]
+                body += f"\r\n--{_BOUNDARY}--\r\n".encode()
+                content_type = f"multipart/byteranges; boundary={_BOUNDARY}"
+                self.reply(206, body, {"Content-Type": content_type})
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(stand_in_server: StandInServer) -> tuple:
+    state = _StandIn()
+    base_url = stand_in_server(_make_handler(state))
+    fs = DataverseFS(
+        base_url,
+        "doi:10.5072/FK2/ABC",
+        native_api=NativeApi(base_url=base_url, verbose=0),
+        metadata_cache=MetadataCache(),
+        skip_instance_cache=True,
+    )
+    files = [
+        File.model_construct(
+            label=label,
+            data_file=DataFile.model_construct(id=file_id, filesize=len(_CONTENT)),
+        )
+        for file_id, label in [(1, "a.bin"), (2, "b.bin")]
+    ]
+    dataset = GetDatasetResponse.model_construct(files=files)
+    fs.metadata_cache.put(fs._metadata_key(), DatasetIndex(dataset))
+    return fs, state
+
+
+class TestRangeReads:
+    """Test suite for vectorized range reads."""
+
+    def test_merge_and_split_ranges(self) -> None:
+        """It merges nearby ranges and cuts the requested ones back out."""
+        ranges = [(500, 600), (0, 100), (150, 200), (90, 120)]
+        spans = merge_ranges(ranges, max_gap=50)
+        assert spans == [(0, 200), (500, 600)]
+
+        buffers = [_CONTENT[0:200], _CONTENT[500:600]]
+        assert split_ranges(ranges, spans, buffers) == [
+            _CONTENT[start:end] for start, end in ranges
+        ]
+
+    def test_read_byteranges_accepts_coalesced_parts(self) -> None:
+        """It serves spans from parts the server coalesced, and rejects gaps."""
+        response = httpx.Response(
+            206, headers={"Content-Range": f"bytes 0-299/{len(_CONTENT)}"}
+        )
+        body = _CONTENT[:300]
+
+        assert read_byteranges(response, body, [(0, 10), (200, 300)]) == [
+            _CONTENT[:10],
+            _CONTENT[200:300],
+        ]
+        assert read_byteranges(response, body, [(0, 10), (400, 500)]) is None
+
+    def test_cat_ranges_uses_one_multipart_request_per_file(self, stand_in) -> None:
+        """It merges nearby ranges and fetches all spans of a file at once."""
+        fs, state = stand_in
+        paths = ["a.bin", "a.bin", "a.bin", "b.bin", "a.bin", "missing.bin"]
+        starts = [0, 1000, 200_000, 5, -10, 0]
+        ends = [100, 1100, 200_500, 50, None, 10]
+
+        out = fs.cat_ranges(paths, starts, ends)
+
+        assert out[:4] == [
+            _CONTENT[0:100],
+            _CONTENT[1000:1100],
+            _CONTENT[200_000:200_500],
+            _CONTENT[5:50],
+        ]
+        assert out[4] == _CONTENT[-10:]
+        assert isinstance(out[5], FileNotFoundError)
+        assert "0-1099,200000-200499" in state.ranges
+        assert "5-49" in state.ranges
+
+    def test_cat_ranges_falls_back_to_concurrent_spans(self, stand_in) -> None:
+        """It fetches spans one by one where multi-range requests are not honored."""
+        fs, state = stand_in
+        state.multipart = False
+        starts = [0, 100_000, 200_000]
+        ends = [10, 100_010, 200_010]
+
+        for _ in range(2):
+            out = fs.cat_ranges(["a.bin"] * 3, starts, ends)
+            assert out == [_CONTENT[start:end] for start, end in zip(starts, ends)]
+
+        multi = [spec for spec in state.ranges if "," in spec]
+        assert len(multi) == 1, "multi-range support is probed once"
+        assert state.ranges.count("100000-100009") == 2
+        with pytest.raises(FileNotFoundError):
+            fs.cat_ranges(["missing.bin"], 0, 10, on_error="raise")
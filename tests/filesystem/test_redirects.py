@@ -0,0 +1,196 @@
+"""Tests for the redirect cache against a local stand-in for Dataverse and S3."""
+
+import threading
+import time
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pyDataverse.api import DataAccessApi
+from pyDataverse.filesystem import RedirectCache
+from pyDataverse.filesystem.redirects import _remaining_lifetime
+from tests.conftest import StandInHandler, StandInServer
+
+_CONTENT = bytes(range(256)) * 64
+
+# Size of the object a store that ignores Range headers sends in full; far
+# more than loopback socket buffers hold, so an early close is observable.
+_LARGE_SIZE = 64 * 1024 * 1024
+
+
+class _StandIn:
+    """State of a stand-in Dataverse installation with an S3 store."""
+
+    def __init__(self):
+        self.redirect = True
+        self.expires = 3600
+        self.generation = 0
+        self.revoked: List[int] = []
+        self.requests: List[str] = []
+        self.storage_ports: List[int] = []
+        self.empty = False
+        self.ignore_range = False
+        self.sent = 0
+        self.done = threading.Event()
+
+
+def _make_handler(state: _StandIn):
+    class Handler(StandInHandler):
+        def _serve_range(self) -> None:
+            if state.empty:
+                self.reply(416, headers={"Content-Range": "bytes */0"})
+                return
+            first, last = self.headers["Range"][len("bytes=") :].split("-")
+            self.reply(206, _CONTENT[int(first) : int(last) + 1])
+
+        def _serve_whole_object(self) -> None:
+            block = bytes(range(256)) * 256
+            self.send_response(200)
+            self.send_header("Content-Length", str(_LARGE_SIZE))
+            self.end_headers()
+            try:
+                while state.sent < _LARGE_SIZE:
+                    self.wfile.write(block)
+                    state.sent += len(block)
+            except OSError:
+                self.close_connection = True
+            finally:
+                state.done.set()
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            state.requests.append(url.path)
+            if url.path.startswith("/api/access/datafile/"):
+                if not state.redirect:
+                    self._serve_range()
+                    return
+                state.generation += 1
+                signed = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+                location = (
+                    f"http://{self.headers['Host']}/s3/object"
+                    f"?generation={state.generation}"
+                    f"&X-Amz-Date={signed}&X-Amz-Expires={state.expires}"
+                )
+                self.reply(303, headers={"Location": location})
+            elif url.path == "/s3/object":
+                assert "X-Dataverse-key" not in self.headers
+                generation = int(parse_qs(url.query)["generation"][0])
+                state.storage_ports.append(self.client_address[1])
+                if generation in state.revoked:
+                    self.reply(403)
+                    return
+                if state.ignore_range:
+                    self._serve_whole_object()
+                    return
+                self._serve_range()
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in(stand_in_server: StandInServer) -> tuple:
+    state = _StandIn()
+    api = DataAccessApi(
+        base_url=stand_in_server(_make_handler(state)),
+        api_token="secret",
+        verbose=0,
+    )
+    return api, state
+
+
+class TestRedirectCache:
+    """Test suite for the redirect cache."""
+
+    def test_reads_go_straight_to_storage(self, stand_in) -> None:
+        """It resolves the redirect once and reads all ranges from storage."""
+        api, state = stand_in
+        redirects = RedirectCache(api)
+
+        for start in range(0, 4096, 1024):
+            expected = _CONTENT[start : start + 1024]
+            assert redirects.fetch_range(42, start, start + 1024) == expected
+
+        assert state.requests.count("/api/access/datafile/42") == 1
+        assert state.requests.count("/s3/object") == 4
+        assert redirects.hits == 3 and redirects.misses == 1
+
+    def test_re_resolves_revoked_and_expired_urls(self, stand_in) -> None:
+        """It resolves the redirect again on a 403 and once the URL has expired."""
+        api, state = stand_in
+        redirects = RedirectCache(api)
+
+        assert redirects.fetch_range(42, 0, 10) == _CONTENT[:10]
+        state.revoked.append(1)
+        assert redirects.fetch_range(42, 10, 20) == _CONTENT[10:20]
+        assert state.requests.count("/api/access/datafile/42") == 2
+
+        # A URL within the expiry margin is never used for a second read.
+        state.expires = 10
+        redirects.invalidate()
+        redirects.fetch_range(42, 0, 10)
+        redirects.fetch_range(42, 0, 10)
+        assert state.requests.count("/api/access/datafile/42") == 4
+
+    def test_local_storage_reads_through_dataverse(self, stand_in) -> None:
+        """It reads files Dataverse serves itself through the Data Access API."""
+        api, state = stand_in
+        state.redirect = False
+        redirects = RedirectCache(api)
+
+        assert redirects.resolve(42) is None
+        assert redirects.fetch_range(42, 100, 200) == _CONTENT[100:200]
+        assert "/s3/object" not in state.requests
+        assert api.get_datafile_download_url(42).endswith("/api/access/datafile/42")
+
+    def test_storage_reads_share_one_connection(self, stand_in) -> None:
+        """It sends probes and storage reads through one pooled client."""
+        api, state = stand_in
+        redirects = RedirectCache(api)
+
+        for start in range(0, 4096, 1024):
+            redirects.fetch_range(42, start, start + 1024)
+
+        assert len(state.storage_ports) == 4
+        assert len(set(state.storage_ports)) == 1
+        redirects.close()
+        assert redirects.fetch_range(42, 0, 10) == _CONTENT[:10]
+
+    def test_empty_files_answer_416(self, stand_in) -> None:
+        """It treats an unsatisfiable range as an empty read, not an error."""
+        api, state = stand_in
+        state.empty = True
+        redirects = RedirectCache(api)
+
+        assert redirects.fetch_range(42, 0, 10) == b""
+
+        state.redirect = False
+        redirects.invalidate()
+        assert redirects.resolve(42) is None
+        assert redirects.fetch_range(42, 0, 10) == b""
+
+    def test_storage_ignoring_range_is_not_read_in_full(self, stand_in) -> None:
+        """It stops reading a whole-object answer once the range is complete."""
+        api, state = stand_in
+        state.ignore_range = True
+        redirects = RedirectCache(api)
+
+        data = redirects.fetch_range(42, 1024, 2048)
+
+        assert data == (bytes(range(256)) * 4)
+        assert state.done.wait(10)
+        assert state.sent < _LARGE_SIZE // 2
+
+    def test_remaining_lifetime_from_signatures(self) -> None:
+        """It reads the expiry of S3, Swift and Azure URLs and falls back otherwise."""
+        now = time.time()
+        signed = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now))
+
+        s3 = f"https://s3/o?X-Amz-Date={signed}&X-Amz-Expires=3600"
+        swift = f"https://swift/o?temp_url_sig=x&temp_url_expires={int(now) + 600}"
+        azure = "https://blob/o?sv=2020&se=2000-01-01T00:00:00Z"
+
+        assert 3590 <= _remaining_lifetime(s3, 5) <= 3600
+        assert 590 <= _remaining_lifetime(swift, 5) <= 600
+        assert _remaining_lifetime(azure, 5) == 0
+        assert _remaining_lifetime("https://store/o?token=x", 5) == 5
@@ -0,0 +1,189 @@
+"""Unit tests and a benchmark for streaming uploads."""
+
+import os
+import threading
+import time
+import tracemalloc
+from typing import List
+
+import pytest
+
+from pyDataverse.api import NativeApi
+from pyDataverse.filesystem import DataverseFS, MetadataCache
+from pyDataverse.filesystem.index import DatasetIndex
+from pyDataverse.filesystem.writer import _UploadStream
+from pyDataverse.models.dataset.edit_get import GetDatasetResponse
+from tests.conftest import StandInHandler, StandInServer
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Size of the upload benchmark, in GiB.
+_BENCHMARK_GIB = float(os.environ.get("PYDATAVERSE_BENCHMARK_UPLOAD_GIB", "4"))
+
+
+def _rss() -> int:
+    """Resident set size of this process in bytes."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class _UploadHandler(StandInHandler):
+    """Stand-in for Dataverse that counts and discards uploaded bytes."""
+
+    received: List[int] = []
+
+    def do_GET(self) -> None:
+        if "/locks" in self.route:
+            self.reply_json([])
+        else:
+            self.reply(404)
+
+    def do_POST(self) -> None:
+        received = 0
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                received += len(self.rfile.read(size))
+                self.rfile.readline()
+                if size == 0:
+                    break
+        else:
+            length = int(self.headers["Content-Length"])
+            while length > received:
+                received += len(self.rfile.read(min(length - received, 1 << 20)))
+        self.received.append(received)
+
+        data_file = {"id": 1, "filesize": received, "contentType": "application/x"}
+        self.reply_json({"files": [{"label": "big.bin", "dataFile": data_file}]})
+
+
+class TestUploadStream:
+    """Test suite for the streaming upload buffer."""
+
+    def test_read_and_readinto_preserve_content(self) -> None:
+        """It returns the written bytes in order, across chunk boundaries."""
+        stream = _UploadStream(name="file.bin", max_chunks=8)
+        stream.put(b"hello ")
+        stream.put(b"")
+        stream.put(b"world")
+        stream.finish()
+
+        assert stream.read(3) == b"hel"
+        buffer = bytearray(5)
+        assert stream.readinto(buffer) == 5
+        assert bytes(buffer) == b"lo wo"
+        assert stream.read() == b"rld"
+        assert stream.read(10) == b""
+
+    def test_put_blocks_while_queue_is_full(self) -> None:
+        """It applies backpressure: at most max_chunks chunks wait for the reader."""
+        stream = _UploadStream(max_chunks=2)
+        stream.put(b"a")
+        stream.put(b"b")
+
+        blocked = threading.Thread(target=stream.put, args=(b"c",))
+        blocked.start()
+        blocked.join(timeout=0.3)
+        assert blocked.is_alive(), "put should wait for the reader"
+
+        assert stream.read(1) == b"a"
+        blocked.join(timeout=5)
+        assert not blocked.is_alive(), "put should resume once a chunk was read"
+
+    def test_abort_releases_blocked_writer(self) -> None:
+        """It fails a blocked put once the upload is aborted."""
+        stream = _UploadStream(max_chunks=1)
+        stream.put(b"a")
+
+        errors = []
+
+        def _put() -> None:
+            try:
+                stream.put(b"b")
+            except IOError as exc:
+                errors.append(exc)
+
+        writer = threading.Thread(target=_put)
+        writer.start()
+        stream.abort()
+        writer.join(timeout=5)
+
+        assert not writer.is_alive(), "abort should unblock the writer"
+        assert len(errors) == 1
+        with pytest.raises(IOError):
+            stream.put(b"c")
+
+    def test_streaming_memory_is_bounded(self) -> None:
+        """Benchmark: streaming 128 MiB keeps peak allocations to a few chunks."""
+        total_chunks = 128
+        stream = _UploadStream(max_chunks=4)
+
+        def _produce() -> None:
+            for _ in range(total_chunks):
+                stream.put(bytes(_CHUNK_SIZE))
+            stream.finish()
+
+        tracemalloc.start()
+        try:
+            producer = threading.Thread(target=_produce)
+            producer.start()
+
+            received = 0
+            while True:
+                data = stream.read(64 * 1024)
+                if not data:
+                    break
+                received += len(data)
+            producer.join()
+
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert received == total_chunks * _CHUNK_SIZE
+        assert peak < 12 * _CHUNK_SIZE, f"Peak allocation {peak} bytes is not bounded"
+
+    @pytest.mark.benchmark
+    def test_upload_throughput_and_rss(self, stand_in_server: StandInServer) -> None:
+        """Benchmark: uploading several GiB keeps RSS flat.
+
+        Set ``PYDATAVERSE_BENCHMARK_UPLOAD_GIB`` to change the upload size.
+        """
+        if not os.path.exists("/proc/self/statm"):
+            pytest.skip("RSS is read from /proc")
+
+        handler = type("Handler", (_UploadHandler,), {"received": []})
+        base_url = stand_in_server(handler)
+        fs = DataverseFS(
+            base_url,
+            "doi:10.5072/FK2/ABC",
+            native_api=NativeApi(base_url=base_url, verbose=0),
+            metadata_cache=MetadataCache(),
+            skip_instance_cache=True,
+        )
+        dataset = GetDatasetResponse.model_construct(files=[])
+        fs.metadata_cache.put(fs._metadata_key(), DatasetIndex(dataset))
+
+        block_size = 8 * _CHUNK_SIZE
+        total = int(_BENCHMARK_GIB * 1024**3) // block_size * block_size
+        block = os.urandom(block_size)
+        baseline = peak = _rss()
+
+        started = time.perf_counter()
+        with fs.open("big.bin", "wb", block_size=block_size) as file:
+            for _ in range(total // block_size):
+                file.write(block)
+                peak = max(peak, _rss())
+        elapsed = time.perf_counter() - started
+
+        throughput = total / elapsed / 1024**2
+        growth = peak - baseline
+        print(
+            f"\nuploaded {total / 1024**3:.1f} GiB in {elapsed:.1f}s "
+            f"({throughput:.0f} MiB/s), RSS grew by {growth / 1024**2:.0f} MiB"
+        )
+
+        # The multipart body adds a few hundred bytes of headers to the file.
+        assert total <= handler.received[0] < total + 4096
+        # The writer buffers one block and the stream queues a few more.
+        assert growth < 16 * block_size, f"RSS grew by {growth} bytes"